@@ -63,6 +63,7 @@ from mcpgateway import version as version_module
 from mcpgateway.auth import get_current_user, get_user_team_roles
 from mcpgateway.cache.a2a_stats_cache import a2a_stats_cache
 from mcpgateway.cache.global_config_cache import global_config_cache
+from mcpgateway.cache.registry_versions import registry_listing_headers
 from mcpgateway.common.models import LogLevel
 from mcpgateway.common.validators import SecurityValidator
 from mcpgateway.config import settings
@@ -121,7 +122,7 @@ from mcpgateway.services.argon2_service import Argon2PasswordService
 from mcpgateway.services.audit_trail_service import get_audit_trail_service
 from mcpgateway.services.catalog_service import catalog_service
 from mcpgateway.services.email_auth_service import AuthenticationError, EmailAuthService, PasswordValidationError
-from mcpgateway.services.encryption_service import get_encryption_service
+from mcpgateway.services.encryption_service import get_derived_key_cache_stats, get_encryption_service
 from mcpgateway.services.export_service import ExportError, ExportService
 from mcpgateway.services.gateway_service import GatewayConnectionError, GatewayDuplicateConflictError, GatewayNameConflictError, GatewayNotFoundError, GatewayService
 from mcpgateway.services.import_service import ConflictStrategy
@@ -1253,6 +1254,36 @@ async def get_a2a_stats_cache_stats(
     return a2a_stats_cache.stats()
 
 
+@admin_router.get("/cache/encryption-keys/stats")
+@require_permission("admin.system_config", allow_admin_bypass=False)
+@rate_limit(requests_per_minute=30)
+async def get_encryption_key_cache_stats(
+    _user=Depends(get_current_user_with_permissions),
+    _db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """Get derived encryption key cache statistics for this worker.
+
+    Returns hit/miss/eviction counts and the size of the Argon2id
+    derived-key cache used when decrypting stored secrets.
+
+    Args:
+        _user: Authenticated user
+        _db: Database session for permission checks.
+
+    Returns:
+        Dict with cache statistics
+
+    Examples:
+        >>> from mcpgateway.admin import get_encryption_key_cache_stats
+        >>> get_encryption_key_cache_stats.__name__
+        'get_encryption_key_cache_stats'
+        >>> import inspect
+        >>> inspect.iscoroutinefunction(get_encryption_key_cache_stats)
+        True
+    """
+    return get_derived_key_cache_stats()
+
+
 @admin_router.get("/mcp-pool/metrics")
 @require_permission("admin.system_config", allow_admin_bypass=False)
 @rate_limit(requests_per_minute=60)
@@ -1457,6 +1488,30 @@ async def get_configuration_settings(
     }
 
 
+def _registry_not_modified(request: Optional[Request], response: Optional[Response], entity_type: str, *scope_parts: Any) -> Optional[Response]:
+    """Attach registry ETag headers to an admin listing, or short-circuit with 304.
+
+    Args:
+        request: Incoming request (None when called directly).
+        response: Outgoing response whose headers receive the ETag.
+        entity_type: Registry entity type (tools, resources, prompts, servers, gateways).
+        *scope_parts: Caller scope values that change the payload.
+
+    Returns:
+        A 304 response when the client's copy is current, otherwise None.
+
+    Examples:
+        >>> _registry_not_modified(None, None, "tools", "a@x.com") is None
+        True
+    """
+    if request is None:
+        return None
+    registry_headers, not_modified = registry_listing_headers(request, entity_type, *scope_parts)
+    if not_modified is None and response is not None:
+        response.headers.update(registry_headers)
+    return not_modified
+
+
 @admin_router.get("/servers", response_model=PaginatedResponse)
 @require_permission("servers.read", allow_admin_bypass=False)
 async def admin_list_servers(
@@ -1465,6 +1520,8 @@ async def admin_list_servers(
     include_inactive: bool = False,
     db: Session = Depends(get_db),
     user=Depends(get_current_user_with_permissions),
+    request: Request = None,
+    response: Response = None,
 ) -> Dict[str, Any]:
     """
     List servers for the admin UI with pagination support.
@@ -1478,6 +1535,8 @@ async def admin_list_servers(
         include_inactive (bool): Whether to include inactive servers.
         db (Session): The database session dependency.
         user (str): The authenticated user dependency.
+        request (Request): Incoming request, used for If-None-Match.
+        response (Response): Outgoing response used to attach ETag headers.
 
     Returns:
         Dict[str, Any]: A dictionary containing:
@@ -1494,6 +1553,10 @@ async def admin_list_servers(
     LOGGER.debug(f"User {get_user_email(user)} requested server list (page={page}, per_page={per_page})")
     user_email = get_user_email(user)
 
+    not_modified = _registry_not_modified(request, response, "servers", user_email)
+    if not_modified is not None:
+        return not_modified
+
     # Call server_service.list_servers with page-based pagination
     paginated_result = await server_service.list_servers(
         db=db,
@@ -2186,6 +2249,8 @@ async def admin_list_resources(
     include_inactive: bool = False,
     db: Session = Depends(get_db),
     user=Depends(get_current_user_with_permissions),
+    request: Request = None,
+    response: Response = None,
 ) -> Dict[str, Any]:
     """
     List resources for the admin UI with pagination support.
@@ -2199,6 +2264,8 @@ async def admin_list_resources(
         include_inactive (bool): Whether to include inactive resources in the results.
         db (Session): Database session dependency.
         user (str): Authenticated user dependency.
+        request (Request): Incoming request, used for If-None-Match.
+        response (Response): Outgoing response used to attach ETag headers.
 
     Returns:
         Dict with 'data', 'pagination', and 'links' keys containing paginated resources.
@@ -2212,6 +2279,10 @@ async def admin_list_resources(
     LOGGER.debug(f"User {get_user_email(user)} requested resource list (page={page}, per_page={per_page})")
     user_email = get_user_email(user)
 
+    not_modified = _registry_not_modified(request, response, "resources", user_email)
+    if not_modified is not None:
+        return not_modified
+
     # Call resource_service.list_resources with page-based pagination
     paginated_result = await resource_service.list_resources(
         db=db,
@@ -2237,6 +2308,8 @@ async def admin_list_prompts(
     include_inactive: bool = False,
     db: Session = Depends(get_db),
     user=Depends(get_current_user_with_permissions),
+    request: Request = None,
+    response: Response = None,
 ) -> Dict[str, Any]:
     """
     List prompts for the admin UI with pagination support.
@@ -2250,6 +2323,8 @@ async def admin_list_prompts(
         include_inactive (bool): Whether to include inactive prompts in the results.
         db (Session): Database session dependency.
         user (str): Authenticated user dependency.
+        request (Request): Incoming request, used for If-None-Match.
+        response (Response): Outgoing response used to attach ETag headers.
 
     Returns:
         Dict[str, Any]: A dictionary containing:
@@ -2266,6 +2341,10 @@ async def admin_list_prompts(
     LOGGER.debug(f"User {get_user_email(user)} requested prompt list (page={page}, per_page={per_page})")
     user_email = get_user_email(user)
 
+    not_modified = _registry_not_modified(request, response, "prompts", user_email)
+    if not_modified is not None:
+        return not_modified
+
     # Call prompt_service.list_prompts with page-based pagination
     paginated_result = await prompt_service.list_prompts(
         db=db,
@@ -2291,6 +2370,8 @@ async def admin_list_gateways(
     include_inactive: bool = False,
     db: Session = Depends(get_db),
     user=Depends(get_current_user_with_permissions),
+    request: Request = None,
+    response: Response = None,
 ) -> Dict[str, Any]:
     """
     List gateways for the admin UI with pagination support.
@@ -2304,6 +2385,8 @@ async def admin_list_gateways(
         include_inactive (bool): Whether to include inactive gateways in the results.
         db (Session): Database session dependency.
         user (str): Authenticated user dependency.
+        request (Request): Incoming request, used for If-None-Match.
+        response (Response): Outgoing response used to attach ETag headers.
 
     Returns:
         Dict[str, Any]: A dictionary containing:
@@ -2320,6 +2403,10 @@ async def admin_list_gateways(
     user_email = get_user_email(user)
     LOGGER.debug(f"User {user_email} requested gateway list (page={page}, per_page={per_page})")
 
+    not_modified = _registry_not_modified(request, response, "gateways", user_email)
+    if not_modified is not None:
+        return not_modified
+
     # Call gateway_service.list_gateways with page-based pagination
     paginated_result = await gateway_service.list_gateways(
         db=db,
@@ -6497,6 +6584,8 @@ async def admin_list_tools(
     include_inactive: bool = False,
     db: Session = Depends(get_db),
     user=Depends(get_current_user_with_permissions),
+    request: Request = None,
+    response: Response = None,
 ) -> Dict[str, Any]:
     """
     List tools for the admin UI with pagination support.
@@ -6510,6 +6599,8 @@ async def admin_list_tools(
         include_inactive (bool): Whether to include inactive tools in the results.
         db (Session): Database session dependency.
         user (str): Authenticated user dependency.
+        request (Request): Incoming request, used for If-None-Match.
+        response (Response): Outgoing response used to attach ETag headers.
 
     Returns:
         Dict with 'data', 'pagination', and 'links' keys containing paginated tools.
@@ -6518,6 +6609,10 @@ async def admin_list_tools(
     LOGGER.debug(f"User {get_user_email(user)} requested tool list (page={page}, per_page={per_page})")
     user_email = get_user_email(user)
     _is_admin = bool(user.get("is_admin", False) if isinstance(user, dict) else getattr(user, "is_admin", False))
+
+    not_modified = _registry_not_modified(request, response, "tools", user_email, _is_admin)
+    if not_modified is not None:
+        return not_modified
     _team_roles = _get_user_team_roles(db, user_email) if not _is_admin else {}
 
     # Call tool_service.list_tools with page-based pagination
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/alembic/versions/d2e3f4a5b6c7_add_response_time_sketch_to_metrics_hourly.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Add response_time_sketch to metrics hourly rollup tables.
+
+Revision ID: d2e3f4a5b6c7
+Revises: c1c2c3c4c5c6
+Create Date: 2026-02-10 09:00:00.000000
+
+Stores a serialized mergeable percentile sketch per hourly rollup so that
+percentiles over multi-hour ranges can be computed by merging rollups.
+Existing rows keep a NULL sketch until their hour is rolled up again.
+"""
+
+# Standard
+from typing import Sequence, Union
+
+# Third-Party
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d2e3f4a5b6c7"
+down_revision: Union[str, Sequence[str], None] = "c1c2c3c4c5c6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+HOURLY_TABLES = [
+    "tool_metrics_hourly",
+    "resource_metrics_hourly",
+    "prompt_metrics_hourly",
+    "server_metrics_hourly",
+    "a2a_agent_metrics_hourly",
+]
+
+
+def upgrade() -> None:
+    """Add the response_time_sketch column to each hourly rollup table."""
+    inspector = sa.inspect(op.get_bind())
+    existing_tables = inspector.get_table_names()
+
+    for table_name in HOURLY_TABLES:
+        if table_name not in existing_tables:
+            continue
+        columns = [col["name"] for col in inspector.get_columns(table_name)]
+        if "response_time_sketch" in columns:
+            continue
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.add_column(sa.Column("response_time_sketch", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove the response_time_sketch column from each hourly rollup table."""
+    inspector = sa.inspect(op.get_bind())
+    existing_tables = inspector.get_table_names()
+
+    for table_name in HOURLY_TABLES:
+        if table_name not in existing_tables:
+            continue
+        columns = [col["name"] for col in inspector.get_columns(table_name)]
+        if "response_time_sketch" not in columns:
+            continue
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.drop_column("response_time_sketch")
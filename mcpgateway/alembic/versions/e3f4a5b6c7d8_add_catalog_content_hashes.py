@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/alembic/versions/e3f4a5b6c7d8_add_catalog_content_hashes.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Add content hashes for incremental federation refresh.
+
+Revision ID: e3f4a5b6c7d8
+Revises: d2e3f4a5b6c7
+Create Date: 2026-02-12 09:00:00.000000
+
+Adds a content_hash column to tools, resources and prompts (hash of the
+upstream definition last synced into the row) and a catalog_hashes column to
+gateways (per-type digest of the last synced upstream catalog). Existing rows
+keep NULL hashes and are compared field by field on their next refresh.
+"""
+
+# Standard
+from typing import Sequence, Union
+
+# Third-Party
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e3f4a5b6c7d8"
+down_revision: Union[str, Sequence[str], None] = "d2e3f4a5b6c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NEW_COLUMNS = [
+    ("tools", "content_hash", sa.String(64)),
+    ("resources", "content_hash", sa.String(64)),
+    ("prompts", "content_hash", sa.String(64)),
+    ("gateways", "catalog_hashes", sa.JSON()),
+]
+
+
+def upgrade() -> None:
+    """Add content hash columns to catalog tables and gateways."""
+    inspector = sa.inspect(op.get_bind())
+    existing_tables = inspector.get_table_names()
+
+    for table_name, column_name, column_type in NEW_COLUMNS:
+        if table_name not in existing_tables:
+            continue
+        columns = [col["name"] for col in inspector.get_columns(table_name)]
+        if column_name in columns:
+            continue
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.add_column(sa.Column(column_name, column_type, nullable=True))
+
+
+def downgrade() -> None:
+    """Remove content hash columns from catalog tables and gateways."""
+    inspector = sa.inspect(op.get_bind())
+    existing_tables = inspector.get_table_names()
+
+    for table_name, column_name, _ in NEW_COLUMNS:
+        if table_name not in existing_tables:
+            continue
+        columns = [col["name"] for col in inspector.get_columns(table_name)]
+        if column_name not in columns:
+            continue
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.drop_column(column_name)
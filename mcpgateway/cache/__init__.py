@@ -11,6 +11,7 @@ Provides caching components for the MCP Gateway including:
 - GlobalConfig caching for passthrough headers
 - Auth caching for user, team, and token revocation data
 - Registry caching for tools, prompts, resources, agents, servers, gateways
+- Scope-aware listing caching for tools/list, resources/list, prompts/list
 - Admin stats caching for dashboard statistics
 
 Note: Imports are lazy to avoid circular dependencies with services.
@@ -28,6 +29,8 @@ __all__ = [
     "CachedAuthContext",
     "GlobalConfigCache",
     "global_config_cache",
+    "ListingCache",
+    "listing_cache",
     "MetricsCache",
     "metrics_cache",
     "RegistryCache",
@@ -47,6 +50,7 @@ if TYPE_CHECKING:
     from mcpgateway.cache.admin_stats_cache import AdminStatsCache, admin_stats_cache
     from mcpgateway.cache.auth_cache import AuthCache, auth_cache, CachedAuthContext
     from mcpgateway.cache.global_config_cache import GlobalConfigCache, global_config_cache
+    from mcpgateway.cache.listing_cache import ListingCache, listing_cache
     from mcpgateway.cache.metrics_cache import MetricsCache, metrics_cache
     from mcpgateway.cache.registry_cache import RegistryCache, registry_cache
     from mcpgateway.cache.tool_lookup_cache import ToolLookupCache, tool_lookup_cache
@@ -87,6 +91,10 @@ def __getattr__(name: str):
         from mcpgateway.cache.global_config_cache import GlobalConfigCache, global_config_cache
 
         return global_config_cache if name == "global_config_cache" else GlobalConfigCache
+    if name in ("ListingCache", "listing_cache"):
+        from mcpgateway.cache.listing_cache import ListingCache, listing_cache
+
+        return listing_cache if name == "listing_cache" else ListingCache
     if name in ("MetricsCache", "metrics_cache"):
         from mcpgateway.cache.metrics_cache import MetricsCache, metrics_cache
 
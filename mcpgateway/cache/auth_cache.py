@@ -13,11 +13,17 @@ revocation status to reduce database queries during authentication.
 Performance Impact:
     - Before: 3-4 DB queries per authenticated request
     - After: 0-1 DB queries (cache hit) per TTL period
+    - RBAC: compiled permission sets are shared by all requests in the process,
+      so permission checks are set lookups instead of role queries
+    - JWT: verified token payloads are kept until the token expires, so repeated
+      requests with the same token skip signature verification
 
 Security Considerations:
     - Short TTLs for revocation data (30s default) to limit exposure window
     - Cache invalidation on token revocation, user update, team change
-    - JWT payloads are NOT cached (security risk)
+    - JWT payloads are NOT cached in Redis; verified payloads are kept in
+      process memory only, keyed by token hash, and dropped once the token's
+      JTI is known to be revoked
     - Graceful fallback to DB on cache failure
 
 Examples:
@@ -30,11 +36,12 @@ Examples:
 
 # Standard
 import asyncio
+from collections import OrderedDict
 from dataclasses import dataclass
 import logging
 import threading
 import time
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +49,9 @@ logger = logging.getLogger(__name__)
 # This allows distinguishing between "not a member" (cached) and "cache miss"
 _NOT_A_MEMBER_SENTINEL = "__NOT_A_MEMBER__"
 
+# Permission index scope used for the user's is_admin flag
+_ADMIN_FLAG_SCOPE = "__is_admin__"
+
 
 @dataclass
 class CachedAuthContext:
@@ -70,6 +80,41 @@ class CachedAuthContext:
     is_token_revoked: bool = False
 
 
+@dataclass(frozen=True)
+class CompiledPermissions:
+    """Effective permissions of a user in one scope, compiled for O(1) checks.
+
+    Attributes:
+        permissions: Effective permission names collected from all active roles
+        wildcard: Whether the set grants every permission ("*")
+        has_admin_permission: Whether the set grants any admin.* permission
+        roles: Role summaries used for permission audit logging
+
+    Examples:
+        >>> compiled = CompiledPermissions(permissions=frozenset({"tools.read"}))
+        >>> compiled.allows("tools.read"), compiled.allows("tools.create")
+        (True, False)
+        >>> CompiledPermissions(permissions=frozenset({"*"}), wildcard=True).allows("tools.create")
+        True
+    """
+
+    permissions: FrozenSet[str]
+    wildcard: bool = False
+    has_admin_permission: bool = False
+    roles: Tuple[Dict[str, Any], ...] = ()
+
+    def allows(self, permission: str) -> bool:
+        """Check whether the compiled set grants a permission.
+
+        Args:
+            permission: Permission name (e.g., 'tools.create')
+
+        Returns:
+            bool: True if the permission or the wildcard is granted
+        """
+        return self.wildcard or permission in self.permissions
+
+
 @dataclass
 class CacheEntry:
     """Cache entry with value and expiry timestamp.
@@ -151,6 +196,12 @@ class AuthCache:
             self._role_ttl = role_ttl or getattr(settings, "auth_cache_role_ttl", 60)
             self._teams_list_ttl = getattr(settings, "auth_cache_teams_ttl", 60)
             self._teams_list_enabled = getattr(settings, "auth_cache_teams_enabled", True)
+            self._permissions_enabled = getattr(settings, "auth_cache_permissions_enabled", True)
+            self._permission_ttl = getattr(settings, "auth_cache_permission_ttl", 300)
+            self._permission_max_entries = getattr(settings, "auth_cache_permission_max_entries", 10000)
+            self._jwt_enabled = getattr(settings, "auth_cache_jwt_enabled", True)
+            self._jwt_max_entries = getattr(settings, "auth_cache_jwt_max_entries", 10000)
+            self._jwt_max_ttl = getattr(settings, "auth_cache_jwt_max_ttl", 900)
             self._enabled = enabled if enabled is not None else getattr(settings, "auth_cache_enabled", True)
             self._cache_prefix = getattr(settings, "cache_prefix", "mcpgw:")
         except ImportError:
@@ -160,6 +211,12 @@ class AuthCache:
             self._role_ttl = role_ttl or 60
             self._teams_list_ttl = 60
             self._teams_list_enabled = True
+            self._permissions_enabled = True
+            self._permission_ttl = 300
+            self._permission_max_entries = 10000
+            self._jwt_enabled = True
+            self._jwt_max_entries = 10000
+            self._jwt_max_ttl = 900
             self._enabled = enabled if enabled is not None else True
             self._cache_prefix = "mcpgw:"
 
@@ -171,6 +228,14 @@ class AuthCache:
         self._role_cache: Dict[str, CacheEntry] = {}
         self._teams_list_cache: Dict[str, CacheEntry] = {}
 
+        # Process-wide RBAC permission index (LRU, L1 only; invalidated via pubsub)
+        self._permission_cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        # Bumped on every permission invalidation so in-flight computations can't store stale sets
+        self._permission_generation = 0
+
+        # Verified JWT payloads keyed by token hash (LRU, L1 only, never shared via Redis)
+        self._verified_token_cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
         # Known revoked tokens (fast local lookup)
         self._revoked_jtis: Set[str] = set()
 
@@ -186,6 +251,10 @@ class AuthCache:
         self._miss_count = 0
         self._redis_hit_count = 0
         self._redis_miss_count = 0
+        self._permission_hit_count = 0
+        self._permission_miss_count = 0
+        self._jwt_hit_count = 0
+        self._jwt_miss_count = 0
 
         logger.info(
             f"AuthCache initialized: enabled={self._enabled}, "
@@ -397,6 +466,8 @@ class AuthCache:
             for key in team_keys_to_remove:
                 self._team_cache.pop(key, None)
 
+            self._evict_permissions(email=email)
+
         # Clear Redis
         redis = await self._get_redis_client()
         if redis:
@@ -445,6 +516,8 @@ class AuthCache:
             for key in keys_to_remove:
                 self._context_cache.pop(key, None)
 
+            self._evict_verified_tokens(jti)
+
         # Update Redis
         redis = await self._get_redis_client()
         if redis:
@@ -490,6 +563,7 @@ class AuthCache:
             keys_to_remove = [k for k in self._context_cache if k.startswith(f"{email}:")]
             for key in keys_to_remove:
                 self._context_cache.pop(key, None)
+            self._evict_permissions(email=email)
 
         # Clear Redis
         redis = await self._get_redis_client()
@@ -624,6 +698,7 @@ class AuthCache:
         # Clear in-memory cache
         with self._lock:
             self._role_cache.pop(cache_key, None)
+            self._evict_permissions(email=email)
 
         # Clear Redis
         redis = await self._get_redis_client()
@@ -655,6 +730,7 @@ class AuthCache:
             keys_to_remove = [k for k in self._role_cache if k.endswith(f":{team_id}")]
             for key in keys_to_remove:
                 self._role_cache.pop(key, None)
+            self._evict_permissions(team_id=team_id)
 
         # Clear Redis
         redis = await self._get_redis_client()
@@ -1114,6 +1190,355 @@ class AuthCache:
         except Exception as e:
             logger.warning(f"AuthCache sync_revoked_tokens failed: {e}")
 
+    @property
+    def permission_generation(self) -> int:
+        """Current permission invalidation generation.
+
+        Read it before computing permissions from the database and pass it to
+        :meth:`set_compiled_permissions`, so a result computed concurrently with
+        an invalidation is never cached.
+
+        Returns:
+            int: Generation counter, bumped on every permission invalidation
+
+        Examples:
+            >>> cache = AuthCache(enabled=True)
+            >>> generation = cache.permission_generation
+            >>> cache.invalidate_permissions_local("test@example.com")
+            >>> cache.permission_generation == generation + 1
+            True
+        """
+        return self._permission_generation
+
+    def _permissions_active(self) -> bool:
+        """Check whether the permission index is enabled.
+
+        Returns:
+            bool: True if both the auth cache and the permission index are enabled
+        """
+        return self._enabled and self._permissions_enabled
+
+    def get_compiled_permissions(self, cache_key: str) -> Optional[CompiledPermissions]:
+        """Get compiled permissions from the process-wide permission index.
+
+        The index is shared by every PermissionService instance in the process,
+        so per-request services reuse permissions compiled by earlier requests.
+
+        Args:
+            cache_key: Permission scope key ("email:team_id", "email:global" or "email:__anyteam__")
+
+        Returns:
+            CompiledPermissions on a hit, None on a miss or when disabled
+
+        Examples:
+            >>> cache = AuthCache(enabled=True)
+            >>> cache.get_compiled_permissions("test@example.com:global") is None
+            True
+            >>> compiled = CompiledPermissions(permissions=frozenset({"tools.read"}))
+            >>> cache.set_compiled_permissions("test@example.com:global", compiled, cache.permission_generation)
+            >>> cache.get_compiled_permissions("test@example.com:global").allows("tools.read")
+            True
+        """
+        return self._load_permission_entry(cache_key)
+
+    def _load_permission_entry(self, cache_key: str) -> Any:
+        """Look up a live permission index entry and mark it recently used.
+
+        Args:
+            cache_key: Permission scope key
+
+        Returns:
+            The stored value, or None on a miss or when disabled
+        """
+        if not self._permissions_active():
+            return None
+        with self._lock:
+            entry = self._permission_cache.get(cache_key)
+            if entry is None or entry.is_expired():
+                if entry is not None:
+                    self._permission_cache.pop(cache_key, None)
+                self._permission_miss_count += 1
+                return None
+            self._permission_cache.move_to_end(cache_key)
+            self._permission_hit_count += 1
+            return entry.value
+
+    def set_compiled_permissions(self, cache_key: str, compiled: CompiledPermissions, generation: int) -> None:
+        """Store compiled permissions in the process-wide permission index.
+
+        The entry is dropped if any permission invalidation happened since
+        ``generation`` was read. The least recently used entries are evicted
+        once the index exceeds its configured size.
+
+        Args:
+            cache_key: Permission scope key
+            compiled: Compiled permission set
+            generation: Value of :attr:`permission_generation` read before computing ``compiled``
+
+        Examples:
+            >>> cache = AuthCache(enabled=True)
+            >>> stale = cache.permission_generation
+            >>> cache.invalidate_permissions_local()
+            >>> cache.set_compiled_permissions("a@example.com:global", CompiledPermissions(permissions=frozenset()), stale)
+            >>> cache.get_compiled_permissions("a@example.com:global") is None
+            True
+        """
+        self._store_permission_entry(cache_key, compiled, generation)
+
+    def get_user_is_admin(self, email: str) -> Optional[bool]:
+        """Get the cached is_admin flag for a user.
+
+        Args:
+            email: User email
+
+        Returns:
+            The cached flag, or None on a miss
+
+        Examples:
+            >>> cache = AuthCache(enabled=True)
+            >>> cache.set_user_is_admin("admin@example.com", True, cache.permission_generation)
+            >>> cache.get_user_is_admin("admin@example.com")
+            True
+            >>> cache.get_user_is_admin("other@example.com") is None
+            True
+        """
+        return self._load_permission_entry(f"{email}:{_ADMIN_FLAG_SCOPE}")
+
+    def set_user_is_admin(self, email: str, is_admin: bool, generation: int) -> None:
+        """Cache the is_admin flag for a user in the permission index.
+
+        Args:
+            email: User email
+            is_admin: Whether the user is an administrator
+            generation: Value of :attr:`permission_generation` read before the lookup
+        """
+        self._store_permission_entry(f"{email}:{_ADMIN_FLAG_SCOPE}", is_admin, generation)
+
+    def _store_permission_entry(self, cache_key: str, value: Any, generation: int) -> None:
+        """Insert a permission index entry, enforcing generation and size bounds.
+
+        Args:
+            cache_key: Permission scope key
+            value: Value to store
+            generation: Generation read before computing the value
+        """
+        if not self._permissions_active():
+            return
+        with self._lock:
+            if generation != self._permission_generation:
+                return
+            self._permission_cache[cache_key] = CacheEntry(value=value, expiry=time.time() + self._permission_ttl)
+            self._permission_cache.move_to_end(cache_key)
+            while len(self._permission_cache) > self._permission_max_entries:
+                self._permission_cache.popitem(last=False)
+
+    def _evict_permissions(self, email: Optional[str] = None, team_id: Optional[str] = None) -> None:
+        """Drop permission index entries; caller must hold the lock.
+
+        Args:
+            email: Drop all entries for this user
+            team_id: Drop entries scoped to this team and all any-team entries
+        """
+        self._permission_generation += 1
+        if email is None and team_id is None:
+            self._permission_cache.clear()
+            return
+        if email is not None:
+            prefix = f"{email}:"
+            keys_to_remove = [k for k in self._permission_cache if k.startswith(prefix)]
+        else:
+            suffix = f":{team_id}"
+            keys_to_remove = [k for k in self._permission_cache if k.endswith(suffix) or k.endswith(":__anyteam__")]
+        for key in keys_to_remove:
+            self._permission_cache.pop(key, None)
+
+    def invalidate_permissions_local(self, email: Optional[str] = None, team_id: Optional[str] = None) -> None:
+        """Drop permission index entries in this process only.
+
+        Used by the cross-worker invalidation subscriber, which must not
+        re-publish the message it is handling.
+
+        Args:
+            email: Drop all entries for this user (all users when both arguments are None)
+            team_id: Drop entries scoped to this team
+
+        Examples:
+            >>> cache = AuthCache(enabled=True)
+            >>> compiled = CompiledPermissions(permissions=frozenset({"tools.read"}))
+            >>> cache.set_compiled_permissions("a@example.com:team-1", compiled, cache.permission_generation)
+            >>> cache.set_compiled_permissions("b@example.com:global", compiled, cache.permission_generation)
+            >>> cache.invalidate_permissions_local(team_id="team-1")
+            >>> cache.get_compiled_permissions("a@example.com:team-1") is None
+            True
+            >>> cache.get_compiled_permissions("b@example.com:global") is not None
+            True
+        """
+        with self._lock:
+            self._evict_permissions(email=email, team_id=team_id)
+
+    async def invalidate_permissions(self, email: Optional[str] = None) -> None:
+        """Invalidate compiled permissions in every worker.
+
+        Call this when role assignments or role definitions change.
+
+        Args:
+            email: User whose permissions changed (all users when None, e.g. after a role update)
+
+        Examples:
+            >>> import asyncio
+            >>> cache = AuthCache()
+            >>> asyncio.run(cache.invalidate_permissions("test@example.com"))
+        """
+        logger.debug(f"AuthCache: Invalidating permissions for {email or 'all users'}")
+
+        self.invalidate_permissions_local(email=email)
+
+        redis = await self._get_redis_client()
+        if redis:
+            try:
+                await redis.publish("mcpgw:auth:invalidate", f"permissions:{email or '*'}")
+            except Exception as e:
+                logger.warning(f"AuthCache Redis invalidate_permissions failed: {e}")
+
+    def get_verified_token(self, token_hash: str, fingerprint: Any) -> Optional[Dict[str, Any]]:
+        """Get a previously verified JWT payload.
+
+        Entries are only returned while the token is unexpired, the verification
+        settings that accepted it are unchanged, and its JTI is not known to be
+        revoked locally (revocations arrive through invalidate_revocation,
+        sync_revoked_tokens and the cross-worker invalidation channel). Callers
+        still run their usual revocation and user checks on the payload.
+
+        Args:
+            token_hash: SHA-256 hex digest of the raw token
+            fingerprint: Verification settings the payload was validated against
+
+        Returns:
+            A copy of the verified payload, or None on a miss
+
+        Examples:
+            >>> cache = AuthCache(enabled=True)
+            >>> import time
+            >>> payload = {"sub": "a@example.com", "jti": "j1", "exp": time.time() + 60}
+            >>> cache.set_verified_token("h1", "fp", payload)
+            >>> cache.get_verified_token("h1", "fp")["sub"]
+            'a@example.com'
+            >>> cache.get_verified_token("h1", "other-settings") is None
+            True
+            >>> cache._revoked_jtis.add("j1")
+            >>> cache.get_verified_token("h1", "fp") is None
+            True
+        """
+        if not (self._enabled and self._jwt_enabled):
+            return None
+        with self._lock:
+            entry = self._verified_token_cache.get(token_hash)
+            if entry is None:
+                self._jwt_miss_count += 1
+                return None
+            entry_fingerprint, jti, payload = entry.value
+            if entry.is_expired() or entry_fingerprint != fingerprint or (jti is not None and self._is_revoked_locally(jti)):
+                self._verified_token_cache.pop(token_hash, None)
+                self._jwt_miss_count += 1
+                return None
+            self._verified_token_cache.move_to_end(token_hash)
+            self._jwt_hit_count += 1
+        return dict(payload)
+
+    def set_verified_token(self, token_hash: str, fingerprint: Any, payload: Dict[str, Any]) -> None:
+        """Cache a verified JWT payload until the token expires.
+
+        The entry lives until the token's ``exp`` claim, capped at
+        ``auth_cache_jwt_max_ttl`` seconds (which also bounds tokens without
+        an expiration). The least recently used entries are evicted once the
+        cache exceeds ``auth_cache_jwt_max_entries``.
+
+        Args:
+            token_hash: SHA-256 hex digest of the raw token
+            fingerprint: Verification settings the payload was validated against
+            payload: Verified token payload
+        """
+        if not (self._enabled and self._jwt_enabled):
+            return
+        now = time.time()
+        expiry = now + self._jwt_max_ttl
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expiry = min(expiry, float(exp))
+        if expiry <= now:
+            return
+        jti = payload.get("jti")
+        with self._lock:
+            if jti is not None and self._is_revoked_locally(jti):
+                return
+            self._verified_token_cache[token_hash] = CacheEntry(value=(fingerprint, jti, dict(payload)), expiry=expiry)
+            self._verified_token_cache.move_to_end(token_hash)
+            while len(self._verified_token_cache) > self._jwt_max_entries:
+                self._verified_token_cache.popitem(last=False)
+
+    def _is_revoked_locally(self, jti: str) -> bool:
+        """Check revocation using only in-process state; caller must hold the lock.
+
+        Args:
+            jti: JWT ID
+
+        Returns:
+            bool: True if the token is known to be revoked
+        """
+        if jti in self._revoked_jtis:
+            return True
+        entry = self._revocation_cache.get(jti)
+        return bool(entry and entry.value is True and not entry.is_expired())
+
+    def _evict_verified_tokens(self, jti: str) -> None:
+        """Drop verified payloads carrying a JTI; caller must hold the lock.
+
+        Args:
+            jti: JWT ID of the revoked token
+        """
+        keys_to_remove = [k for k, entry in self._verified_token_cache.items() if entry.value[1] == jti]
+        for key in keys_to_remove:
+            self._verified_token_cache.pop(key, None)
+
+    def mark_token_revoked_local(self, jti: str) -> None:
+        """Record a revocation published by another worker.
+
+        Adds the JTI to the local revoked set and drops verified payloads and
+        auth contexts for the token, without touching Redis.
+
+        Args:
+            jti: JWT ID of the revoked token
+
+        Examples:
+            >>> cache = AuthCache(enabled=True)
+            >>> cache.set_verified_token("h1", "fp", {"sub": "a@example.com", "jti": "j1"})
+            >>> cache.mark_token_revoked_local("j1")
+            >>> cache.get_verified_token("h1", "fp") is None
+            True
+        """
+        with self._lock:
+            self._revoked_jtis.add(jti)
+            self._revocation_cache.pop(jti, None)
+            keys_to_remove = [k for k in self._context_cache if k.endswith(f":{jti}")]
+            for key in keys_to_remove:
+                self._context_cache.pop(key, None)
+            self._evict_verified_tokens(jti)
+
+    def invalidate_verified_tokens(self) -> None:
+        """Drop all cached verified JWT payloads.
+
+        Call this when JWT keys or verification settings change.
+
+        Examples:
+            >>> cache = AuthCache(enabled=True)
+            >>> cache.set_verified_token("h1", "fp", {"sub": "a@example.com"})
+            >>> cache.invalidate_verified_tokens()
+            >>> cache.get_verified_token("h1", "fp") is None
+            True
+        """
+        with self._lock:
+            self._verified_token_cache.clear()
+
     def invalidate_all(self) -> None:
         """Invalidate all cached data.
 
@@ -1130,6 +1555,8 @@ class AuthCache:
             self._context_cache.clear()
             self._role_cache.clear()
             self._teams_list_cache.clear()
+            self._evict_permissions()
+            self._verified_token_cache.clear()
             # Don't clear _revoked_jtis as those are confirmed revocations
 
         logger.info("AuthCache: All caches invalidated")
@@ -1148,6 +1575,7 @@ class AuthCache:
         """
         total = self._hit_count + self._miss_count
         redis_total = self._redis_hit_count + self._redis_miss_count
+        jwt_total = self._jwt_hit_count + self._jwt_miss_count
 
         return {
             "enabled": self._enabled,
@@ -1163,12 +1591,22 @@ class AuthCache:
             "role_cache_size": len(self._role_cache),
             "teams_list_cache_size": len(self._teams_list_cache),
             "team_membership_cache_size": len(self._team_cache),
+            "permission_cache_size": len(self._permission_cache),
+            "permission_hit_count": self._permission_hit_count,
+            "permission_miss_count": self._permission_miss_count,
             "user_ttl": self._user_ttl,
             "revocation_ttl": self._revocation_ttl,
             "team_ttl": self._team_ttl,
             "role_ttl": self._role_ttl,
             "teams_list_enabled": self._teams_list_enabled,
             "teams_list_ttl": self._teams_list_ttl,
+            "permissions_enabled": self._permissions_enabled,
+            "permission_ttl": self._permission_ttl,
+            "jwt_cache_enabled": self._jwt_enabled,
+            "jwt_cache_size": len(self._verified_token_cache),
+            "jwt_hit_count": self._jwt_hit_count,
+            "jwt_miss_count": self._jwt_miss_count,
+            "jwt_hit_rate": self._jwt_hit_count / jwt_total if jwt_total > 0 else 0.0,
         }
 
     def reset_stats(self) -> None:
@@ -1185,6 +1623,10 @@ class AuthCache:
         self._miss_count = 0
         self._redis_hit_count = 0
         self._redis_miss_count = 0
+        self._permission_hit_count = 0
+        self._permission_miss_count = 0
+        self._jwt_hit_count = 0
+        self._jwt_miss_count = 0
 
 
 # Global singleton instance
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/cache/listing_cache.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Scope-aware listing cache for tools/list, resources/list and prompts/list.
+
+RegistryCache only serves unscoped (admin) listings, but almost every MCP
+client authenticates with a team-scoped token. This cache keys each page of a
+listing by the caller's normalized visibility scope (sorted team ids plus a
+public/admin flag, and the owner email where owner access applies) and stores
+the JSON-RPC result as pre-serialized bytes. A hit costs one orjson parse
+instead of a joined query plus Pydantic conversion of every row.
+
+Entries are per worker, bounded by count and total size, expire with the
+matching registry TTL and are dropped whenever RegistryCache invalidates the
+corresponding type, locally or via CacheInvalidationSubscriber.
+
+Examples:
+    >>> cache = ListingCache()
+    >>> key = cache.make_key("tools", ListingCache.scope_key("a@x.com", ["t2", "t1"]))
+    >>> key
+    'tools||teams=t1,t2|owner=a@x.com||'
+    >>> cache.set(key, b'{"tools":[]}', "tools")
+    >>> cache.get(key)
+    b'{"tools":[]}'
+    >>> cache.invalidate_tools()
+    >>> cache.get(key) is None
+    True
+"""
+
+# Future
+from __future__ import annotations
+
+# Standard
+from collections import OrderedDict
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+# First-Party
+from mcpgateway.cache.registry_cache import get_registry_cache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ListingEntry:
+    """Cached listing page.
+
+    Attributes:
+        data: Pre-serialized JSON-RPC result.
+        expiry: Unix timestamp when the entry expires.
+        kind: Listing type (tools, resources, prompts).
+        server_scoped: True when the listing is restricted to a virtual server.
+    """
+
+    data: bytes
+    expiry: float
+    kind: str
+    server_scoped: bool
+
+
+class ListingCache:
+    """Per-worker LRU of serialized listing pages keyed by visibility scope.
+
+    Examples:
+        >>> ListingCache.scope_key(None, None)
+        'admin'
+        >>> ListingCache.scope_key("a@x.com", [])
+        'public'
+    """
+
+    def __init__(self) -> None:
+        """Initialize cache settings and register registry invalidation listeners.
+
+        Examples:
+            >>> isinstance(ListingCache().enabled, bool)
+            True
+        """
+        try:
+            # First-Party
+            from mcpgateway.config import settings  # pylint: disable=import-outside-toplevel
+
+            self._enabled = getattr(settings, "listing_cache_enabled", True)
+            self._max_entries = getattr(settings, "listing_cache_max_entries", 2000)
+            self._max_bytes = getattr(settings, "listing_cache_max_bytes", 64 * 1024 * 1024)
+            self._ttls = {
+                "tools": getattr(settings, "registry_cache_tools_ttl", 20),
+                "resources": getattr(settings, "registry_cache_resources_ttl", 15),
+                "prompts": getattr(settings, "registry_cache_prompts_ttl", 15),
+            }
+        except ImportError:
+            self._enabled = True
+            self._max_entries = 2000
+            self._max_bytes = 64 * 1024 * 1024
+            self._ttls = {"tools": 20, "resources": 15, "prompts": 15}
+
+        self._cache: "OrderedDict[str, ListingEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hit_count = 0
+        self._miss_count = 0
+
+        registry = get_registry_cache()
+        registry.add_invalidation_listener("tools", self.invalidate_tools)
+        registry.add_invalidation_listener("resources", self.invalidate_resources)
+        registry.add_invalidation_listener("prompts", self.invalidate_prompts)
+        registry.add_invalidation_listener("servers", self.invalidate_servers)
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if the cache is enabled.
+
+        Returns:
+            True if enabled, otherwise False.
+        """
+        return self._enabled
+
+    @staticmethod
+    def scope_key(user_email: Optional[str], token_teams: Optional[List[str]]) -> str:
+        """Normalize a ``(user_email, token_teams)`` visibility scope into a cache key part.
+
+        Public-only scopes are shared by every caller; team scopes include the
+        owner email because services also return items the caller owns.
+
+        Args:
+            user_email: Email used for owner access, or None for unrestricted admins.
+            token_teams: Team ids from the token; None for admins, [] for public-only.
+
+        Returns:
+            Scope key string.
+
+        Examples:
+            >>> ListingCache.scope_key("a@x.com", ["t2", "t1", "t2"])
+            'teams=t1,t2|owner=a@x.com'
+        """
+        if token_teams is None:
+            return "admin" if user_email is None else f"user={user_email}"
+        if not token_teams:
+            return "public"
+        return f"teams={','.join(sorted(set(token_teams)))}|owner={user_email or ''}"
+
+    @staticmethod
+    def make_key(kind: str, scope: str, server_id: Optional[str] = None, cursor: Optional[str] = None, requester: Optional[str] = None) -> str:
+        """Build the cache key for one listing page.
+
+        Args:
+            kind: Listing type (tools, resources, prompts).
+            scope: Result of :meth:`scope_key`.
+            server_id: Virtual server the listing is restricted to, if any.
+            cursor: Pagination cursor, if any.
+            requester: Extra discriminator for per-requester rendering (e.g. header masking).
+
+        Returns:
+            Cache key string.
+
+        Examples:
+            >>> ListingCache.make_key("prompts", "public", server_id="s1", cursor="c")
+            'prompts|s1|public||c'
+        """
+        return f"{kind}|{server_id or ''}|{scope}|{requester or ''}|{cursor or ''}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return a live cached page and mark it most recently used.
+
+        Args:
+            key: Cache key from :meth:`make_key`.
+
+        Returns:
+            Serialized page, or None on miss.
+        """
+        if not self._enabled:
+            return None
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None or entry.expiry <= time.time():
+                if entry is not None:
+                    self._drop(key)
+                self._miss_count += 1
+                return None
+            self._cache.move_to_end(key)
+            self._hit_count += 1
+            return entry.data
+
+    def set(self, key: str, data: bytes, kind: str) -> None:
+        """Store a serialized page, evicting least recently used pages to stay within bounds.
+
+        Args:
+            key: Cache key from :meth:`make_key`.
+            data: Serialized JSON-RPC result.
+            kind: Listing type, used for TTL and invalidation.
+        """
+        if not self._enabled or len(data) > self._max_bytes:
+            return
+        parts = key.split("|", 2)
+        entry = ListingEntry(data=data, expiry=time.time() + self._ttls.get(kind, 15), kind=kind, server_scoped=len(parts) > 1 and parts[1] != "")
+        with self._lock:
+            if key in self._cache:
+                self._drop(key)
+            self._cache[key] = entry
+            self._bytes += len(data)
+            while self._cache and (len(self._cache) > self._max_entries or self._bytes > self._max_bytes):
+                self._drop(next(iter(self._cache)))
+
+    def _drop(self, key: str) -> None:
+        """Remove an entry; caller must hold the lock.
+
+        Args:
+            key: Cache key.
+        """
+        entry = self._cache.pop(key)
+        self._bytes -= len(entry.data)
+
+    def _invalidate_where(self, kind: Optional[str] = None, server_scoped: bool = False) -> int:
+        """Drop entries of a kind, or every server-scoped entry.
+
+        Args:
+            kind: Listing type to drop.
+            server_scoped: Drop all server-scoped entries instead.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            keys = [k for k, e in self._cache.items() if (server_scoped and e.server_scoped) or (kind is not None and e.kind == kind)]
+            for key in keys:
+                self._drop(key)
+        return len(keys)
+
+    def invalidate_tools(self) -> None:
+        """Drop cached tools/list pages."""
+        self._invalidate_where(kind="tools")
+
+    def invalidate_resources(self) -> None:
+        """Drop cached resources/list pages."""
+        self._invalidate_where(kind="resources")
+
+    def invalidate_prompts(self) -> None:
+        """Drop cached prompts/list pages."""
+        self._invalidate_where(kind="prompts")
+
+    def invalidate_servers(self) -> None:
+        """Drop server-scoped pages, whose contents depend on server associations."""
+        self._invalidate_where(server_scoped=True)
+
+    def invalidate_all(self) -> None:
+        """Drop every cached page.
+
+        Examples:
+            >>> cache = ListingCache()
+            >>> cache.set("tools||admin||", b"{}", "tools")
+            >>> cache.invalidate_all()
+            >>> cache.stats()["entries"]
+            0
+        """
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache statistics.
+
+        Returns:
+            Hit/miss counters, hit rate and occupancy.
+        """
+        total = self._hit_count + self._miss_count
+        return {
+            "enabled": self._enabled,
+            "hit_count": self._hit_count,
+            "miss_count": self._miss_count,
+            "hit_rate": self._hit_count / total if total > 0 else 0.0,
+            "entries": len(self._cache),
+            "size_bytes": self._bytes,
+            "max_entries": self._max_entries,
+            "max_bytes": self._max_bytes,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss counters."""
+        self._hit_count = 0
+        self._miss_count = 0
+
+
+listing_cache = ListingCache()
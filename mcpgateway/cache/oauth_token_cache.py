@@ -0,0 +1,603 @@
+# -*- coding: utf-8 -*-
+"""OAuth access-token cache with proactive refresh and single-flight fetches.
+
+OAuthManager.get_access_token is called for every OAuth-protected tool
+invocation and gateway health check. Without caching, each call decrypts the
+client secret and performs a full round trip to the identity provider. This
+cache keeps issued tokens per (grant, token_url, client, scopes[, resource owner])
+for the lifetime reported by ``expires_in``, refreshes them in the background
+shortly before they expire, and collapses concurrent fetches for the same key
+into one token request. When CACHE_TYPE=redis, tokens are also shared across
+workers through Redis, encrypted with AUTH_ENCRYPTION_SECRET.
+"""
+
+# Future
+from __future__ import annotations
+
+# Standard
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+# Third-Party
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+def _secret_digest(secret: Any) -> str:
+    """Return a digest identifying a credential without exposing it in the key.
+
+    Args:
+        secret: Client secret or password as configured (may be encrypted or empty).
+
+    Returns:
+        Hex digest, or an empty string when no secret is set.
+
+    Examples:
+        >>> _secret_digest(None)
+        ''
+        >>> _secret_digest("s") == _secret_digest("s") != _secret_digest("t")
+        True
+    """
+    if not secret:
+        return ""
+    return hashlib.sha256(str(secret).encode("utf-8")).hexdigest()
+
+
+class IssuedAccessToken(str):
+    """Access token string that remembers the lifetime reported by the IdP.
+
+    Subclassing ``str`` keeps OAuthManager flows returning plain tokens to
+    existing callers while letting the cache honor ``expires_in``.
+
+    Examples:
+        >>> tok = IssuedAccessToken("abc", expires_in=120)
+        >>> tok == "abc", tok.expires_in
+        (True, 120)
+        >>> IssuedAccessToken("abc").expires_in is None
+        True
+    """
+
+    expires_in: Optional[int]
+
+    def __new__(cls, value: str, expires_in: Optional[int] = None) -> "IssuedAccessToken":
+        """Create a token string carrying its lifetime.
+
+        Args:
+            value: Access token.
+            expires_in: Token lifetime in seconds, if the IdP reported one.
+
+        Returns:
+            New IssuedAccessToken instance.
+        """
+        obj = super().__new__(cls, value)
+        obj.expires_in = expires_in
+        return obj
+
+    @classmethod
+    def from_response(cls, token_response: Dict[str, Any]) -> "IssuedAccessToken":
+        """Build a token from a parsed token endpoint response.
+
+        Args:
+            token_response: Parsed JSON or form-encoded token response.
+
+        Returns:
+            IssuedAccessToken with ``expires_in`` parsed when present and valid.
+
+        Examples:
+            >>> IssuedAccessToken.from_response({"access_token": "t", "expires_in": "300"}).expires_in
+            300
+            >>> IssuedAccessToken.from_response({"access_token": "t", "expires_in": "soon"}).expires_in is None
+            True
+        """
+        expires_in = token_response.get("expires_in")
+        try:
+            lifetime = int(expires_in) if expires_in is not None else None
+        except (TypeError, ValueError):
+            lifetime = None
+        return cls(token_response["access_token"], expires_in=lifetime)
+
+
+@dataclass
+class TokenEntry:
+    """Cached token with absolute expiry and proactive refresh timestamps."""
+
+    token: str
+    expires_at: float
+    refresh_at: float
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Return True if the token must no longer be served.
+
+        Args:
+            now: Current time (defaults to ``time.time()``).
+
+        Returns:
+            True if expired, otherwise False.
+
+        Examples:
+            >>> TokenEntry(token="t", expires_at=100.0, refresh_at=90.0).is_expired(now=100.0)
+            True
+            >>> TokenEntry(token="t", expires_at=100.0, refresh_at=90.0).is_expired(now=95.0)
+            False
+        """
+        return (time.time() if now is None else now) >= self.expires_at
+
+    def needs_refresh(self, now: Optional[float] = None) -> bool:
+        """Return True if the token is inside its proactive refresh window.
+
+        Args:
+            now: Current time (defaults to ``time.time()``).
+
+        Returns:
+            True if a background refresh should be started.
+
+        Examples:
+            >>> TokenEntry(token="t", expires_at=100.0, refresh_at=90.0).needs_refresh(now=95.0)
+            True
+            >>> TokenEntry(token="t", expires_at=100.0, refresh_at=90.0).needs_refresh(now=50.0)
+            False
+        """
+        return (time.time() if now is None else now) >= self.refresh_at
+
+
+class OAuthTokenCache:
+    """Two-tier cache for OAuth access tokens.
+
+    L1: in-memory per worker, with single-flight fetches and background refresh.
+    L2: Redis (optional, shared across workers, tokens stored encrypted).
+    """
+
+    def __init__(self) -> None:
+        """Initialize cache settings and in-memory structures.
+
+        Examples:
+            >>> cache = OAuthTokenCache()
+            >>> isinstance(cache.enabled, bool)
+            True
+        """
+        try:
+            # First-Party
+            from mcpgateway.config import settings  # pylint: disable=import-outside-toplevel
+
+            self._enabled = getattr(settings, "oauth_token_cache_enabled", True)
+            self._refresh_margin_seconds = getattr(settings, "oauth_token_refresh_margin_seconds", 60)
+            self._default_ttl_seconds = getattr(settings, "oauth_default_timeout", 3600)
+            self._l1_maxsize = getattr(settings, "oauth_token_cache_l1_maxsize", 1000)
+            self._l2_enabled = getattr(settings, "oauth_token_cache_l2_enabled", True) and settings.cache_type == "redis"
+            self._cache_prefix = getattr(settings, "cache_prefix", "mcpgw:")
+        except ImportError:
+            self._enabled = True
+            self._refresh_margin_seconds = 60
+            self._default_ttl_seconds = 3600
+            self._l1_maxsize = 1000
+            self._l2_enabled = False
+            self._cache_prefix = "mcpgw:"
+
+        self._cache: "OrderedDict[str, TokenEntry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._background: Set[asyncio.Task] = set()
+
+        self._redis_checked = False
+        self._redis_available = False
+
+        self._hit_count = 0
+        self._miss_count = 0
+        self._l2_hit_count = 0
+        self._fetch_count = 0
+        self._refresh_count = 0
+        self._coalesced_count = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if the cache is enabled.
+
+        Returns:
+            True if enabled, otherwise False.
+
+        Examples:
+            >>> OAuthTokenCache().enabled in (True, False)
+            True
+        """
+        return self._enabled
+
+    @staticmethod
+    def build_key(grant_type: str, credentials: Dict[str, Any]) -> Optional[str]:
+        """Build the cache key for a token request.
+
+        The key covers the grant, token endpoint, client, requested scopes and
+        a digest of the client secret, so callers only share a token when they
+        hold the same credentials and a rotated secret never serves the old
+        token. For the password grant the username and a digest of the password
+        are included as well, because tokens issued to different resource
+        owners are not interchangeable.
+
+        Args:
+            grant_type: Grant actually used to fetch the token.
+            credentials: OAuth configuration passed to OAuthManager.
+
+        Returns:
+            Hex digest key, or None if the credentials cannot identify a token.
+
+        Examples:
+            >>> creds = {"token_url": "https://idp/token", "client_id": "c", "scopes": ["b", "a"]}
+            >>> k1 = OAuthTokenCache.build_key("client_credentials", creds)
+            >>> k2 = OAuthTokenCache.build_key("client_credentials", dict(creds, scopes="a b"))
+            >>> k1 == k2
+            True
+            >>> OAuthTokenCache.build_key("client_credentials", {"client_id": "c"}) is None
+            True
+            >>> k1 == OAuthTokenCache.build_key("password", dict(creds, username="u"))
+            False
+            >>> k1 == OAuthTokenCache.build_key("client_credentials", dict(creds, client_secret="s"))
+            False
+            >>> pw = dict(creds, username="u", password="p1")
+            >>> OAuthTokenCache.build_key("password", pw) == OAuthTokenCache.build_key("password", dict(pw, password="p2"))
+            False
+        """
+        token_url = credentials.get("token_url")
+        client_id = credentials.get("client_id")
+        if not isinstance(token_url, str) or not token_url:
+            return None
+        if grant_type == "client_credentials" and not client_id:
+            return None
+
+        scopes = credentials.get("scopes") or []
+        if isinstance(scopes, str):
+            scopes = scopes.split()
+        parts = [grant_type, token_url, str(client_id or ""), " ".join(sorted(str(s) for s in scopes)), _secret_digest(credentials.get("client_secret"))]
+        if grant_type == "password":
+            parts.append(str(credentials.get("username") or ""))
+            parts.append(_secret_digest(credentials.get("password")))
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def _redis_key(self, key: str) -> str:
+        """Build the Redis key for a token cache key.
+
+        Args:
+            key: Token cache key.
+
+        Returns:
+            Redis key for the cached token.
+        """
+        return f"{self._cache_prefix}oauth_token:{key}"
+
+    async def _get_redis_client(self):
+        """Return a Redis client if L2 is enabled and available.
+
+        Returns:
+            Redis client instance or None.
+        """
+        if not self._l2_enabled:
+            return None
+        try:
+            # First-Party
+            from mcpgateway.utils.redis_client import get_redis_client  # pylint: disable=import-outside-toplevel
+
+            client = await get_redis_client()
+            if client and not self._redis_checked:
+                self._redis_checked = True
+                self._redis_available = True
+            return client
+        except Exception:
+            if not self._redis_checked:
+                self._redis_checked = True
+                self._redis_available = False
+            return None
+
+    @staticmethod
+    def _get_encryption():
+        """Return the encryption service used for L2 token storage.
+
+        Returns:
+            EncryptionService bound to AUTH_ENCRYPTION_SECRET.
+        """
+        # First-Party
+        from mcpgateway.config import settings  # pylint: disable=import-outside-toplevel
+        from mcpgateway.services.encryption_service import get_encryption_service  # pylint: disable=import-outside-toplevel
+
+        return get_encryption_service(settings.auth_encryption_secret)
+
+    def _make_entry(self, token: str, expires_at: float) -> TokenEntry:
+        """Create an entry whose refresh point sits ahead of expiry.
+
+        The refresh margin is capped at half of the token lifetime so that
+        short-lived tokens are not refreshed on every call.
+
+        Args:
+            token: Access token.
+            expires_at: Absolute expiry timestamp.
+
+        Returns:
+            TokenEntry for the token.
+
+        Examples:
+            >>> cache = OAuthTokenCache()
+            >>> cache._refresh_margin_seconds = 60
+            >>> entry = cache._make_entry("t", time.time() + 30)
+            >>> round(entry.expires_at - entry.refresh_at)
+            15
+        """
+        lifetime = max(expires_at - time.time(), 0.0)
+        margin = min(float(self._refresh_margin_seconds), lifetime / 2)
+        return TokenEntry(token=token, expires_at=expires_at, refresh_at=expires_at - margin)
+
+    def _get_l1(self, key: str) -> Optional[TokenEntry]:
+        """Return a non-expired L1 entry, evicting it if it has expired.
+
+        Args:
+            key: Token cache key.
+
+        Returns:
+            TokenEntry or None.
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if entry.is_expired():
+            self._cache.pop(key, None)
+            return None
+        self._cache.move_to_end(key)
+        return entry
+
+    def _set_l1(self, key: str, entry: TokenEntry) -> None:
+        """Store an entry in L1, evicting the least recently used if full.
+
+        Args:
+            key: Token cache key.
+            entry: Entry to store.
+        """
+        if key in self._cache:
+            self._cache.pop(key, None)
+        elif len(self._cache) >= self._l1_maxsize:
+            self._cache.popitem(last=False)
+        self._cache[key] = entry
+
+    async def _get_l2(self, key: str) -> Optional[TokenEntry]:
+        """Load a token shared by another worker from Redis.
+
+        Args:
+            key: Token cache key.
+
+        Returns:
+            TokenEntry or None if absent, expired or unreadable.
+        """
+        redis = await self._get_redis_client()
+        if not redis:
+            return None
+        try:
+            data = await redis.get(self._redis_key(key))
+            if not data:
+                return None
+            payload = orjson.loads(data)
+            expires_at = float(payload["expires_at"])
+            if time.time() >= expires_at:
+                return None
+            token = await self._get_encryption().decrypt_secret_async(payload["token"])
+            if not token:
+                return None
+            self._l2_hit_count += 1
+            return self._make_entry(token, expires_at)
+        except Exception as exc:
+            logger.debug("OAuthTokenCache Redis get failed: %s", exc)
+            return None
+
+    async def _set_l2(self, key: str, token: str, expires_at: float) -> None:
+        """Share a freshly issued token with other workers through Redis.
+
+        Args:
+            key: Token cache key.
+            token: Access token.
+            expires_at: Absolute expiry timestamp.
+        """
+        redis = await self._get_redis_client()
+        if not redis:
+            return
+        ttl = int(expires_at - time.time())
+        if ttl <= 0:
+            return
+        try:
+            encrypted = await self._get_encryption().encrypt_secret_async(token)
+            await redis.setex(self._redis_key(key), ttl, orjson.dumps({"token": encrypted, "expires_at": expires_at}))
+        except Exception as exc:
+            logger.debug("OAuthTokenCache Redis set failed: %s", exc)
+
+    async def _fetch(self, key: str, fetch: Callable[[], Awaitable[str]]) -> str:
+        """Fetch a token from the IdP and store it in both tiers.
+
+        Args:
+            key: Token cache key.
+            fetch: Coroutine factory performing the token request.
+
+        Returns:
+            Access token.
+        """
+        self._fetch_count += 1
+        token = await fetch()
+        expires_in = getattr(token, "expires_in", None)
+        if expires_in is None:
+            expires_in = self._default_ttl_seconds
+        if expires_in > 0:
+            expires_at = time.time() + expires_in
+            self._set_l1(key, self._make_entry(str(token), expires_at))
+            await self._set_l2(key, str(token), expires_at)
+        return str(token)
+
+    def _start_fetch(self, key: str, fetch: Callable[[], Awaitable[str]]) -> asyncio.Task:
+        """Start a fetch for ``key`` unless one is already running on this loop.
+
+        Args:
+            key: Token cache key.
+            fetch: Coroutine factory performing the token request.
+
+        Returns:
+            Task resolving to the access token.
+        """
+        task = self._inflight.get(key)
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            self._coalesced_count += 1
+            return task
+
+        task = asyncio.create_task(self._fetch(key, fetch))
+        self._inflight[key] = task
+
+        def _done(finished: asyncio.Task) -> None:
+            """Drop the in-flight marker once the fetch settles.
+
+            Args:
+                finished: Completed fetch task.
+            """
+            if self._inflight.get(key) is finished:
+                self._inflight.pop(key, None)
+            if not finished.cancelled() and finished.exception() is not None:
+                logger.debug("OAuth token fetch failed: %s", finished.exception())
+
+        task.add_done_callback(_done)
+        return task
+
+    def _schedule_refresh(self, key: str, fetch: Callable[[], Awaitable[str]]) -> None:
+        """Refresh a still-valid token in the background.
+
+        Failures are logged and the current token keeps being served until it
+        actually expires.
+
+        Args:
+            key: Token cache key.
+            fetch: Coroutine factory performing the token request.
+        """
+        task = self._inflight.get(key)
+        if task is not None and not task.done():
+            return
+        self._refresh_count += 1
+        task = self._start_fetch(key, fetch)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def get_or_fetch(self, key: Optional[str], fetch: Callable[[], Awaitable[str]]) -> str:
+        """Return a cached token for ``key`` or fetch one with single-flight.
+
+        Args:
+            key: Token cache key from :meth:`build_key`; None disables caching.
+            fetch: Coroutine factory performing the token request.
+
+        Returns:
+            Access token.
+
+        Examples:
+            >>> import asyncio
+            >>> cache = OAuthTokenCache()
+            >>> cache._enabled, cache._l2_enabled = True, False
+            >>> calls = []
+            >>> async def fetch():
+            ...     calls.append(1)
+            ...     return IssuedAccessToken("tok", expires_in=300)
+            >>> async def main():
+            ...     results = await asyncio.gather(*(cache.get_or_fetch("k", fetch) for _ in range(5)))
+            ...     again = await cache.get_or_fetch("k", fetch)
+            ...     return results, again
+            >>> asyncio.run(main())
+            (['tok', 'tok', 'tok', 'tok', 'tok'], 'tok')
+            >>> len(calls)
+            1
+        """
+        if not self._enabled or key is None:
+            return await fetch()
+
+        entry = self._get_l1(key)
+        if entry is None:
+            entry = await self._get_l2(key)
+            if entry is not None:
+                self._set_l1(key, entry)
+
+        if entry is not None:
+            self._hit_count += 1
+            if entry.needs_refresh():
+                self._schedule_refresh(key, fetch)
+            return entry.token
+
+        self._miss_count += 1
+        return await asyncio.shield(self._start_fetch(key, fetch))
+
+    async def invalidate(self, key: Optional[str]) -> None:
+        """Drop a cached token from both tiers (e.g. after the IdP revoked it).
+
+        Args:
+            key: Token cache key.
+
+        Examples:
+            >>> import asyncio
+            >>> cache = OAuthTokenCache()
+            >>> cache._l2_enabled = False
+            >>> cache._set_l1("k", TokenEntry(token="t", expires_at=time.time() + 60, refresh_at=time.time() + 30))
+            >>> asyncio.run(cache.invalidate("k"))
+            >>> "k" in cache._cache
+            False
+        """
+        if key is None:
+            return
+        self._cache.pop(key, None)
+        redis = await self._get_redis_client()
+        if redis:
+            try:
+                await redis.delete(self._redis_key(key))
+            except Exception as exc:
+                logger.debug("OAuthTokenCache Redis delete failed: %s", exc)
+
+    def invalidate_all_local(self) -> None:
+        """Clear all L1 entries and forget in-flight fetches."""
+        # Note: L2 is intentionally not cleared here; this is L1 only.
+        self._cache.clear()
+        self._inflight.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache hit/miss statistics and configuration.
+
+        Returns:
+            Cache stats and settings.
+
+        Examples:
+            >>> s = OAuthTokenCache().stats()
+            >>> {"hit_count", "fetch_count", "refresh_count", "coalesced_count"} <= set(s)
+            True
+        """
+        total = self._hit_count + self._miss_count
+        return {
+            "enabled": self._enabled,
+            "hit_count": self._hit_count,
+            "miss_count": self._miss_count,
+            "hit_rate": self._hit_count / total if total > 0 else 0.0,
+            "l2_hit_count": self._l2_hit_count,
+            "fetch_count": self._fetch_count,
+            "refresh_count": self._refresh_count,
+            "coalesced_count": self._coalesced_count,
+            "size": len(self._cache),
+            "l1_maxsize": self._l1_maxsize,
+            "refresh_margin_seconds": self._refresh_margin_seconds,
+            "l2_enabled": self._l2_enabled,
+            "redis_available": self._redis_available,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss counters.
+
+        Examples:
+            >>> cache = OAuthTokenCache()
+            >>> cache._hit_count = 3
+            >>> cache.reset_stats()
+            >>> cache.stats()["hit_count"]
+            0
+        """
+        self._hit_count = 0
+        self._miss_count = 0
+        self._l2_hit_count = 0
+        self._fetch_count = 0
+        self._refresh_count = 0
+        self._coalesced_count = 0
+
+
+oauth_token_cache = OAuthTokenCache()
@@ -24,15 +24,20 @@ Examples:
 
 # Standard
 import asyncio
+from collections import deque
 from dataclasses import dataclass
 import hashlib
 import logging
 import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional
+import weakref
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for this worker's own registry invalidation to come back over pub/sub
+_ECHO_WINDOW = 5.0
+
 
 def _get_cleanup_timeout() -> float:
     """Get cleanup timeout from config (lazy import to avoid circular deps).
@@ -166,6 +171,12 @@ class RegistryCache:
         # Thread safety
         self._lock = threading.Lock()
 
+        # Local callbacks fired when a cache type is invalidated (weakly held)
+        self._listeners: Dict[str, List[Any]] = {}
+
+        # Publish times of our own registry invalidations, so the subscriber can skip their echo
+        self._pending_echoes: Dict[str, Deque[float]] = {}
+
         # Redis availability (None = not checked yet)
         self._redis_checked = False
         self._redis_available = False
@@ -340,6 +351,83 @@ class RegistryCache:
         with self._lock:
             self._cache[cache_key] = CacheEntry(value=data, expiry=time.time() + ttl)
 
+    def add_invalidation_listener(self, cache_type: str, callback: Callable[[], None]) -> None:
+        """Register a callback fired whenever a cache type is invalidated.
+
+        Callbacks run for local invalidations and for invalidations received
+        from other workers via CacheInvalidationSubscriber, so derived
+        in-process indexes can stay in sync with the registry. Bound methods
+        are held weakly and dropped once their owner is garbage collected.
+
+        Args:
+            cache_type: Type of cache to watch (tools, resources, etc.)
+            callback: Zero-argument callable.
+
+        Examples:
+            >>> cache = RegistryCache()
+            >>> calls = []
+            >>> cache.add_invalidation_listener("resources", lambda: calls.append(1))
+            >>> cache._notify_listeners("resources")
+            >>> calls
+            [1]
+        """
+        ref = weakref.WeakMethod(callback) if hasattr(callback, "__self__") else (lambda: callback)
+        with self._lock:
+            self._listeners.setdefault(cache_type, []).append(ref)
+
+    def _notify_listeners(self, cache_type: str) -> None:
+        """Fire invalidation listeners registered for a cache type.
+
+        Args:
+            cache_type: Type of cache that was invalidated.
+        """
+        with self._lock:
+            refs = list(self._listeners.get(cache_type, ()))
+        dead = []
+        for ref in refs:
+            callback = ref()
+            if callback is None:
+                dead.append(ref)
+                continue
+            try:
+                callback()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning(f"RegistryCache invalidation listener for {cache_type} failed: {e}")
+        if dead:
+            with self._lock:
+                self._listeners[cache_type] = [r for r in self._listeners.get(cache_type, []) if r not in dead]
+
+    def _consume_echo(self, cache_type: str) -> bool:
+        """Check whether a received invalidation is the echo of one we published.
+
+        Listeners already ran when this worker invalidated locally, so the
+        subscriber skips them for our own messages. Expectations expire after
+        a few seconds so a lost echo never hides another worker's message.
+
+        Args:
+            cache_type: Cache type named in the received message.
+
+        Returns:
+            True if the message matched a pending echo (which is consumed).
+
+        Examples:
+            >>> cache = RegistryCache()
+            >>> cache._consume_echo("tools")
+            False
+            >>> cache._pending_echoes["tools"] = deque([time.monotonic()])
+            >>> cache._consume_echo("tools"), cache._consume_echo("tools")
+            (True, False)
+        """
+        cutoff = time.monotonic() - _ECHO_WINDOW
+        with self._lock:
+            pending = self._pending_echoes.get(cache_type)
+            while pending and pending[0] < cutoff:
+                pending.popleft()
+            if pending:
+                pending.popleft()
+                return True
+        return False
+
     async def invalidate(self, cache_type: str) -> None:
         """Invalidate all cached data for a cache type.
 
@@ -359,6 +447,7 @@ class RegistryCache:
             keys_to_remove = [k for k in self._cache if k.startswith(prefix)]
             for key in keys_to_remove:
                 self._cache.pop(key, None)
+        self._notify_listeners(cache_type)
 
         # Clear Redis
         redis = await self._get_redis_client()
@@ -370,6 +459,8 @@ class RegistryCache:
 
                 # Publish invalidation for other workers
                 await redis.publish("mcpgw:cache:invalidate", f"registry:{cache_type}")
+                with self._lock:
+                    self._pending_echoes.setdefault(cache_type, deque()).append(time.monotonic())
             except Exception as e:
                 logger.warning(f"RegistryCache Redis invalidate failed: {e}")
 
@@ -534,15 +625,19 @@ registry_cache = get_registry_cache()
 class CacheInvalidationSubscriber:
     """Redis pubsub subscriber for cross-worker cache invalidation.
 
-    This class subscribes to the 'mcpgw:cache:invalidate' Redis channel
-    and processes invalidation messages from other workers, ensuring
-    local in-memory caches stay synchronized in multi-worker deployments.
+    This class subscribes to the 'mcpgw:cache:invalidate' and
+    'mcpgw:auth:invalidate' Redis channels and processes invalidation
+    messages from other workers, ensuring local in-memory caches stay
+    synchronized in multi-worker deployments.
 
     Message formats handled:
         - registry:{cache_type} - Invalidate registry cache (tools, prompts, etc.)
         - tool_lookup:{name} - Invalidate specific tool lookup
         - tool_lookup:gateway:{gateway_id} - Invalidate all tools for a gateway
         - admin:{prefix} - Invalidate admin stats cache
+        - user:/team:/role:/permissions:{email}, team_roles:{team_id} - Invalidate
+          compiled RBAC permissions (published by AuthCache)
+        - revoke:{jti} - Drop locally cached verified payloads for a revoked token
 
     Examples:
         >>> subscriber = CacheInvalidationSubscriber()
@@ -558,6 +653,7 @@ class CacheInvalidationSubscriber:
         self._stop_event: Optional[asyncio.Event] = None
         self._pubsub: Optional[Any] = None
         self._channel = "mcpgw:cache:invalidate"
+        self._auth_channel = "mcpgw:auth:invalidate"
         self._started = False
 
     async def start(self) -> None:
@@ -587,6 +683,7 @@ class CacheInvalidationSubscriber:
             self._stop_event = asyncio.Event()
             self._pubsub = redis.pubsub()
             await self._pubsub.subscribe(self._channel)  # pyright: ignore[reportOptionalMemberAccess]
+            await self._pubsub.subscribe(self._auth_channel)  # pyright: ignore[reportOptionalMemberAccess]
 
             self._task = asyncio.create_task(self._listen_loop())
             self._started = True
@@ -639,6 +736,7 @@ class CacheInvalidationSubscriber:
             cleanup_timeout = _get_cleanup_timeout()
             try:
                 await asyncio.wait_for(self._pubsub.unsubscribe(self._channel), timeout=cleanup_timeout)
+                await asyncio.wait_for(self._pubsub.unsubscribe(self._auth_channel), timeout=cleanup_timeout)
             except asyncio.TimeoutError:
                 logger.debug("Pubsub unsubscribe timed out - proceeding anyway")
             except Exception as e:
@@ -707,6 +805,8 @@ class CacheInvalidationSubscriber:
                     keys_to_remove = [k for k in cache._cache if k.startswith(prefix)]  # pyright: ignore[reportPrivateUsage]
                     for key in keys_to_remove:
                         cache._cache.pop(key, None)  # pyright: ignore[reportPrivateUsage]
+                if not cache._consume_echo(cache_type):  # pyright: ignore[reportPrivateUsage]
+                    cache._notify_listeners(cache_type)  # pyright: ignore[reportPrivateUsage]
                 logger.debug("CacheInvalidationSubscriber: Cleared local registry:%s cache (%d keys)", cache_type, len(keys_to_remove))
 
             elif message.startswith("tool_lookup:gateway:"):
@@ -747,6 +847,30 @@ class CacheInvalidationSubscriber:
                         admin_stats_cache._cache.pop(key, None)  # pyright: ignore[reportPrivateUsage]
                 logger.debug("CacheInvalidationSubscriber: Cleared local admin:%s cache (%d keys)", prefix, len(keys_to_remove))
 
+            elif message.startswith("revoke:"):
+                # Handle token revocation published by AuthCache
+                jti = message[len("revoke:") :]
+                # First-Party
+                from mcpgateway.cache.auth_cache import get_auth_cache  # pylint: disable=import-outside-toplevel
+
+                get_auth_cache().mark_token_revoked_local(jti)
+                logger.debug("CacheInvalidationSubscriber: Marked token %s... revoked locally", jti[:8])
+
+            elif message.startswith(("user:", "team:", "role:", "permissions:", "team_roles:")):
+                # Handle AuthCache invalidations that affect compiled RBAC permissions
+                kind, _, identifier = message.partition(":")
+                # First-Party
+                from mcpgateway.cache.auth_cache import get_auth_cache  # pylint: disable=import-outside-toplevel
+
+                if kind == "team_roles":
+                    get_auth_cache().invalidate_permissions_local(team_id=identifier)
+                elif identifier == "*":
+                    get_auth_cache().invalidate_permissions_local()
+                else:
+                    # role:{email}:{team_id} - emails never contain ':'
+                    get_auth_cache().invalidate_permissions_local(email=identifier.split(":", 1)[0])
+                logger.debug("CacheInvalidationSubscriber: Cleared local permissions for %s", message)
+
             else:
                 logger.debug("CacheInvalidationSubscriber: Unknown message format: %s", message)
 
@@ -0,0 +1,498 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/cache/registry_versions.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Registry version counters for conditional and delta listing.
+
+Dashboards and sidecars poll the tools, resources, prompts, servers and
+gateways list endpoints every few seconds and almost always get the same
+payload back. This module keeps a per-worker version counter for each entity
+type so those endpoints can:
+
+- return an ``ETag`` derived from the version and the caller's scope, and
+  answer ``If-None-Match`` with ``304 Not Modified`` before touching the
+  database;
+- return an ``X-Registry-Version`` token and, given ``?since=<token>``, only
+  the ids that were added, changed or removed after that token.
+
+Versions are bumped from two sources:
+
+1. The services' ``_notify_*`` event hooks, which carry the entity id.
+2. RegistryCache invalidation listeners, which fire for every mutation
+   (including bulk updates that emit no per-entity event) and for
+   invalidations received from other workers, but carry no id.
+
+A delta is only served when every id-less bump in the requested range is
+explained by an id-carrying event from the same mutation (same task, within
+a second); otherwise the caller is told to reset and refetch the full list.
+Tokens embed a per-process epoch, so a token issued by another worker or
+before a restart also leads to a reset rather than a wrong answer.
+
+Examples:
+    >>> versions = RegistryVersions(register_listeners=False)
+    >>> token = versions.token("tools")
+    >>> versions.record("tools", "t1", "added")
+    >>> versions.changes_since("tools", token)
+    {'t1': 'added'}
+    >>> import contextvars
+    >>> contextvars.Context().run(versions.record, "tools")  # id-less bump from another task
+    >>> versions.changes_since("tools", token) is None
+    True
+"""
+
+# Standard
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+import functools
+import hashlib
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+import uuid
+
+# Third-Party
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+
+ENTITY_TYPES = ("tools", "resources", "prompts", "servers", "gateways")
+
+# Maximum distance in seconds between an id-less bump and the event explaining it
+_PAIR_WINDOW = 1.0
+
+_mutation_scope: ContextVar[Optional[int]] = ContextVar("registry_mutation_scope", default=None)
+_scope_ids = itertools.count(1)
+
+
+def _current_scope() -> int:
+    """Return an id for the current task, assigning one on first use.
+
+    Returns:
+        Integer that is stable for the lifetime of the current asyncio task.
+    """
+    scope = _mutation_scope.get()
+    if scope is None:
+        scope = next(_scope_ids)
+        _mutation_scope.set(scope)
+    return scope
+
+
+def event_op(event_type: str) -> str:
+    """Map a service event type to a delta operation.
+
+    Args:
+        event_type: Event type such as ``tool_added`` or ``gateway_deleted``.
+
+    Returns:
+        ``added``, ``removed`` or ``changed``.
+
+    Examples:
+        >>> event_op("tool_added"), event_op("prompt_deleted"), event_op("gateway_offline")
+        ('added', 'removed', 'changed')
+    """
+    suffix = event_type.rsplit("_", 1)[-1]
+    if suffix == "added":
+        return "added"
+    if suffix == "deleted":
+        return "removed"
+    return "changed"
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an ``If-None-Match`` header against an ETag using weak comparison.
+
+    Args:
+        if_none_match: Raw header value, possibly a comma separated list.
+        etag: Current ETag.
+
+    Returns:
+        True if the client's copy is current.
+
+    Examples:
+        >>> etag_matches('W/"a", W/"b"', 'W/"b"')
+        True
+        >>> etag_matches('"b"', 'W/"b"'), etag_matches("*", 'W/"b"'), etag_matches(None, 'W/"b"')
+        (True, True, False)
+    """
+    if not if_none_match:
+        return False
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if (candidate[2:] if candidate.startswith("W/") else candidate) == opaque:
+            return True
+    return False
+
+
+@dataclass(frozen=True)
+class ChangeEntry:
+    """One version bump.
+
+    Attributes:
+        version: Version reached by this bump.
+        entity_id: Id of the entity, or None for an id-less invalidation.
+        op: ``added``, ``changed``, ``removed`` or ``unknown``.
+        scope: Task id of the mutation that produced the bump.
+        at: Monotonic timestamp of the bump.
+    """
+
+    version: int
+    entity_id: Optional[str]
+    op: str
+    scope: int
+    at: float
+
+
+class RegistryVersions:
+    """Per-worker version counters and change logs for registry entity types.
+
+    Examples:
+        >>> versions = RegistryVersions(register_listeners=False)
+        >>> versions.version("servers")
+        0
+        >>> versions.record("servers", "s1", "changed")
+        >>> versions.version("servers")
+        1
+        >>> versions.parse_token(versions.token("servers"))[1]
+        1
+    """
+
+    def __init__(self, register_listeners: bool = True) -> None:
+        """Initialize counters and hook into RegistryCache invalidation.
+
+        Args:
+            register_listeners: Register invalidation listeners on the shared RegistryCache.
+        """
+        try:
+            # First-Party
+            from mcpgateway.config import settings  # pylint: disable=import-outside-toplevel
+
+            self._enabled = getattr(settings, "registry_etag_enabled", True)
+            log_size = getattr(settings, "registry_delta_log_size", 1000)
+            self._shared_invalidation = getattr(settings, "cache_type", "database") == "redis"
+            self._ttls = {entity_type: getattr(settings, f"registry_cache_{entity_type}_ttl", 20) for entity_type in ENTITY_TYPES}
+        except ImportError:
+            self._enabled = True
+            log_size = 1000
+            self._shared_invalidation = False
+            self._ttls = dict.fromkeys(ENTITY_TYPES, 20)
+
+        self._epoch = uuid.uuid4().hex[:12]
+        self._versions: Dict[str, int] = dict.fromkeys(ENTITY_TYPES, 0)
+        self._logs: Dict[str, Deque[ChangeEntry]] = {entity_type: deque(maxlen=log_size) for entity_type in ENTITY_TYPES}
+        self._lock = threading.Lock()
+
+        if register_listeners:
+            # First-Party
+            from mcpgateway.cache.registry_cache import get_registry_cache  # pylint: disable=import-outside-toplevel
+
+            registry = get_registry_cache()
+            for entity_type in ENTITY_TYPES:
+                registry.add_invalidation_listener(entity_type, functools.partial(self.record, entity_type))
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if conditional and delta listing are enabled.
+
+        Returns:
+            True if enabled, otherwise False.
+        """
+        return self._enabled
+
+    def version(self, entity_type: str) -> int:
+        """Return the current version of an entity type.
+
+        Args:
+            entity_type: One of :data:`ENTITY_TYPES`.
+
+        Returns:
+            Current version counter.
+        """
+        return self._versions[entity_type]
+
+    def record(self, entity_type: str, entity_id: Optional[str] = None, op: str = "unknown") -> None:
+        """Bump the version of an entity type and log the change.
+
+        Args:
+            entity_type: One of :data:`ENTITY_TYPES`; other values are ignored.
+            entity_id: Id of the changed entity, or None when unknown.
+            op: ``added``, ``changed``, ``removed`` or ``unknown``.
+        """
+        if entity_type not in self._versions:
+            return
+        scope = _current_scope()
+        now = time.monotonic()
+        with self._lock:
+            version = self._versions[entity_type] + 1
+            self._versions[entity_type] = version
+            self._logs[entity_type].append(ChangeEntry(version=version, entity_id=entity_id, op=op, scope=scope, at=now))
+
+    def record_event(self, entity_type: str, event: Dict[str, Any]) -> None:
+        """Record a service ``_notify_*`` event.
+
+        Args:
+            entity_type: One of :data:`ENTITY_TYPES`.
+            event: Event dict with ``type`` and ``data.id``.
+
+        Examples:
+            >>> versions = RegistryVersions(register_listeners=False)
+            >>> token = versions.token("prompts")
+            >>> versions.record_event("prompts", {"type": "prompt_deleted", "data": {"id": "p1"}})
+            >>> versions.changes_since("prompts", token)
+            {'p1': 'removed'}
+        """
+        data = event.get("data") or {}
+        entity_id = data.get("id") if isinstance(data, dict) else None
+        self.record(entity_type, str(entity_id) if entity_id is not None else None, event_op(str(event.get("type", ""))) if entity_id is not None else "unknown")
+
+    def token(self, entity_type: str) -> str:
+        """Return the delta token for the current version.
+
+        Args:
+            entity_type: One of :data:`ENTITY_TYPES`.
+
+        Returns:
+            Opaque ``epoch.version.issued`` token.
+        """
+        return f"{self._epoch}.{self._versions[entity_type]}.{int(time.time())}"
+
+    @staticmethod
+    def parse_token(token: str) -> Optional[Tuple[str, int, int]]:
+        """Parse a delta token.
+
+        Args:
+            token: Token from :meth:`token`.
+
+        Returns:
+            Tuple of (epoch, version, issued), or None if malformed.
+
+        Examples:
+            >>> RegistryVersions.parse_token("abc.7.1700000000")
+            ('abc', 7, 1700000000)
+            >>> RegistryVersions.parse_token("garbage") is None
+            True
+        """
+        parts = token.split(".")
+        if len(parts) != 3:
+            return None
+        try:
+            return parts[0], int(parts[1]), int(parts[2])
+        except ValueError:
+            return None
+
+    def etag(self, entity_type: str, *scope_parts: Any) -> str:
+        """Build a weak ETag for a listing.
+
+        The tag covers the entity type's version, the caller's scope and the
+        request's query, plus a registry-TTL time bucket so that changes the
+        counter cannot see (team membership, another worker without Redis)
+        are picked up within the same bound as RegistryCache.
+
+        Args:
+            entity_type: One of :data:`ENTITY_TYPES`.
+            *scope_parts: Values that affect the payload (identity, teams, query string).
+
+        Returns:
+            Weak ETag header value.
+
+        Examples:
+            >>> versions = RegistryVersions(register_listeners=False)
+            >>> tag = versions.etag("tools", "a@x.com", ["t1"], "limit=10")
+            >>> tag == versions.etag("tools", "a@x.com", ["t1"], "limit=10"), tag == versions.etag("tools", "b@x.com", ["t1"], "limit=10")
+            (True, False)
+            >>> versions.record("tools", "t1", "changed")
+            >>> tag == versions.etag("tools", "a@x.com", ["t1"], "limit=10")
+            False
+        """
+        bucket = int(time.time() // self._ttls[entity_type])
+        digest = hashlib.sha256(repr(scope_parts).encode()).hexdigest()[:16]
+        return f'W/"{self._epoch}-{self._versions[entity_type]}-{bucket}-{digest}"'
+
+    def changes_since(self, entity_type: str, since: str, until: Optional[int] = None) -> Optional[Dict[str, str]]:
+        """Return the net operation per entity id after a token.
+
+        Args:
+            entity_type: One of :data:`ENTITY_TYPES`.
+            since: Token previously returned by :meth:`token`.
+            until: Last version to include (defaults to the current version).
+
+        Returns:
+            Mapping of entity id to ``added``, ``changed`` or ``removed``, or
+            None when the range cannot be reconstructed and the caller must
+            refetch the full listing.
+        """
+        parsed = self.parse_token(since)
+        if parsed is None or parsed[0] != self._epoch:
+            return None
+        _, base, issued = parsed
+        # Without shared invalidation other workers' writes are invisible here; bound staleness like RegistryCache
+        if not self._shared_invalidation and time.time() - issued > self._ttls[entity_type]:
+            return None
+        with self._lock:
+            until = self._versions[entity_type] if until is None else until
+            if base > until:
+                return None
+            entries = [entry for entry in self._logs[entity_type] if base < entry.version <= until]
+        if len(entries) != until - base:
+            return None  # Part of the range fell out of the change log
+
+        changes: Dict[str, str] = {}
+        for index, entry in enumerate(entries):
+            if entry.entity_id is None:
+                neighbours = entries[max(index - 1, 0) : index] + entries[index + 1 : index + 2]
+                if not any(n.entity_id is not None and n.scope == entry.scope and abs(n.at - entry.at) <= _PAIR_WINDOW for n in neighbours):
+                    return None
+                continue
+            previous = changes.get(entry.entity_id)
+            changes[entry.entity_id] = "added" if previous == "added" and entry.op == "changed" else entry.op
+        return changes
+
+    def delta(
+        self,
+        db: Any,
+        entity_type: str,
+        since: str,
+        user_email: Optional[str] = None,
+        token_teams: Optional[List[str]] = None,
+        team_id: Optional[str] = None,
+        include_inactive: bool = False,
+    ) -> Dict[str, Any]:
+        """Build a delta listing response for a caller.
+
+        Touched ids are re-checked against the database with the same
+        visibility rules as the list endpoints: ids the caller can still see
+        are reported as added or changed, ids that were deleted, disabled or
+        moved out of the caller's scope are reported as removed, and ids that
+        were created outside the caller's scope are omitted.
+
+        Args:
+            db: Database session.
+            entity_type: One of :data:`ENTITY_TYPES`.
+            since: Token previously returned by :meth:`token`.
+            user_email: Caller email for owner access; None together with token_teams None means unrestricted.
+            token_teams: Caller team ids, already normalized by the endpoint; [] for public-only.
+            team_id: Restrict to a single team.
+            include_inactive: Treat disabled entities as visible.
+
+        Returns:
+            Dict with ``version`` (next token), ``reset``, ``added``, ``changed`` and ``removed``.
+        """
+        with self._lock:
+            until = self._versions[entity_type]
+        payload: Dict[str, Any] = {"version": f"{self._epoch}.{until}.{int(time.time())}", "reset": False, "added": [], "changed": [], "removed": []}
+        changes = self.changes_since(entity_type, since, until)
+        if changes is None:
+            payload["reset"] = True
+            return payload
+        if not changes:
+            return payload
+
+        visible = self._visible_ids(db, entity_type, list(changes), user_email, token_teams, team_id, include_inactive)
+        for entity_id, op in changes.items():
+            if entity_id in visible:
+                payload["added" if op == "added" else "changed"].append(entity_id)
+            elif op != "added":
+                payload["removed"].append(entity_id)
+        return payload
+
+    @staticmethod
+    def _visible_ids(
+        db: Any,
+        entity_type: str,
+        ids: List[str],
+        user_email: Optional[str],
+        token_teams: Optional[List[str]],
+        team_id: Optional[str],
+        include_inactive: bool,
+    ) -> Set[str]:
+        """Return the subset of ids the caller can currently list.
+
+        Visibility is decided by the owning service's ``apply_visibility_filter``,
+        the same helper its list endpoint uses, so delta and full listings agree.
+
+        Args:
+            db: Database session.
+            entity_type: One of :data:`ENTITY_TYPES`.
+            ids: Candidate entity ids.
+            user_email: Caller email for owner access.
+            token_teams: Caller team ids; [] for public-only, None for unrestricted.
+            team_id: Restrict to a single team.
+            include_inactive: Treat disabled entities as visible.
+
+        Returns:
+            Set of visible ids.
+        """
+        # Third-Party
+        from sqlalchemy import select  # pylint: disable=import-outside-toplevel
+
+        # First-Party
+        from mcpgateway.db import Gateway, Prompt, Resource, Server, Tool  # pylint: disable=import-outside-toplevel
+        from mcpgateway.services.gateway_service import GatewayService  # pylint: disable=import-outside-toplevel
+        from mcpgateway.services.prompt_service import PromptService  # pylint: disable=import-outside-toplevel
+        from mcpgateway.services.resource_service import ResourceService  # pylint: disable=import-outside-toplevel
+        from mcpgateway.services.server_service import ServerService  # pylint: disable=import-outside-toplevel
+        from mcpgateway.services.tool_service import ToolService  # pylint: disable=import-outside-toplevel
+
+        model, service = {
+            "tools": (Tool, ToolService),
+            "resources": (Resource, ResourceService),
+            "prompts": (Prompt, PromptService),
+            "servers": (Server, ServerService),
+            "gateways": (Gateway, GatewayService),
+        }[entity_type]
+        query = select(model.id).where(model.id.in_(ids))
+        if not include_inactive:
+            query = query.where(model.enabled)
+        if user_email is not None or token_teams is not None:
+            # Endpoints pass token teams already normalized; they are the caller's teams here
+            query = service.apply_visibility_filter(query, user_email, token_teams or [], token_teams, team_id)
+            if query is None:
+                return set()
+        return {str(row[0]) for row in db.execute(query).all()}
+
+
+registry_versions = RegistryVersions()
+
+
+def registry_listing_headers(request: Any, entity_type: str, *scope_parts: Any) -> Tuple[Dict[str, str], Optional[Response]]:
+    """Compute conditional-GET headers for a registry listing endpoint.
+
+    The ETag and version token are taken before the listing is queried, so a
+    concurrent write can only make the tag older than the payload, never newer.
+
+    Args:
+        request: Incoming request (path, query and If-None-Match are used).
+        entity_type: One of :data:`ENTITY_TYPES`.
+        *scope_parts: Caller scope values that change the payload.
+
+    Returns:
+        Tuple of (headers to attach, 304 response when the client copy is current).
+        Headers are empty when the feature is disabled.
+
+    Examples:
+        >>> from unittest.mock import MagicMock
+        >>> req = MagicMock()
+        >>> req.url.path, req.url.query, req.headers = "/tools", "", {}
+        >>> headers, not_modified = registry_listing_headers(req, "tools", "a@x.com", ["t1"])
+        >>> sorted(headers), not_modified is None
+        (['ETag', 'X-Registry-Version'], True)
+        >>> req.headers = {"if-none-match": headers["ETag"]}
+        >>> registry_listing_headers(req, "tools", "a@x.com", ["t1"])[1].status_code
+        304
+    """
+    if not registry_versions.enabled:
+        return {}, None
+    headers = {
+        "ETag": registry_versions.etag(entity_type, request.url.path, request.url.query, *scope_parts),
+        "X-Registry-Version": registry_versions.token(entity_type),
+    }
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return headers, Response(status_code=304, headers=headers)
+    return headers, None
@@ -14,7 +14,8 @@ three backend modes:
 
 - **memory**: In-memory storage for single-process deployments (default)
 - **redis**: Redis-backed shared storage for multi-worker deployments
-- **database**: SQLAlchemy-backed shared storage using any supported database
+- **database**: SQLAlchemy-backed shared storage using any supported database.
+  On PostgreSQL, message delivery is pushed via LISTEN/NOTIFY; other databases poll.
 
 In distributed mode (redis/database), session existence is tracked in the shared
 backend while transport objects remain local to each worker process. This allows
@@ -65,6 +66,7 @@ import orjson
 
 # First-Party
 from mcpgateway import __version__
+from mcpgateway.cache.pg_notify import is_postgres_url, PgNotifyListener
 from mcpgateway.common.models import Implementation, InitializeResult, ServerCapabilities
 from mcpgateway.config import settings
 from mcpgateway.db import get_db, SessionMessageRecord, SessionRecord
@@ -92,9 +94,12 @@ try:
 except ImportError:
     REDIS_AVAILABLE = False
 
+# NOTIFY channel carrying the target session id of each stored session message
+SESSION_MESSAGE_CHANNEL = "mcp_session_messages"
+
 try:
     # Third-Party
-    from sqlalchemy import func
+    from sqlalchemy import func, text
 
     SQLALCHEMY_AVAILABLE = True
 except ImportError:
@@ -182,6 +187,8 @@ class SessionBackend:
         self._backend = backend.lower()
         self._session_ttl = session_ttl
         self._message_ttl = message_ttl
+        self._pg_notify = False  # PostgreSQL LISTEN/NOTIFY delivery (database backend only)
+        self._notify_listener: Optional[PgNotifyListener] = None
 
         # Set up backend-specific components
         if self._backend == "memory":
@@ -207,6 +214,9 @@ class SessionBackend:
                 raise ValueError("Database backend requested but SQLAlchemy not installed")
             if not database_url:
                 raise ValueError("Database backend requires database_url")
+            # Push delivery via LISTEN/NOTIFY on PostgreSQL; the listener is opened in initialize()
+            self._pg_notify = settings.session_registry_pg_notify_enabled and is_postgres_url(database_url)
+            self._database_url = database_url
         else:
             raise ValueError(f"Invalid backend: {backend}")
 
@@ -490,6 +500,14 @@ class SessionRegistry(SessionBackend):
             self._cleanup_task = asyncio.create_task(self._db_cleanup_task())
             logger.info("Database cleanup task started")
 
+            if self._pg_notify:
+                listener = PgNotifyListener(self._database_url, SESSION_MESSAGE_CHANNEL)
+                try:
+                    await listener.start()
+                    self._notify_listener = listener
+                except Exception as e:
+                    logger.warning(f"PostgreSQL LISTEN/NOTIFY unavailable, falling back to polling for session messages: {e}")
+
         elif self._backend == "redis":
             # Get shared Redis client from factory
             self._redis = await get_redis_client()
@@ -579,6 +597,10 @@ class SessionRegistry(SessionBackend):
                 except asyncio.TimeoutError:
                     logger.error("Some stuck tasks could not be cancelled during shutdown")
 
+        if self._notify_listener:
+            await self._notify_listener.stop()
+            self._notify_listener = None
+
         # Close Redis pubsub (but not the shared client)
         # Use timeout to prevent blocking if pubsub doesn't close cleanly
         cleanup_timeout = settings.mcp_session_pool_cleanup_timeout
@@ -997,6 +1019,9 @@ class SessionRegistry(SessionBackend):
                     try:
                         message_record = SessionMessageRecord(session_id=session_id, message=msg_json)
                         db_session.add(message_record)
+                        if self._pg_notify:
+                            # Delivered on commit, so the listener never sees a message that isn't stored yet
+                            db_session.execute(text("SELECT pg_notify(:channel, :session_id)"), {"channel": SESSION_MESSAGE_CHANNEL, "session_id": session_id})
                         db_session.commit()
                     except Exception as ex:
                         db_session.rollback()
@@ -1140,7 +1165,7 @@ class SessionRegistry(SessionBackend):
 
         - **memory**: Checks the temporary message storage
         - **redis**: Subscribes to Redis pubsub channel
-        - **database**: Polls database for new messages
+        - **database**: Polls database for new messages (woken by LISTEN/NOTIFY on PostgreSQL)
 
         When a message is received and the transport exists locally, it processes
         the message and sends the response through the transport.
@@ -1364,6 +1389,12 @@ class SessionRegistry(SessionBackend):
 
                 The loop continues until the session is removed from the database.
 
+                On PostgreSQL with the LISTEN/NOTIFY listener connected, the loop sleeps on
+                the session's notification event instead of the backoff timer and drains
+                pending messages back to back. It still re-checks the table every
+                ``session_registry_notify_recheck_interval`` seconds in case a
+                notification was lost.
+
                 Behavior:
                     - Starts with a fast polling interval for low-latency message delivery.
                     - When no message is found, the polling interval increases exponentially
@@ -1419,6 +1450,8 @@ class SessionRegistry(SessionBackend):
                 poll_interval = settings.poll_interval  # start fast
                 max_interval = settings.max_interval  # cap at configured maximum
                 backoff_factor = settings.backoff_factor
+                listener = self._notify_listener
+                wake = listener.subscribe(session_id) if listener else None
                 try:
                     while True:
                         # Check if session is closing before querying DB
@@ -1426,6 +1459,10 @@ class SessionRegistry(SessionBackend):
                             logger.debug("Session %s closing, stopping poll loop early", session_id)
                             break
 
+                        # Clear before reading so a NOTIFY that lands during the query is not lost
+                        if wake is not None:
+                            wake.clear()
+
                         session, record = await asyncio.to_thread(_db_read_session_and_message, session_id)
 
                         # session gone → stop polling
@@ -1454,17 +1491,28 @@ class SessionRegistry(SessionBackend):
                                 )
 
                                 await asyncio.to_thread(_db_remove, session_id, record.message)
+                                if wake is not None and listener.connected:
+                                    continue  # drain queued messages without waiting
                         else:
                             # no message → backoff
                             # update polling interval with backoff factor
                             poll_interval = min(poll_interval * backoff_factor, max_interval)
 
-                        await asyncio.sleep(poll_interval)
+                        if wake is not None and listener.connected:
+                            try:
+                                await asyncio.wait_for(wake.wait(), timeout=settings.session_registry_notify_recheck_interval)
+                            except asyncio.TimeoutError:
+                                pass
+                        else:
+                            await asyncio.sleep(poll_interval)
                 except asyncio.CancelledError:
                     logger.info(f"Message check loop cancelled for session {session_id}")
                     raise  # Re-raise to properly complete cancellation
                 except Exception as e:
                     logger.error(f"Message check loop error for session {session_id}: {e}")
+                finally:
+                    if listener is not None:
+                        listener.unsubscribe(session_id)
 
             # CRITICAL: Await instead of fire-and-forget
             # This ensures CancelledError propagates from outer respond() task to inner loop
@@ -394,6 +394,10 @@ class Settings(BaseSettings):
     oauth_request_timeout: int = Field(default=30, description="OAuth request timeout in seconds")
     oauth_max_retries: int = Field(default=3, description="Maximum retries for OAuth token requests")
     oauth_default_timeout: int = Field(default=3600, description="Default OAuth token timeout in seconds")
+    oauth_token_cache_enabled: bool = Field(default=True, description="Cache OAuth access tokens (client_credentials/password grants) until expires_in")
+    oauth_token_refresh_margin_seconds: int = Field(default=60, ge=0, le=3600, description="Refresh cached OAuth tokens in the background this many seconds before expiry")
+    oauth_token_cache_l1_maxsize: int = Field(default=1000, ge=10, le=100000, description="Max entries for the in-memory OAuth token cache (L1)")
+    oauth_token_cache_l2_enabled: bool = Field(default=True, description="Share encrypted OAuth tokens across workers through Redis (L2) when cache_type=redis")
 
     # ===================================
     # Dynamic Client Registration (DCR) - Client Mode
@@ -453,6 +457,7 @@ class Settings(BaseSettings):
     argon2id_time_cost: int = Field(default=3, description="Argon2id time cost (number of iterations)")
     argon2id_memory_cost: int = Field(default=65536, description="Argon2id memory cost in KiB")
     argon2id_parallelism: int = Field(default=1, description="Argon2id parallelism (number of threads)")
+    argon2id_key_cache_size: int = Field(default=1024, ge=0, description="Max Argon2id-derived encryption keys cached per process (0 disables the cache)")
 
     # Password Policy Configuration
     password_min_length: int = Field(default=8, description="Minimum password length")
@@ -495,6 +500,11 @@ class Settings(BaseSettings):
     # Tool Execution Cancellation
     mcpgateway_tool_cancellation_enabled: bool = Field(default=True, description="Enable gateway-authoritative tool execution cancellation with REST API endpoints")
 
+    # JSON-RPC Batch Requests
+    mcpgateway_rpc_batch_enabled: bool = Field(default=True, description="Accept JSON-RPC 2.0 batch arrays on the /rpc endpoint")
+    mcpgateway_rpc_batch_max_size: int = Field(default=100, ge=1, le=10000, description="Maximum number of calls accepted in a single JSON-RPC batch")
+    mcpgateway_rpc_batch_max_concurrency: int = Field(default=10, ge=1, le=1000, description="Maximum number of batch calls dispatched concurrently per request")
+
     # A2A (Agent-to-Agent) Feature Flags
     mcpgateway_a2a_enabled: bool = True
     mcpgateway_a2a_max_agents: int = 100
@@ -612,6 +622,12 @@ class Settings(BaseSettings):
     poll_interval: float = Field(default=1.0, description="Initial polling interval in seconds for checking new session messages")
     max_interval: float = Field(default=5.0, description="Maximum polling interval in seconds when the session is idle")
     backoff_factor: float = Field(default=1.5, description="Multiplier used to gradually increase the polling interval during inactivity")
+    session_registry_pg_notify_enabled: bool = Field(
+        default=True, description="On PostgreSQL, deliver session messages via LISTEN/NOTIFY on one shared connection per worker instead of per-session polling"
+    )
+    session_registry_notify_recheck_interval: float = Field(
+        default=30.0, gt=0, description="Seconds a session waiting on LISTEN/NOTIFY sleeps before re-checking the message table (safety net for lost notifications)"
+    )
 
     # redis configurations for Maintaining Chat Sessions in multi-worker environment
     llmchat_session_ttl: int = Field(default=300, description="Seconds for active_session key TTL")
@@ -1072,6 +1088,15 @@ class Settings(BaseSettings):
     # Sample rate (0.0 to 1.0) - 1.0 means trace everything
     observability_sample_rate: float = Field(default=1.0, ge=0.0, le=1.0, description="Trace sampling rate (0.0-1.0)")
 
+    # Traces slower than this are kept regardless of the sample rate (errors are always kept)
+    observability_slow_request_threshold_ms: float = Field(default=1000.0, ge=0.0, description="Always keep traces at least this slow in milliseconds (0 disables)")
+
+    # Buffered trace export (batches trace/span/event inserts off the request path)
+    observability_buffer_enabled: bool = Field(default=True, description="Buffer request traces in memory and bulk-insert them in the background")
+    observability_buffer_max_queue_size: int = Field(default=10000, ge=100, le=1000000, description="Completed traces awaiting export before new traces are dropped")
+    observability_buffer_batch_size: int = Field(default=500, ge=1, le=10000, description="Maximum traces written per export transaction")
+    observability_buffer_flush_interval: float = Field(default=2.0, gt=0.0, le=60.0, description="Seconds between trace export flushes")
+
     # Include paths for tracing (regex patterns)
     observability_include_paths: List[str] = Field(
         default_factory=lambda: [
@@ -1122,6 +1147,15 @@ class Settings(BaseSettings):
     structured_logging_database_enabled: bool = Field(default=False, description="Persist structured logs to database (enables /api/logs/* endpoints, impacts performance)")
     structured_logging_external_enabled: bool = Field(default=False, description="Send logs to external systems")
 
+    # Buffered structured log persistence (bulk inserts from a background task)
+    structured_logging_buffer_enabled: bool = Field(default=True, description="Batch structured log database writes instead of committing each entry")
+    structured_logging_buffer_max_size: int = Field(default=10000, ge=100, le=1000000, description="Maximum buffered log entries before the overflow policy applies")
+    structured_logging_buffer_batch_size: int = Field(default=500, ge=1, le=10000, description="Log entries per bulk insert; a full batch triggers an early flush")
+    structured_logging_buffer_flush_interval: float = Field(default=2.0, gt=0.0, le=60.0, description="Seconds between structured log buffer flushes")
+    structured_logging_buffer_overflow_policy: Literal["drop_oldest", "drop_newest"] = Field(
+        default="drop_oldest", description="Which entry to drop when the structured log buffer is full"
+    )
+
     # Performance Tracking Configuration
     performance_tracking_enabled: bool = Field(default=True, description="Enable performance tracking and metrics")
     performance_threshold_database_query_ms: float = Field(default=100.0, description="Alert threshold for database queries (ms)")
@@ -1215,6 +1249,12 @@ class Settings(BaseSettings):
     auth_cache_teams_enabled: bool = Field(default=True, description="Enable caching for get_user_teams() (default: true)")
     auth_cache_teams_ttl: int = Field(default=60, ge=10, le=300, description="TTL in seconds for user teams list cache")
     auth_cache_batch_queries: bool = Field(default=True, description="Batch auth DB queries into single call (reduces 3 queries to 1)")
+    auth_cache_permissions_enabled: bool = Field(default=True, description="Share compiled RBAC permission sets across requests in each worker")
+    auth_cache_permission_ttl: int = Field(default=300, ge=10, le=3600, description="TTL in seconds for compiled RBAC permission sets")
+    auth_cache_permission_max_entries: int = Field(default=10000, ge=100, description="Maximum user/team permission sets kept per worker (LRU eviction)")
+    auth_cache_jwt_enabled: bool = Field(default=True, description="Cache verified JWT payloads per worker so repeated tokens skip signature verification")
+    auth_cache_jwt_max_entries: int = Field(default=10000, ge=100, description="Maximum verified JWT payloads kept per worker (LRU eviction)")
+    auth_cache_jwt_max_ttl: int = Field(default=900, ge=10, le=86400, description="Upper bound in seconds for keeping a verified JWT payload (entries never outlive the token's exp)")
 
     # Registry Cache Configuration (reduces DB queries for list endpoints)
     registry_cache_enabled: bool = Field(default=True, description="Enable caching for registry list endpoints (tools, prompts, resources, etc.)")
@@ -1226,6 +1266,15 @@ class Settings(BaseSettings):
     registry_cache_gateways_ttl: int = Field(default=20, ge=5, le=300, description="TTL in seconds for gateways list cache")
     registry_cache_catalog_ttl: int = Field(default=300, ge=60, le=600, description="TTL in seconds for catalog servers list cache (external catalog, changes infrequently)")
 
+    # Listing Cache Configuration (scope-aware tools/list, resources/list, prompts/list pages per worker)
+    listing_cache_enabled: bool = Field(default=True, description="Cache serialized tools/resources/prompts list pages per visibility scope (uses the registry cache TTLs)")
+    listing_cache_max_entries: int = Field(default=2000, ge=10, description="Maximum listing pages kept per worker (LRU eviction)")
+    listing_cache_max_bytes: int = Field(default=64 * 1024 * 1024, ge=1024 * 1024, description="Maximum total size in bytes of listing pages kept per worker")
+
+    # Registry Versions (ETag / If-None-Match and ?since= delta listing on registry list endpoints)
+    registry_etag_enabled: bool = Field(default=True, description="Return ETag and X-Registry-Version on registry list endpoints, answer If-None-Match with 304 and support ?since= delta listing")
+    registry_delta_log_size: int = Field(default=1000, ge=10, le=100000, description="Change-log entries kept per entity type and worker for ?since= delta listing (older tokens get a reset)")
+
     # Tool Lookup Cache Configuration (reduces hot-path DB lookups in invoke_tool)
     tool_lookup_cache_enabled: bool = Field(default=True, description="Enable tool lookup cache (tool name -> tool config)")
     tool_lookup_cache_ttl_seconds: int = Field(default=60, ge=5, le=600, description="TTL in seconds for tool lookup cache entries")
@@ -1376,6 +1425,17 @@ class Settings(BaseSettings):
     mcp_session_pool_circuit_breaker_threshold: int = 5  # Failures before circuit opens
     mcp_session_pool_circuit_breaker_reset: float = 60.0  # Seconds before circuit resets
     mcp_session_pool_idle_eviction: float = 600.0  # Evict idle pool keys after this time
+    # Concurrent requests one pooled session may carry. 1 = exclusive checkout (default).
+    # Values > 1 multiplex JSON-RPC requests over shared sessions (least-loaded first),
+    # cutting upstream connections and initialize handshakes under bursty load.
+    mcp_session_pool_max_in_flight_per_session: int = Field(default=1, ge=1, le=1000)
+    # Warm-up: keep sessions open (and refreshed before TTL expiry) for the busiest pool keys,
+    # ranked by recent acquires, so cold keys after eviction don't pay connect + initialize.
+    mcp_session_pool_warmup_enabled: bool = False
+    mcp_session_pool_warmup_top_n: int = Field(default=10, ge=1, le=1000)  # Pool keys kept warm
+    mcp_session_pool_warmup_min_sessions: int = Field(default=1, ge=1, le=100)  # Live sessions per warm key
+    mcp_session_pool_warmup_interval: float = Field(default=30.0, ge=1.0)  # Seconds between warm-up cycles
+    mcp_session_pool_warmup_refresh_margin: float = Field(default=60.0, ge=0.0)  # Replace sessions this long before TTL
     # Transport timeout for pooled sessions (default 30s to match MCP SDK default).
     # This timeout applies to all HTTP operations (connect, read, write) on pooled sessions.
     # Use a higher value for deployments with long-running tool calls.
@@ -1456,6 +1516,10 @@ class Settings(BaseSettings):
     unhealthy_threshold: int = 3
     # Max concurrent health checks per worker
     max_concurrent_health_checks: int = 10
+    # Upper bound (seconds) for exponential backoff between checks of a failing gateway
+    health_check_max_backoff: int = 600
+    # Consecutive probes a healthy gateway may skip while it keeps serving traffic successfully (0 = always probe)
+    health_check_passive_max_skips: int = 4
 
     # Auto-refresh tools/resources/prompts from gateways during health checks
     # When enabled, tools/resources/prompts are fetched and synced with DB during health checks
@@ -1464,6 +1528,9 @@ class Settings(BaseSettings):
     # Per-gateway refresh configuration (used when auto_refresh_servers is True)
     # Gateways can override this with their own refresh_interval_seconds
     gateway_auto_refresh_interval: int = Field(default=300, ge=60, description="Default refresh interval in seconds for gateway tools/resources/prompts sync (minimum 60 seconds)")
+    gateway_auto_refresh_list_changed_interval: int = Field(
+        default=3600, ge=60, description="Fallback refresh interval in seconds for gateways that advertise listChanged notifications (minimum 60 seconds)"
+    )
 
     # Validation Gateway URL
     gateway_validation_timeout: int = 5  # seconds
@@ -1572,6 +1639,7 @@ class Settings(BaseSettings):
     json_response_enabled: bool = True  # Enable JSON responses instead of SSE streams
     streamable_http_max_events_per_stream: int = 100  # Ring buffer capacity per stream
     streamable_http_event_ttl: int = 3600  # Event stream TTL in seconds (1 hour)
+    streamable_http_event_store_mode: Literal["hash", "stream"] = "hash"  # Redis layout: hash (sorted set + hash via Lua) or stream (Redis Streams)
 
     # Core plugin settings
     plugins_enabled: bool = Field(default=False, description="Enable the plugin framework")
@@ -2207,6 +2207,7 @@ class ToolMetricsHourly(Base):
         p50_response_time: 50th percentile (median) response time.
         p95_response_time: 95th percentile response time.
         p99_response_time: 99th percentile response time.
+        response_time_sketch: Serialized mergeable percentile sketch of the hour's response times.
         created_at: When this rollup was created.
     """
 
@@ -2229,6 +2230,7 @@ class ToolMetricsHourly(Base):
     p50_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     p95_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     p99_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    response_time_sketch: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
 
 
@@ -2254,6 +2256,7 @@ class ResourceMetricsHourly(Base):
     p50_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     p95_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     p99_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    response_time_sketch: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
 
 
@@ -2279,6 +2282,7 @@ class PromptMetricsHourly(Base):
     p50_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     p95_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     p99_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    response_time_sketch: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
 
 
@@ -2304,6 +2308,7 @@ class ServerMetricsHourly(Base):
     p50_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     p95_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     p99_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    response_time_sketch: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
 
 
@@ -2330,6 +2335,7 @@ class A2AAgentMetricsHourly(Base):
     p50_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     p95_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     p99_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    response_time_sketch: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
 
 
@@ -2790,6 +2796,7 @@ class Tool(Base):
     enabled: Mapped[bool] = mapped_column(default=True)
     reachable: Mapped[bool] = mapped_column(default=True)
     jsonpath_filter: Mapped[str] = mapped_column(Text, default="")
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, comment="Hash of the upstream definition last synced into this row (federated tools)")
     tags: Mapped[List[str]] = mapped_column(JSON, default=list, nullable=False)
 
     # Comprehensive metadata for audit tracking
@@ -3200,6 +3207,7 @@ class Resource(Base):
     mime_type: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     size: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     uri_template: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # URI template for parameterized resources
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, comment="Hash of the upstream definition last synced into this row (federated resources)")
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, onupdate=utc_now)
     # is_active: Mapped[bool] = mapped_column(default=True)
@@ -3617,6 +3625,7 @@ class Prompt(Base):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     template: Mapped[str] = mapped_column(Text)
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, comment="Hash of the upstream definition last synced into this row (federated prompts)")
     argument_schema: Mapped[Dict[str, Any]] = mapped_column(JSON)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, onupdate=utc_now)
@@ -4402,6 +4411,7 @@ class Gateway(Base):
     # Per-gateway refresh configuration
     refresh_interval_seconds: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, comment="Per-gateway refresh interval in seconds; NULL uses global default")
     last_refresh_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True, comment="Timestamp of the last successful tools/resources/prompts refresh")
+    catalog_hashes: Mapped[Optional[Dict[str, str]]] = mapped_column(JSON, nullable=True, comment="Digest of the last synced upstream catalog per type (tools/resources/prompts)")
 
     # Relationship with OAuth tokens
     oauth_tokens: Mapped[List["OAuthToken"]] = relationship("OAuthToken", back_populates="gateway", cascade="all, delete-orphan")
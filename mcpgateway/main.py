@@ -29,19 +29,20 @@ Structure:
 # Standard
 import asyncio
 from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from functools import lru_cache
 import hashlib
 import html
 import os as _os  # local alias to avoid collisions
 import sys
-from typing import Any, AsyncIterator, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Union
 from urllib.parse import urlparse, urlunparse
 import uuid
 import warnings
 
 # Third-Party
-from fastapi import APIRouter, Body, Depends, FastAPI, HTTPException, Query, Request, status, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Body, Depends, FastAPI, HTTPException, Query, Request, Response, status, WebSocket, WebSocketDisconnect
 from fastapi.background import BackgroundTasks
 from fastapi.exception_handlers import request_validation_exception_handler as fastapi_default_validation_handler
 from fastapi.exceptions import RequestValidationError
@@ -68,6 +69,8 @@ from mcpgateway.admin import admin_router, set_logging_service
 from mcpgateway.auth import _check_token_revoked_sync, _lookup_api_token_sync, get_current_user, get_user_team_roles, normalize_token_teams
 from mcpgateway.bootstrap_db import main as bootstrap_db
 from mcpgateway.cache import ResourceCache, SessionRegistry
+from mcpgateway.cache.listing_cache import listing_cache, ListingCache
+from mcpgateway.cache.registry_versions import registry_listing_headers, registry_versions
 from mcpgateway.common.models import InitializeResult
 from mcpgateway.common.models import JSONRPCError as PydanticJSONRPCError
 from mcpgateway.common.models import ListResourceTemplatesResult, LogLevel, Root
@@ -85,7 +88,7 @@ from mcpgateway.middleware.security_headers import SecurityHeadersMiddleware
 from mcpgateway.middleware.token_scoping import token_scoping_middleware
 from mcpgateway.middleware.validation_middleware import ValidationMiddleware
 from mcpgateway.observability import init_telemetry
-from mcpgateway.plugins.framework import PluginError, PluginManager, PluginViolationError
+from mcpgateway.plugins.framework import GlobalContext, PluginContextTable, PluginError, PluginManager, PluginViolationError
 from mcpgateway.routers.server_well_known import router as server_well_known_router
 from mcpgateway.routers.well_known import router as well_known_router
 from mcpgateway.schemas import (
@@ -440,7 +443,7 @@ def _get_rpc_filter_context(request: Request, user) -> tuple:
 
 
 # Initialize cache
-resource_cache = ResourceCache(max_size=settings.resource_cache_size, ttl=settings.resource_cache_ttl)
+resource_cache =ResourceCache(max_size=settings.resource_cache_size, ttl=settings.resource_cache_ttl)
 
 
 @lru_cache(maxsize=512)
@@ -644,6 +647,11 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
             # Configurable health check chain - ordered list of methods to try.
             health_check_methods=settings.mcp_session_pool_health_check_methods,
             health_check_timeout_seconds=settings.mcp_session_pool_health_check_timeout,
+            max_in_flight_per_session=settings.mcp_session_pool_max_in_flight_per_session,
+            warmup_top_n=settings.mcp_session_pool_warmup_top_n if settings.mcp_session_pool_warmup_enabled else 0,
+            warmup_min_sessions=settings.mcp_session_pool_warmup_min_sessions,
+            warmup_interval_seconds=settings.mcp_session_pool_warmup_interval,
+            warmup_refresh_margin_seconds=settings.mcp_session_pool_warmup_refresh_margin,
         )
         logger.info("MCP session pool initialized")
 
@@ -682,6 +690,12 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
 
             await start_pool_notification_service(gateway_service)
 
+            if settings.mcp_session_pool_warmup_enabled:
+                # First-Party
+                from mcpgateway.services.mcp_session_pool import get_mcp_session_pool  # pylint: disable=import-outside-toplevel
+
+                get_mcp_session_pool().start_warmup()
+
             # Start RPC listener for multi-worker session affinity
             if settings.mcpgateway_session_affinity_enabled:
                 # First-Party
@@ -730,6 +744,20 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
             else:
                 logger.info("Metrics buffer service initialized (recording disabled)")
 
+        # Initialize buffered structured log persistence
+        if settings.structured_logging_database_enabled and settings.structured_logging_buffer_enabled:
+            # First-Party
+            from mcpgateway.services.log_buffer_service import get_log_buffer_service  # pylint: disable=import-outside-toplevel
+
+            await get_log_buffer_service().start()
+
+        # Initialize buffered trace export for the observability middleware
+        if settings.observability_enabled and settings.observability_buffer_enabled:
+            # First-Party
+            from mcpgateway.services.observability_buffer_service import get_observability_buffer_service  # pylint: disable=import-outside-toplevel
+
+            await get_observability_buffer_service().start()
+
         # Initialize metrics cleanup service for automatic deletion of old metrics
         if settings.metrics_cleanup_enabled:
             # First-Party
@@ -911,6 +939,20 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
             metrics_cleanup_service = get_metrics_cleanup_service()
             services_to_shutdown.insert(2, metrics_cleanup_service)
 
+        # Export traces still buffered by the observability middleware
+        if settings.observability_enabled and settings.observability_buffer_enabled:
+            # First-Party
+            from mcpgateway.services.observability_buffer_service import get_observability_buffer_service  # pylint: disable=import-outside-toplevel
+
+            services_to_shutdown.insert(0, get_observability_buffer_service())
+
+        # Flush buffered structured logs last, after other services have logged their shutdown
+        if settings.structured_logging_database_enabled and settings.structured_logging_buffer_enabled:
+            # First-Party
+            from mcpgateway.services.log_buffer_service import get_log_buffer_service  # pylint: disable=import-outside-toplevel
+
+            services_to_shutdown.append(get_log_buffer_service())
+
         await shutdown_services(services_to_shutdown)
 
         # Shutdown MCP session pool (before shared HTTP client)
@@ -1252,9 +1294,24 @@ async def plugin_violation_exception_handler(_request: Request, exc: PluginViola
         >>> content["error"]["data"]["plugin_error_code"]
         'PROHIBITED_CONTENT'
     """
-    policy_violation = exc.violation.model_dump() if exc.violation else {}
+    return ORJSONResponse(status_code=200, content={"error": _plugin_violation_to_jsonrpc_error(exc).model_dump()})
+
+
+def _plugin_violation_to_jsonrpc_error(exc: PluginViolationError) -> PydanticJSONRPCError:
+    """Convert a plugin violation into a JSON-RPC error object.
+
+    Args:
+        exc: The PluginViolationError raised by a plugin.
+
+    Returns:
+        PydanticJSONRPCError: The JSON-RPC error describing the violation.
+
+    Examples:
+        >>> from mcpgateway.plugins.framework import PluginViolationError
+        >>> _plugin_violation_to_jsonrpc_error(PluginViolationError(message="denied")).code
+        -32602
+    """
     message = exc.violation.description if exc.violation else "A plugin violation occurred."
-    policy_violation["message"] = exc.message
     status_code = exc.violation.mcp_error_code if exc.violation and exc.violation.mcp_error_code else -32602
     violation_details: dict[str, Any] = {}
     if exc.violation:
@@ -1266,8 +1323,7 @@ async def plugin_violation_exception_handler(_request: Request, exc: PluginViola
             violation_details["plugin_error_code"] = exc.violation.code
         if exc.violation.plugin_name:
             violation_details["plugin_name"] = exc.violation.plugin_name
-    json_rpc_error = PydanticJSONRPCError(code=status_code, message="Plugin Violation: " + message, data=violation_details)
-    return ORJSONResponse(status_code=200, content={"error": json_rpc_error.model_dump()})
+    return PydanticJSONRPCError(code=status_code, message="Plugin Violation: " + message, data=violation_details)
 
 
 @app.exception_handler(PluginError)
@@ -1313,6 +1369,25 @@ async def plugin_exception_handler(_request: Request, exc: PluginError):
         >>> content["error"]["data"]["plugin_name"]
         'abc'
     """
+    return ORJSONResponse(status_code=200, content={"error": _plugin_error_to_jsonrpc_error(exc).model_dump()})
+
+
+def _plugin_error_to_jsonrpc_error(exc: PluginError) -> PydanticJSONRPCError:
+    """Convert a plugin error into a JSON-RPC error object.
+
+    Args:
+        exc: The PluginError raised by a plugin.
+
+    Returns:
+        PydanticJSONRPCError: The JSON-RPC error describing the plugin failure.
+
+    Examples:
+        >>> from mcpgateway.plugins.framework import PluginError
+        >>> from mcpgateway.plugins.framework.models import PluginErrorModel
+        >>> err = _plugin_error_to_jsonrpc_error(PluginError(error=PluginErrorModel(message="boom", plugin_name="p")))
+        >>> err.message
+        'Plugin Error: boom'
+    """
     message = exc.error.message if exc.error else "A plugin error occurred."
     status_code = exc.error.mcp_error_code if exc.error else -32603
     error_details: dict[str, Any] = {}
@@ -1323,8 +1398,7 @@ async def plugin_exception_handler(_request: Request, exc: PluginError):
             error_details["plugin_error_code"] = exc.error.code
         if exc.error.plugin_name:
             error_details["plugin_name"] = exc.error.plugin_name
-    json_rpc_error = PydanticJSONRPCError(code=status_code, message="Plugin Error: " + message, data=error_details)
-    return ORJSONResponse(status_code=200, content={"error": json_rpc_error.model_dump()})
+    return PydanticJSONRPCError(code=status_code, message="Plugin Error: " + message, data=error_details)
 
 
 def _normalize_scope_path(scope_path: str, root_path: str) -> str:
@@ -2048,6 +2122,31 @@ async def _read_request_json(request: Request) -> Any:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid JSON in request body") from exc
 
 
+def _reject_since_with_filters(**filters: Optional[str]) -> None:
+    """Refuse delta listings combined with listing filters.
+
+    ``since`` deltas are computed from the registry change log and only apply the
+    caller's team and visibility scope, so filters such as tags would be ignored.
+
+    Args:
+        **filters: Filter query parameters by name.
+
+    Raises:
+        HTTPException: 400 when any filter is set.
+
+    Examples:
+        >>> _reject_since_with_filters(tags=None, visibility="")
+        >>> try:
+        ...     _reject_since_with_filters(tags="a", visibility=None, gateway_id="g1")
+        ... except HTTPException as exc:
+        ...     print(exc.status_code, exc.detail)
+        400 The since parameter cannot be combined with: tags, gateway_id
+    """
+    used = [name for name, value in filters.items() if value]
+    if used:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"The since parameter cannot be combined with: {', '.join(used)}")
+
+
 def require_api_key(api_key: str) -> None:
     """Validates the provided API key.
 
@@ -2412,8 +2511,10 @@ async def list_servers(
     tags: Optional[str] = None,
     team_id: Optional[str] = None,
     visibility: Optional[str] = None,
+    since: Optional[str] = None,
     db: Session = Depends(get_db),
     user=Depends(get_current_user_with_permissions),
+    response: Response = None,
 ) -> Union[List[ServerRead], Dict[str, Any]]:
     """
     Lists servers accessible to the user, with team filtering and cursor pagination support.
@@ -2427,8 +2528,10 @@ async def list_servers(
         tags (Optional[str]): Comma-separated list of tags to filter by.
         team_id (Optional[str]): Filter by specific team ID.
         visibility (Optional[str]): Filter by visibility (private, team, public).
+        since (Optional[str]): X-Registry-Version token for delta listing.
         db (Session): The database session used to interact with the data store.
         user (str): The authenticated user making the request.
+        response (Response): Outgoing response used to attach ETag headers.
 
     Returns:
         Union[List[ServerRead], Dict[str, Any]]: A list of server objects or paginated response with nextCursor.
@@ -2463,6 +2566,17 @@ async def list_servers(
 
     # Use consolidated server listing with optional team filtering
     # For admin bypass: pass user_email=None and token_teams=None to skip all filtering
+    filter_email = None if is_admin_bypass else user_email
+    registry_headers, not_modified = registry_listing_headers(request, "servers", filter_email, token_teams, team_id)
+    if not_modified is not None:
+        return not_modified
+    if since is not None and registry_headers:
+        _reject_since_with_filters(tags=tags, visibility=visibility)
+        delta = registry_versions.delta(db, "servers", since, filter_email, token_teams, team_id, include_inactive)
+        return ORJSONResponse(content=delta, headers=registry_headers)
+    if response is not None:
+        response.headers.update(registry_headers)
+
     logger.debug(f"User: {user_email} requested server list with include_inactive={include_inactive}, tags={tags_list}, team_id={team_id}, visibility={visibility}")
     data, next_cursor = await server_service.list_servers(
         db=db,
@@ -3532,9 +3646,11 @@ async def list_tools(
     team_id: Optional[str] = Query(None, description="Filter by team ID"),
     visibility: Optional[str] = Query(None, description="Filter by visibility: private, team, public"),
     gateway_id: Optional[str] = Query(None, description="Filter by gateway ID"),
+    since: Optional[str] = None,
     db: Session = Depends(get_db),
     apijsonpath: JsonPathModifier = Body(None),
     user=Depends(get_current_user_with_permissions),
+    response: Response = None,
 ) -> Union[List[ToolRead], List[Dict], Dict]:
     """List all registered tools with team-based filtering and pagination support.
 
@@ -3549,9 +3665,11 @@ async def list_tools(
         team_id: Optional team ID to filter tools by specific team
         visibility: Optional visibility filter (private, team, public)
         gateway_id: Optional gateway ID to filter tools by specific gateway
+        since: X-Registry-Version token for delta listing
         db: Database session
         apijsonpath: JSON path modifier to filter or transform the response
         user: Authenticated user with permissions
+        response: Outgoing response used to attach ETag headers
 
     Returns:
         List of tools or modified result based on jsonpath
@@ -3592,6 +3710,17 @@ async def list_tools(
     if not is_empty_team_token:
         team_id = team_id or token_team_id
 
+    # Tool payloads depend on the requester (header masking) and any jsonpath body
+    registry_headers, not_modified = registry_listing_headers(request, "tools", user_email, token_teams, team_id, _req_email, _req_is_admin) if apijsonpath is None else ({}, None)
+    if not_modified is not None:
+        return not_modified
+    if since is not None and registry_headers:
+        _reject_since_with_filters(tags=tags, visibility=visibility, gateway_id=gateway_id)
+        delta = registry_versions.delta(db, "tools", since, user_email, token_teams, team_id, include_inactive)
+        return ORJSONResponse(content=delta, headers=registry_headers)
+    if response is not None:
+        response.headers.update(registry_headers)
+
     # Use unified list_tools() with token-based team filtering
     # Always apply visibility filtering based on token scope
     _req_team_roles = get_user_team_roles(db, _req_email) if _req_email and not _req_is_admin else None
@@ -4070,8 +4199,10 @@ async def list_resources(
     tags: Optional[str] = None,
     team_id: Optional[str] = None,
     visibility: Optional[str] = None,
+    since: Optional[str] = None,
     db: Session = Depends(get_db),
     user=Depends(get_current_user_with_permissions),
+    response: Response = None,
 ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
     """
     Retrieve a list of resources accessible to the user, with team filtering and cursor pagination support.
@@ -4085,8 +4216,10 @@ async def list_resources(
         tags (Optional[str]): Comma-separated list of tags to filter by.
         team_id (Optional[str]): Filter by specific team ID.
         visibility (Optional[str]): Filter by visibility (private, team, public).
+        since (Optional[str]): X-Registry-Version token for delta listing.
         db (Session): Database session.
         user (str): Authenticated user.
+        response (Response): Outgoing response used to attach ETag headers.
 
     Returns:
         Union[List[ResourceRead], Dict[str, Any]]: List of resources or paginated response with nextCursor.
@@ -4126,6 +4259,16 @@ async def list_resources(
 
     # Use unified list_resources() with token-based team filtering
     # Always apply visibility filtering based on token scope
+    registry_headers, not_modified = registry_listing_headers(request, "resources", user_email, token_teams, team_id)
+    if not_modified is not None:
+        return not_modified
+    if since is not None and registry_headers:
+        _reject_since_with_filters(tags=tags, visibility=visibility)
+        delta = registry_versions.delta(db, "resources", since, user_email, token_teams, team_id, include_inactive)
+        return ORJSONResponse(content=delta, headers=registry_headers)
+    if response is not None:
+        response.headers.update(registry_headers)
+
     logger.debug(f"User {user_email} requested resource list with cursor {cursor}, include_inactive={include_inactive}, tags={tags_list}, team_id={team_id}, visibility={visibility}")
     data, next_cursor = await resource_service.list_resources(
         db=db,
@@ -4556,8 +4699,10 @@ async def list_prompts(
     tags: Optional[str] = None,
     team_id: Optional[str] = None,
     visibility: Optional[str] = None,
+    since: Optional[str] = None,
     db: Session = Depends(get_db),
     user=Depends(get_current_user_with_permissions),
+    response: Response = None,
 ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
     """
     List prompts accessible to the user, with team filtering and cursor pagination support.
@@ -4571,8 +4716,10 @@ async def list_prompts(
         tags: Comma-separated list of tags to filter by.
         team_id: Filter by specific team ID.
         visibility: Filter by visibility (private, team, public).
+        since: X-Registry-Version token for delta listing.
         db: Database session.
         user: Authenticated user.
+        response: Outgoing response used to attach ETag headers.
 
     Returns:
         Union[List[Dict[str, Any]], Dict[str, Any]]: List of prompt records or paginated response with nextCursor.
@@ -4612,6 +4759,16 @@ async def list_prompts(
 
     # Use consolidated prompt listing with token-based team filtering
     # Always apply visibility filtering based on token scope
+    registry_headers, not_modified = registry_listing_headers(request, "prompts", user_email, token_teams, team_id)
+    if not_modified is not None:
+        return not_modified
+    if since is not None and registry_headers:
+        _reject_since_with_filters(tags=tags, visibility=visibility)
+        delta = registry_versions.delta(db, "prompts", since, user_email, token_teams, team_id, include_inactive)
+        return ORJSONResponse(content=delta, headers=registry_headers)
+    if response is not None:
+        response.headers.update(registry_headers)
+
     logger.debug(f"User: {user_email} requested prompt list with include_inactive={include_inactive}, cursor={cursor}, tags={tags_list}, team_id={team_id}, visibility={visibility}")
     data, next_cursor = await prompt_service.list_prompts(
         db=db,
@@ -5057,8 +5214,10 @@ async def list_gateways(
     include_inactive: bool = False,
     team_id: Optional[str] = Query(None, description="Filter by team ID"),
     visibility: Optional[str] = Query(None, description="Filter by visibility: private, team, public"),
+    since: Optional[str] = None,
     db: Session = Depends(get_db),
     user=Depends(get_current_user_with_permissions),
+    response: Response = None,
 ) -> Union[List[GatewayRead], Dict[str, Any]]:
     """
     List all gateways with cursor pagination support.
@@ -5071,8 +5230,10 @@ async def list_gateways(
         include_inactive: Include inactive gateways.
         team_id (Optional): Filter by specific team ID.
         visibility (Optional): Filter by visibility (private, team, public).
+        since: X-Registry-Version token for delta listing.
         db: Database session.
         user: Authenticated user.
+        response: Outgoing response used to attach ETag headers.
 
     Returns:
         Union[List[GatewayRead], Dict[str, Any]]: List of gateway records or paginated response with nextCursor.
@@ -5104,6 +5265,17 @@ async def list_gateways(
 
     # Use consolidated gateway listing with optional team filtering
     # For admin bypass: pass user_email=None and token_teams=None to skip all filtering
+    filter_email = None if is_admin_bypass else user_email
+    registry_headers, not_modified = registry_listing_headers(request, "gateways", filter_email, token_teams, team_id)
+    if not_modified is not None:
+        return not_modified
+    if since is not None and registry_headers:
+        _reject_since_with_filters(visibility=visibility)
+        delta = registry_versions.delta(db, "gateways", since, filter_email, token_teams, team_id, include_inactive)
+        return ORJSONResponse(content=delta, headers=registry_headers)
+    if response is not None:
+        response.headers.update(registry_headers)
+
     logger.debug(f"User: {user_email} requested gateway list with include_inactive={include_inactive}, team_id={team_id}, visibility={visibility}")
     data, next_cursor = await gateway_service.list_gateways(
         db=db,
@@ -5602,6 +5774,10 @@ async def remove_root(
 async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depends(get_current_user_with_permissions)):
     """Handle RPC requests.
 
+    Accepts either a single JSON-RPC request object or a JSON-RPC 2.0 batch array.
+    Authentication, RBAC and token scoping run once for the HTTP request; batch
+    entries are then dispatched concurrently (see ``_handle_rpc_batch``).
+
     Args:
         request (Request): The incoming FastAPI request.
         db (Session): Database session.
@@ -5614,7 +5790,6 @@ async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depen
         PluginError: If encounters issue with plugin
         PluginViolationError: If plugin violated the request. Example - In case of OPA plugin, if the request is denied by policy.
     """
-    req_id = None
     try:
         # Extract user identifier from either RBAC user object or JWT payload
         if hasattr(user, "email"):
@@ -5636,13 +5811,956 @@ async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depen
                     "id": None,
                 },
             )
+    except Exception as e:
+        logger.error(f"RPC error: {str(e)}")
+        return {
+            "jsonrpc": "2.0",
+            "error": {"code": -32000, "message": "Internal error", "data": str(e)},
+            "id": None,
+        }
+
+    if isinstance(body, list):
+        return await _handle_rpc_batch(request, body, user)
+    return await _handle_rpc_message(request, body, db, user)
+
+
+def _copy_plugin_contexts(request: Request) -> tuple[Optional[PluginContextTable], Optional[GlobalContext]]:
+    """Copy the request's plugin contexts so one batch entry cannot leak state into another.
+
+    Args:
+        request: The incoming FastAPI request carrying middleware plugin contexts.
+
+    Returns:
+        tuple: Deep copies of the plugin context table and global context (``None`` when absent).
+
+    Examples:
+        >>> from types import SimpleNamespace
+        >>> gc = GlobalContext(request_id="r1", state={"k": "v"})
+        >>> req = SimpleNamespace(state=SimpleNamespace(plugin_global_context=gc, plugin_context_table=None))
+        >>> table, copied = _copy_plugin_contexts(req)
+        >>> table is None, copied.request_id, copied is gc
+        (True, 'r1', False)
+    """
+    context_table = getattr(request.state, "plugin_context_table", None)
+    global_context = getattr(request.state, "plugin_global_context", None)
+    if isinstance(context_table, dict):
+        context_table = {key: ctx.model_copy(deep=True) for key, ctx in context_table.items()}
+    if isinstance(global_context, GlobalContext):
+        global_context = global_context.model_copy(deep=True)
+    return context_table, global_context
+
+
+async def _handle_rpc_batch(request: Request, batch: List[Any], user) -> Any:
+    """Dispatch a JSON-RPC 2.0 batch with bounded concurrency.
+
+    Each entry runs through ``_handle_rpc_message`` with its own database session and its
+    own copy of the plugin contexts, so concurrent calls never share a ``Session`` or
+    mutate each other's ``GlobalContext``. At most ``mcpgateway_rpc_batch_max_concurrency``
+    entries execute at once. Responses are returned in request order; notifications
+    (entries without an ``id`` member) produce no response entry.
+
+    Args:
+        request: The incoming FastAPI request.
+        batch: The decoded JSON-RPC batch array.
+        user: The authenticated user, resolved once for the whole batch.
+
+    Returns:
+        A list of JSON-RPC responses, an error response for invalid batches, or an
+        empty 202 response when the batch only contained notifications.
+    """
+    if not settings.mcpgateway_rpc_batch_enabled:
+        return ORJSONResponse(status_code=400, content={"jsonrpc": "2.0", "error": {"code": -32600, "message": "Batch requests are not supported"}, "id": None})
+    if not batch:
+        return ORJSONResponse(status_code=400, content={"jsonrpc": "2.0", "error": {"code": -32600, "message": "Invalid Request"}, "id": None})
+    if len(batch) > settings.mcpgateway_rpc_batch_max_size:
+        return ORJSONResponse(
+            status_code=400,
+            content={
+                "jsonrpc": "2.0",
+                "error": {"code": -32600, "message": f"Batch too large: {len(batch)} requests exceeds limit of {settings.mcpgateway_rpc_batch_max_size}"},
+                "id": None,
+            },
+        )
+
+    semaphore = asyncio.Semaphore(settings.mcpgateway_rpc_batch_max_concurrency)
+
+    async def dispatch(entry: Any) -> Any:
+        """Execute one batch entry and always return a JSON-RPC response object.
+
+        Args:
+            entry: A single JSON-RPC request object from the batch.
+
+        Returns:
+            The JSON-RPC response for the entry.
+        """
+        if not isinstance(entry, dict):
+            return {"jsonrpc": "2.0", "error": {"code": -32600, "message": "Invalid Request"}, "id": None}
+        entry_id = entry.get("id")
+        context_table, global_context = _copy_plugin_contexts(request)
+        async with semaphore:
+            entry_db = SessionLocal()
+            try:
+                response = await _handle_rpc_message(request, entry, entry_db, user, plugin_context_table=context_table, plugin_global_context=global_context)
+                if entry_db.is_active:
+                    entry_db.commit()
+            except PluginViolationError as e:
+                entry_db.rollback()
+                return {"jsonrpc": "2.0", "error": _plugin_violation_to_jsonrpc_error(e).model_dump(), "id": entry_id}
+            except PluginError as e:
+                entry_db.rollback()
+                return {"jsonrpc": "2.0", "error": _plugin_error_to_jsonrpc_error(e).model_dump(), "id": entry_id}
+            except Exception as e:
+                entry_db.rollback()
+                logger.error(f"RPC batch entry error: {str(e)}")
+                return {"jsonrpc": "2.0", "error": {"code": -32000, "message": "Internal error", "data": str(e)}, "id": entry_id}
+            finally:
+                entry_db.close()
+        if isinstance(response, starletteResponse):
+            # The single-request path answers invalid requests with a bare HTTP error
+            return {"jsonrpc": "2.0", "error": {"code": -32600, "message": "Invalid Request"}, "id": entry_id}
+        return response
+
+    logger.debug(f"Dispatching JSON-RPC batch of {len(batch)} requests")
+    responses = await asyncio.gather(*(dispatch(entry) for entry in batch))
+    results = [response for entry, response in zip(batch, responses) if not (isinstance(entry, dict) and "id" not in entry)]
+    if not results:
+        return starletteResponse(status_code=202)
+    return results
+
+
+@dataclass
+class _RPCCall:
+    """Per-message state shared by the JSON-RPC method handlers.
+
+    Built once per JSON-RPC request object so handlers do not re-parse params or
+    re-derive the caller's visibility scope.
+
+    Attributes:
+        request: The incoming FastAPI request.
+        db: Database session used for this call.
+        user: The authenticated user (dict with RBAC context).
+        method: JSON-RPC method name.
+        params: JSON-RPC params object.
+        req_id: JSON-RPC request id (generated when the client omitted it).
+        headers: Lower-cased request headers.
+        plugin_context_table: Plugin context table for cross-hook sharing.
+        plugin_global_context: Plugin global context for cross-hook sharing.
+    """
+
+    request: Request
+    db: Session
+    user: Any
+    method: str
+    params: Dict[str, Any]
+    req_id: Any
+    headers: Dict[str, str]
+    plugin_context_table: Optional[PluginContextTable] = None
+    plugin_global_context: Optional[GlobalContext] = None
+    _filter_context: Optional[tuple] = field(default=None, repr=False)
+
+    @property
+    def server_id(self) -> Optional[str]:
+        """Server ID the call is scoped to, if any.
+
+        Returns:
+            Optional[str]: The ``server_id`` param.
+        """
+        return self.params.get("server_id", None)
+
+    @property
+    def cursor(self) -> Optional[str]:
+        """Pagination cursor supplied by the client.
+
+        Returns:
+            Optional[str]: The ``cursor`` param.
+        """
+        return self.params.get("cursor")
+
+    def filter_context(self) -> tuple:
+        """Return the caller's raw ``(email, token_teams, is_admin)`` filter context, resolved once.
+
+        Returns:
+            tuple: Result of ``_get_rpc_filter_context`` for this request.
+        """
+        if self._filter_context is None:
+            self._filter_context = _get_rpc_filter_context(self.request, self.user)
+        return self._filter_context
+
+    def visibility_scope(self) -> tuple[Optional[str], Optional[List[str]]]:
+        """Return the ``(user_email, token_teams)`` pair services use for visibility filtering.
+
+        Admin bypass applies only when the token has NO team restrictions; a
+        non-admin without teams is restricted to public items (secure default).
+
+        Returns:
+            tuple: ``(None, None)`` for unrestricted admins, otherwise the email and team list.
+        """
+        user_email, token_teams, is_admin = self.filter_context()
+        if is_admin and token_teams is None:
+            return None, None
+        if token_teams is None:
+            return user_email, []
+        return user_email, token_teams
+
+    def release_db(self) -> None:
+        """Commit and close the session early to avoid idle-in-transaction connections under load."""
+        self.db.commit()
+        self.db.close()
+
+
+async def _rpc_initialize(call: _RPCCall) -> Any:
+    """Handle ``initialize``.
+
+    Args:
+        call: Per-message RPC state.
+
+    Returns:
+        The serialized initialize result.
+    """
+    params = call.params
+    # Extract session_id from params or query string (for capability tracking)
+    init_session_id = params.get("session_id") or params.get("sessionId") or call.request.query_params.get("session_id")
+    # Pass server_id to advertise OAuth capability if configured per RFC 9728
+    result = await session_registry.handle_initialize_logic(params, session_id=init_session_id, server_id=call.server_id)
+    if hasattr(result, "model_dump"):
+        result = result.model_dump(by_alias=True, exclude_none=True)
+
+    # Register session ownership in Redis for multi-worker affinity
+    # This must happen AFTER initialize succeeds so subsequent requests route to this worker
+    mcp_session_id = call.headers.get("mcp-session-id") or call.headers.get("x-mcp-session-id")
+    if settings.mcpgateway_session_affinity_enabled and mcp_session_id and mcp_session_id != "not-provided":
+        try:
+            # First-Party
+            from mcpgateway.services.mcp_session_pool import get_mcp_session_pool, WORKER_ID  # pylint: disable=import-outside-toplevel
+
+            pool = get_mcp_session_pool()
+            # Claim-or-refresh ownership for this session (does not steal).
+            await pool.register_pool_session_owner(mcp_session_id)
+            logger.debug(f"[AFFINITY_INIT] Worker {WORKER_ID} | Session {mcp_session_id[:8]}... | Registered ownership after initialize")
+        except Exception as e:
+            logger.warning(f"[AFFINITY_INIT] Failed to register session ownership: {e}")
+    return result
+
+
+def _store_listing(cache_key: str, result: Dict[str, Any], kind: str) -> None:
+    """Serialize a listing result into the scope-aware listing cache.
+
+    Args:
+        cache_key: Key built with ``ListingCache.make_key``.
+        result: JSON-RPC result dict.
+        kind: Listing type (tools, resources, prompts).
+    """
+    if not listing_cache.enabled:
+        return
+    try:
+        listing_cache.set(cache_key, orjson.dumps(result, default=str), kind)
+    except TypeError as e:
+        logger.debug(f"Skipping listing cache for {kind}: {e}")
+
+
+async def _rpc_list_tools(call: _RPCCall) -> Any:
+    """Handle ``tools/list`` and the legacy ``list_tools`` method.
+
+    Args:
+        call: Per-message RPC state.
+
+    Returns:
+        dict: The tool listing.
+    """
+    _req_email, _, _req_is_admin = call.filter_context()
+    user_email, token_teams = call.visibility_scope()
+    # Header masking depends on the requester, so it is part of the key
+    cache_key = ListingCache.make_key("tools", ListingCache.scope_key(user_email, token_teams), call.server_id, call.cursor, requester="admin" if _req_is_admin else _req_email)
+    cached = listing_cache.get(cache_key)
+    if cached is not None:
+        return orjson.loads(cached)
+    result = await _list_tools_uncached(call, _req_email, _req_is_admin, user_email, token_teams)
+    _store_listing(cache_key, result, "tools")
+    return result
+
+
+async def _list_tools_uncached(call: _RPCCall, req_email: Optional[str], req_is_admin: bool, user_email: Optional[str], token_teams: Optional[List[str]]) -> Dict[str, Any]:
+    """Query a ``tools/list`` page from the database.
+
+    Args:
+        call: Per-message RPC state.
+        req_email: Requester email used for header masking.
+        req_is_admin: Whether the requester is an admin.
+        user_email: Visibility scope email.
+        token_teams: Visibility scope teams.
+
+    Returns:
+        dict: The tool listing.
+    """
+    req_team_roles = get_user_team_roles(call.db, req_email) if req_email and not req_is_admin else None
+    if call.server_id:
+        tools = await tool_service.list_server_tools(
+            call.db,
+            call.server_id,
+            cursor=call.cursor,
+            user_email=user_email,
+            token_teams=token_teams,
+            requesting_user_email=req_email,
+            requesting_user_is_admin=req_is_admin,
+            requesting_user_team_roles=req_team_roles,
+        )
+        call.release_db()
+        return {"tools": [t.model_dump(by_alias=True, exclude_none=True) for t in tools]}
+    tools, next_cursor = await tool_service.list_tools(
+        call.db,
+        cursor=call.cursor,
+        limit=0,
+        user_email=user_email,
+        token_teams=token_teams,
+        requesting_user_email=req_email,
+        requesting_user_is_admin=req_is_admin,
+        requesting_user_team_roles=req_team_roles,
+    )
+    call.release_db()
+    result = {"tools": [t.model_dump(by_alias=True, exclude_none=True) for t in tools]}
+    if next_cursor:
+        result["nextCursor"] = next_cursor
+    return result
+
+
+async def _rpc_list_gateways(call: _RPCCall) -> Any:
+    """Handle the legacy ``list_gateways`` method.
+
+    Args:
+        call: Per-message RPC state.
+
+    Returns:
+        dict: The gateway listing.
+    """
+    user_email, token_teams = call.visibility_scope()
+    gateways, next_cursor = await gateway_service.list_gateways(call.db, include_inactive=False, user_email=user_email, token_teams=token_teams)
+    call.release_db()
+    result = {"gateways": [g.model_dump(by_alias=True, exclude_none=True) for g in gateways]}
+    if next_cursor:
+        result["nextCursor"] = next_cursor
+    return result
+
+
+async def _rpc_list_roots(_call: _RPCCall) -> Any:
+    """Handle ``roots/list`` and the legacy ``list_roots`` method.
+
+    Args:
+        _call: Per-message RPC state (unused).
+
+    Returns:
+        dict: The configured roots.
+    """
+    roots = await root_service.list_roots()
+    return {"roots": [r.model_dump(by_alias=True, exclude_none=True) for r in roots]}
+
+
+async def _rpc_list_resources(call: _RPCCall) -> Any:
+    """Handle ``resources/list``.
+
+    Args:
+        call: Per-message RPC state.
+
+    Returns:
+        dict: The resource listing.
+    """
+    user_email, token_teams = call.visibility_scope()
+    cache_key = ListingCache.make_key("resources", ListingCache.scope_key(user_email, token_teams), call.server_id, call.cursor)
+    cached = listing_cache.get(cache_key)
+    if cached is not None:
+        return orjson.loads(cached)
+    if call.server_id:
+        resources = await resource_service.list_server_resources(call.db, call.server_id, user_email=user_email, token_teams=token_teams)
+        call.release_db()
+        result = {"resources": [r.model_dump(by_alias=True, exclude_none=True) for r in resources]}
+    else:
+        resources, next_cursor = await resource_service.list_resources(call.db, cursor=call.cursor, limit=0, user_email=user_email, token_teams=token_teams)
+        call.release_db()
+        result = {"resources": [r.model_dump(by_alias=True, exclude_none=True) for r in resources]}
+        if next_cursor:
+            result["nextCursor"] = next_cursor
+    _store_listing(cache_key, result, "resources")
+    return result
+
+
+async def _rpc_read_resource(call: _RPCCall) -> Any:
+    """Handle ``resources/read``.
+
+    Args:
+        call: Per-message RPC state.
+
+    Returns:
+        dict: The resource contents.
+
+    Raises:
+        JSONRPCError: If the URI is missing or the resource does not exist.
+    """
+    params = call.params
+    uri = params.get("uri")
+    if not uri:
+        raise JSONRPCError(-32602, "Missing resource URI in parameters", params)
+
+    auth_user_email, auth_token_teams = call.visibility_scope()
+    try:
+        result = await resource_service.read_resource(
+            call.db,
+            resource_uri=uri,
+            request_id=params.get("requestId", None),
+            user=auth_user_email,
+            server_id=call.server_id,
+            token_teams=auth_token_teams,
+            plugin_context_table=call.plugin_context_table,
+            plugin_global_context=call.plugin_global_context,
+            meta_data=params.get("_meta", None),
+        )
+        if hasattr(result, "model_dump"):
+            result = {"contents": [result.model_dump(by_alias=True, exclude_none=True)]}
+        else:
+            result = {"contents": [result]}
+    except ValueError:
+        # Resource not found in the gateway
+        logger.error(f"Resource not found: {uri}")
+        raise JSONRPCError(-32002, f"Resource not found: {uri}", {"uri": uri})
+    # Release transaction after resources/read completes
+    call.release_db()
+    return result
+
+
+async def _rpc_subscribe_resource(call: _RPCCall) -> Any:
+    """Handle ``resources/subscribe`` and ``resources/unsubscribe``.
+
+    Args:
+        call: Per-message RPC state.
+
+    Returns:
+        dict: Empty result per the MCP spec.
+
+    Raises:
+        JSONRPCError: If the URI is missing.
+    """
+    uri = call.params.get("uri")
+    if not uri:
+        raise JSONRPCError(-32602, "Missing resource URI in parameters", call.params)
+    # Get user email for subscriber ID
+    subscription = ResourceSubscription(uri=uri, subscriber_id=get_user_email(call.user))
+    if call.method == "resources/subscribe":
+        await resource_service.subscribe_resource(call.db, subscription)
+    else:
+        await resource_service.unsubscribe_resource(call.db, subscription)
+    call.release_db()
+    return {}
+
+
+async def _rpc_list_prompts(call: _RPCCall) -> Any:
+    """Handle ``prompts/list``.
+
+    Args:
+        call: Per-message RPC state.
+
+    Returns:
+        dict: The prompt listing.
+    """
+    user_email, token_teams = call.visibility_scope()
+    cache_key = ListingCache.make_key("prompts", ListingCache.scope_key(user_email, token_teams), call.server_id, call.cursor)
+    cached = listing_cache.get(cache_key)
+    if cached is not None:
+        return orjson.loads(cached)
+    if call.server_id:
+        prompts = await prompt_service.list_server_prompts(call.db, call.server_id, cursor=call.cursor, user_email=user_email, token_teams=token_teams)
+        call.release_db()
+        result = {"prompts": [p.model_dump(by_alias=True, exclude_none=True) for p in prompts]}
+    else:
+        prompts, next_cursor = await prompt_service.list_prompts(call.db, cursor=call.cursor, limit=0, user_email=user_email, token_teams=token_teams)
+        call.release_db()
+        result = {"prompts": [p.model_dump(by_alias=True, exclude_none=True) for p in prompts]}
+        if next_cursor:
+            result["nextCursor"] = next_cursor
+    _store_listing(cache_key, result, "prompts")
+    return result
+
+
+async def _rpc_get_prompt(call: _RPCCall) -> Any:
+    """Handle ``prompts/get``.
+
+    Args:
+        call: Per-message RPC state.
+
+    Returns:
+        The rendered prompt.
+
+    Raises:
+        JSONRPCError: If the prompt name is missing.
+    """
+    params = call.params
+    name = params.get("name")
+    if not name:
+        raise JSONRPCError(-32602, "Missing prompt name in parameters", params)
+
+    auth_user_email, auth_token_teams = call.visibility_scope()
+    result = await prompt_service.get_prompt(
+        call.db,
+        name,
+        params.get("arguments", {}),
+        user=auth_user_email,
+        server_id=call.server_id,
+        token_teams=auth_token_teams,
+        plugin_context_table=call.plugin_context_table,
+        plugin_global_context=call.plugin_global_context,
+        _meta_data=params.get("_meta", None),
+    )
+    if hasattr(result, "model_dump"):
+        result = result.model_dump(by_alias=True, exclude_none=True)
+    # Release transaction after prompts/get completes
+    call.release_db()
+    return result
+
+
+async def _rpc_empty_result(_call: _RPCCall) -> Any:
+    """Handle methods that always return an empty result (e.g. ``ping``).
+
+    Args:
+        _call: Per-message RPC state (unused).
+
+    Returns:
+        dict: Empty result.
+    """
+    return {}
+
+
+async def _rpc_call_tool(call: _RPCCall) -> Any:  # pylint: disable=too-many-nested-blocks
+    """Handle ``tools/call`` with cancellation tracking.
+
+    Args:
+        call: Per-message RPC state.
+
+    Returns:
+        The tool invocation result.
+
+    Raises:
+        JSONRPCError: If the tool name is missing, the tool is not found, or execution is cancelled.
+    """
+    # Note: Multi-worker session affinity forwarding is handled earlier
+    # (before method routing) to apply to ALL methods, not just tools/call
+    params = call.params
+    name = params.get("name")
+    arguments = params.get("arguments", {})
+    meta_data = params.get("_meta", None)
+    if not name:
+        raise JSONRPCError(-32602, "Missing tool name in parameters", params)
+
+    auth_user_email, auth_token_teams = call.visibility_scope()
+    # Get user email for OAuth token selection
+    oauth_user_email = get_user_email(call.user)
+
+    # Register the tool execution for cancellation tracking with task reference (if enabled)
+    # Note: req_id can be 0 which is falsy but valid per JSON-RPC spec, so use 'is not None'
+    run_id = str(call.req_id) if call.req_id is not None else None
+    tool_task: Optional[asyncio.Task] = None
+
+    async def cancel_tool_task(reason: Optional[str] = None):
+        """Cancel callback that actually cancels the asyncio task.
+
+        Args:
+            reason: Optional reason for cancellation.
+        """
+        if tool_task and not tool_task.done():
+            logger.info(f"Cancelling tool task for run_id={run_id}, reason={reason}")
+            tool_task.cancel()
+
+    if settings.mcpgateway_tool_cancellation_enabled and run_id:
+        await cancellation_service.register_run(run_id, name=f"tool:{name}", cancel_callback=cancel_tool_task)
+
+    try:
+        # Check if cancelled before execution (only if feature enabled)
+        if settings.mcpgateway_tool_cancellation_enabled and run_id:
+            run_status = await cancellation_service.get_status(run_id)
+            if run_status and run_status.get("cancelled"):
+                raise JSONRPCError(-32800, f"Tool execution cancelled: {name}", {"requestId": run_id})
+
+        # Create task for tool execution to enable real cancellation
+        async def execute_tool():
+            """Execute tool invocation with fallback to gateway forwarding.
+
+            Returns:
+                The tool invocation result or gateway forwarding result.
+
+            Raises:
+                JSONRPCError: If the tool is not found.
+            """
+            try:
+                return await tool_service.invoke_tool(
+                    db=call.db,
+                    name=name,
+                    arguments=arguments,
+                    request_headers=call.headers,
+                    app_user_email=oauth_user_email,
+                    user_email=auth_user_email,
+                    token_teams=auth_token_teams,
+                    server_id=call.server_id,
+                    plugin_context_table=call.plugin_context_table,
+                    plugin_global_context=call.plugin_global_context,
+                    meta_data=meta_data,
+                )
+            except ValueError:
+                # Tool not found log error and raise JSONRPCError
+                logger.error(f"Tool not found: {name}")
+                raise JSONRPCError(-32601, f"Tool not found: {name}", None)
+
+        tool_task = asyncio.create_task(execute_tool())
+
+        # Re-check cancellation after task creation to handle race condition
+        # where cancel arrived between pre-check and task creation (callback saw tool_task=None)
+        if settings.mcpgateway_tool_cancellation_enabled and run_id:
+            run_status = await cancellation_service.get_status(run_id)
+            if run_status and run_status.get("cancelled"):
+                tool_task.cancel()
+
+        try:
+            result = await tool_task
+            if hasattr(result, "model_dump"):
+                result = result.model_dump(by_alias=True, exclude_none=True)
+        except asyncio.CancelledError:
+            # Task was cancelled - return partial result or error
+            logger.info(f"Tool execution cancelled for run_id={run_id}, tool={name}")
+            raise JSONRPCError(-32800, f"Tool execution cancelled: {name}", {"requestId": run_id, "partial": False})
+    finally:
+        # Unregister the run when done (only if feature enabled)
+        if settings.mcpgateway_tool_cancellation_enabled and run_id:
+            await cancellation_service.unregister_run(run_id)
+        # Release transaction after tools/call completes
+        call.release_db()
+    return result
+
+
+async def _rpc_list_resource_templates(call: _RPCCall) -> Any:
+    """Handle ``resources/templates/list``.
+
+    Args:
+        call: Per-message RPC state.
+
+    Returns:
+        dict: The resource template listing.
+    """
+    # Unlike the other listings, the requesting email is always passed through
+    user_email_rpc = call.filter_context()[0]
+    _, token_teams_rpc = call.visibility_scope()
+    resource_templates = await resource_service.list_resource_templates(
+        call.db,
+        user_email=user_email_rpc,
+        token_teams=token_teams_rpc,
+    )
+    call.release_db()
+    return {"resourceTemplates": [rt.model_dump(by_alias=True, exclude_none=True) for rt in resource_templates]}
+
+
+async def _rpc_notification_initialized(_call: _RPCCall) -> Any:
+    """Handle ``notifications/initialized``.
+
+    Args:
+        _call: Per-message RPC state (unused).
+
+    Returns:
+        dict: Empty result.
+    """
+    logger.info("Client initialized")
+    await logging_service.notify("Client initialized", LogLevel.INFO)
+    return {}
+
+
+async def _rpc_notification_cancelled(call: _RPCCall) -> Any:
+    """Handle ``notifications/cancelled`` by attempting local cancellation per the MCP spec.
+
+    Args:
+        call: Per-message RPC state.
+
+    Returns:
+        dict: Empty result.
+    """
+    # Note: requestId can be 0 (valid per JSON-RPC), so use 'is not None' and normalize to string
+    raw_request_id = call.params.get("requestId")
+    request_id = str(raw_request_id) if raw_request_id is not None else None
+    reason = call.params.get("reason")
+    logger.info(f"Request cancelled: {request_id}, reason: {reason}")
+    if request_id is not None:
+        await cancellation_service.cancel_run(request_id, reason=reason)
+    await logging_service.notify(f"Request cancelled: {request_id}", LogLevel.INFO)
+    return {}
+
+
+async def _rpc_notification_message(call: _RPCCall) -> Any:
+    """Handle ``notifications/message`` (client log message).
+
+    Args:
+        call: Per-message RPC state.
+
+    Returns:
+        dict: Empty result.
+    """
+    await logging_service.notify(
+        call.params.get("data"),
+        LogLevel(call.params.get("level", "info")),
+        call.params.get("logger"),
+    )
+    return {}
+
+
+async def _rpc_create_message(call: _RPCCall) -> Any:
+    """Handle ``sampling/createMessage``.
+
+    Args:
+        call: Per-message RPC state.
+
+    Returns:
+        The sampling result.
+    """
+    return await sampling_handler.create_message(call.db, call.params)
+
+
+async def _rpc_create_elicitation(call: _RPCCall) -> Any:
+    """Handle ``elicitation/create`` (MCP 2025-06-18 server-to-client requests).
+
+    Elicitation allows servers to request structured user input through clients.
+
+    Args:
+        call: Per-message RPC state.
+
+    Returns:
+        dict: The client's elicitation result.
+
+    Raises:
+        JSONRPCError: If elicitation is disabled, params are invalid, no capable session exists, or the request times out.
+    """
+    params = call.params
+    if not settings.mcpgateway_elicitation_enabled:
+        raise JSONRPCError(-32601, "Elicitation feature is disabled", {"feature": "elicitation", "config": "MCPGATEWAY_ELICITATION_ENABLED=false"})
+
+    # First-Party
+    from mcpgateway.common.models import ElicitRequestParams  # pylint: disable=import-outside-toplevel
+    from mcpgateway.services.elicitation_service import get_elicitation_service  # pylint: disable=import-outside-toplevel
+
+    try:
+        elicit_params = ElicitRequestParams(**params)
+    except Exception as e:
+        raise JSONRPCError(-32602, f"Invalid elicitation params: {e}", params)
+
+    # Get target session (from params or find elicitation-capable session)
+    target_session_id = params.get("session_id") or params.get("sessionId")
+    if not target_session_id:
+        capable_sessions = await session_registry.get_elicitation_capable_sessions()
+        if not capable_sessions:
+            raise JSONRPCError(-32000, "No elicitation-capable clients available", {"message": elicit_params.message})
+        target_session_id = capable_sessions[0]
+        logger.debug(f"Selected session {target_session_id} for elicitation")
+
+    # Verify session has elicitation capability
+    if not await session_registry.has_elicitation_capability(target_session_id):
+        raise JSONRPCError(-32000, f"Session {target_session_id} does not support elicitation", {"session_id": target_session_id})
+
+    elicitation_service = get_elicitation_service()
+    timeout = params.get("timeout", settings.mcpgateway_elicitation_timeout)
+
+    try:
+        # For now, use dummy upstream_session_id - in full bidirectional proxy,
+        # this would be the session that initiated the request
+        upstream_session_id = "gateway"
+
+        # Start the elicitation (creates pending request and future)
+        elicitation_task = asyncio.create_task(
+            elicitation_service.create_elicitation(
+                upstream_session_id=upstream_session_id, downstream_session_id=target_session_id, message=elicit_params.message, requested_schema=elicit_params.requestedSchema, timeout=timeout
+            )
+        )
+
+        # Get the pending elicitation to extract request_id
+        # Wait a moment for it to be created
+        await asyncio.sleep(0.01)
+        pending_elicitations = [e for e in elicitation_service._pending.values() if e.downstream_session_id == target_session_id]  # pylint: disable=protected-access
+        if not pending_elicitations:
+            raise JSONRPCError(-32000, "Failed to create elicitation request", {})
+
+        pending = pending_elicitations[-1]  # Get most recent
+
+        # Send elicitation request to client via broadcast
+        elicitation_request = {
+            "jsonrpc": "2.0",
+            "id": pending.request_id,
+            "method": "elicitation/create",
+            "params": {"message": elicit_params.message, "requestedSchema": elicit_params.requestedSchema},
+        }
+
+        await session_registry.broadcast(target_session_id, elicitation_request)
+        logger.debug(f"Sent elicitation request {pending.request_id} to session {target_session_id}")
+
+        elicit_result = await elicitation_task
+        return elicit_result.model_dump(by_alias=True, exclude_none=True)
+    except asyncio.TimeoutError:
+        raise JSONRPCError(-32000, f"Elicitation timed out after {timeout}s", {"message": elicit_params.message, "timeout": timeout})
+    except ValueError as e:
+        raise JSONRPCError(-32000, str(e), {"message": elicit_params.message})
+
+
+async def _rpc_complete(call: _RPCCall) -> Any:
+    """Handle ``completion/complete``.
+
+    Args:
+        call: Per-message RPC state.
+
+    Returns:
+        The completion result.
+    """
+    return await completion_service.handle_completion(call.db, call.params)
+
+
+async def _rpc_set_log_level(call: _RPCCall) -> Any:
+    """Handle ``logging/setLevel``.
+
+    Args:
+        call: Per-message RPC state.
+
+    Returns:
+        dict: Empty result.
+    """
+    await logging_service.set_level(LogLevel(call.params.get("level")))
+    return {}
+
+
+async def _rpc_invoke_tool_by_method(call: _RPCCall) -> Any:
+    """Backward compatibility: invoke a tool named by the JSON-RPC method itself.
+
+    This allows both old format (method=tool_name) and new format (method=tools/call).
+
+    Args:
+        call: Per-message RPC state.
+
+    Returns:
+        The tool invocation result.
+
+    Raises:
+        PluginError: If a plugin fails during invocation.
+        PluginViolationError: If a plugin blocks the invocation.
+        JSONRPCError: If the method does not resolve to a tool.
+    """
+    auth_user_email, auth_token_teams = call.visibility_scope()
+    try:
+        result = await tool_service.invoke_tool(
+            db=call.db,
+            name=call.method,
+            arguments=call.params,
+            request_headers=call.headers,
+            app_user_email=get_user_email(call.user),
+            user_email=auth_user_email,
+            token_teams=auth_token_teams,
+            server_id=call.server_id,
+            plugin_context_table=call.plugin_context_table,
+            plugin_global_context=call.plugin_global_context,
+            meta_data=call.params.get("_meta", None),
+        )
+        if hasattr(result, "model_dump"):
+            result = result.model_dump(by_alias=True, exclude_none=True)
+    except (PluginError, PluginViolationError):
+        raise
+    except Exception:
+        # Log error and return invalid method
+        logger.error(f"Method not found: {call.method}")
+        raise JSONRPCError(-32000, "Invalid method", call.params)
+    return result
+
+
+# JSON-RPC method table: one O(1) lookup per message instead of walking an if/elif chain.
+_RPC_METHOD_HANDLERS: Dict[str, Callable[[_RPCCall], Awaitable[Any]]] = {
+    "initialize": _rpc_initialize,
+    "ping": _rpc_empty_result,
+    "tools/list": _rpc_list_tools,
+    "list_tools": _rpc_list_tools,  # Legacy endpoint
+    "tools/call": _rpc_call_tool,
+    "list_gateways": _rpc_list_gateways,
+    "list_roots": _rpc_list_roots,
+    "roots/list": _rpc_list_roots,
+    "resources/list": _rpc_list_resources,
+    "resources/read": _rpc_read_resource,
+    "resources/subscribe": _rpc_subscribe_resource,
+    "resources/unsubscribe": _rpc_subscribe_resource,
+    "resources/templates/list": _rpc_list_resource_templates,
+    "prompts/list": _rpc_list_prompts,
+    "prompts/get": _rpc_get_prompt,
+    "notifications/initialized": _rpc_notification_initialized,
+    "notifications/cancelled": _rpc_notification_cancelled,
+    "notifications/message": _rpc_notification_message,
+    "sampling/createMessage": _rpc_create_message,
+    "elicitation/create": _rpc_create_elicitation,
+    "completion/complete": _rpc_complete,
+    "logging/setLevel": _rpc_set_log_level,
+}
+
+# Namespaces whose other methods are accepted but currently unsupported (empty result).
+_RPC_NOOP_NAMESPACES = frozenset({"roots", "notifications", "sampling", "elicitation", "completion", "logging"})
+
+
+def _resolve_rpc_handler(method: str) -> Callable[[_RPCCall], Awaitable[Any]]:
+    """Resolve the handler for a JSON-RPC method.
+
+    Exact matches come from ``_RPC_METHOD_HANDLERS``; other methods in a known MCP
+    namespace return an empty result; anything else is treated as a legacy direct
+    tool invocation.
+
+    Args:
+        method: JSON-RPC method name.
+
+    Returns:
+        The coroutine function handling the method.
+
+    Examples:
+        >>> _resolve_rpc_handler("tools/call") is _rpc_call_tool
+        True
+        >>> _resolve_rpc_handler("roots/remove") is _rpc_empty_result
+        True
+        >>> _resolve_rpc_handler("my_tool") is _rpc_invoke_tool_by_method
+        True
+    """
+    handler = _RPC_METHOD_HANDLERS.get(method)
+    if handler is not None:
+        return handler
+    namespace, sep, _ = method.partition("/")
+    if sep and namespace in _RPC_NOOP_NAMESPACES:
+        return _rpc_empty_result
+    return _rpc_invoke_tool_by_method
+
+
+async def _handle_rpc_message(
+    request: Request,
+    body: Any,
+    db: Session,
+    user,
+    plugin_context_table: Optional[PluginContextTable] = None,
+    plugin_global_context: Optional[GlobalContext] = None,
+):
+    """Dispatch a single JSON-RPC request object.
+
+    Args:
+        request (Request): The incoming FastAPI request.
+        body: The decoded JSON-RPC request object.
+        db (Session): Database session used for this call.
+        user: The authenticated user (dict with RBAC context).
+        plugin_context_table: Plugin context table for this call; defaults to the one on ``request.state``.
+        plugin_global_context: Plugin global context for this call; defaults to the one on ``request.state``.
+
+    Returns:
+        Response with the RPC result or error.
+
+    Raises:
+        PluginError: If encounters issue with plugin
+        PluginViolationError: If plugin violated the request. Example - In case of OPA plugin, if the request is denied by policy.
+    """
+    req_id = None
+    if plugin_context_table is None:
+        plugin_context_table = getattr(request.state, "plugin_context_table", None)
+    if plugin_global_context is None:
+        plugin_global_context = getattr(request.state, "plugin_global_context", None)
+    try:
         method = body["method"]
         req_id = body.get("id")
         if req_id is None:
             req_id = str(uuid.uuid4())
         params = body.get("params", {})
-        server_id = params.get("server_id", None)
-        cursor = params.get("cursor")  # Extract cursor parameter
 
         RPCRequest(jsonrpc="2.0", method=method, params=params)  # Validate the request body against the RPCRequest model
 
@@ -5695,578 +6813,18 @@ async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depen
             session_short = mcp_session_id[:8] if len(mcp_session_id) >= 8 else mcp_session_id
             logger.debug(f"[AFFINITY] Worker {WORKER_ID} | Session {session_short}... | Method: {method} | Internally forwarded request, executing locally")
 
-        if method == "initialize":
-            # Extract session_id from params or query string (for capability tracking)
-            init_session_id = params.get("session_id") or params.get("sessionId") or request.query_params.get("session_id")
-            # Pass server_id to advertise OAuth capability if configured per RFC 9728
-            result = await session_registry.handle_initialize_logic(body.get("params", {}), session_id=init_session_id, server_id=server_id)
-            if hasattr(result, "model_dump"):
-                result = result.model_dump(by_alias=True, exclude_none=True)
-
-            # Register session ownership in Redis for multi-worker affinity
-            # This must happen AFTER initialize succeeds so subsequent requests route to this worker
-            if settings.mcpgateway_session_affinity_enabled and mcp_session_id and mcp_session_id != "not-provided":
-                try:
-                    # First-Party
-                    from mcpgateway.services.mcp_session_pool import get_mcp_session_pool, WORKER_ID  # pylint: disable=import-outside-toplevel
-
-                    pool = get_mcp_session_pool()
-                    # Claim-or-refresh ownership for this session (does not steal).
-                    await pool.register_pool_session_owner(mcp_session_id)
-                    logger.debug(f"[AFFINITY_INIT] Worker {WORKER_ID} | Session {mcp_session_id[:8]}... | Registered ownership after initialize")
-                except Exception as e:
-                    logger.warning(f"[AFFINITY_INIT] Failed to register session ownership: {e}")
-        elif method == "tools/list":
-            user_email, token_teams, is_admin = _get_rpc_filter_context(request, user)
-            _req_email, _req_is_admin = user_email, is_admin
-            _req_team_roles = get_user_team_roles(db, _req_email) if _req_email and not _req_is_admin else None
-            # Admin bypass - only when token has NO team restrictions
-            if is_admin and token_teams is None:
-                user_email = None
-                token_teams = None  # Admin unrestricted
-            elif token_teams is None:
-                token_teams = []  # Non-admin without teams = public-only (secure default)
-            if server_id:
-                tools = await tool_service.list_server_tools(
-                    db,
-                    server_id,
-                    cursor=cursor,
-                    user_email=user_email,
-                    token_teams=token_teams,
-                    requesting_user_email=_req_email,
-                    requesting_user_is_admin=_req_is_admin,
-                    requesting_user_team_roles=_req_team_roles,
-                )
-                # Release DB connection early to prevent idle-in-transaction under load
-                db.commit()
-                db.close()
-                result = {"tools": [t.model_dump(by_alias=True, exclude_none=True) for t in tools]}
-            else:
-                tools, next_cursor = await tool_service.list_tools(
-                    db,
-                    cursor=cursor,
-                    limit=0,
-                    user_email=user_email,
-                    token_teams=token_teams,
-                    requesting_user_email=_req_email,
-                    requesting_user_is_admin=_req_is_admin,
-                    requesting_user_team_roles=_req_team_roles,
-                )
-                # Release DB connection early to prevent idle-in-transaction under load
-                db.commit()
-                db.close()
-                result = {"tools": [t.model_dump(by_alias=True, exclude_none=True) for t in tools]}
-                if next_cursor:
-                    result["nextCursor"] = next_cursor
-        elif method == "list_tools":  # Legacy endpoint
-            user_email, token_teams, is_admin = _get_rpc_filter_context(request, user)
-            _req_email, _req_is_admin = user_email, is_admin
-            _req_team_roles = get_user_team_roles(db, _req_email) if _req_email and not _req_is_admin else None
-            # Admin bypass - only when token has NO team restrictions (token_teams is None)
-            # If token has explicit team scope (even empty [] for public-only), respect it
-            if is_admin and token_teams is None:
-                user_email = None
-                token_teams = None  # Admin unrestricted
-            elif token_teams is None:
-                token_teams = []  # Non-admin without teams = public-only (secure default)
-            if server_id:
-                tools = await tool_service.list_server_tools(
-                    db,
-                    server_id,
-                    cursor=cursor,
-                    user_email=user_email,
-                    token_teams=token_teams,
-                    requesting_user_email=_req_email,
-                    requesting_user_is_admin=_req_is_admin,
-                    requesting_user_team_roles=_req_team_roles,
-                )
-                db.commit()
-                db.close()
-                result = {"tools": [t.model_dump(by_alias=True, exclude_none=True) for t in tools]}
-            else:
-                tools, next_cursor = await tool_service.list_tools(
-                    db,
-                    cursor=cursor,
-                    limit=0,
-                    user_email=user_email,
-                    token_teams=token_teams,
-                    requesting_user_email=_req_email,
-                    requesting_user_is_admin=_req_is_admin,
-                    requesting_user_team_roles=_req_team_roles,
-                )
-                db.commit()
-                db.close()
-                result = {"tools": [t.model_dump(by_alias=True, exclude_none=True) for t in tools]}
-                if next_cursor:
-                    result["nextCursor"] = next_cursor
-        elif method == "list_gateways":
-            user_email, token_teams, is_admin = _get_rpc_filter_context(request, user)
-            # Admin bypass - only when token has NO team restrictions
-            if is_admin and token_teams is None:
-                user_email = None
-                token_teams = None  # Admin unrestricted
-            elif token_teams is None:
-                token_teams = []  # Non-admin without teams = public-only (secure default)
-            gateways, next_cursor = await gateway_service.list_gateways(db, include_inactive=False, user_email=user_email, token_teams=token_teams)
-            db.commit()
-            db.close()
-            result = {"gateways": [g.model_dump(by_alias=True, exclude_none=True) for g in gateways]}
-            if next_cursor:
-                result["nextCursor"] = next_cursor
-        elif method == "list_roots":
-            roots = await root_service.list_roots()
-            result = {"roots": [r.model_dump(by_alias=True, exclude_none=True) for r in roots]}
-        elif method == "resources/list":
-            user_email, token_teams, is_admin = _get_rpc_filter_context(request, user)
-            # Admin bypass - only when token has NO team restrictions
-            if is_admin and token_teams is None:
-                user_email = None
-                token_teams = None  # Admin unrestricted
-            elif token_teams is None:
-                token_teams = []  # Non-admin without teams = public-only (secure default)
-            if server_id:
-                resources = await resource_service.list_server_resources(db, server_id, user_email=user_email, token_teams=token_teams)
-                db.commit()
-                db.close()
-                result = {"resources": [r.model_dump(by_alias=True, exclude_none=True) for r in resources]}
-            else:
-                resources, next_cursor = await resource_service.list_resources(db, cursor=cursor, limit=0, user_email=user_email, token_teams=token_teams)
-                db.commit()
-                db.close()
-                result = {"resources": [r.model_dump(by_alias=True, exclude_none=True) for r in resources]}
-                if next_cursor:
-                    result["nextCursor"] = next_cursor
-        elif method == "resources/read":
-            uri = params.get("uri")
-            request_id = params.get("requestId", None)
-            meta_data = params.get("_meta", None)
-            if not uri:
-                raise JSONRPCError(-32602, "Missing resource URI in parameters", params)
-
-            # Get authorization context (same as resources/list)
-            auth_user_email, auth_token_teams, auth_is_admin = _get_rpc_filter_context(request, user)
-            if auth_is_admin and auth_token_teams is None:
-                auth_user_email = None
-                # auth_token_teams stays None (unrestricted)
-            elif auth_token_teams is None:
-                auth_token_teams = []  # Non-admin without teams = public-only
-
-            # Get user email for OAuth token selection
-            oauth_user_email = get_user_email(user)
-            # Get plugin contexts from request.state for cross-hook sharing
-            plugin_context_table = getattr(request.state, "plugin_context_table", None)
-            plugin_global_context = getattr(request.state, "plugin_global_context", None)
-            try:
-                result = await resource_service.read_resource(
-                    db,
-                    resource_uri=uri,
-                    request_id=request_id,
-                    user=auth_user_email,
-                    server_id=server_id,
-                    token_teams=auth_token_teams,
-                    plugin_context_table=plugin_context_table,
-                    plugin_global_context=plugin_global_context,
-                    meta_data=meta_data,
-                )
-                if hasattr(result, "model_dump"):
-                    result = {"contents": [result.model_dump(by_alias=True, exclude_none=True)]}
-                else:
-                    result = {"contents": [result]}
-            except ValueError:
-                # Resource not found in the gateway
-                logger.error(f"Resource not found: {uri}")
-                raise JSONRPCError(-32002, f"Resource not found: {uri}", {"uri": uri})
-            # Release transaction after resources/read completes
-            db.commit()
-            db.close()
-        elif method == "resources/subscribe":
-            # MCP spec-compliant resource subscription endpoint
-            uri = params.get("uri")
-            if not uri:
-                raise JSONRPCError(-32602, "Missing resource URI in parameters", params)
-            # Get user email for subscriber ID
-            user_email = get_user_email(user)
-            subscription = ResourceSubscription(uri=uri, subscriber_id=user_email)
-            await resource_service.subscribe_resource(db, subscription)
-            db.commit()
-            db.close()
-            result = {}
-        elif method == "resources/unsubscribe":
-            # MCP spec-compliant resource unsubscription endpoint
-            uri = params.get("uri")
-            if not uri:
-                raise JSONRPCError(-32602, "Missing resource URI in parameters", params)
-            # Get user email for subscriber ID
-            user_email = get_user_email(user)
-            subscription = ResourceSubscription(uri=uri, subscriber_id=user_email)
-            await resource_service.unsubscribe_resource(db, subscription)
-            db.commit()
-            db.close()
-            result = {}
-        elif method == "prompts/list":
-            user_email, token_teams, is_admin = _get_rpc_filter_context(request, user)
-            # Admin bypass - only when token has NO team restrictions
-            if is_admin and token_teams is None:
-                user_email = None
-                token_teams = None  # Admin unrestricted
-            elif token_teams is None:
-                token_teams = []  # Non-admin without teams = public-only (secure default)
-            if server_id:
-                prompts = await prompt_service.list_server_prompts(db, server_id, cursor=cursor, user_email=user_email, token_teams=token_teams)
-                db.commit()
-                db.close()
-                result = {"prompts": [p.model_dump(by_alias=True, exclude_none=True) for p in prompts]}
-            else:
-                prompts, next_cursor = await prompt_service.list_prompts(db, cursor=cursor, limit=0, user_email=user_email, token_teams=token_teams)
-                db.commit()
-                db.close()
-                result = {"prompts": [p.model_dump(by_alias=True, exclude_none=True) for p in prompts]}
-                if next_cursor:
-                    result["nextCursor"] = next_cursor
-        elif method == "prompts/get":
-            name = params.get("name")
-            arguments = params.get("arguments", {})
-            meta_data = params.get("_meta", None)
-            if not name:
-                raise JSONRPCError(-32602, "Missing prompt name in parameters", params)
-
-            # Get authorization context (same as prompts/list)
-            auth_user_email, auth_token_teams, auth_is_admin = _get_rpc_filter_context(request, user)
-            if auth_is_admin and auth_token_teams is None:
-                auth_user_email = None
-                # auth_token_teams stays None (unrestricted)
-            elif auth_token_teams is None:
-                auth_token_teams = []  # Non-admin without teams = public-only
-
-            # Get plugin contexts from request.state for cross-hook sharing
-            plugin_context_table = getattr(request.state, "plugin_context_table", None)
-            plugin_global_context = getattr(request.state, "plugin_global_context", None)
-            result = await prompt_service.get_prompt(
-                db,
-                name,
-                arguments,
-                user=auth_user_email,
-                server_id=server_id,
-                token_teams=auth_token_teams,
-                plugin_context_table=plugin_context_table,
-                plugin_global_context=plugin_global_context,
-                _meta_data=meta_data,
-            )
-            if hasattr(result, "model_dump"):
-                result = result.model_dump(by_alias=True, exclude_none=True)
-            # Release transaction after prompts/get completes
-            db.commit()
-            db.close()
-        elif method == "ping":
-            # Per the MCP spec, a ping returns an empty result.
-            result = {}
-        elif method == "tools/call":  # pylint: disable=too-many-nested-blocks
-            # Note: Multi-worker session affinity forwarding is handled earlier
-            # (before method routing) to apply to ALL methods, not just tools/call
-            name = params.get("name")
-            arguments = params.get("arguments", {})
-            meta_data = params.get("_meta", None)
-            if not name:
-                raise JSONRPCError(-32602, "Missing tool name in parameters", params)
-
-            # Get authorization context (same as tools/list)
-            auth_user_email, auth_token_teams, auth_is_admin = _get_rpc_filter_context(request, user)
-            if auth_is_admin and auth_token_teams is None:
-                auth_user_email = None
-                # auth_token_teams stays None (unrestricted)
-            elif auth_token_teams is None:
-                auth_token_teams = []  # Non-admin without teams = public-only
-
-            # Get user email for OAuth token selection
-            oauth_user_email = get_user_email(user)
-            # Get plugin contexts from request.state for cross-hook sharing
-            plugin_context_table = getattr(request.state, "plugin_context_table", None)
-            plugin_global_context = getattr(request.state, "plugin_global_context", None)
-
-            # Register the tool execution for cancellation tracking with task reference (if enabled)
-            # Note: req_id can be 0 which is falsy but valid per JSON-RPC spec, so use 'is not None'
-            run_id = str(req_id) if req_id is not None else None
-            tool_task: Optional[asyncio.Task] = None
-
-            async def cancel_tool_task(reason: Optional[str] = None):
-                """Cancel callback that actually cancels the asyncio task.
-
-                Args:
-                    reason: Optional reason for cancellation.
-                """
-                if tool_task and not tool_task.done():
-                    logger.info(f"Cancelling tool task for run_id={run_id}, reason={reason}")
-                    tool_task.cancel()
-
-            if settings.mcpgateway_tool_cancellation_enabled and run_id:
-                await cancellation_service.register_run(run_id, name=f"tool:{name}", cancel_callback=cancel_tool_task)
-
-            try:
-                # Check if cancelled before execution (only if feature enabled)
-                if settings.mcpgateway_tool_cancellation_enabled and run_id:
-                    run_status = await cancellation_service.get_status(run_id)
-                    if run_status and run_status.get("cancelled"):
-                        raise JSONRPCError(-32800, f"Tool execution cancelled: {name}", {"requestId": run_id})
-
-                # Create task for tool execution to enable real cancellation
-                async def execute_tool():
-                    """Execute tool invocation with fallback to gateway forwarding.
-
-                    Returns:
-                        The tool invocation result or gateway forwarding result.
-
-                    Raises:
-                        JSONRPCError: If the tool is not found.
-                    """
-                    try:
-                        return await tool_service.invoke_tool(
-                            db=db,
-                            name=name,
-                            arguments=arguments,
-                            request_headers=headers,
-                            app_user_email=oauth_user_email,
-                            user_email=auth_user_email,
-                            token_teams=auth_token_teams,
-                            server_id=server_id,
-                            plugin_context_table=plugin_context_table,
-                            plugin_global_context=plugin_global_context,
-                            meta_data=meta_data,
-                        )
-                    except ValueError:
-                        # Tool not found log error and raise JSONRPCError
-                        logger.error(f"Tool not found: {name}")
-                        raise JSONRPCError(-32601, f"Tool not found: {name}", None)
-
-                tool_task = asyncio.create_task(execute_tool())
-
-                # Re-check cancellation after task creation to handle race condition
-                # where cancel arrived between pre-check and task creation (callback saw tool_task=None)
-                if settings.mcpgateway_tool_cancellation_enabled and run_id:
-                    run_status = await cancellation_service.get_status(run_id)
-                    if run_status and run_status.get("cancelled"):
-                        tool_task.cancel()
-
-                try:
-                    result = await tool_task
-                    if hasattr(result, "model_dump"):
-                        result = result.model_dump(by_alias=True, exclude_none=True)
-                except asyncio.CancelledError:
-                    # Task was cancelled - return partial result or error
-                    logger.info(f"Tool execution cancelled for run_id={run_id}, tool={name}")
-                    raise JSONRPCError(-32800, f"Tool execution cancelled: {name}", {"requestId": run_id, "partial": False})
-            finally:
-                # Unregister the run when done (only if feature enabled)
-                if settings.mcpgateway_tool_cancellation_enabled and run_id:
-                    await cancellation_service.unregister_run(run_id)
-                # Release transaction after tools/call completes
-                db.commit()
-                db.close()
-        # TODO: Implement methods  # pylint: disable=fixme
-        elif method == "resources/templates/list":
-            # MCP spec-compliant resource templates list endpoint
-            # Use _get_rpc_filter_context - same pattern as tools/list
-            user_email_rpc, token_teams_rpc, is_admin_rpc = _get_rpc_filter_context(request, user)
-
-            # Admin bypass - only when token has NO team restrictions
-            if is_admin_rpc and token_teams_rpc is None:
-                token_teams_rpc = None  # Admin unrestricted
-            elif token_teams_rpc is None:
-                token_teams_rpc = []  # Non-admin without teams = public-only
-
-            resource_templates = await resource_service.list_resource_templates(
-                db,
-                user_email=user_email_rpc,
-                token_teams=token_teams_rpc,
-            )
-            db.commit()
-            db.close()
-            result = {"resourceTemplates": [rt.model_dump(by_alias=True, exclude_none=True) for rt in resource_templates]}
-        elif method == "roots/list":
-            # MCP spec-compliant method name
-            roots = await root_service.list_roots()
-            result = {"roots": [r.model_dump(by_alias=True, exclude_none=True) for r in roots]}
-        elif method.startswith("roots/"):
-            # Catch-all for other roots/* methods (currently unsupported)
-            result = {}
-        elif method == "notifications/initialized":
-            # MCP spec-compliant notification: client initialized
-            logger.info("Client initialized")
-            await logging_service.notify("Client initialized", LogLevel.INFO)
-            result = {}
-        elif method == "notifications/cancelled":
-            # MCP spec-compliant notification: request cancelled
-            # Note: requestId can be 0 (valid per JSON-RPC), so use 'is not None' and normalize to string
-            raw_request_id = params.get("requestId")
-            request_id = str(raw_request_id) if raw_request_id is not None else None
-            reason = params.get("reason")
-            logger.info(f"Request cancelled: {request_id}, reason: {reason}")
-            # Attempt local cancellation per MCP spec
-            if request_id is not None:
-                await cancellation_service.cancel_run(request_id, reason=reason)
-            await logging_service.notify(f"Request cancelled: {request_id}", LogLevel.INFO)
-            result = {}
-        elif method == "notifications/message":
-            # MCP spec-compliant notification: log message
-            await logging_service.notify(
-                params.get("data"),
-                LogLevel(params.get("level", "info")),
-                params.get("logger"),
-            )
-            result = {}
-        elif method.startswith("notifications/"):
-            # Catch-all for other notifications/* methods (currently unsupported)
-            result = {}
-        elif method == "sampling/createMessage":
-            # MCP spec-compliant sampling endpoint
-            result = await sampling_handler.create_message(db, params)
-        elif method.startswith("sampling/"):
-            # Catch-all for other sampling/* methods (currently unsupported)
-            result = {}
-        elif method == "elicitation/create":
-            # MCP spec 2025-06-18: Elicitation support (server-to-client requests)
-            # Elicitation allows servers to request structured user input through clients
-
-            # Check if elicitation is enabled
-            if not settings.mcpgateway_elicitation_enabled:
-                raise JSONRPCError(-32601, "Elicitation feature is disabled", {"feature": "elicitation", "config": "MCPGATEWAY_ELICITATION_ENABLED=false"})
-
-            # Validate params
-            # First-Party
-            from mcpgateway.common.models import ElicitRequestParams  # pylint: disable=import-outside-toplevel
-            from mcpgateway.services.elicitation_service import get_elicitation_service  # pylint: disable=import-outside-toplevel
-
-            try:
-                elicit_params = ElicitRequestParams(**params)
-            except Exception as e:
-                raise JSONRPCError(-32602, f"Invalid elicitation params: {e}", params)
-
-            # Get target session (from params or find elicitation-capable session)
-            target_session_id = params.get("session_id") or params.get("sessionId")
-            if not target_session_id:
-                # Find an elicitation-capable session
-                capable_sessions = await session_registry.get_elicitation_capable_sessions()
-                if not capable_sessions:
-                    raise JSONRPCError(-32000, "No elicitation-capable clients available", {"message": elicit_params.message})
-                target_session_id = capable_sessions[0]
-                logger.debug(f"Selected session {target_session_id} for elicitation")
-
-            # Verify session has elicitation capability
-            if not await session_registry.has_elicitation_capability(target_session_id):
-                raise JSONRPCError(-32000, f"Session {target_session_id} does not support elicitation", {"session_id": target_session_id})
-
-            # Get elicitation service and create request
-            elicitation_service = get_elicitation_service()
-
-            # Extract timeout from params or use default
-            timeout = params.get("timeout", settings.mcpgateway_elicitation_timeout)
-
-            try:
-                # Create elicitation request - this stores it and waits for response
-                # For now, use dummy upstream_session_id - in full bidirectional proxy,
-                # this would be the session that initiated the request
-                upstream_session_id = "gateway"
-
-                # Start the elicitation (creates pending request and future)
-                elicitation_task = asyncio.create_task(
-                    elicitation_service.create_elicitation(
-                        upstream_session_id=upstream_session_id, downstream_session_id=target_session_id, message=elicit_params.message, requested_schema=elicit_params.requestedSchema, timeout=timeout
-                    )
-                )
-
-                # Get the pending elicitation to extract request_id
-                # Wait a moment for it to be created
-                await asyncio.sleep(0.01)
-                pending_elicitations = [e for e in elicitation_service._pending.values() if e.downstream_session_id == target_session_id]  # pylint: disable=protected-access
-                if not pending_elicitations:
-                    raise JSONRPCError(-32000, "Failed to create elicitation request", {})
-
-                pending = pending_elicitations[-1]  # Get most recent
-
-                # Send elicitation request to client via broadcast
-                elicitation_request = {
-                    "jsonrpc": "2.0",
-                    "id": pending.request_id,
-                    "method": "elicitation/create",
-                    "params": {"message": elicit_params.message, "requestedSchema": elicit_params.requestedSchema},
-                }
-
-                await session_registry.broadcast(target_session_id, elicitation_request)
-                logger.debug(f"Sent elicitation request {pending.request_id} to session {target_session_id}")
-
-                # Wait for response
-                elicit_result = await elicitation_task
-
-                # Return result
-                result = elicit_result.model_dump(by_alias=True, exclude_none=True)
-
-            except asyncio.TimeoutError:
-                raise JSONRPCError(-32000, f"Elicitation timed out after {timeout}s", {"message": elicit_params.message, "timeout": timeout})
-            except ValueError as e:
-                raise JSONRPCError(-32000, str(e), {"message": elicit_params.message})
-        elif method.startswith("elicitation/"):
-            # Catch-all for other elicitation/* methods
-            result = {}
-        elif method == "completion/complete":
-            # MCP spec-compliant completion endpoint
-            result = await completion_service.handle_completion(db, params)
-        elif method.startswith("completion/"):
-            # Catch-all for other completion/* methods (currently unsupported)
-            result = {}
-        elif method == "logging/setLevel":
-            # MCP spec-compliant logging endpoint
-            level = LogLevel(params.get("level"))
-            await logging_service.set_level(level)
-            result = {}
-        elif method.startswith("logging/"):
-            # Catch-all for other logging/* methods (currently unsupported)
-            result = {}
-        else:
-            # Backward compatibility: Try to invoke as a tool directly
-            # This allows both old format (method=tool_name) and new format (method=tools/call)
-            # Standard
-            headers = {k.lower(): v for k, v in request.headers.items()}
-
-            # Get authorization context (same as tools/call)
-            auth_user_email, auth_token_teams, auth_is_admin = _get_rpc_filter_context(request, user)
-            if auth_is_admin and auth_token_teams is None:
-                auth_user_email = None
-                # auth_token_teams stays None (unrestricted)
-            elif auth_token_teams is None:
-                auth_token_teams = []  # Non-admin without teams = public-only
-
-            # Get user email for OAuth token selection
-            oauth_user_email = get_user_email(user)
-            # Get server_id from params if provided
-            server_id = params.get("server_id")
-            # Get plugin contexts from request.state for cross-hook sharing
-            plugin_context_table = getattr(request.state, "plugin_context_table", None)
-            plugin_global_context = getattr(request.state, "plugin_global_context", None)
-
-            meta_data = params.get("_meta", None)
-
-            try:
-                result = await tool_service.invoke_tool(
-                    db=db,
-                    name=method,
-                    arguments=params,
-                    request_headers=headers,
-                    app_user_email=oauth_user_email,
-                    user_email=auth_user_email,
-                    token_teams=auth_token_teams,
-                    server_id=server_id,
-                    plugin_context_table=plugin_context_table,
-                    plugin_global_context=plugin_global_context,
-                    meta_data=meta_data,
-                )
-                if hasattr(result, "model_dump"):
-                    result = result.model_dump(by_alias=True, exclude_none=True)
-            except (PluginError, PluginViolationError):
-                raise
-            except Exception:
-                # Log error and return invalid method
-                logger.error(f"Method not found: {method}")
-                raise JSONRPCError(-32000, "Invalid method", params)
-
+        call = _RPCCall(
+            request=request,
+            db=db,
+            user=user,
+            method=method,
+            params=params,
+            req_id=req_id,
+            headers=headers,
+            plugin_context_table=plugin_context_table,
+            plugin_global_context=plugin_global_context,
+        )
+        result = await _resolve_rpc_handler(method)(call)
         return {"jsonrpc": "2.0", "result": result, "id": req_id}
 
     except (PluginError, PluginViolationError):
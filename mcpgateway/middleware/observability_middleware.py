@@ -18,7 +18,7 @@ Examples:
 import logging
 import time
 import traceback
-from typing import Callable
+from typing import Any, Callable, Dict, Optional
 
 # Third-Party
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -30,6 +30,7 @@ from mcpgateway.config import settings
 from mcpgateway.db import SessionLocal
 from mcpgateway.instrumentation.sqlalchemy import attach_trace_to_session
 from mcpgateway.middleware.path_filter import should_skip_observability
+from mcpgateway.services.observability_buffer_service import get_observability_buffer_service
 from mcpgateway.services.observability_service import current_trace_id, ObservabilityService, parse_traceparent
 
 logger = logging.getLogger(__name__)
@@ -43,19 +44,26 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
 
     This middleware is disabled by default and can be enabled via the
     MCPGATEWAY_OBSERVABILITY_ENABLED environment variable.
+
+    With OBSERVABILITY_BUFFER_ENABLED (the default), traces are recorded in
+    memory and exported in batches by the ObservabilityBufferService instead
+    of being written to the database while the request is in flight.
     """
 
-    def __init__(self, app, enabled: bool = None):
+    def __init__(self, app, enabled: bool = None, buffered: Optional[bool] = None):
         """Initialize the observability middleware.
 
         Args:
             app: ASGI application
             enabled: Whether observability is enabled (defaults to settings)
+            buffered: Whether traces go through the export buffer (defaults to settings)
         """
         super().__init__(app)
         self.enabled = enabled if enabled is not None else getattr(settings, "observability_enabled", False)
         self.service = ObservabilityService()
-        logger.info(f"Observability middleware initialized (enabled={self.enabled})")
+        buffered = buffered if buffered is not None else getattr(settings, "observability_buffer_enabled", True)
+        self.buffer = get_observability_buffer_service() if buffered else None
+        logger.info(f"Observability middleware initialized (enabled={self.enabled}, buffered={buffered})")
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process request and create observability trace.
@@ -92,13 +100,38 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
         # Extract W3C Trace Context from headers (for distributed tracing)
         external_trace_id = None
         external_parent_span_id = None
+        upstream_sampled = None
         traceparent_header = request.headers.get("traceparent")
         if traceparent_header:
             parsed = parse_traceparent(traceparent_header)
             if parsed:
-                external_trace_id, external_parent_span_id, _flags = parsed
+                external_trace_id, external_parent_span_id, flags = parsed
+                # Lowest trace-flags bit is "sampled": the caller already recorded its side
+                upstream_sampled = True if flags and flags[-1] in "13579bdf" else None
                 logger.debug(f"Extracted W3C trace context: trace_id={external_trace_id}, parent_span_id={external_parent_span_id}")
 
+        trace_kwargs: Dict[str, Any] = {
+            "name": f"{http_method} {request.url.path}",
+            "trace_id": external_trace_id,  # Use external trace ID if provided
+            "parent_span_id": external_parent_span_id,  # Track parent span from upstream
+            "http_method": http_method,
+            "http_url": http_url,
+            "user_email": user_email,
+            "user_agent": user_agent,
+            "ip_address": ip_address,
+            "attributes": {
+                "http.route": request.url.path,
+                "http.query": str(request.url.query) if request.url.query else None,
+            },
+            "resource_attributes": {
+                "service.name": "mcp-gateway",
+                "service.version": getattr(settings, "version", "unknown"),
+            },
+        }
+
+        if self.buffer is not None:
+            return await self._dispatch_buffered(request, call_next, trace_kwargs, upstream_sampled)
+
         db = None
         trace_id = None
         span_id = None
@@ -109,25 +142,7 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
             db = SessionLocal()
 
             # Start trace (use external trace_id if provided for distributed tracing)
-            trace_id = self.service.start_trace(
-                db=db,
-                name=f"{http_method} {request.url.path}",
-                trace_id=external_trace_id,  # Use external trace ID if provided
-                parent_span_id=external_parent_span_id,  # Track parent span from upstream
-                http_method=http_method,
-                http_url=http_url,
-                user_email=user_email,
-                user_agent=user_agent,
-                ip_address=ip_address,
-                attributes={
-                    "http.route": request.url.path,
-                    "http.query": str(request.url.query) if request.url.query else None,
-                },
-                resource_attributes={
-                    "service.name": "mcp-gateway",
-                    "service.version": getattr(settings, "version", "unknown"),
-                },
-            )
+            trace_id = self.service.start_trace(db=db, **trace_kwargs)
 
             # Store trace_id in request state for use in route handlers
             request.state.trace_id = trace_id
@@ -226,3 +241,47 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
                     db.close()
                 except Exception as close_error:
                     logger.warning(f"Failed to close database session: {close_error}")
+
+    async def _dispatch_buffered(self, request: Request, call_next: Callable, trace_kwargs: Dict[str, Any], upstream_sampled: Optional[bool]) -> Response:
+        """Trace a request in the export buffer without touching the database.
+
+        Args:
+            request: Incoming HTTP request
+            call_next: Next middleware/handler in chain
+            trace_kwargs: Trace fields extracted from the request
+            upstream_sampled: True when the upstream traceparent has the sampled flag
+
+        Returns:
+            HTTP response
+
+        Raises:
+            Exception: Re-raises any exception from request processing after recording it
+        """
+        buffer = self.buffer
+        trace_id = buffer.start_trace(sampled=upstream_sampled, **trace_kwargs)
+        request.state.trace_id = trace_id
+        current_trace_id.set(trace_id)
+        http_attributes = {"http.method": trace_kwargs["http_method"], "http.url": trace_kwargs["http_url"]}
+        span_id = buffer.start_span(trace_id, "http.request", kind="server", attributes=http_attributes)
+        start_time = time.time()
+
+        try:
+            response = await call_next(request)
+        except Exception as e:
+            buffer.end_span(span_id, status="error", status_message=str(e), attributes={"exception.type": type(e).__name__, "exception.message": str(e)})
+            buffer.add_event(
+                span_id,
+                "exception",
+                severity="error",
+                message=str(e),
+                exception_type=type(e).__name__,
+                exception_message=str(e),
+                exception_stacktrace=traceback.format_exc(),
+            )
+            buffer.end_trace(trace_id, status="error", status_message=str(e), http_status_code=500)
+            raise
+
+        status = "ok" if response.status_code < 400 else "error"
+        buffer.end_span(span_id, status=status, attributes={"http.status_code": response.status_code, "http.response_size": response.headers.get("content-length")})
+        buffer.end_trace(trace_id, status=status, http_status_code=response.status_code, attributes={"response_time_ms": (time.time() - start_time) * 1000})
+        return response
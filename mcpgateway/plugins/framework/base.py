@@ -92,6 +92,15 @@ class Plugin(ABC):
         """
         return self._config.priority
 
+    @property
+    def read_only(self) -> bool:
+        """Return whether the plugin is declared read-only (never modifies payloads).
+
+        Returns:
+            True if the plugin may run concurrently with other read-only plugins.
+        """
+        return self._config.read_only
+
     @property
     def config(self) -> PluginConfig:
         """Return the plugin's configuration.
@@ -318,6 +327,15 @@ class PluginRef:
         """
         return self._plugin.name
 
+    @property
+    def read_only(self) -> bool:
+        """Return whether the plugin is declared read-only.
+
+        Returns:
+            True if the plugin may run concurrently with other read-only plugins.
+        """
+        return self._plugin.read_only
+
     @property
     def hooks(self) -> list[str]:
         """Returns the plugin's currently configured hooks.
@@ -26,12 +26,14 @@ class GetPluginConfigRequest(_message.Message):
     def __init__(self, name: _Optional[str] = ...) -> None: ...
 
 class GetPluginConfigResponse(_message.Message):
-    __slots__ = ("found", "config")
+    __slots__ = ("found", "config", "features")
     FOUND_FIELD_NUMBER: _ClassVar[int]
     CONFIG_FIELD_NUMBER: _ClassVar[int]
+    FEATURES_FIELD_NUMBER: _ClassVar[int]
     found: bool
     config: _struct_pb2.Struct
-    def __init__(self, found: bool = ..., config: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ...) -> None: ...
+    features: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, found: bool = ..., config: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., features: _Optional[_Iterable[str]] = ...) -> None: ...
 
 class GetPluginConfigsRequest(_message.Message):
     __slots__ = ()
@@ -44,35 +46,45 @@ class GetPluginConfigsResponse(_message.Message):
     def __init__(self, configs: _Optional[_Iterable[_Union[_struct_pb2.Struct, _Mapping]]] = ...) -> None: ...
 
 class InvokeHookRequest(_message.Message):
-    __slots__ = ("hook_type", "plugin_name", "payload", "context")
+    __slots__ = ("hook_type", "plugin_name", "payload", "context", "request_id", "payload_json")
     HOOK_TYPE_FIELD_NUMBER: _ClassVar[int]
     PLUGIN_NAME_FIELD_NUMBER: _ClassVar[int]
     PAYLOAD_FIELD_NUMBER: _ClassVar[int]
     CONTEXT_FIELD_NUMBER: _ClassVar[int]
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    PAYLOAD_JSON_FIELD_NUMBER: _ClassVar[int]
     hook_type: str
     plugin_name: str
     payload: _struct_pb2.Struct
     context: PluginContext
+    request_id: int
+    payload_json: bytes
     def __init__(
         self,
         hook_type: _Optional[str] = ...,
         plugin_name: _Optional[str] = ...,
         payload: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ...,
         context: _Optional[_Union[PluginContext, _Mapping]] = ...,
+        request_id: _Optional[int] = ...,
+        payload_json: _Optional[bytes] = ...,
     ) -> None: ...
 
 class InvokeHookResponse(_message.Message):
-    __slots__ = ("plugin_name", "result", "context", "error", "result_base")
+    __slots__ = ("plugin_name", "result", "context", "error", "result_base", "request_id", "result_json")
     PLUGIN_NAME_FIELD_NUMBER: _ClassVar[int]
     RESULT_FIELD_NUMBER: _ClassVar[int]
     CONTEXT_FIELD_NUMBER: _ClassVar[int]
     ERROR_FIELD_NUMBER: _ClassVar[int]
     RESULT_BASE_FIELD_NUMBER: _ClassVar[int]
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    RESULT_JSON_FIELD_NUMBER: _ClassVar[int]
     plugin_name: str
     result: _struct_pb2.Struct
     context: PluginContext
     error: PluginError
     result_base: PluginResultBase
+    request_id: int
+    result_json: bytes
     def __init__(
         self,
         plugin_name: _Optional[str] = ...,
@@ -80,6 +92,8 @@ class InvokeHookResponse(_message.Message):
         context: _Optional[_Union[PluginContext, _Mapping]] = ...,
         error: _Optional[_Union[PluginError, _Mapping]] = ...,
         result_base: _Optional[_Union[PluginResultBase, _Mapping]] = ...,
+        request_id: _Optional[int] = ...,
+        result_json: _Optional[bytes] = ...,
     ) -> None: ...
 
 class GlobalContext(_message.Message):
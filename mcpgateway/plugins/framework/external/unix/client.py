@@ -8,7 +8,9 @@ Unix socket client for external plugins.
 
 This module provides a high-performance client for communicating with
 external plugins over Unix domain sockets using length-prefixed protobuf
-messages.
+messages. Requests carry a ``request_id`` so many hook invocations can be
+in flight on one connection; responses are matched back by id (or in order
+for servers that do not echo it).
 
 Examples:
     Create and use a Unix socket plugin client:
@@ -30,19 +32,21 @@ Examples:
 
 # Standard
 import asyncio
+from collections import OrderedDict
+import itertools
 import logging
 from typing import Any, Optional
 
 # Third-Party
 from google.protobuf import json_format
-from google.protobuf.struct_pb2 import Struct
+import orjson
 
 # First-Party
 from mcpgateway.plugins.framework.base import Plugin
 from mcpgateway.plugins.framework.errors import convert_exception_to_error, PluginError
 from mcpgateway.plugins.framework.external.grpc.proto import plugin_service_pb2
 from mcpgateway.plugins.framework.external.proto_convert import pydantic_context_to_proto, update_pydantic_context_from_proto
-from mcpgateway.plugins.framework.external.unix.protocol import read_message, write_message_async
+from mcpgateway.plugins.framework.external.unix.protocol import JSON_PAYLOAD_FEATURE, read_message, write_message_async
 from mcpgateway.plugins.framework.hooks.registry import get_hook_registry
 from mcpgateway.plugins.framework.models import PluginConfig, PluginContext, PluginErrorModel, PluginResult
 
@@ -53,8 +57,12 @@ class UnixSocketExternalPlugin(Plugin):
     """External plugin client using raw Unix domain sockets.
 
     This client provides high-performance IPC for local plugins using
-    length-prefixed protobuf messages. It includes automatic reconnection
-    with configurable retry logic.
+    length-prefixed protobuf messages. Concurrent invocations share one
+    connection: each request is tagged with an id and a reader task resolves
+    the waiting callers as responses arrive. When the server advertises the
+    ``json_payload`` feature, payloads and results travel as raw JSON bytes
+    instead of protobuf Structs. It includes automatic reconnection with
+    configurable retry logic.
 
     Attributes:
         config: The plugin configuration.
@@ -96,6 +104,13 @@ class UnixSocketExternalPlugin(Plugin):
         self._connected = False
         self._lock = asyncio.Lock()
 
+        # Multiplexing state: request id -> future resolved by the reader task
+        self._pending: "OrderedDict[int, asyncio.Future[plugin_service_pb2.InvokeHookResponse]]" = OrderedDict()
+        self._request_ids = itertools.count(1)
+        self._reader_task: Optional[asyncio.Task[None]] = None
+        self._server_echoes_ids = False
+        self._json_payload = False
+
     @property
     def connected(self) -> bool:
         """Check if the client is connected.
@@ -120,7 +135,11 @@ class UnixSocketExternalPlugin(Plugin):
             raise PluginError(error=PluginErrorModel(message=f"Failed to connect to {self._socket_path}: {e}", plugin_name=self.name)) from e
 
     async def _disconnect(self) -> None:
-        """Close the connection."""
+        """Close the connection and fail requests still waiting on it."""
+        if self._reader_task and not self._reader_task.done():
+            self._reader_task.cancel()
+        self._reader_task = None
+        self._fail_pending(ConnectionResetError("Unix socket connection closed"))
         if self._writer:
             try:
                 self._writer.close()
@@ -153,8 +172,54 @@ class UnixSocketExternalPlugin(Plugin):
 
         raise PluginError(error=PluginErrorModel(message=f"Failed to reconnect after {self._reconnect_attempts} attempts: {last_error}", plugin_name=self.name))
 
+    def _fail_pending(self, exc: BaseException) -> None:
+        """Fail every request still waiting for a response.
+
+        Args:
+            exc: Exception delivered to the waiting callers.
+        """
+        pending = list(self._pending.values())
+        self._pending.clear()
+        for future in pending:
+            if not future.done():
+                future.set_exception(exc)
+
+    async def _read_responses(self, reader: asyncio.StreamReader) -> None:
+        """Read responses and resolve the matching pending requests.
+
+        Runs while requests are pending. Responses carrying a ``request_id``
+        are matched by id; responses without one (servers that predate
+        multiplexing answer strictly in order) resolve the oldest request.
+
+        Args:
+            reader: The stream reader of the current connection.
+        """
+        try:
+            while self._pending:
+                response_bytes = await read_message(reader)
+                response = plugin_service_pb2.InvokeHookResponse()
+                response.ParseFromString(response_bytes)
+
+                if response.request_id:
+                    self._server_echoes_ids = True
+                    future = self._pending.pop(response.request_id, None)
+                else:
+                    future = self._pending.popitem(last=False)[1] if self._pending else None
+
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._connected = False
+            self._fail_pending(e)
+
     async def _send_request(self, request: plugin_service_pb2.InvokeHookRequest) -> plugin_service_pb2.InvokeHookResponse:
-        """Send a request and receive response, with reconnection on failure.
+        """Send a request and wait for its response, with reconnection on failure.
+
+        The connection is shared: the request is written immediately and the
+        caller waits only for its own response, so concurrent invocations are
+        pipelined instead of serialized.
 
         Args:
             request: The protobuf request to send.
@@ -165,37 +230,48 @@ class UnixSocketExternalPlugin(Plugin):
         Raises:
             PluginError: If sending fails after reconnection attempts.
         """
+        request_id = next(self._request_ids)
+        request.request_id = request_id
         request_bytes = request.SerializeToString()
 
-        async with self._lock:
-            for attempt in range(self._reconnect_attempts + 1):
-                try:
-                    if not self.connected:
-                        await self._reconnect()
+        for attempt in range(self._reconnect_attempts + 1):
+            try:
+                if not self.connected:
+                    async with self._lock:
+                        if not self.connected:
+                            await self._reconnect()
 
-                    # Send request
+                future: asyncio.Future[plugin_service_pb2.InvokeHookResponse] = asyncio.get_running_loop().create_future()
+                self._pending[request_id] = future
+                try:
                     await write_message_async(self._writer, request_bytes)
+                except BaseException:
+                    self._pending.pop(request_id, None)
+                    raise
 
-                    # Read response
-                    response_bytes = await read_message(self._reader, timeout=self._timeout)
+                if self._reader_task is None or self._reader_task.done():
+                    self._reader_task = asyncio.create_task(self._read_responses(self._reader))
 
-                    # Parse response
-                    response = plugin_service_pb2.InvokeHookResponse()
-                    response.ParseFromString(response_bytes)
-                    return response
+                try:
+                    return await asyncio.wait_for(future, timeout=self._timeout)
+                except asyncio.TimeoutError:
+                    # Servers answering in order need the slot kept to stay aligned
+                    if self._server_echoes_ids:
+                        self._pending.pop(request_id, None)
+                    raise
 
-                except asyncio.TimeoutError as e:
-                    logger.warning("Request timed out after %s seconds", self._timeout)
-                    raise PluginError(error=PluginErrorModel(message=f"Request timed out after {self._timeout}s", plugin_name=self.name)) from e
+            except asyncio.TimeoutError as e:
+                logger.warning("Request timed out after %s seconds", self._timeout)
+                raise PluginError(error=PluginErrorModel(message=f"Request timed out after {self._timeout}s", plugin_name=self.name)) from e
 
-                except (OSError, asyncio.IncompleteReadError, BrokenPipeError) as e:
-                    logger.warning("Connection error on attempt %d: %s", attempt + 1, e)
-                    self._connected = False
+            except (OSError, asyncio.IncompleteReadError, BrokenPipeError) as e:
+                logger.warning("Connection error on attempt %d: %s", attempt + 1, e)
+                self._connected = False
 
-                    if attempt < self._reconnect_attempts:
-                        await asyncio.sleep(self._reconnect_delay * (attempt + 1))
-                        continue
-                    raise PluginError(error=PluginErrorModel(message=f"Request failed after {self._reconnect_attempts + 1} attempts: {e}", plugin_name=self.name)) from e
+                if attempt < self._reconnect_attempts:
+                    await asyncio.sleep(self._reconnect_delay * (attempt + 1))
+                    continue
+                raise PluginError(error=PluginErrorModel(message=f"Request failed after {self._reconnect_attempts + 1} attempts: {e}", plugin_name=self.name)) from e
 
         # Should not reach here
         raise PluginError(error=PluginErrorModel(message="Unexpected state in _send_request", plugin_name=self.name))
@@ -230,6 +306,7 @@ class UnixSocketExternalPlugin(Plugin):
             response = plugin_service_pb2.GetPluginConfigResponse()
             response.ParseFromString(response_bytes)
 
+            self._json_payload = JSON_PAYLOAD_FEATURE in response.features
             if response.found:
                 logger.debug("Remote plugin config verified for %s", self.name)
             else:
@@ -256,7 +333,7 @@ class UnixSocketExternalPlugin(Plugin):
 
         Args:
             hook_type: The type of hook to invoke (e.g., "tool_pre_invoke").
-            payload: The hook payload (will be serialized to protobuf Struct).
+            payload: The hook payload (sent as JSON bytes when the server supports it, otherwise as a protobuf Struct).
             context: The plugin context.
 
         Returns:
@@ -271,23 +348,21 @@ class UnixSocketExternalPlugin(Plugin):
         if not result_type:
             raise PluginError(error=PluginErrorModel(message=f"Hook type '{hook_type}' not registered in hook registry", plugin_name=self.name))
 
-        # Convert payload to Struct (still polymorphic)
-        payload_struct = Struct()
-        if hasattr(payload, "model_dump"):
-            json_format.ParseDict(payload.model_dump(), payload_struct)
-        else:
-            json_format.ParseDict(payload, payload_struct)
+        payload_dict = payload.model_dump() if hasattr(payload, "model_dump") else payload
 
         # Convert context to explicit proto message (faster than Struct)
         context_proto = pydantic_context_to_proto(context)
 
-        # Build request
+        # Build request; the payload skips the Struct round trip when the server accepts JSON bytes
         request = plugin_service_pb2.InvokeHookRequest(
             hook_type=hook_type,
             plugin_name=self.name,
-            payload=payload_struct,
             context=context_proto,
         )
+        if self._json_payload:
+            request.payload_json = orjson.dumps(payload_dict)
+        else:
+            json_format.ParseDict(payload_dict, request.payload)
 
         try:
             # Send request and get response
@@ -310,6 +385,8 @@ class UnixSocketExternalPlugin(Plugin):
                 update_pydantic_context_from_proto(context, response.context)
 
             # Parse and return result
+            if response.result_json:
+                return result_type.model_validate_json(response.result_json)
             if response.HasField("result"):
                 result_dict = json_format.MessageToDict(response.result)
                 return result_type.model_validate(result_dict)
@@ -36,6 +36,10 @@ LENGTH_SIZE = 4
 # Maximum message size (16 MB) to prevent memory exhaustion
 MAX_MESSAGE_SIZE = 16 * 1024 * 1024
 
+# Feature advertised in GetPluginConfigResponse.features by servers that accept
+# InvokeHookRequest.payload_json and answer with InvokeHookResponse.result_json
+JSON_PAYLOAD_FEATURE = "json_payload"
+
 
 class ProtocolError(Exception):
     """Raised when a protocol-level error occurs."""
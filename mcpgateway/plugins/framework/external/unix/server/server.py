@@ -7,7 +7,9 @@ Authors: Teryl Taylor
 Unix socket server for external plugins.
 
 This module provides a high-performance server that handles plugin requests
-over Unix domain sockets using length-prefixed protobuf messages.
+over Unix domain sockets using length-prefixed protobuf messages. Requests on
+one connection are processed concurrently and answered with the request's
+``request_id`` so clients can pipeline hook invocations.
 
 Examples:
     Run the server:
@@ -38,6 +40,7 @@ from typing import Optional
 # Third-Party
 from google.protobuf import json_format
 from google.protobuf.struct_pb2 import Struct
+import orjson
 
 # First-Party
 from mcpgateway.plugins.framework.external.grpc.proto import plugin_service_pb2
@@ -46,11 +49,14 @@ from mcpgateway.plugins.framework.external.proto_convert import (
     proto_context_to_pydantic,
     pydantic_context_to_proto,
 )
-from mcpgateway.plugins.framework.external.unix.protocol import ProtocolError, read_message, write_message_async
+from mcpgateway.plugins.framework.external.unix.protocol import JSON_PAYLOAD_FEATURE, ProtocolError, read_message, write_message_async
 from mcpgateway.plugins.framework.models import PluginContext
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of requests processed concurrently for a single client connection
+MAX_CONCURRENT_REQUESTS_PER_CONNECTION = 64
+
 
 class UnixSocketPluginServer:
     """Unix socket server for handling external plugin requests.
@@ -113,6 +119,10 @@ class UnixSocketPluginServer:
     ) -> None:
         """Handle a client connection.
 
+        Each request is handled in its own task (bounded per connection) and
+        responses are written as they complete, so a slow hook does not block
+        the requests pipelined behind it.
+
         Args:
             reader: The stream reader for the client.
             writer: The stream writer for the client.
@@ -120,6 +130,25 @@ class UnixSocketPluginServer:
         peer = writer.get_extra_info("peername") or "unknown"
         logger.debug("Client connected: %s", peer)
 
+        write_lock = asyncio.Lock()
+        slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS_PER_CONNECTION)
+        in_flight: set[asyncio.Task[None]] = set()
+
+        async def respond(data: bytes) -> None:
+            """Handle one message and write its response.
+
+            Args:
+                data: The raw message bytes.
+            """
+            try:
+                response_bytes = await self._handle_message(data)
+                async with write_lock:
+                    await write_message_async(writer, response_bytes)
+            except (OSError, BrokenPipeError):
+                logger.debug("Client %s disconnected during write", peer)
+            finally:
+                slots.release()
+
         try:
             while self._running:
                 try:
@@ -135,19 +164,17 @@ class UnixSocketPluginServer:
                     logger.warning("Protocol error from %s: %s", peer, e)
                     break
 
-                # Determine message type and handle
-                response_bytes = await self._handle_message(data)
-
-                # Send response
-                try:
-                    await write_message_async(writer, response_bytes)
-                except (OSError, BrokenPipeError):
-                    logger.debug("Client %s disconnected during write", peer)
-                    break
+                # Handle the message concurrently with the ones already in flight
+                await slots.acquire()
+                task = asyncio.create_task(respond(data))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
 
         except Exception as e:
             logger.exception("Error handling client %s: %s", peer, e)
         finally:
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
             logger.debug("Client disconnected: %s", peer)
             try:
                 writer.close()
@@ -213,11 +240,14 @@ class UnixSocketPluginServer:
         Returns:
             Serialized InvokeHookResponse.
         """
-        response = plugin_service_pb2.InvokeHookResponse(plugin_name=request.plugin_name)
+        response = plugin_service_pb2.InvokeHookResponse(plugin_name=request.plugin_name, request_id=request.request_id)
 
         try:
-            # Convert payload to dict (still polymorphic)
-            payload_dict = json_format.MessageToDict(request.payload)
+            # Convert payload to dict (still polymorphic); JSON bytes skip the Struct round trip
+            if request.payload_json:
+                payload_dict = orjson.loads(request.payload_json)
+            else:
+                payload_dict = json_format.MessageToDict(request.payload)
 
             # Convert explicit PluginContext proto directly to Pydantic
             context_pydantic = proto_context_to_pydantic(request.context)
@@ -244,7 +274,10 @@ class UnixSocketPluginServer:
                 response.error.mcp_error_code = error_dict.get("mcp_error_code", -32603)
             else:
                 if "result" in result:
-                    json_format.ParseDict(result["result"], response.result)
+                    if request.payload_json:
+                        response.result_json = orjson.dumps(result["result"])
+                    else:
+                        json_format.ParseDict(result["result"], response.result)
                 if "context" in result:
                     ctx = result["context"]
                     # Handle both Pydantic (optimized path) and dict (MCP compat)
@@ -274,7 +307,7 @@ class UnixSocketPluginServer:
         Returns:
             Serialized GetPluginConfigResponse.
         """
-        response = plugin_service_pb2.GetPluginConfigResponse()
+        response = plugin_service_pb2.GetPluginConfigResponse(features=[JSON_PAYLOAD_FEATURE])
 
         try:
             config = await self._plugin_server.get_plugin_config(request.name)
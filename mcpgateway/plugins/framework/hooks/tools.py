@@ -48,6 +48,9 @@ class ToolPreInvokePayload(PluginPayload):
         name: The tool name.
         args: The tool arguments for invocation.
         headers: The http pass through headers.
+        result: A final tool result supplied by a plugin. When a plugin returns a modified
+            payload with ``result`` set, the gateway returns it without invoking the tool
+            (``tool_post_invoke`` hooks still run on it).
 
     Examples:
         >>> payload = ToolPreInvokePayload(name="test_tool", args={"input": "data"})
@@ -58,6 +61,11 @@ class ToolPreInvokePayload(PluginPayload):
         >>> payload2 = ToolPreInvokePayload(name="empty")
         >>> payload2.args
         {}
+        >>> payload2.result is None
+        True
+        >>> hit = payload.model_copy(update={"result": {"content": [{"type": "text", "text": "cached"}]}})
+        >>> hit.result["content"][0]["text"]
+        'cached'
         >>> p = ToolPreInvokePayload(name="calculator", args={"operation": "add", "a": 5, "b": 3})
         >>> p.name
         'calculator'
@@ -69,6 +77,7 @@ class ToolPreInvokePayload(PluginPayload):
     name: str
     args: Optional[dict[str, Any]] = Field(default_factory=dict)
     headers: Optional[HttpHeaderPayload] = None
+    result: Optional[Any] = None
 
 
 class ToolPostInvokePayload(PluginPayload):
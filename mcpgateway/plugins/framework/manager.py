@@ -146,6 +146,7 @@ class PluginExecutor:
         combined_metadata: dict[str, Any] = {}
         current_payload: PluginPayload | None = None
 
+        active_refs = []
         for hook_ref in hook_refs:
             # Skip disabled plugins
             if hook_ref.plugin_ref.mode == PluginMode.DISABLED:
@@ -155,23 +156,25 @@ class PluginExecutor:
             if hook_ref.plugin_ref.conditions and not payload_matches(payload, hook_type, hook_ref.plugin_ref.conditions, global_context):
                 logger.debug("Skipping plugin %s - conditions not met", hook_ref.plugin_ref.name)
                 continue
+            active_refs.append(hook_ref)
+
+        for group in self._group_by_concurrency(active_refs):
+            if len(group) > 1:
+                blocked = await self._execute_concurrently(
+                    group,
+                    current_payload or payload,
+                    global_context,
+                    local_contexts,
+                    res_local_contexts,
+                    violations_as_exceptions,
+                    combined_metadata,
+                )
+                if blocked is not None:
+                    return (blocked, res_local_contexts)
+                continue
 
-            tmp_global_context = GlobalContext(
-                request_id=global_context.request_id,
-                user=global_context.user,
-                tenant_id=global_context.tenant_id,
-                server_id=global_context.server_id,
-                state={} if not global_context.state else copyonwrite(global_context.state),
-                metadata={} if not global_context.metadata else copyonwrite(global_context.metadata),
-            )
-            # Get or create local context for this plugin
-            local_context_key = global_context.request_id + hook_ref.plugin_ref.uuid
-            if local_contexts and local_context_key in local_contexts:
-                local_context = local_contexts[local_context_key]
-                local_context.global_context = tmp_global_context
-            else:
-                local_context = PluginContext(global_context=tmp_global_context)
-            res_local_contexts[local_context_key] = local_context
+            hook_ref = group[0]
+            local_context = self._prepare_local_context(hook_ref, global_context, local_contexts, res_local_contexts)
 
             # Execute plugin with timeout protection
             result = await self.execute_plugin(
@@ -193,6 +196,122 @@ class PluginExecutor:
             res_local_contexts,
         )
 
+    @staticmethod
+    def _group_by_concurrency(hook_refs: list[HookRef]) -> list[list[HookRef]]:
+        """Split priority-ordered hook references into execution groups.
+
+        Consecutive read-only plugins form one group that may run concurrently;
+        every other plugin is a group of its own, so payload-modifying plugins keep
+        their priority order relative to everything else.
+
+        Args:
+            hook_refs: Hook references sorted by priority.
+
+        Returns:
+            Execution groups in priority order.
+
+        Examples:
+            >>> from types import SimpleNamespace
+            >>> refs = [SimpleNamespace(name=n, plugin_ref=SimpleNamespace(read_only=ro)) for n, ro in [("a", True), ("b", True), ("m", False), ("c", True)]]
+            >>> [[r.name for r in g] for g in PluginExecutor._group_by_concurrency(refs)]
+            [['a', 'b'], ['m'], ['c']]
+        """
+        groups: list[list[HookRef]] = []
+        for hook_ref in hook_refs:
+            if hook_ref.plugin_ref.read_only and groups and groups[-1][-1].plugin_ref.read_only:
+                groups[-1].append(hook_ref)
+            else:
+                groups.append([hook_ref])
+        return groups
+
+    @staticmethod
+    def _prepare_local_context(
+        hook_ref: HookRef,
+        global_context: GlobalContext,
+        local_contexts: Optional[PluginContextTable],
+        res_local_contexts: PluginContextTable,
+    ) -> PluginContext:
+        """Get or create a plugin's local context with a copy-on-write view of the global context.
+
+        Args:
+            hook_ref: The hook reference about to be executed.
+            global_context: Shared context for all plugins containing request metadata.
+            local_contexts: Optional existing contexts from previous hook executions.
+            res_local_contexts: Contexts for this execution; the local context is recorded here.
+
+        Returns:
+            The plugin's local context.
+        """
+        tmp_global_context = GlobalContext(
+            request_id=global_context.request_id,
+            user=global_context.user,
+            tenant_id=global_context.tenant_id,
+            server_id=global_context.server_id,
+            state={} if not global_context.state else copyonwrite(global_context.state),
+            metadata={} if not global_context.metadata else copyonwrite(global_context.metadata),
+        )
+        # Get or create local context for this plugin
+        local_context_key = global_context.request_id + hook_ref.plugin_ref.uuid
+        if local_contexts and local_context_key in local_contexts:
+            local_context = local_contexts[local_context_key]
+            local_context.global_context = tmp_global_context
+        else:
+            local_context = PluginContext(global_context=tmp_global_context)
+        res_local_contexts[local_context_key] = local_context
+        return local_context
+
+    async def _execute_concurrently(
+        self,
+        group: list[HookRef],
+        payload: PluginPayload,
+        global_context: GlobalContext,
+        local_contexts: Optional[PluginContextTable],
+        res_local_contexts: PluginContextTable,
+        violations_as_exceptions: bool,
+        combined_metadata: dict[str, Any],
+    ) -> PluginResult | None:
+        """Run a group of read-only plugins concurrently on the same payload.
+
+        Each plugin keeps its own timeout and local context. Results are applied in
+        priority order once all plugins finish: context state and metadata are merged,
+        the first exception is re-raised and the first ENFORCE-mode block is returned,
+        exactly as if the plugins had run sequentially. Payload modifications returned
+        by read-only plugins are ignored.
+
+        Args:
+            group: Read-only hook references in priority order.
+            payload: The payload shared by the group.
+            global_context: Shared context for all plugins containing request metadata.
+            local_contexts: Optional existing contexts from previous hook executions.
+            res_local_contexts: Contexts for this execution.
+            violations_as_exceptions: Raise violations as exceptions rather than as returns.
+            combined_metadata: combination of the metadata of all plugins.
+
+        Returns:
+            The blocking result if a plugin in ENFORCE mode stopped processing, otherwise None.
+
+        Raises:
+            BaseException: The first error raised by a plugin in the group, in priority order.
+        """
+        contexts = [self._prepare_local_context(hook_ref, global_context, local_contexts, res_local_contexts) for hook_ref in group]
+        results = await asyncio.gather(
+            *(self.execute_plugin(hook_ref, payload, context, violations_as_exceptions) for hook_ref, context in zip(group, contexts)),
+            return_exceptions=True,
+        )
+        for hook_ref, context, result in zip(group, contexts, results):
+            if isinstance(result, BaseException):
+                raise result
+            if context.global_context:
+                global_context.state.update(context.global_context.state)
+                global_context.metadata.update(context.global_context.metadata)
+            if result.metadata:
+                combined_metadata.update(result.metadata)
+            if result.modified_payload is not None and result.continue_processing:
+                logger.warning("Ignoring payload modification from read-only plugin %s", hook_ref.plugin_ref.name)
+            if not result.continue_processing and hook_ref.plugin_ref.plugin.mode == PluginMode.ENFORCE:
+                return PluginResult(continue_processing=False, modified_payload=payload, violation=result.violation, metadata=combined_metadata)
+        return None
+
     async def execute_plugin(
         self,
         hook_ref: HookRef,
@@ -1153,6 +1153,7 @@ class PluginConfig(BaseModel):
         tags (list[str]): a list of tags for making the plugin searchable.
         mode (bool): whether the plugin is active.
         priority (int): indicates the order in which the plugin is run. Lower = higher priority. Default: 100.
+        read_only (bool): the plugin never modifies payloads, so it may run concurrently with adjacent read-only plugins. Default: False.
         conditions (Optional[list[PluginCondition]]): the conditions on which the plugin is run.
         applied_to (Optional[list[AppliedTo]]): the tools, fields, that the plugin is applied to.
         config (dict[str, Any]): the plugin specific configurations.
@@ -1170,6 +1171,7 @@ class PluginConfig(BaseModel):
     tags: list[str] = Field(default_factory=list)
     mode: PluginMode = PluginMode.ENFORCE
     priority: int = 100  # Lower = higher priority
+    read_only: bool = False  # Observer plugins that never modify the payload may run concurrently
     conditions: list[PluginCondition] = Field(default_factory=list)  # When to apply
     applied_to: Optional[AppliedTo] = None  # Fields to apply to.
     config: Optional[dict[str, Any]] = None
@@ -32,6 +32,7 @@ from mcpgateway.db import (
 )
 from mcpgateway.middleware.rbac import get_current_user_with_permissions, require_permission
 from mcpgateway.services.log_aggregator import get_log_aggregator
+from mcpgateway.services.log_buffer_service import get_log_buffer_service
 
 logger = logging.getLogger(__name__)
 
@@ -428,6 +429,23 @@ async def search_logs(request: LogSearchRequest, user=Depends(get_current_user_w
         raise HTTPException(status_code=500, detail="Log search failed")
 
 
+@router.get("/buffer-stats")
+@require_permission("logs:read")
+async def get_log_buffer_stats(user=Depends(get_current_user_with_permissions)) -> Dict[str, Any]:
+    """Get structured log buffer statistics.
+
+    Reports the buffered entry count, dropped and failed entries, and flush
+    latency of the background writer that persists structured logs.
+
+    Args:
+        user: Current authenticated user
+
+    Returns:
+        Buffer statistics
+    """
+    return get_log_buffer_service().get_stats()
+
+
 @router.get("/trace/{correlation_id}", response_model=CorrelationTraceResponse)
 @require_permission("logs:read")
 async def trace_correlation_id(correlation_id: str, user=Depends(get_current_user_with_permissions), db: Session = Depends(get_db)) -> CorrelationTraceResponse:
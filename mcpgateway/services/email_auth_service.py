@@ -1188,6 +1188,13 @@ class EmailAuthService:
 
             self.db.commit()
 
+            if is_admin is not None or is_active is not None:
+                # First-Party
+                from mcpgateway.cache.auth_cache import auth_cache  # pylint: disable=import-outside-toplevel
+
+                # Admin status bypasses RBAC checks; drop the cached flag in every worker
+                await auth_cache.invalidate_permissions(email)
+
             return user
 
         except Exception as e:
@@ -1344,6 +1351,8 @@ class EmailAuthService:
                 # First-Party
                 from mcpgateway.cache.auth_cache import auth_cache  # pylint: disable=import-outside-toplevel
 
+                # Role assignments were deleted in the committed transaction above
+                await auth_cache.invalidate_permissions(email)
                 asyncio.create_task(auth_cache.invalidate_user(email))
                 asyncio.create_task(auth_cache.invalidate_user_teams(email))
                 asyncio.create_task(auth_cache.invalidate_team_membership(email))
@@ -13,9 +13,12 @@ using the AUTH_ENCRYPTION_SECRET from configuration.
 # Standard
 import asyncio
 import base64
+from collections import OrderedDict
+import hashlib
 import logging
 import os
-from typing import Optional, Union
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 # Third-Party
 from argon2.low_level import hash_secret_raw, Type
@@ -28,6 +31,51 @@ from mcpgateway.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Process-local LRU of Argon2id-derived Fernet keys.
+# Key: (sha256(passphrase), salt, time_cost, memory_cost, parallelism, hash_len)
+_DerivedKeyId = Tuple[bytes, bytes, int, int, int, int]
+_derived_key_cache: "OrderedDict[_DerivedKeyId, bytes]" = OrderedDict()
+_derived_key_lock = threading.Lock()
+_derived_key_stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def get_derived_key_cache_stats() -> Dict[str, int]:
+    """Return hit/miss counters for the derived-key cache.
+
+    Returns:
+        Dict with hits, misses, evictions, size and maxsize.
+
+    Examples:
+        >>> stats = get_derived_key_cache_stats()
+        >>> sorted(stats)
+        ['evictions', 'hits', 'maxsize', 'misses', 'size']
+    """
+    with _derived_key_lock:
+        return {**_derived_key_stats, "size": len(_derived_key_cache), "maxsize": _derived_key_cache_maxsize()}
+
+
+def clear_derived_key_cache() -> None:
+    """Drop all cached derived keys and reset the counters.
+
+    Examples:
+        >>> clear_derived_key_cache()
+        >>> get_derived_key_cache_stats()["size"]
+        0
+    """
+    with _derived_key_lock:
+        _derived_key_cache.clear()
+        for name in _derived_key_stats:
+            _derived_key_stats[name] = 0
+
+
+def _derived_key_cache_maxsize() -> int:
+    """Return the configured derived-key cache size (0 disables caching).
+
+    Returns:
+        Maximum number of cached derived keys.
+    """
+    return max(int(getattr(settings, "argon2id_key_cache_size", 1024)), 0)
+
 
 class EncryptionService:
     """Handles encryption and decryption of client secrets.
@@ -95,6 +143,54 @@ class EncryptionService:
         )
         return base64.urlsafe_b64encode(raw)
 
+    def _get_derived_key(self, salt: bytes, time_cost: int, memory_cost: int, parallelism: int) -> bytes:
+        """Return the Argon2id key for ``salt`` and KDF params, deriving it at most once.
+
+        Derived keys are kept in a bounded process-local LRU shared by all
+        EncryptionService instances, so repeatedly decrypting the same bundle
+        skips the deliberately expensive key derivation.
+
+        Args:
+            salt: The salt to use in key derivation
+            time_cost: Argon2id time cost parameter
+            memory_cost: Argon2id memory cost parameter (in KiB)
+            parallelism: Argon2id parallelism parameter
+
+        Returns:
+            The derived key
+
+        Examples:
+            >>> clear_derived_key_cache()
+            >>> enc = EncryptionService('k', time_cost=1, memory_cost=1024, parallelism=1)
+            >>> k1 = enc._get_derived_key(b'0123456789abcdef', 1, 1024, 1)
+            >>> k2 = enc._get_derived_key(b'0123456789abcdef', 1, 1024, 1)
+            >>> k1 == k2, get_derived_key_cache_stats()["hits"]
+            (True, 1)
+        """
+        maxsize = _derived_key_cache_maxsize()
+        if maxsize == 0:
+            return self.derive_key_argon2id(self.encryption_secret, salt, time_cost, memory_cost, parallelism)
+
+        cache_id: _DerivedKeyId = (hashlib.sha256(self.encryption_secret).digest(), salt, time_cost, memory_cost, parallelism, self.hash_len)
+        with _derived_key_lock:
+            key = _derived_key_cache.get(cache_id)
+            if key is not None:
+                _derived_key_cache.move_to_end(cache_id)
+                _derived_key_stats["hits"] += 1
+                return key
+            _derived_key_stats["misses"] += 1
+
+        # Derive outside the lock so other threads are not serialized behind Argon2id
+        key = self.derive_key_argon2id(self.encryption_secret, salt, time_cost, memory_cost, parallelism)
+
+        with _derived_key_lock:
+            _derived_key_cache[cache_id] = key
+            _derived_key_cache.move_to_end(cache_id)
+            while len(_derived_key_cache) > maxsize:
+                _derived_key_cache.popitem(last=False)
+                _derived_key_stats["evictions"] += 1
+        return key
+
     def encrypt_secret(self, plaintext: str) -> str:
         """Encrypt a plaintext secret.
 
@@ -109,7 +205,7 @@ class EncryptionService:
         """
         try:
             salt = os.urandom(16)
-            key = self.derive_key_argon2id(self.encryption_secret, salt, self.time_cost, self.memory_cost, self.parallelism)
+            key = self._get_derived_key(salt, self.time_cost, self.memory_cost, self.parallelism)
             fernet = Fernet(key)
             encrypted = fernet.encrypt(plaintext.encode())
             return orjson.dumps(
@@ -152,7 +248,7 @@ class EncryptionService:
         try:
             b = orjson.loads(bundle_json)
             salt = base64.b64decode(b["salt"])
-            key = self.derive_key_argon2id(self.encryption_secret, salt, time_cost=b["t"], memory_cost=b["m"], parallelism=b["p"])
+            key = self._get_derived_key(salt, time_cost=b["t"], memory_cost=b["m"], parallelism=b["p"])
             fernet = Fernet(key)
             decrypted = fernet.decrypt(b["token"].encode())
             return decrypted.decode()
@@ -171,6 +267,49 @@ class EncryptionService:
         """
         return await asyncio.to_thread(self.decrypt_secret, bundle_json)
 
+    def decrypt_many(self, bundles: Sequence[str]) -> List[Optional[str]]:
+        """Decrypt several encrypted secrets, deriving each distinct key once.
+
+        Bundles that share a salt and KDF parameters (e.g. the same secret
+        stored on many rows) reuse one derived key.
+
+        Args:
+            bundles: JSON strings containing encryption metadata and token
+
+        Returns:
+            Decrypted secrets in input order; None for entries that fail to decrypt
+
+        Examples:
+            >>> enc = EncryptionService('k', time_cost=1, memory_cost=1024, parallelism=1)
+            >>> c = enc.encrypt_secret('a')
+            >>> enc.decrypt_many([c, 'not-a-bundle', c])
+            ['a', None, 'a']
+        """
+        results: List[Optional[str]] = [None] * len(bundles)
+        fernets: Dict[Tuple[bytes, int, int, int], Fernet] = {}
+        for index, bundle_json in enumerate(bundles):
+            try:
+                b = orjson.loads(bundle_json)
+                params = (base64.b64decode(b["salt"]), b["t"], b["m"], b["p"])
+                fernet = fernets.get(params)
+                if fernet is None:
+                    fernet = fernets[params] = Fernet(self._get_derived_key(*params))
+                results[index] = fernet.decrypt(b["token"].encode()).decode()
+            except Exception as e:
+                logger.error(f"Failed to decrypt secret at index {index}: {e}")
+        return results
+
+    async def decrypt_many_async(self, bundles: Sequence[str]) -> List[Optional[str]]:
+        """Decrypt several encrypted secrets asynchronously.
+
+        Args:
+            bundles: JSON strings containing encryption metadata and token
+
+        Returns:
+            Decrypted secrets in input order; None for entries that fail to decrypt
+        """
+        return await asyncio.to_thread(self.decrypt_many, list(bundles))
+
     def is_encrypted(self, text: str) -> bool:
         """Check if a string appears to be encrypted.
 
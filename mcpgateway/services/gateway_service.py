@@ -78,6 +78,7 @@ except ImportError:
     logging.info("Redis is not utilized in this environment.")
 
 # First-Party
+from mcpgateway.cache.registry_versions import registry_versions
 from mcpgateway.config import settings
 from mcpgateway.db import fresh_db_session
 from mcpgateway.db import Gateway as DbGateway
@@ -94,12 +95,14 @@ from mcpgateway.schemas import GatewayCreate, GatewayRead, GatewayUpdate, Prompt
 # logging.getLogger("httpx").setLevel(logging.WARNING)  # Disables httpx logs for regular health checks
 from mcpgateway.services.audit_trail_service import get_audit_trail_service
 from mcpgateway.services.event_service import EventService
+from mcpgateway.services.health_check_scheduler import HealthCheckScheduler
 from mcpgateway.services.http_client_service import get_default_verify, get_http_timeout, get_isolated_http_client
 from mcpgateway.services.logging_service import LoggingService
-from mcpgateway.services.mcp_session_pool import get_mcp_session_pool, register_gateway_capabilities_for_notifications, TransportType
-from mcpgateway.services.oauth_manager import OAuthManager
+from mcpgateway.services.mcp_session_pool import gateway_supports_list_changed, get_mcp_session_pool, register_gateway_capabilities_for_notifications, TransportType
+from mcpgateway.services.oauth_manager import is_unauthorized_error, OAuthManager
 from mcpgateway.services.structured_logger import get_structured_logger
 from mcpgateway.services.team_management_service import TeamManagementService
+from mcpgateway.utils.catalog_hash import catalog_digest, prompt_content_hash, resource_content_hash, tool_content_hash
 from mcpgateway.utils.create_slug import slugify
 from mcpgateway.utils.display_name import generate_display_name
 from mcpgateway.utils.pagination import unified_paginate
@@ -399,6 +402,14 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
         self.prompt_service = prompt_service
         self.resource_service = resource_service
         self._gateway_failure_counts: dict[str, int] = {}
+        # Per-gateway next-check times; the gateway list is re-read once per interval
+        self._health_scheduler = HealthCheckScheduler(
+            interval=GW_HEALTH_CHECK_INTERVAL,
+            max_backoff=settings.health_check_max_backoff,
+            passive_max_skips=settings.health_check_passive_max_skips,
+        )
+        self._health_gateways: Dict[str, DbGateway] = {}
+        self._health_gateways_synced_at: Optional[float] = None
         self.oauth_manager = OAuthManager(request_timeout=int(os.getenv("OAUTH_REQUEST_TIMEOUT", "30")), max_retries=int(os.getenv("OAUTH_MAX_RETRIES", "3")))
         self._event_service = EventService(channel_name="mcpgateway:gateway_events")
 
@@ -1454,6 +1465,69 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
             logger.error(f"Failed to fetch tools after OAuth for gateway {gateway_id}: {e}")
             raise GatewayConnectionError(f"Failed to fetch tools after OAuth: {str(e)}")
 
+    @staticmethod
+    def apply_visibility_filter(query: Any, user_email: Optional[str], team_ids: List[str], token_teams: Optional[List[str]], team_id: Optional[str]) -> Any:
+        """Restrict a gateway query to the rows the caller may list.
+
+        This is the single source of the gateway listing visibility rules; it is
+        shared by :meth:`list_gateways` and the registry delta listing.
+
+        - token_teams is None: admin bypass when user_email is None, else DB team memberships (team_ids) apply
+        - token_teams is []: public-only access
+        - token_teams is [...]: public + gateways in those teams + the caller's private gateways
+
+        Args:
+            query: SQLAlchemy select over DbGateway.
+            user_email: Caller email for owner access.
+            team_ids: Caller's DB team memberships (used when token_teams is None).
+            token_teams: Teams from the token; None means no token scoping.
+            team_id: Restrict to a single team (DB-membership access only).
+
+        Returns:
+            The filtered query, or None if the caller has no access to ``team_id``.
+
+        Examples:
+            >>> GatewayService.apply_visibility_filter(select(DbGateway.id), "a@x.com", ["t1"], None, "t2") is None
+            True
+            >>> q = select(DbGateway.id)
+            >>> GatewayService.apply_visibility_filter(q, None, [], None, None) is q
+            True
+        """
+        if token_teams is not None:
+            if len(token_teams) == 0:
+                # Public-only token: only access public gateways
+                return query.where(DbGateway.visibility == "public")
+            # Team-scoped token: public gateways + gateways in allowed teams + user's own
+            access_conditions = [
+                DbGateway.visibility == "public",
+                and_(DbGateway.team_id.in_(token_teams), DbGateway.visibility.in_(["team", "public"])),
+            ]
+            if user_email:
+                access_conditions.append(and_(DbGateway.owner_email == user_email, DbGateway.visibility == "private"))
+            return query.where(or_(*access_conditions))
+
+        if not user_email:
+            return query
+
+        if team_id:
+            # User requesting specific team - verify access
+            if team_id not in team_ids:
+                return None
+            access_conditions = [
+                and_(DbGateway.team_id == team_id, DbGateway.visibility.in_(["team", "public"])),
+                and_(DbGateway.team_id == team_id, DbGateway.owner_email == user_email),
+            ]
+            return query.where(or_(*access_conditions))
+
+        # General access: user's gateways + public gateways + team gateways
+        access_conditions = [
+            DbGateway.owner_email == user_email,
+            DbGateway.visibility == "public",
+        ]
+        if team_ids:
+            access_conditions.append(and_(DbGateway.team_id.in_(team_ids), DbGateway.visibility.in_(["team", "public"])))
+        return query.where(or_(*access_conditions))
+
     async def list_gateways(
         self,
         db: Session,
@@ -1549,50 +1623,18 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
         # - token_teams is None: admin bypass (is_admin=true with explicit null teams) - sees all
         # - token_teams is []: public-only access (missing teams or explicit empty)
         # - token_teams is [...]: access to specified teams + public + user's own
-        if token_teams is not None:
-            if len(token_teams) == 0:
-                # Public-only token: only access public gateways
-                query = query.where(DbGateway.visibility == "public")
-            else:
-                # Team-scoped token: public gateways + gateways in allowed teams + user's own
-                access_conditions = [
-                    DbGateway.visibility == "public",
-                    and_(DbGateway.team_id.in_(token_teams), DbGateway.visibility.in_(["team", "public"])),
-                ]
-                if user_email:
-                    access_conditions.append(and_(DbGateway.owner_email == user_email, DbGateway.visibility == "private"))
-                query = query.where(or_(*access_conditions))
-
-            if visibility:
-                query = query.where(DbGateway.visibility == visibility)
-
-        # Apply team-based access control if user_email is provided (and no token_teams filtering)
-        elif user_email:
+        if token_teams is None and user_email:
             team_service = TeamManagementService(db)
             user_teams = await team_service.get_user_teams(user_email)
             team_ids = [team.id for team in user_teams]
+        else:
+            team_ids = []
+        query = self.apply_visibility_filter(query, user_email, team_ids, token_teams, team_id)
+        if query is None:
+            return ([], None)
 
-            if team_id:
-                # User requesting specific team - verify access
-                if team_id not in team_ids:
-                    return ([], None)
-                access_conditions = [
-                    and_(DbGateway.team_id == team_id, DbGateway.visibility.in_(["team", "public"])),
-                    and_(DbGateway.team_id == team_id, DbGateway.owner_email == user_email),
-                ]
-                query = query.where(or_(*access_conditions))
-            else:
-                # General access: user's gateways + public gateways + team gateways
-                access_conditions = [
-                    DbGateway.owner_email == user_email,
-                    DbGateway.visibility == "public",
-                ]
-                if team_ids:
-                    access_conditions.append(and_(DbGateway.team_id.in_(team_ids), DbGateway.visibility.in_(["team", "public"])))
-                query = query.where(or_(*access_conditions))
-
-            if visibility:
-                query = query.where(DbGateway.visibility == visibility)
+        if visibility and (token_teams is not None or user_email):
+            query = query.where(DbGateway.visibility == visibility)
 
         # Add tag filtering if tags are provided (supports both List[str] and List[Dict] formats)
         if tags:
@@ -1889,6 +1931,7 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                 # Save original values BEFORE updating for change detection checks later
                 original_url = gateway.url
                 original_auth_type = gateway.auth_type
+                original_oauth_config = gateway.oauth_config
 
                 # Update fields if provided
                 if gateway_update.name is not None:
@@ -2209,6 +2252,9 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                 await cache.invalidate_gateways()
                 tool_lookup_cache = _get_tool_lookup_cache()
                 await tool_lookup_cache.invalidate_gateway(str(gateway.id))
+                # Drop the token cached for replaced OAuth credentials
+                if original_oauth_config and original_oauth_config != gateway.oauth_config:
+                    await self.oauth_manager.invalidate_access_token(original_oauth_config)
                 # Also invalidate tags cache since gateway tags may have changed
                 # First-Party
                 from mcpgateway.cache.admin_stats_cache import admin_stats_cache  # pylint: disable=import-outside-toplevel
@@ -2997,6 +3043,8 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
             >>> service._gateway_failure_counts.get('gw1', 0) == old_count
             True
         """
+        self._health_scheduler.record_result(str(gateway.id), healthy=False)
+
         if GW_FAILURE_THRESHOLD == -1:
             return  # Gateway failure action disabled
 
@@ -3377,6 +3425,9 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                                 refresh_interval = getattr(settings, "gateway_auto_refresh_interval", 300)
                                 if gateway.refresh_interval_seconds is not None:
                                     refresh_interval = gateway.refresh_interval_seconds
+                                elif gateway_supports_list_changed(str(gateway_id)):
+                                    # list_changed notifications drive refreshes; polling is only a fallback
+                                    refresh_interval = max(refresh_interval, settings.gateway_auto_refresh_list_changed_interval)
 
                                 time_since_refresh = (datetime.now(timezone.utc) - last_refresh).total_seconds()
 
@@ -3402,6 +3453,8 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                         except Exception as refresh_error:
                             logger.warning(f"Failed to refresh tools for gateway {gateway_name}: {refresh_error}")
 
+                    self._health_scheduler.record_result(str(gateway_id), healthy=True)
+
                     if span:
                         span.set_attribute("health.status", "healthy")
                         span.set_attribute("success", True)
@@ -3413,6 +3466,9 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
 
                     # Set the logger as debug as this check happens for each interval
                     logger.debug(f"Health check failed for gateway {gateway_name}: {e}")
+                    # A 401 means the cached client-credentials token was rejected; fetch a new one next time
+                    if gateway_auth_type == "oauth" and gateway_oauth_config and gateway_oauth_config.get("grant_type") != "authorization_code" and is_unauthorized_error(e):
+                        await self.oauth_manager.invalidate_access_token(gateway_oauth_config)
                     await self._handle_gateway_failure(gateway)
 
     async def aggregate_capabilities(self, db: Session) -> Dict[str, Any]:
@@ -3754,11 +3810,64 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                 logger.warning(f"Leader heartbeat error: {e}")
                 # Continue trying - the main health check loop will handle leadership loss
 
+    async def _run_due_health_checks(self, user_email: Optional[str]) -> float:
+        """Probe the gateways whose scheduled health check is due.
+
+        The gateway list is re-read from the database at most once per
+        interval; in between, only the gateways picked by the adaptive
+        scheduler are probed.
+
+        Args:
+            user_email: Email of the user for OAuth token lookup
+
+        Returns:
+            Seconds to sleep before the next call.
+
+        Examples:
+            >>> import asyncio
+            >>> from types import SimpleNamespace
+            >>> from unittest.mock import AsyncMock, MagicMock
+            >>> service = GatewayService()
+            >>> service._health_check_interval = 30
+            >>> gw = SimpleNamespace(id="gw1", url="http://gw1", reachable=True)
+            >>> service._get_gateways = MagicMock(return_value=[gw])
+            >>> service.check_health_of_gateways = AsyncMock(return_value=True)
+            >>> delay = asyncio.run(service._run_due_health_checks(None))
+            >>> service.check_health_of_gateways.await_args.args[0] == [gw]
+            True
+            >>> 29 <= delay <= 30
+            True
+        """
+        scheduler = self._health_scheduler
+        scheduler.interval = self._health_check_interval
+
+        now = time.monotonic()
+        if self._health_gateways_synced_at is None or now - self._health_gateways_synced_at >= self._health_check_interval:
+            gateways = await asyncio.to_thread(self._get_gateways)
+            self._health_gateways = {str(gw.id): gw for gw in gateways}
+            scheduler.sync(gateways)
+            self._health_gateways_synced_at = now
+
+        due_ids = scheduler.due()
+        due = [self._health_gateways[gateway_id] for gateway_id in due_ids if gateway_id in self._health_gateways]
+        if due:
+            try:
+                await self.check_health_of_gateways(due, user_email)
+            finally:
+                scheduler.finish(due_ids)
+
+        # Wake at most once per second (or per interval, if shorter) so that
+        # evenly spread checks are batched instead of waking per gateway
+        return min(max(scheduler.next_delay(), 1.0), self._health_check_interval)
+
     async def _run_health_checks(self, user_email: str) -> None:
         """Run health checks periodically,
         Uses Redis or FileLock - for multiple workers.
         Uses simple health check for single worker mode.
 
+        Each pass probes only the gateways whose adaptive schedule is due
+        (see _run_due_health_checks and HealthCheckScheduler).
+
         NOTE: This method intentionally does NOT take a db parameter.
         Health checks use fresh_db_session() only when DB access is needed,
         avoiding holding connections during HTTP calls to MCP servers.
@@ -3790,23 +3899,19 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                     if current_leader != self._instance_id:
                         return
 
-                    # Run health checks
-                    gateways = await asyncio.to_thread(self._get_gateways)
-                    if gateways:
-                        await self.check_health_of_gateways(gateways, user_email)
-
-                    await asyncio.sleep(self._health_check_interval)
+                    # Run due health checks
+                    delay = await self._run_due_health_checks(user_email)
+                    await asyncio.sleep(delay)
 
                 elif settings.cache_type == "none":
+                    delay = self._health_check_interval
                     try:
                         # For single worker mode, run health checks directly
-                        gateways = await asyncio.to_thread(self._get_gateways)
-                        if gateways:
-                            await self.check_health_of_gateways(gateways, user_email)
+                        delay = await self._run_due_health_checks(user_email)
                     except Exception as e:
                         logger.error(f"Health check run failed: {str(e)}")
 
-                    await asyncio.sleep(self._health_check_interval)
+                    await asyncio.sleep(delay)
 
                 else:
                     # FileLock-based leader fallback
@@ -3815,10 +3920,8 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                         logger.info("File lock acquired. Running health checks.")
 
                         while True:
-                            gateways = await asyncio.to_thread(self._get_gateways)
-                            if gateways:
-                                await self.check_health_of_gateways(gateways, user_email)
-                            await asyncio.sleep(self._health_check_interval)
+                            delay = await self._run_due_health_checks(user_email)
+                            await asyncio.sleep(delay)
 
                     except Timeout:
                         logger.debug("File lock already held. Retrying later.")
@@ -4061,6 +4164,7 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
             request_type=tool.request_type,
             headers=tool.headers,
             input_schema=tool.input_schema,
+            output_schema=tool.output_schema,
             annotations=tool.annotations,
             jsonpath_filter=tool.jsonpath_filter,
             auth_type=gateway.auth_type,
@@ -4076,6 +4180,8 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
             team_id=gateway.team_id,
             owner_email=gateway.owner_email,
             visibility="public",  # Federated tools should be public for discovery
+            # Only record the synced hash when the row matches it; otherwise the next refresh reconciles visibility
+            content_hash=tool_content_hash(tool, gateway) if gateway.visibility == "public" else None,
         )
 
     def _update_or_create_tools(self, db: Session, tools: List[Any], gateway: DbGateway, created_via: str) -> List[DbTool]:
@@ -4113,6 +4219,10 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                 # Check if tool already exists for this gateway from the tools_map
                 existing_tool = existing_tools_map.get(tool.name)
                 if existing_tool:
+                    content_hash = tool_content_hash(tool, gateway)
+                    if existing_tool.content_hash == content_hash:
+                        continue  # Upstream definition unchanged since last sync
+
                     # Update existing tool if there are changes
                     fields_to_update = False
 
@@ -4147,6 +4257,7 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                         existing_tool.auth_value = gateway.auth_value
                         existing_tool.visibility = gateway.visibility
                         logger.debug(f"Updated existing tool: {tool.name}")
+                    existing_tool.content_hash = content_hash
                 else:
                     # Create new tool if it doesn't exist
                     db_tool = self._create_db_tool(
@@ -4201,6 +4312,10 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                 existing_resource = existing_resources_map.get(resource.uri)
 
                 if existing_resource:
+                    content_hash = resource_content_hash(resource, gateway)
+                    if existing_resource.content_hash == content_hash:
+                        continue  # Upstream definition unchanged since last sync
+
                     # Update existing resource if there are changes
                     fields_to_update = False
 
@@ -4220,6 +4335,7 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                         existing_resource.uri_template = resource.uri_template
                         existing_resource.visibility = gateway.visibility
                         logger.debug(f"Updated existing resource: {resource.uri}")
+                    existing_resource.content_hash = content_hash
                 else:
                     # Create new resource if it doesn't exist
                     db_resource = DbResource(
@@ -4228,6 +4344,7 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                         description=resource.description,
                         mime_type=resource.mime_type,
                         uri_template=resource.uri_template,
+                        content_hash=resource_content_hash(resource, gateway),
                         gateway_id=gateway.id,
                         created_by="system",
                         created_via=created_via,
@@ -4277,6 +4394,10 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                 existing_prompt = existing_prompts_map.get(prompt.name)
 
                 if existing_prompt:
+                    content_hash = prompt_content_hash(prompt, gateway)
+                    if existing_prompt.content_hash == content_hash:
+                        continue  # Upstream definition unchanged since last sync
+
                     # Update existing prompt if there are changes
                     fields_to_update = False
 
@@ -4292,6 +4413,7 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                         existing_prompt.template = prompt.template if hasattr(prompt, "template") else ""
                         existing_prompt.visibility = gateway.visibility
                         logger.debug(f"Updated existing prompt: {prompt.name}")
+                    existing_prompt.content_hash = content_hash
                 else:
                     # Create new prompt if it doesn't exist
                     db_prompt = DbPrompt(
@@ -4301,6 +4423,7 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                         display_name=prompt.name,
                         description=prompt.description,
                         template=prompt.template if hasattr(prompt, "template") else "",
+                        content_hash=prompt_content_hash(prompt, gateway),
                         argument_schema={},  # Use argument_schema instead of arguments
                         gateway_id=gateway.id,
                         created_by="system",
@@ -4325,12 +4448,16 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
         gateway: Optional[DbGateway] = None,
         include_resources: bool = True,
         include_prompts: bool = True,
+        force: bool = False,
     ) -> Dict[str, int]:
         """Refresh tools, resources, and prompts for a gateway during health checks.
 
         Fetches the latest tools/resources/prompts from the MCP server and syncs
         with the database (add new, update changed, remove stale). Only performs
-        DB operations if actual changes are detected.
+        DB operations if actual changes are detected: when the digest of every
+        fetched catalog type matches the one stored on the gateway, no rows are
+        loaded at all, and within a changed catalog only rows whose content hash
+        differs are compared and written.
 
         This method uses fresh_db_session() internally to avoid holding
         connections during HTTP calls to MCP servers.
@@ -4343,6 +4470,7 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
             gateway: Optional DbGateway object to avoid redundant DB lookup
             include_resources: Whether to include resources in the refresh
             include_prompts: Whether to include prompts in the refresh
+            force: Reconcile rows even if the upstream catalog digest is unchanged
 
         Returns:
             Dict with counts: {tools_added, tools_removed, resources_added,
@@ -4502,22 +4630,26 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
 
         # Update database with fresh session
         with fresh_db_session() as db:
-            # Fetch gateway with relationships for update/comparison
-            gateway = db.execute(
-                select(DbGateway)
-                .options(
-                    selectinload(DbGateway.tools),
-                    selectinload(DbGateway.resources),
-                    selectinload(DbGateway.prompts),
-                )
-                .where(DbGateway.id == gateway_id)
-            ).scalar_one_or_none()
-
+            # Relationships are lazy-loaded only if the catalog changed
+            gateway = db.execute(select(DbGateway).where(DbGateway.id == gateway_id)).scalar_one_or_none()
             if not gateway:
                 result["success"] = False
                 result["error"] = f"Gateway {gateway_id} not found during refresh"
                 return result
 
+            # Short-circuit when the upstream catalog matches the last synced digest
+            new_catalog_hashes = {"tools": catalog_digest((tool.name, tool_content_hash(tool, gateway)) for tool in tools if tool is not None)}
+            if include_resources:
+                new_catalog_hashes["resources"] = catalog_digest((resource.uri, resource_content_hash(resource, gateway)) for resource in resources if resource is not None)
+            if include_prompts:
+                new_catalog_hashes["prompts"] = catalog_digest((prompt.name, prompt_content_hash(prompt, gateway)) for prompt in prompts if prompt is not None)
+            stored_catalog_hashes = dict(gateway.catalog_hashes) if isinstance(gateway.catalog_hashes, dict) else {}
+            if not force and all(stored_catalog_hashes.get(kind) == digest for kind, digest in new_catalog_hashes.items()):
+                gateway.last_refresh_at = datetime.now(timezone.utc)
+                db.commit()
+                logger.debug(f"Catalog unchanged for gateway {gateway_name}, skipped row comparison")
+                return result
+
             new_tool_names = [tool.name for tool in tools]
             new_resource_uris = [resource.uri for resource in resources] if include_resources else None
             new_prompt_names = [prompt.name for prompt in prompts] if include_prompts else None
@@ -4604,6 +4736,7 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                 result["prompts_added"] = len(prompts_to_add)
 
             gateway.last_refresh_at = datetime.now(timezone.utc)
+            gateway.catalog_hashes = {**stored_catalog_hashes, **new_catalog_hashes}
 
             total_changes = (
                 result["tools_added"]
@@ -4632,14 +4765,14 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                 cache = _get_registry_cache()
                 if result["tools_added"] > 0 or result["tools_removed"] > 0 or result["tools_updated"] > 0:
                     await cache.invalidate_tools()
+
+                    # Invalidate tool lookup cache for this gateway
+                    tool_lookup_cache = _get_tool_lookup_cache()
+                    await tool_lookup_cache.invalidate_gateway(str(gateway_id))
                 if result["resources_added"] > 0 or result["resources_removed"] > 0 or result["resources_updated"] > 0:
                     await cache.invalidate_resources()
                 if result["prompts_added"] > 0 or result["prompts_removed"] > 0 or result["prompts_updated"] > 0:
                     await cache.invalidate_prompts()
-
-                # Invalidate tool lookup cache for this gateway
-                tool_lookup_cache = _get_tool_lookup_cache()
-                await tool_lookup_cache.invalidate_gateway(str(gateway_id))
             else:
                 db.commit()
                 logger.debug(f"No changes detected during refresh of gateway {gateway_name}")
@@ -4746,6 +4879,7 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                 gateway=gateway,
                 include_resources=include_resources,
                 include_prompts=include_prompts,
+                force=True,
             )
             # Note: last_refresh_at is updated inside _refresh_gateway_tools_resources_prompts on success
 
@@ -4785,6 +4919,7 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
             >>> # Verify the event was passed to the event service
             >>> service._event_service.publish_event.assert_awaited_with(test_event)
         """
+        registry_versions.record_event("gateways", event)
         await self._event_service.publish_event(event)
 
     def _validate_tools(self, tools: list[dict[str, Any]], context: str = "default") -> tuple[list[ToolCreate], list[str]]:
@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+"""Adaptive per-gateway health-check scheduling.
+
+Instead of probing every gateway once per HEALTH_CHECK_INTERVAL, each gateway
+gets its own next-check time in a priority queue:
+
+- initial checks are spread evenly over the interval instead of bursting
+- a healthy gateway that recently served traffic successfully (passive
+  signals from the MCP session pool and tool invocations) skips its probe,
+  up to HEALTH_CHECK_PASSIVE_MAX_SKIPS times in a row
+- a gateway whose probe fails is re-checked with exponential backoff and
+  jitter, capped at HEALTH_CHECK_MAX_BACKOFF
+- a passive failure pulls the gateway's next probe forward
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Standard
+from dataclasses import dataclass
+import heapq
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class GatewayHealthSignals:
+    """Process-local record of passive gateway health signals.
+
+    Successes and failures observed while serving real traffic are keyed by
+    gateway id and/or URL, since some producers (the session pool) only know
+    the URL. Recording is synchronous and cheap so it can be called from hot
+    paths.
+
+    Examples:
+        >>> signals = GatewayHealthSignals(clock=lambda: 100.0)
+        >>> signals.record_success(gateway_id="gw1")
+        >>> signals.last_success("gw1", None)
+        100.0
+        >>> signals.record_failure(url="http://a")
+        >>> signals.drain_failures()
+        (set(), {'http://a'})
+        >>> signals.drain_failures()
+        (set(), set())
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize empty signal maps.
+
+        Args:
+            clock: Monotonic time source.
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._success_by_id: Dict[str, float] = {}
+        self._success_by_url: Dict[str, float] = {}
+        self._failed_ids: Set[str] = set()
+        self._failed_urls: Set[str] = set()
+
+    def record_success(self, gateway_id: Optional[str] = None, url: Optional[str] = None) -> None:
+        """Record a successful interaction with a gateway.
+
+        Args:
+            gateway_id: Gateway ID, if known.
+            url: Gateway URL, if known.
+        """
+        now = self._clock()
+        with self._lock:
+            if gateway_id:
+                self._success_by_id[gateway_id] = now
+            if url:
+                self._success_by_url[url] = now
+
+    def record_failure(self, gateway_id: Optional[str] = None, url: Optional[str] = None) -> None:
+        """Record a connectivity failure observed while serving traffic.
+
+        Args:
+            gateway_id: Gateway ID, if known.
+            url: Gateway URL, if known.
+        """
+        with self._lock:
+            if gateway_id:
+                self._failed_ids.add(gateway_id)
+            if url:
+                self._failed_urls.add(url)
+
+    def last_success(self, gateway_id: Optional[str], url: Optional[str]) -> Optional[float]:
+        """Return the most recent passive success for a gateway.
+
+        Args:
+            gateway_id: Gateway ID.
+            url: Gateway URL.
+
+        Returns:
+            Monotonic timestamp of the latest success, or None.
+        """
+        with self._lock:
+            seen = [ts for ts in (self._success_by_id.get(gateway_id or ""), self._success_by_url.get(url or "")) if ts is not None]
+        return max(seen) if seen else None
+
+    def drain_failures(self) -> Tuple[Set[str], Set[str]]:
+        """Return and clear gateway ids and URLs that failed since the last drain.
+
+        Returns:
+            Tuple of (gateway ids, urls).
+        """
+        with self._lock:
+            ids, urls = self._failed_ids, self._failed_urls
+            self._failed_ids, self._failed_urls = set(), set()
+        return ids, urls
+
+    def forget(self, gateway_id: str, url: Optional[str] = None) -> None:
+        """Drop all signals for a gateway that is no longer scheduled.
+
+        Args:
+            gateway_id: Gateway ID.
+            url: Gateway URL.
+        """
+        with self._lock:
+            self._success_by_id.pop(gateway_id, None)
+            self._failed_ids.discard(gateway_id)
+            if url:
+                self._success_by_url.pop(url, None)
+                self._failed_urls.discard(url)
+
+    def clear(self) -> None:
+        """Drop all recorded signals."""
+        with self._lock:
+            self._success_by_id.clear()
+            self._success_by_url.clear()
+            self._failed_ids.clear()
+            self._failed_urls.clear()
+
+
+gateway_health_signals = GatewayHealthSignals()
+
+
+@dataclass
+class _GatewaySchedule:
+    """Scheduling state for one gateway."""
+
+    gateway_id: str
+    url: Optional[str]
+    reachable: bool
+    next_check: float
+    failures: int = 0
+    skips: int = 0
+    in_flight: bool = False
+
+
+class HealthCheckScheduler:
+    """Priority-queue scheduler assigning each gateway its own next-check time.
+
+    Examples:
+        >>> from types import SimpleNamespace
+        >>> clock = [0.0]
+        >>> sched = HealthCheckScheduler(interval=60, signals=GatewayHealthSignals(clock=lambda: clock[0]), clock=lambda: clock[0], rng=lambda: 0.5)
+        >>> gws = [SimpleNamespace(id=f"gw{i}", url=f"http://gw{i}", reachable=True) for i in range(4)]
+        >>> sched.sync(gws)
+        >>> sched.due()
+        ['gw0']
+        >>> clock[0] = 30.0
+        >>> sched.due()
+        ['gw1', 'gw2']
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        max_backoff: Optional[float] = None,
+        passive_max_skips: int = 4,
+        signals: Optional[GatewayHealthSignals] = None,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            interval: Base seconds between checks of a healthy gateway.
+            max_backoff: Upper bound in seconds for failure backoff (defaults to 10 intervals).
+            passive_max_skips: Max consecutive probes skipped thanks to passive successes (0 disables).
+            signals: Passive signal source (defaults to the process-wide one).
+            clock: Monotonic time source.
+            rng: Random source in [0, 1) used for jitter.
+        """
+        self.interval = interval
+        self.max_backoff = max_backoff
+        self.passive_max_skips = passive_max_skips
+        self._signals = signals if signals is not None else gateway_health_signals
+        self._clock = clock
+        self._rng = rng
+        self._states: Dict[str, _GatewaySchedule] = {}
+        self._by_url: Dict[str, str] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = 0
+        self._probes = 0
+        self._skipped = 0
+
+    def __len__(self) -> int:
+        """Return the number of scheduled gateways.
+
+        Returns:
+            Number of gateways tracked by the scheduler.
+        """
+        return len(self._states)
+
+    def _push(self, state: _GatewaySchedule, when: float) -> None:
+        """Schedule ``state`` for ``when``; older heap entries become stale.
+
+        Args:
+            state: Gateway schedule state.
+            when: Monotonic time of the next check.
+        """
+        state.next_check = when
+        self._seq += 1
+        heapq.heappush(self._heap, (when, self._seq, state.gateway_id))
+
+    def sync(self, gateways: Iterable[Any]) -> None:
+        """Reconcile the schedule with the current set of gateways.
+
+        New gateways are spread evenly across one interval; gateways that
+        disappeared are dropped.
+
+        Args:
+            gateways: Gateway objects exposing ``id``, ``url`` and ``reachable``.
+        """
+        now = self._clock()
+        current: Dict[str, Any] = {str(gw.id): gw for gw in gateways}
+
+        for gateway_id in [gid for gid in self._states if gid not in current]:
+            state = self._states.pop(gateway_id)
+            if state.url:
+                self._by_url.pop(state.url, None)
+            self._signals.forget(gateway_id, state.url)
+
+        new_ids = [gid for gid in current if gid not in self._states]
+        for index, gateway_id in enumerate(new_ids):
+            gw = current[gateway_id]
+            state = _GatewaySchedule(gateway_id=gateway_id, url=getattr(gw, "url", None), reachable=bool(getattr(gw, "reachable", True)), next_check=now)
+            self._states[gateway_id] = state
+            self._push(state, now + self.interval * index / len(new_ids))
+
+        for gateway_id, gw in current.items():
+            state = self._states[gateway_id]
+            url = getattr(gw, "url", None)
+            if state.url != url:
+                if state.url:
+                    self._by_url.pop(state.url, None)
+                state.url = url
+            if url:
+                self._by_url[url] = gateway_id
+            state.reachable = bool(getattr(gw, "reachable", True))
+
+    def _apply_passive_failures(self, now: float) -> None:
+        """Pull the next probe forward for gateways that failed in live traffic.
+
+        Args:
+            now: Current monotonic time.
+        """
+        ids, urls = self._signals.drain_failures()
+        ids.update(self._by_url[url] for url in urls if url in self._by_url)
+        for gateway_id in ids:
+            state = self._states.get(gateway_id)
+            if state is None or state.in_flight or state.next_check <= now:
+                continue
+            state.skips = self.passive_max_skips  # next probe must not be skipped
+            self._push(state, now)
+
+    def due(self) -> List[str]:
+        """Pop gateways whose check is due, skipping recently-active healthy ones.
+
+        Returned gateways are marked in flight until :meth:`record_result` or
+        :meth:`finish` reschedules them.
+
+        Returns:
+            Gateway IDs to probe now.
+        """
+        now = self._clock()
+        self._apply_passive_failures(now)
+        ready: List[str] = []
+        while self._heap and self._heap[0][0] <= now:
+            when, _, gateway_id = heapq.heappop(self._heap)
+            state = self._states.get(gateway_id)
+            if state is None or state.in_flight or state.next_check != when:
+                continue  # stale heap entry
+            last_success = self._signals.last_success(gateway_id, state.url)
+            if state.reachable and state.failures == 0 and state.skips < self.passive_max_skips and last_success is not None and now - last_success < self.interval:
+                state.skips += 1
+                self._skipped += 1
+                self._push(state, now + self.interval)
+                continue
+            state.skips = 0
+            state.in_flight = True
+            ready.append(gateway_id)
+        self._probes += len(ready)
+        return ready
+
+    def backoff(self, failures: int) -> float:
+        """Return the jittered delay before re-checking a failing gateway.
+
+        Args:
+            failures: Consecutive failed probes (>= 1).
+
+        Returns:
+            Delay in seconds, between half and all of min(interval * 2**(failures-1), max_backoff).
+
+        Examples:
+            >>> sched = HealthCheckScheduler(interval=10, max_backoff=60, rng=lambda: 1.0)
+            >>> [sched.backoff(n) for n in (1, 2, 3, 4, 5)]
+            [10.0, 20.0, 40.0, 60.0, 60.0]
+            >>> HealthCheckScheduler(interval=10, rng=lambda: 0.0).backoff(1)
+            5.0
+        """
+        cap = self.max_backoff if self.max_backoff is not None else self.interval * 10
+        base = min(self.interval * (2 ** min(failures - 1, 30)), cap)
+        return base / 2 + self._rng() * base / 2
+
+    def record_result(self, gateway_id: str, healthy: bool) -> None:
+        """Reschedule a gateway after a probe.
+
+        Args:
+            gateway_id: Gateway ID.
+            healthy: Whether the probe succeeded.
+        """
+        state = self._states.get(gateway_id)
+        if state is None:
+            return
+        now = self._clock()
+        state.in_flight = False
+        if healthy:
+            state.failures = 0
+            state.reachable = True
+            self._push(state, now + self.interval)
+        else:
+            state.failures += 1
+            self._push(state, now + self.backoff(state.failures))
+
+    def finish(self, gateway_ids: Iterable[str]) -> None:
+        """Reschedule probed gateways that reported no result.
+
+        Args:
+            gateway_ids: Gateway IDs returned by :meth:`due`.
+        """
+        now = self._clock()
+        for gateway_id in gateway_ids:
+            state = self._states.get(gateway_id)
+            if state is not None and state.in_flight:
+                state.in_flight = False
+                self._push(state, now + self.interval)
+
+    def next_delay(self) -> float:
+        """Return seconds until the next scheduled check (at most one interval).
+
+        Returns:
+            Delay in seconds.
+        """
+        now = self._clock()
+        while self._heap:
+            when, _, gateway_id = self._heap[0]
+            state = self._states.get(gateway_id)
+            if state is not None and not state.in_flight and state.next_check == when:
+                return min(max(when - now, 0.0), self.interval)
+            heapq.heappop(self._heap)
+        return self.interval
+
+    def stats(self) -> Dict[str, Any]:
+        """Return scheduler counters.
+
+        Returns:
+            Dict with scheduled, failing, probes and skipped counts.
+        """
+        return {
+            "scheduled": len(self._states),
+            "failing": sum(1 for s in self._states.values() if s.failures),
+            "probes": self._probes,
+            "skipped": self._skipped,
+        }
@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+"""Buffered bulk writer for structured log persistence.
+
+StructuredLogger entries destined for the ``structured_log_entries`` table are
+collected in an in-memory ring buffer and bulk-inserted from a thread by a
+background task, instead of opening a session and committing once per log
+call on the event loop.
+
+Flushes run every ``STRUCTURED_LOGGING_BUFFER_FLUSH_INTERVAL`` seconds, and
+early once ``STRUCTURED_LOGGING_BUFFER_BATCH_SIZE`` entries are waiting. When
+the buffer is full, ``STRUCTURED_LOGGING_BUFFER_OVERFLOW_POLICY`` decides
+whether the oldest or the newest entry is dropped; drops are counted.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Examples:
+    >>> buffer = LogBufferService(enabled=True, max_size=2, overflow_policy="drop_oldest")
+    >>> for message in ("a", "b", "c"):
+    ...     buffer.add({"message": message})
+    >>> [row["message"] for row in buffer._buffer], buffer.get_stats()["total_dropped"]
+    (['b', 'c'], 1)
+"""
+
+# Standard
+import asyncio
+from collections import deque
+import logging
+import threading
+import time
+from typing import Any, Deque, Dict, List, Optional
+
+# First-Party
+from mcpgateway.config import settings
+from mcpgateway.db import fresh_db_session, StructuredLogEntry
+
+logger = logging.getLogger(__name__)
+
+
+class LogBufferService:
+    """Service for buffering and batching structured log writes to the database.
+
+    This service provides:
+    - Thread-safe ring buffer of structured log rows
+    - Periodic and size-triggered bulk inserts on a worker thread
+    - Drop-oldest or drop-newest overflow policy with drop accounting
+    - Graceful shutdown with final flush
+
+    Configuration (via environment variables):
+    - STRUCTURED_LOGGING_BUFFER_ENABLED: Enable buffered log writes (default: True)
+    - STRUCTURED_LOGGING_BUFFER_MAX_SIZE: Ring buffer capacity (default: 10000)
+    - STRUCTURED_LOGGING_BUFFER_BATCH_SIZE: Rows per insert, and early-flush threshold (default: 500)
+    - STRUCTURED_LOGGING_BUFFER_FLUSH_INTERVAL: Seconds between flushes (default: 2.0)
+    - STRUCTURED_LOGGING_BUFFER_OVERFLOW_POLICY: drop_oldest or drop_newest (default: drop_oldest)
+    """
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        max_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        overflow_policy: Optional[str] = None,
+    ):
+        """Initialize the log buffer service.
+
+        Args:
+            enabled: Whether buffering is enabled (default: from settings)
+            max_size: Ring buffer capacity (default: from settings)
+            batch_size: Rows per insert and early-flush threshold (default: from settings)
+            flush_interval: Seconds between flushes (default: from settings)
+            overflow_policy: ``drop_oldest`` or ``drop_newest`` (default: from settings)
+        """
+        self.enabled = enabled if enabled is not None else getattr(settings, "structured_logging_buffer_enabled", True)
+        self.max_size = max_size or getattr(settings, "structured_logging_buffer_max_size", 10000)
+        self.batch_size = batch_size or getattr(settings, "structured_logging_buffer_batch_size", 500)
+        self.flush_interval = flush_interval or getattr(settings, "structured_logging_buffer_flush_interval", 2.0)
+        self.overflow_policy = overflow_policy or getattr(settings, "structured_logging_buffer_overflow_policy", "drop_oldest")
+
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._lock = threading.Lock()
+
+        # Background flush task
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Stats for monitoring
+        self._total_buffered = 0
+        self._total_flushed = 0
+        self._total_dropped = 0
+        self._total_failed = 0
+        self._flush_count = 0
+        self._last_flush_ms = 0.0
+        self._max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Return whether the flush task is running and entries should be buffered.
+
+        Returns:
+            bool: True while the background flush task is alive.
+        """
+        return self._flush_task is not None and not self._flush_task.done()
+
+    async def start(self) -> None:
+        """Start the background flush task."""
+        if not self.enabled:
+            logger.info("LogBufferService disabled, skipping start")
+            return
+
+        if not self.running:
+            self._loop = asyncio.get_running_loop()
+            self._flush_event = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._flush_loop())
+            logger.info(f"LogBufferService flush task started (interval={self.flush_interval}s, batch_size={self.batch_size}, max_size={self.max_size})")
+
+    async def shutdown(self) -> None:
+        """Shutdown service with final flush."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        self._loop = None
+
+        # Final flush to persist any remaining entries
+        await self._flush_all()
+
+        logger.info(f"LogBufferService shutdown complete: total_flushed={self._total_flushed}, total_dropped={self._total_dropped}")
+
+    def add(self, row: Dict[str, Any]) -> None:
+        """Buffer a structured log row for the next flush.
+
+        Args:
+            row: Column mapping for a ``StructuredLogEntry``.
+
+        Examples:
+            >>> buffer = LogBufferService(enabled=True, max_size=1, overflow_policy="drop_newest")
+            >>> buffer.add({"message": "kept"}); buffer.add({"message": "dropped"})
+            >>> [row["message"] for row in buffer._buffer], buffer.get_stats()["total_dropped"]
+            (['kept'], 1)
+        """
+        with self._lock:
+            if len(self._buffer) >= self.max_size:
+                self._total_dropped += 1
+                if self.overflow_policy == "drop_newest":
+                    return
+                self._buffer.popleft()
+            self._buffer.append(row)
+            self._total_buffered += 1
+            pending = len(self._buffer)
+
+        if pending >= self.batch_size and self._loop is not None and self._flush_event is not None:
+            self._loop.call_soon_threadsafe(self._flush_event.set)
+
+    async def _flush_loop(self) -> None:
+        """Background task that flushes on an interval or when a batch is waiting.
+
+        Raises:
+            asyncio.CancelledError: When the flush loop is cancelled.
+        """
+        while True:
+            try:
+                try:
+                    await asyncio.wait_for(self._flush_event.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._flush_event.clear()
+                await self._flush_all()
+            except asyncio.CancelledError:
+                logger.debug("Log flush loop cancelled")
+                raise
+            except Exception as e:
+                logger.error(f"Error in log flush loop: {e}", exc_info=True)
+                await asyncio.sleep(self.flush_interval)
+
+    async def _flush_all(self) -> None:
+        """Flush all buffered rows to the database, one batch per transaction."""
+        while True:
+            with self._lock:
+                batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+            if not batch:
+                return
+
+            # Flush in thread to avoid blocking event loop
+            start = time.perf_counter()
+            await asyncio.to_thread(self._flush_to_db, batch)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            self._flush_count += 1
+            self._last_flush_ms = elapsed_ms
+            self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+            self._total_flush_ms += elapsed_ms
+
+    def _flush_to_db(self, batch: List[Dict[str, Any]]) -> None:
+        """Bulk-insert buffered log rows (runs in thread).
+
+        Args:
+            batch: Column mappings to insert.
+        """
+        try:
+            with fresh_db_session() as db:
+                db.bulk_insert_mappings(StructuredLogEntry, batch)
+                db.commit()
+            self._total_flushed += len(batch)
+        except Exception as e:
+            # Log rows are lost on failure; use the stdlib logger so this does not re-enter the buffer
+            self._total_failed += len(batch)
+            logger.error(f"Failed to flush {len(batch)} structured log entries to database: {e}")
+
+    def get_stats(self) -> dict:
+        """Get buffer statistics for monitoring.
+
+        Returns:
+            dict: Buffer statistics including sizes, drop counts, and flush latency.
+        """
+        with self._lock:
+            current_size = len(self._buffer)
+
+        return {
+            "enabled": self.enabled,
+            "running": self.running,
+            "flush_interval": self.flush_interval,
+            "batch_size": self.batch_size,
+            "max_size": self.max_size,
+            "overflow_policy": self.overflow_policy,
+            "current_buffer_size": current_size,
+            "total_buffered": self._total_buffered,
+            "total_flushed": self._total_flushed,
+            "total_dropped": self._total_dropped,
+            "total_failed": self._total_failed,
+            "flush_count": self._flush_count,
+            "last_flush_ms": round(self._last_flush_ms, 3),
+            "max_flush_ms": round(self._max_flush_ms, 3),
+            "avg_flush_ms": round(self._total_flush_ms / self._flush_count, 3) if self._flush_count else 0.0,
+        }
+
+
+# Singleton instance
+_log_buffer_service: Optional[LogBufferService] = None
+
+
+def get_log_buffer_service() -> LogBufferService:
+    """Get or create the singleton LogBufferService instance.
+
+    Returns:
+        LogBufferService: The singleton log buffer service instance.
+    """
+    global _log_buffer_service  # pylint: disable=global-statement
+    if _log_buffer_service is None:
+        _log_buffer_service = LogBufferService()
+    return _log_buffer_service
@@ -51,6 +51,7 @@ import orjson
 
 # First-Party
 from mcpgateway.config import settings
+from mcpgateway.services.health_check_scheduler import gateway_health_signals
 from mcpgateway.utils.url_auth import sanitize_url_for_logging
 
 # JSON-RPC standard error code for method not found
@@ -116,6 +117,7 @@ class PooledSession:
     created_at: float = field(default_factory=time.time)
     last_used: float = field(default_factory=time.time)
     use_count: int = 0
+    in_flight: int = 0  # Concurrent requests holding this session (multiplexed mode)
     _closed: bool = field(default=False, repr=False)
 
     @property
@@ -150,6 +152,23 @@ class PooledSession:
         self._closed = True
 
 
+@dataclass(eq=False)
+class _SharedSessions:
+    """Sessions of one pool key that are shared by concurrent requests (multiplexed mode).
+
+    Attributes:
+        sessions: Live sessions in rotation; each tracks its own ``in_flight`` count.
+        creating: Number of sessions currently being opened for this key.
+        waiting: Acquirers parked until a pending creation finishes.
+        condition: Guards the fields above and wakes waiters on release/creation.
+    """
+
+    sessions: list[PooledSession] = field(default_factory=list)
+    creating: int = 0
+    waiting: int = 0
+    condition: asyncio.Condition = field(default_factory=asyncio.Condition)
+
+
 # Type aliases
 # Pool key includes transport type and gateway_id to prevent returning wrong transport for same URL
 # and to ensure correct notification attribution when notifications are enabled
@@ -179,6 +198,34 @@ MessageHandlerFactory = Callable[
 ]
 
 
+@dataclass(eq=False)
+class _WarmupTarget:
+    """Connection details and recent demand for a pool key tracked by the warm-up loop.
+
+    Attributes:
+        url: The MCP server URL.
+        headers: Request headers from the most recent acquire (reused to open sessions).
+            Dropped with the target when its pool key is evicted or its demand decays.
+        transport_type: The transport type.
+        httpx_client_factory: Optional factory for httpx clients.
+        timeout: Transport connection timeout in seconds.
+        user_id: Raw user identity stored on new sessions.
+        gateway_id: Optional gateway ID for notification handler context.
+        recent: Acquires since the last warm-up cycle.
+        score: Exponentially decayed acquire count used to rank keys.
+    """
+
+    url: str
+    headers: Optional[Dict[str, str]]
+    transport_type: TransportType
+    httpx_client_factory: Optional[HttpxClientFactory]
+    timeout: float
+    user_id: str
+    gateway_id: Optional[str]
+    recent: int = 0
+    score: float = 0.0
+
+
 class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
     """
     Pool of MCP ClientSessions keyed by (user_identity, server URL, identity hash, transport type, gateway_id).
@@ -214,6 +261,8 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         - Custom identity extractor for rotating tokens (e.g., JWT decode)
         - Metrics for monitoring (hits, misses, evictions)
         - Graceful shutdown with close_all()
+        - Optional multiplexing: one session carries several concurrent requests
+        - Optional warm-up of the busiest pool keys (keeps sessions open and fresh)
 
     Usage:
         pool = MCPSessionPool()
@@ -263,6 +312,11 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         health_check_methods: Optional[list[str]] = None,
         health_check_timeout_seconds: float = 5.0,
         message_handler_factory: Optional[MessageHandlerFactory] = None,
+        max_in_flight_per_session: int = 1,
+        warmup_top_n: int = 0,
+        warmup_min_sessions: int = 1,
+        warmup_interval_seconds: float = 30.0,
+        warmup_refresh_margin_seconds: float = 60.0,
     ):
         """
         Initialize the session pool.
@@ -288,6 +342,16 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
             message_handler_factory: Optional factory for creating message handlers.
                                     Called with (url, gateway_id) to create handlers for
                                     each new session. Enables notification handling.
+            max_in_flight_per_session: Concurrent requests a pooled session may carry.
+                                       1 (default) hands sessions out exclusively; higher values
+                                       multiplex requests over shared sessions, choosing the
+                                       least-loaded one and opening a new session only when all
+                                       are at this limit.
+            warmup_top_n: Number of busiest pool keys kept warm by start_warmup() (0 disables).
+            warmup_min_sessions: Live sessions kept open for each warm pool key.
+            warmup_interval_seconds: Seconds between warm-up cycles; demand scores halve each cycle.
+            warmup_refresh_margin_seconds: Open a replacement this many seconds before a session
+                                           reaches its TTL, so requests never wait for the reconnect.
         """
         # Configuration
         self._max_sessions = max_sessions_per_key
@@ -304,6 +368,11 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         self._health_check_methods = health_check_methods or ["ping", "skip"]
         self._health_check_timeout = health_check_timeout_seconds
         self._message_handler_factory = message_handler_factory
+        self._max_in_flight = max(1, max_in_flight_per_session)
+        self._warmup_top_n = warmup_top_n
+        self._warmup_min_sessions = warmup_min_sessions
+        self._warmup_interval = warmup_interval_seconds
+        self._warmup_refresh_margin = warmup_refresh_margin_seconds
 
         # State - protected by _global_lock for creation, per-key locks for access
         self._global_lock = asyncio.Lock()
@@ -312,6 +381,7 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         self._locks: Dict[PoolKey, asyncio.Lock] = {}
         self._semaphores: Dict[PoolKey, asyncio.Semaphore] = {}
         self._pool_last_used: Dict[PoolKey, float] = {}  # Track last use time per pool key
+        self._shared: Dict[PoolKey, _SharedSessions] = {}  # Multiplexed sessions per pool key
 
         # Circuit breaker state
         self._failures: Dict[str, int] = {}  # url -> consecutive failure count
@@ -330,6 +400,16 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         self._pool_keys_evicted = 0
         self._sessions_reaped = 0  # Sessions closed during background eviction
         self._anonymous_identity_count = 0  # Count of requests with no identity headers
+        self._multiplexed_acquires = 0  # Acquires served by a session already carrying requests
+
+        # Warm-up state: demand per pool key, the keys currently kept warm, and the background task
+        self._warmup_targets: Dict[PoolKey, _WarmupTarget] = {}
+        self._warm_keys: Set[PoolKey] = set()
+        self._warmup_task: Optional[asyncio.Task[None]] = None
+        self._warmup_cycles = 0
+        self._warmup_sessions_created = 0
+        self._warmup_sessions_refreshed = 0
+        self._warmup_failures = 0
 
         # Lifecycle
         self._closed = False
@@ -496,6 +576,7 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
 
     def _record_failure(self, url: str) -> None:
         """Record a failure and potentially trip circuit breaker."""
+        gateway_health_signals.record_failure(url=url)
         self._failures[url] = self._failures.get(url, 0) + 1
         if self._failures[url] >= self._circuit_breaker_threshold:
             self._circuit_open_until[url] = time.time() + self._circuit_breaker_reset
@@ -504,6 +585,7 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
 
     def _record_success(self, url: str) -> None:
         """Record a success, resetting failure count."""
+        gateway_health_signals.record_success(url=url)
         self._failures[url] = 0
 
     @staticmethod
@@ -764,6 +846,12 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         # Throttled eviction - only run if enough time has passed (inline, not spawned)
         await self._maybe_evict_idle_pool_keys()
 
+        if self._warmup_top_n > 0:
+            self._record_demand(pool_key, url, headers, transport_type, httpx_client_factory, effective_timeout, user_id, gateway_id)
+
+        if self._max_in_flight > 1:
+            return await self._acquire_shared(pool_key, url, headers, transport_type, httpx_client_factory, effective_timeout, user_id, gateway_id)
+
         # Try to get from pool first (quick path, no lock needed for queue get)
         while True:
             try:
@@ -844,10 +932,6 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         Args:
             pooled: The session to release.
         """
-        if pooled.is_closed:
-            logger.warning("Attempted to release already-closed session")
-            return
-
         # Pool key includes transport type, user identity, and gateway_id
         # Re-compute user hash from stored raw identity (full hash for collision resistance)
         user_hash = "anonymous"
@@ -855,6 +939,16 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
             user_hash = hashlib.sha256(pooled.user_identity.encode()).hexdigest()
 
         pool_key = (user_hash, pooled.url, pooled.identity_key, pooled.transport_type.value, pooled.gateway_id)
+
+        if self._max_in_flight > 1:
+            # Shared sessions need their slot bookkeeping even when already closed
+            await self._release_shared(pool_key, pooled)
+            return
+
+        if pooled.is_closed:
+            logger.warning("Attempted to release already-closed session")
+            return
+
         lock = await self._get_or_create_lock(pool_key)
         pool = await self._get_or_create_pool(pool_key)
 
@@ -890,6 +984,414 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
             if pool_key in self._semaphores:
                 self._semaphores[pool_key].release()
 
+    async def _acquire_shared(
+        self,
+        pool_key: PoolKey,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        transport_type: TransportType,
+        httpx_client_factory: Optional[HttpxClientFactory],
+        timeout: float,
+        user_id: str,
+        gateway_id: Optional[str],
+    ) -> PooledSession:
+        """
+        Acquire a request slot on a shared session (multiplexed mode).
+
+        Picks the least-loaded live session with spare capacity. A new session
+        is opened only when every session is at the in-flight limit and pending
+        creations will not cover the caller, so a burst of N calls opens about
+        N / max_in_flight_per_session sessions instead of N.
+
+        Args:
+            pool_key: Resolved pool key for the caller.
+            url: The MCP server URL.
+            headers: Request headers.
+            transport_type: The transport type.
+            httpx_client_factory: Optional factory for httpx clients.
+            timeout: Transport connection timeout in seconds.
+            user_id: Raw user identity stored on new sessions.
+            gateway_id: Optional gateway ID for notification handler context.
+
+        Returns:
+            PooledSession whose in_flight count includes the caller.
+
+        Raises:
+            asyncio.TimeoutError: If no slot frees up within the acquire timeout.
+            RuntimeError: If the session is owned by another worker or creation fails.
+        """
+        async with self._global_lock:
+            shared = self._shared.setdefault(pool_key, _SharedSessions())
+        semaphore = self._semaphores[pool_key]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._acquire_timeout
+
+        while True:
+            to_validate: Optional[PooledSession] = None
+            try:
+                async with shared.condition:
+                    while True:
+                        candidates = [s for s in shared.sessions if s.in_flight < self._max_in_flight and (s.in_flight == 0 or s.age_seconds <= self._session_ttl)]
+                        if candidates:
+                            pooled = min(candidates, key=lambda s: s.in_flight)
+                            if pooled.in_flight == 0 and (pooled.age_seconds > self._session_ttl or pooled.idle_seconds > self._health_check_interval):
+                                # Take it out of rotation so nobody piles onto it while it is checked
+                                shared.sessions.remove(pooled)
+                                to_validate = pooled
+                                break
+                            if pooled.in_flight > 0:
+                                self._multiplexed_acquires += 1
+                            pooled.in_flight += 1
+                            pooled.last_used = time.time()
+                            pooled.use_count += 1
+                            self._hits += 1
+                            return pooled
+
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            raise asyncio.TimeoutError()
+                        if shared.waiting < shared.creating * (self._max_in_flight - 1):
+                            # A session being opened has room for us once it is ready
+                            shared.waiting += 1
+                            try:
+                                await asyncio.wait_for(shared.condition.wait(), timeout=remaining)
+                            finally:
+                                shared.waiting -= 1
+                            continue
+                        if not semaphore.locked():
+                            await semaphore.acquire()
+                            shared.creating += 1
+                            break
+                        await asyncio.wait_for(shared.condition.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                raise asyncio.TimeoutError(f"Timeout waiting for available session for {sanitize_url_for_logging(url)}") from None
+
+            if to_validate is not None:
+                try:
+                    valid = await self._validate_session(to_validate)
+                except BaseException:
+                    await self._close_session(to_validate)
+                    semaphore.release()
+                    raise
+                if valid:
+                    async with shared.condition:
+                        to_validate.in_flight += 1
+                        to_validate.last_used = time.time()
+                        to_validate.use_count += 1
+                        self._hits += 1
+                        shared.sessions.append(to_validate)
+                    return to_validate
+                await self._close_session(to_validate)
+                self._evictions += 1
+                semaphore.release()
+                async with shared.condition:
+                    shared.condition.notify_all()
+                continue
+
+            try:
+                owner = await self._foreign_pool_owner(headers)
+                if owner:
+                    raise RuntimeError(f"Session owned by another worker: {owner}")
+                pooled = await asyncio.wait_for(
+                    self._create_session(url, headers, transport_type, httpx_client_factory, timeout, gateway_id),
+                    timeout=self._session_create_timeout,
+                )
+            except BaseException as e:
+                semaphore.release()
+                async with shared.condition:
+                    shared.creating -= 1
+                    shared.condition.notify_all()
+                if not isinstance(e, asyncio.CancelledError):
+                    self._record_failure(url)
+                    logger.warning(f"Failed to create session for {sanitize_url_for_logging(url)}: {e}")
+                raise
+
+            pooled.identity_key = pool_key[2]
+            pooled.user_identity = user_id
+            pooled.in_flight = 1
+            self._misses += 1
+            self._record_success(url)
+            async with shared.condition:
+                shared.creating -= 1
+                shared.sessions.append(pooled)
+                shared.condition.notify_all()
+            logger.debug(f"Pool miss for {sanitize_url_for_logging(url)} - created new shared session (transport={transport_type.value})")
+            return pooled
+
+    async def _release_shared(self, pool_key: PoolKey, pooled: PooledSession) -> None:
+        """
+        Give back one request slot on a shared session (multiplexed mode).
+
+        The session stays in rotation until it is both idle and expired (or the
+        pool is closing), so requests still running on it are never cut off.
+        A session closed while in use is dropped from rotation on its first release.
+
+        Args:
+            pool_key: Pool key the session belongs to.
+            pooled: The shared session.
+        """
+        if pooled.in_flight <= 0:
+            logger.warning("Attempted to release shared session with no requests in flight")
+            return
+
+        shared = self._shared.get(pool_key)
+        retire = False
+        if shared is None:
+            pooled.in_flight = max(0, pooled.in_flight - 1)
+            retire = pooled.in_flight == 0
+        else:
+            async with shared.condition:
+                pooled.in_flight -= 1
+                pooled.last_used = time.time()
+                self._pool_last_used[pool_key] = pooled.last_used
+                if pooled.is_closed:
+                    # Closed under us: drop it from rotation so it stops counting against the pool
+                    if pooled in shared.sessions:
+                        shared.sessions.remove(pooled)
+                        retire = True
+                elif pooled.in_flight == 0 and (self._closed or pooled.age_seconds > self._session_ttl) and pooled in shared.sessions:
+                    shared.sessions.remove(pooled)
+                    retire = True
+                shared.condition.notify_all()
+
+        if pooled.is_closed:
+            if retire and pool_key in self._semaphores:
+                self._semaphores[pool_key].release()
+            return
+
+        if retire:
+            await self._close_session(pooled)
+            if pool_key in self._semaphores:
+                self._semaphores[pool_key].release()
+            if pooled.age_seconds > self._session_ttl:
+                self._evictions += 1
+
+    async def _foreign_pool_owner(self, headers: Optional[Dict[str, str]]) -> Optional[str]:
+        """Return the owning worker when another worker already claimed this downstream session.
+
+        Args:
+            headers: Request headers carrying the optional x-mcp-session-id.
+
+        Returns:
+            The owner worker ID if it is not this worker, otherwise None.
+        """
+        if not (settings.mcpgateway_session_affinity_enabled and headers):
+            return None
+        headers_lower = {k.lower(): v for k, v in headers.items()}
+        mcp_session_id = headers_lower.get("x-mcp-session-id")
+        if not (mcp_session_id and self.is_valid_mcp_session_id(mcp_session_id)):
+            return None
+        owner = await self._get_pool_session_owner(mcp_session_id)
+        if owner and owner != WORKER_ID:
+            logger.warning(f"Session {mcp_session_id[:8]}... owned by worker {owner}, not us ({WORKER_ID})")
+            return owner
+        return None
+
+    def _record_demand(
+        self,
+        pool_key: PoolKey,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        transport_type: TransportType,
+        httpx_client_factory: Optional[HttpxClientFactory],
+        timeout: float,
+        user_id: str,
+        gateway_id: Optional[str],
+    ) -> None:
+        """Count an acquire towards the warm-up ranking and remember how to reconnect the key.
+
+        Keys bound to a downstream session (x-mcp-session-id) are not tracked:
+        their sessions are never shared, so warming them would only waste connections.
+
+        Args:
+            pool_key: The pool key that was acquired.
+            url: The MCP server URL.
+            headers: Request headers of the acquire, including upstream auth.
+            transport_type: The transport type.
+            httpx_client_factory: Optional factory for httpx clients.
+            timeout: Transport connection timeout in seconds.
+            user_id: Raw user identity stored on new sessions.
+            gateway_id: Optional gateway ID for notification handler context.
+        """
+        if headers and any(k.lower() == "x-mcp-session-id" for k in headers):
+            return
+        target = self._warmup_targets.get(pool_key)
+        if target is None:
+            target = _WarmupTarget(url, headers, transport_type, httpx_client_factory, timeout, user_id, gateway_id)
+            self._warmup_targets[pool_key] = target
+        else:
+            # Latest headers win so rotated credentials are picked up
+            target.headers = headers
+            target.httpx_client_factory = httpx_client_factory
+        target.recent += 1
+
+    def start_warmup(self) -> None:
+        """Start the background warm-up loop if warm-up is configured and not already running."""
+        if self._warmup_top_n <= 0 or self._closed:
+            return
+        if self._warmup_task is None or self._warmup_task.done():
+            self._warmup_task = asyncio.create_task(self._warmup_loop())
+            logger.info(f"MCP session pool warm-up started (top_n={self._warmup_top_n}, min_sessions={self._warmup_min_sessions})")
+
+    async def _warmup_loop(self) -> None:
+        """Run warm-up cycles until the pool closes."""
+        while not self._closed:
+            try:
+                await self.run_warmup_cycle()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Session pool warm-up cycle failed: {e}")
+            await asyncio.sleep(self._warmup_interval)
+
+    async def run_warmup_cycle(self) -> None:
+        """
+        Re-rank pool keys by recent demand and top up the busiest ones.
+
+        Each cycle halves every key's score and adds the acquires seen since the
+        previous cycle, so the ranking follows recent traffic. The top-N keys are
+        protected from idle eviction and kept at ``warmup_min_sessions`` sessions
+        that are not about to expire.
+        """
+        self._warmup_cycles += 1
+        for target in self._warmup_targets.values():
+            target.score = target.score / 2 + target.recent
+            target.recent = 0
+
+        ranked = sorted(self._warmup_targets.items(), key=lambda item: item[1].score, reverse=True)
+        hot = [(key, target) for key, target in ranked[: self._warmup_top_n] if target.score >= 0.1]
+        self._warm_keys = {key for key, _ in hot}
+
+        # Forget keys whose demand has decayed away, along with their auth headers
+        for key, target in ranked:
+            if target.score < 0.1:
+                del self._warmup_targets[key]
+
+        for pool_key, target in hot:
+            if self._closed:
+                return
+            if self._is_circuit_open(target.url):
+                continue
+            await self._warm_pool_key(pool_key, target)
+
+    async def _warm_pool_key(self, pool_key: PoolKey, target: _WarmupTarget) -> None:
+        """Open sessions for a pool key until it has enough that are not close to expiry.
+
+        When the key is at ``max_sessions_per_key``, an idle session that is close to
+        expiry is retired to make room, so its replacement is ready before the TTL hits.
+
+        Args:
+            pool_key: The pool key to top up.
+            target: Connection details recorded for the key.
+        """
+        pool = await self._get_or_create_pool(pool_key)
+        semaphore = self._semaphores[pool_key]
+
+        fresh_cutoff = self._session_ttl - self._warmup_refresh_margin
+        live = self._idle_sessions(pool) + list(self._active.get(pool_key, ())) + self._shared_sessions(pool_key)
+        deficit = self._warmup_min_sessions - sum(1 for s in live if not s.is_closed and s.age_seconds < fresh_cutoff)
+
+        for _ in range(deficit):
+            retiring: Optional[PooledSession] = None
+            if semaphore.locked():
+                retiring = await self._take_expiring_idle(pool_key, pool, fresh_cutoff)
+                if retiring is None:
+                    return
+            else:
+                await semaphore.acquire()
+
+            try:
+                pooled = await asyncio.wait_for(
+                    self._create_session(target.url, target.headers, target.transport_type, target.httpx_client_factory, target.timeout, target.gateway_id),
+                    timeout=self._session_create_timeout,
+                )
+            except Exception as e:
+                self._warmup_failures += 1
+                if retiring is not None:
+                    await self._park_session(pool_key, pool, retiring)
+                else:
+                    semaphore.release()
+                logger.debug(f"Session pool warm-up failed for {sanitize_url_for_logging(target.url)}: {e}")
+                return
+
+            pooled.identity_key = pool_key[2]
+            pooled.user_identity = target.user_id
+            await self._park_session(pool_key, pool, pooled)
+            if retiring is not None:
+                await self._close_session(retiring)
+                self._warmup_sessions_refreshed += 1
+            else:
+                self._warmup_sessions_created += 1
+
+    @staticmethod
+    def _idle_sessions(pool: asyncio.Queue[PooledSession]) -> list[PooledSession]:
+        """Snapshot the idle sessions parked in a pool queue without removing them.
+
+        Args:
+            pool: The pool queue.
+
+        Returns:
+            Idle sessions in queue order.
+        """
+        idle: list[PooledSession] = []
+        while True:
+            try:
+                idle.append(pool.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        for pooled in idle:
+            pool.put_nowait(pooled)
+        return idle
+
+    async def _take_expiring_idle(self, pool_key: PoolKey, pool: asyncio.Queue[PooledSession], fresh_cutoff: float) -> Optional[PooledSession]:
+        """Remove one idle session that is close to expiry from rotation, keeping its slot.
+
+        Args:
+            pool_key: The pool key.
+            pool: The pool queue.
+            fresh_cutoff: Sessions at least this old (seconds) count as expiring.
+
+        Returns:
+            The removed session, or None if every session is fresh or in use.
+        """
+        shared = self._shared.get(pool_key)
+        if shared is not None:
+            async with shared.condition:
+                for pooled in shared.sessions:
+                    if pooled.in_flight == 0 and pooled.age_seconds >= fresh_cutoff:
+                        shared.sessions.remove(pooled)
+                        return pooled
+            return None
+
+        idle: list[PooledSession] = []
+        while True:
+            try:
+                idle.append(pool.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        taken = next((pooled for pooled in idle if pooled.age_seconds >= fresh_cutoff), None)
+        for pooled in idle:
+            if pooled is not taken:
+                pool.put_nowait(pooled)
+        return taken
+
+    async def _park_session(self, pool_key: PoolKey, pool: asyncio.Queue[PooledSession], pooled: PooledSession) -> None:
+        """Put an idle session into rotation for its pool key.
+
+        Args:
+            pool_key: The pool key.
+            pool: The pool queue (used in exclusive mode).
+            pooled: The idle session; its semaphore slot must already be held.
+        """
+        if self._max_in_flight > 1:
+            async with self._global_lock:
+                shared = self._shared.setdefault(pool_key, _SharedSessions())
+            async with shared.condition:
+                shared.sessions.append(pooled)
+                shared.condition.notify_all()
+            return
+        pool.put_nowait(pooled)
+
     async def _maybe_evict_idle_pool_keys(self) -> None:
         """
         Reap stale sessions and evict idle pool keys.
@@ -923,8 +1425,8 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
 
         async with self._global_lock:
             for pool_key, last_used in list(self._pool_last_used.items()):
-                # Skip recently-used pools
-                if now - last_used < self._idle_pool_eviction:
+                # Skip recently-used pools and pools the warm-up loop is keeping open
+                if now - last_used < self._idle_pool_eviction or pool_key in self._warm_keys:
                     continue
 
                 pool = self._pools.get(pool_key)
@@ -934,6 +1436,19 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
                 if active:
                     continue
 
+                shared = self._shared.get(pool_key)
+                if shared is not None:
+                    if shared.creating or shared.waiting or any(s.in_flight for s in shared.sessions):
+                        continue
+                    for session in list(shared.sessions):
+                        if session.age_seconds > self._session_ttl or session.idle_seconds > self._idle_pool_eviction:
+                            shared.sessions.remove(session)
+                            sessions_to_close.append(session)
+                            if pool_key in self._semaphores:
+                                self._semaphores[pool_key].release()
+                    if shared.sessions:
+                        continue
+
                 if pool:
                     # Phase 1: Drain and collect expired/stale sessions from idle pools
                     while not pool.empty():
@@ -963,6 +1478,8 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
                 self._locks.pop(pool_key, None)
                 self._semaphores.pop(pool_key, None)
                 self._pool_last_used.pop(pool_key, None)
+                self._shared.pop(pool_key, None)
+                self._warmup_targets.pop(pool_key, None)
                 self._pool_keys_evicted += 1
                 logger.debug(f"Evicted idle pool key: {pool_key[0][:8]}|{pool_key[1]}|{pool_key[2][:8]}")
 
@@ -1276,10 +1793,26 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
                 for pooled in list(active_set):
                     await self._close_session(pooled)
 
+            # Close all shared (multiplexed) sessions, including those carrying requests
+            for shared in list(self._shared.values()):
+                for pooled in list(shared.sessions):
+                    await self._close_session(pooled)
+
             self._pools.clear()
             self._active.clear()
+            self._shared.clear()
             self._locks.clear()
             self._semaphores.clear()
+            self._warmup_targets.clear()
+            self._warm_keys = set()
+
+        if self._warmup_task and not self._warmup_task.done():
+            self._warmup_task.cancel()
+            try:
+                await self._warmup_task
+            except asyncio.CancelledError:
+                pass
+            self._warmup_task = None
 
         # Stop RPC listener if running
         if self._rpc_listener_task and not self._rpc_listener_task.done():
@@ -1781,6 +2314,18 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
             logger.warning(f"Error forwarding HTTP request via Redis: {e}")
             return None
 
+    def _shared_sessions(self, pool_key: PoolKey) -> list[PooledSession]:
+        """Return the multiplexed sessions currently in rotation for a pool key.
+
+        Args:
+            pool_key: The pool key.
+
+        Returns:
+            List of shared sessions (empty in exclusive mode).
+        """
+        shared = self._shared.get(pool_key)
+        return shared.sessions if shared is not None else []
+
     def get_metrics(self) -> Dict[str, Any]:
         """
         Return pool metrics for monitoring.
@@ -1801,6 +2346,18 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
             "anonymous_identity_count": self._anonymous_identity_count,
             "hit_rate": self._hits / total_requests if total_requests > 0 else 0.0,
             "pool_key_count": len(self._pools),
+            "max_in_flight_per_session": self._max_in_flight,
+            "multiplexed_acquires": self._multiplexed_acquires,
+            "warmup": {
+                "enabled": self._warmup_top_n > 0,
+                "running": self._warmup_task is not None and not self._warmup_task.done(),
+                "cycles": self._warmup_cycles,
+                "tracked_keys": len(self._warmup_targets),
+                "warm_keys": len(self._warm_keys),
+                "sessions_created": self._warmup_sessions_created,
+                "sessions_refreshed": self._warmup_sessions_refreshed,
+                "failures": self._warmup_failures,
+            },
             # Session affinity metrics
             "session_affinity": {
                 "local_hits": self._session_affinity_local_hits,
@@ -1816,6 +2373,8 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
                     "available": pool.qsize(),
                     "active": len(self._active.get((user, url, identity, transport, gw_id), set())),
                     "max": self._max_sessions,
+                    "shared": len(shared_sessions := self._shared_sessions((user, url, identity, transport, gw_id))),
+                    "in_flight": sum(s.in_flight for s in shared_sessions),
                 }
                 for (user, url, identity, transport, gw_id), pool in self._pools.items()
             },
@@ -1900,6 +2459,11 @@ def init_mcp_session_pool(
     message_handler_factory: Optional[MessageHandlerFactory] = None,
     enable_notifications: bool = True,
     notification_debounce_seconds: float = 5.0,
+    max_in_flight_per_session: int = 1,
+    warmup_top_n: int = 0,
+    warmup_min_sessions: int = 1,
+    warmup_interval_seconds: float = 30.0,
+    warmup_refresh_margin_seconds: float = 60.0,
 ) -> MCPSessionPool:
     """Initialize the global MCP session pool.
 
@@ -1907,6 +2471,11 @@ def init_mcp_session_pool(
         See MCPSessionPool.__init__ for argument descriptions.
         enable_notifications: Enable automatic notification service for list_changed events.
         notification_debounce_seconds: Debounce interval for notification-triggered refreshes.
+        max_in_flight_per_session: Concurrent requests per pooled session (>1 enables multiplexing).
+        warmup_top_n: Busiest pool keys kept warm once start_warmup() runs (0 disables).
+        warmup_min_sessions: Live sessions kept open for each warm pool key.
+        warmup_interval_seconds: Seconds between warm-up cycles.
+        warmup_refresh_margin_seconds: Replace sessions this many seconds before their TTL.
 
     Returns:
         The initialized MCPSessionPool instance.
@@ -1955,6 +2524,11 @@ def init_mcp_session_pool(
         health_check_methods=health_check_methods,
         health_check_timeout_seconds=health_check_timeout_seconds,
         message_handler_factory=effective_handler_factory,
+        max_in_flight_per_session=max_in_flight_per_session,
+        warmup_top_n=warmup_top_n,
+        warmup_min_sessions=warmup_min_sessions,
+        warmup_interval_seconds=warmup_interval_seconds,
+        warmup_refresh_margin_seconds=warmup_refresh_margin_seconds,
     )
     logger.info("MCP session pool initialized")
     return _mcp_session_pool
@@ -2022,6 +2596,27 @@ def register_gateway_capabilities_for_notifications(gateway_id: str, capabilitie
         pass  # Notification service not initialized
 
 
+def gateway_supports_list_changed(gateway_id: str) -> bool:
+    """Check whether a gateway advertised any listChanged capability.
+
+    Args:
+        gateway_id: The gateway ID.
+
+    Returns:
+        True if the gateway sends list_changed notifications, False otherwise
+        or when the notification service is not initialized.
+    """
+    try:
+        # First-Party
+        from mcpgateway.services.notification_service import (  # pylint: disable=import-outside-toplevel
+            get_notification_service,
+        )
+
+        return get_notification_service().supports_list_changed(gateway_id)
+    except RuntimeError:
+        return False  # Notification service not initialized
+
+
 def unregister_gateway_from_notifications(gateway_id: str) -> None:
     """Unregister a gateway from notification handling.
 
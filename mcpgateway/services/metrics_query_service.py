@@ -2,7 +2,9 @@
 """Metrics Query Service for combined raw + rollup queries.
 
 This service provides unified metrics queries that combine recent raw metrics
-with historical hourly rollups for complete historical coverage.
+with historical hourly rollups for complete historical coverage. Response-time
+percentiles are answered by merging the percentile sketches stored in hourly
+rollups, so raw metrics are only read for hours that have not been rolled up.
 
 Copyright 2025
 SPDX-License-Identifier: Apache-2.0
@@ -32,6 +34,7 @@ from mcpgateway.db import (
     ToolMetric,
     ToolMetricsHourly,
 )
+from mcpgateway.utils.percentile_sketch import PercentileSketch
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +51,9 @@ class AggregatedMetrics:
     max_response_time: Optional[float]
     avg_response_time: Optional[float]
     last_execution_time: Optional[datetime]
+    p50_response_time: Optional[float] = None
+    p95_response_time: Optional[float] = None
+    p99_response_time: Optional[float] = None
     # Source breakdown for debugging
     raw_count: int = 0
     rollup_count: int = 0
@@ -67,6 +73,9 @@ class AggregatedMetrics:
             "max_response_time": self.max_response_time,
             "avg_response_time": self.avg_response_time,
             "last_execution_time": self.last_execution_time,
+            "p50_response_time": self.p50_response_time,
+            "p95_response_time": self.p95_response_time,
+            "p99_response_time": self.p99_response_time,
         }
 
 
@@ -269,6 +278,70 @@ def get_current_hour_aggregation(
     )
 
 
+def get_response_time_sketch(
+    db: Session,
+    metric_type: str,
+    entity_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+) -> PercentileSketch:
+    """Build a response-time percentile sketch covering ``since`` until now.
+
+    Hourly rollup sketches are merged for every completed hour that has been
+    rolled up; raw metrics are streamed only for the hours after the newest
+    rollup (at the latest, the current incomplete hour) and never before the
+    retention cutoff, where raw rows may already be gone.
+
+    Args:
+        db: Database session.
+        metric_type: Type of metric ('tool', 'resource', 'prompt', 'server', 'a2a_agent').
+        entity_id: Optional entity ID to filter by.
+        since: Optional start of the range, aligned down to the hour (default: all history).
+
+    Returns:
+        PercentileSketch: Merged sketch; empty when no data exists.
+
+    Raises:
+        ValueError: If metric_type is not recognized.
+
+    Examples:
+        >>> from unittest.mock import MagicMock
+        >>> get_response_time_sketch(MagicMock(), "tool").count
+        0
+    """
+    if metric_type not in METRIC_MODELS:
+        raise ValueError(f"Unknown metric type: {metric_type}")
+
+    raw_model, hourly_model, id_col, _ = METRIC_MODELS[metric_type]
+    current_hour_start = get_current_hour_start()
+    sketch = PercentileSketch()
+
+    hourly_filters = [hourly_model.hour_start < current_hour_start, hourly_model.response_time_sketch.isnot(None)]
+    if since is not None:
+        since = since.replace(minute=0, second=0, microsecond=0)
+        hourly_filters.append(hourly_model.hour_start >= since)
+    if entity_id is not None:
+        hourly_filters.append(getattr(hourly_model, id_col) == entity_id)
+
+    # Raw rows are only read for hours that no rollup covers yet
+    raw_start = get_retention_cutoff()
+    hourly_query = select(hourly_model.hour_start, hourly_model.response_time_sketch).where(and_(*hourly_filters))
+    for hour_start, data in db.execute(hourly_query).yield_per(settings.yield_batch_size):
+        sketch.merge(PercentileSketch.from_dict(data))
+        if hour_start.tzinfo is None:
+            hour_start = hour_start.replace(tzinfo=timezone.utc)
+        raw_start = max(raw_start, hour_start + timedelta(hours=1))
+
+    if since is not None:
+        raw_start = max(raw_start, since)
+    raw_filters = [raw_model.timestamp >= raw_start]
+    if entity_id is not None:
+        raw_filters.append(getattr(raw_model, id_col) == entity_id)
+
+    raw_query = select(raw_model.response_time).where(and_(*raw_filters))
+    sketch.update(row[0] for row in db.execute(raw_query).yield_per(settings.yield_batch_size))
+    return sketch
+
+
 def aggregate_metrics_combined(
     db: Session,
     metric_type: str,
@@ -283,6 +356,7 @@ def aggregate_metrics_combined(
 
     This three-source approach ensures metrics are available immediately during
     benchmarks, even before the hourly rollup job has processed the current hour.
+    Percentiles come from merged rollup sketches (see ``get_response_time_sketch``).
 
     Args:
         db: Database session
@@ -405,6 +479,9 @@ def aggregate_metrics_combined(
     # Last execution time (most recent from any source)
     last_time = _merge_last_time(_merge_last_time(rollup_last_time, raw_last_time), current_last_time)
 
+    # Percentiles over the whole range from merged sketches
+    sketch = get_response_time_sketch(db, metric_type, entity_id) if total > 0 else PercentileSketch()
+
     return AggregatedMetrics(
         total_executions=total,
         successful_executions=successful,
@@ -414,6 +491,9 @@ def aggregate_metrics_combined(
         max_response_time=max_rt,
         avg_response_time=avg_rt,
         last_execution_time=last_time,
+        p50_response_time=sketch.quantile(0.50),
+        p95_response_time=sketch.quantile(0.95),
+        p99_response_time=sketch.quantile(0.99),
         raw_count=raw_total + current_total,
         rollup_count=rollup_total,
     )
@@ -6,6 +6,7 @@ enabling efficient historical queries without scanning millions of raw records.
 
 Features:
 - Hourly aggregation with percentile calculation
+- Mergeable percentile sketches stored per hour for range percentiles
 - Upsert logic to handle re-runs safely
 - Background task for periodic rollup
 - Optional deletion of raw metrics after rollup
@@ -52,6 +53,7 @@ from mcpgateway.db import (
     ToolMetric,
     ToolMetricsHourly,
 )
+from mcpgateway.utils.percentile_sketch import PercentileSketch
 
 logger = logging.getLogger(__name__)
 
@@ -101,6 +103,7 @@ class HourlyAggregation:
     p95_response_time: Optional[float]
     p99_response_time: Optional[float]
     interaction_type: Optional[str] = None  # For A2A agents
+    response_time_sketch: Optional[Dict[str, Any]] = None  # Serialized PercentileSketch
 
 
 class MetricsRollupService:
@@ -554,7 +557,9 @@ class MetricsRollupService:
 
         Uses a single GROUP BY query to get basic aggregations (count, min, max, avg,
         success count) for all entities at once, minimizing database round trips.
-        Percentiles are calculated by loading response times in a single bulk query.
+        Response times are streamed once into a mergeable percentile sketch per
+        entity, which is stored with the rollup and, outside the PostgreSQL
+        ``percentile_cont`` path, also provides p50/p95/p99.
 
         Args:
             db: Database session
@@ -616,7 +621,11 @@ class MetricsRollupService:
                     .group_by(*group_by_cols)
                 )
                 # pylint: enable=not-callable
-                for row in db.execute(agg_query).yield_per(settings.yield_batch_size):
+                rows = list(db.execute(agg_query).yield_per(settings.yield_batch_size))
+                sketch_cols = [entity_id_attr, raw_model.interaction_type] if is_a2a else [entity_id_attr]
+                sketches = self._build_sketches(db, raw_model, sketch_cols, time_filter, is_a2a)
+                for row in rows:
+                    sketch = sketches.get((row.entity_id, row.interaction_type) if is_a2a else row.entity_id)
                     aggregations.append(
                         HourlyAggregation(
                             entity_id=row.entity_id,
@@ -632,6 +641,7 @@ class MetricsRollupService:
                             p95_response_time=row.p95_rt,
                             p99_response_time=row.p99_rt,
                             interaction_type=row.interaction_type if is_a2a else None,
+                            response_time_sketch=sketch.to_dict() if sketch is not None else None,
                         )
                     )
             else:
@@ -689,29 +699,8 @@ class MetricsRollupService:
                     entities = db.execute(select(entity_model.id, getattr(entity_model, entity_name_col)).where(entity_model.id.in_(entity_ids)))  # .fetchall()
                     entity_names = {e[0]: e[1] for e in entities}
 
-                # OPTIMIZED: Bulk load all response times for percentile calculation
-                # Load all response times for the hour in one query, grouped by entity
-                rt_query = (
-                    select(
-                        *group_cols,
-                        raw_model.response_time,
-                    )
-                    .where(time_filter)
-                    .order_by(*group_cols, raw_model.response_time)
-                )
-
-                # Group response times by entity
-                response_times_by_entity: Dict[Any, List[float]] = {}
-                for row in db.execute(rt_query).yield_per(settings.yield_batch_size):
-                    entity_id = row[0]
-                    interaction_type = row[1] if is_a2a else None
-                    key = (entity_id, interaction_type) if is_a2a else entity_id
-                    rt = row.response_time if not is_a2a else row[2]
-
-                    if key not in response_times_by_entity:
-                        response_times_by_entity[key] = []
-                    if rt is not None:
-                        response_times_by_entity[key].append(rt)
+                # Stream response times into per-entity sketches (bounded memory, no sort)
+                sketches = self._build_sketches(db, raw_model, group_cols, time_filter, is_a2a)
 
                 # Build aggregation results with percentiles
                 aggregations = []
@@ -722,14 +711,12 @@ class MetricsRollupService:
                     # Get entity name
                     entity_name = entity_names.get(entity_id, "unknown")
 
-                    # Get response times for percentile calculation
-                    response_times = response_times_by_entity.get(key, [])
-
-                    # Calculate percentiles (response_times are already sorted from ORDER BY)
-                    if response_times:
-                        p50_rt = self._percentile(response_times, 50)
-                        p95_rt = self._percentile(response_times, 95)
-                        p99_rt = self._percentile(response_times, 99)
+                    # Calculate percentiles from the entity's sketch
+                    sketch = sketches.get(key)
+                    if sketch is not None:
+                        p50_rt = sketch.quantile(0.50)
+                        p95_rt = sketch.quantile(0.95)
+                        p99_rt = sketch.quantile(0.99)
                     else:
                         p50_rt = p95_rt = p99_rt = None
 
@@ -748,6 +735,7 @@ class MetricsRollupService:
                             p95_response_time=p95_rt,
                             p99_response_time=p99_rt,
                             interaction_type=interaction_type,
+                            response_time_sketch=sketch.to_dict() if sketch is not None else None,
                         )
                     )
             return aggregations
@@ -764,6 +752,39 @@ class MetricsRollupService:
             )
             raise
 
+    def _build_sketches(
+        self,
+        db: Session,
+        raw_model: Type,
+        group_cols: List[Any],
+        time_filter: Any,
+        is_a2a: bool,
+    ) -> Dict[Any, PercentileSketch]:
+        """Stream an hour's response times into one percentile sketch per entity.
+
+        Args:
+            db: Database session
+            raw_model: SQLAlchemy model for raw metrics
+            group_cols: Entity ID column, plus interaction_type for A2A agents
+            time_filter: Filter selecting the hour's raw metrics
+            is_a2a: Whether this is A2A agent metrics (keys include interaction_type)
+
+        Returns:
+            Dict[Any, PercentileSketch]: Sketches keyed like the aggregation results
+        """
+        rt_query = select(*group_cols, raw_model.response_time).where(time_filter)
+
+        sketches: Dict[Any, PercentileSketch] = {}
+        for row in db.execute(rt_query).yield_per(settings.yield_batch_size):
+            key = (row[0], row[1]) if is_a2a else row[0]
+            rt = row.response_time if not is_a2a else row[2]
+            if rt is not None:
+                sketch = sketches.get(key)
+                if sketch is None:
+                    sketch = sketches[key] = PercentileSketch()
+                sketch.add(rt)
+        return sketches
+
     def _percentile(self, sorted_data: List[float], percentile: int) -> float:
         """Calculate percentile from sorted data.
 
@@ -839,6 +860,7 @@ class MetricsRollupService:
                 "p50_response_time": agg.p50_response_time,
                 "p95_response_time": agg.p95_response_time,
                 "p99_response_time": agg.p99_response_time,
+                "response_time_sketch": agg.response_time_sketch,
             }
 
             if is_a2a:
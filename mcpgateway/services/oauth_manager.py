@@ -19,7 +19,7 @@ import hashlib
 import hmac
 import logging
 import secrets
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 # Third-Party
 import httpx
@@ -27,6 +27,7 @@ import orjson
 from requests_oauthlib import OAuth2Session
 
 # First-Party
+from mcpgateway.cache.oauth_token_cache import IssuedAccessToken, oauth_token_cache
 from mcpgateway.config import get_settings
 from mcpgateway.services.encryption_service import get_encryption_service
 from mcpgateway.services.http_client_service import get_http_client
@@ -77,6 +78,30 @@ async def _get_redis_client():
     return _redis_client
 
 
+def is_unauthorized_error(exc: BaseException) -> bool:
+    """Return True if ``exc`` (or any exception grouped in it) is an upstream HTTP 401.
+
+    The MCP SDK wraps transport errors in exception groups, so every leaf is checked.
+
+    Args:
+        exc: Exception raised while calling an upstream server.
+
+    Returns:
+        True if the upstream rejected the credentials with 401 Unauthorized.
+
+    Examples:
+        >>> request = httpx.Request("GET", "https://upstream")
+        >>> err = httpx.HTTPStatusError("denied", request=request, response=httpx.Response(401, request=request))
+        >>> is_unauthorized_error(err), is_unauthorized_error(ExceptionGroup("tg", [ValueError(), err]))
+        (True, True)
+        >>> is_unauthorized_error(RuntimeError("boom"))
+        False
+    """
+    if isinstance(exc, BaseExceptionGroup):
+        return any(is_unauthorized_error(inner) for inner in exc.exceptions)
+    return isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 401
+
+
 class OAuthManager:
     """Manages OAuth 2.0 authentication flows.
 
@@ -152,6 +177,10 @@ class OAuthManager:
     async def get_access_token(self, credentials: Dict[str, Any]) -> str:
         """Get access token based on grant type.
 
+        Tokens are served from the shared OAuth token cache while they are
+        valid, refreshed in the background shortly before they expire, and
+        concurrent requests for the same token share a single IdP round trip.
+
         Args:
             credentials: OAuth configuration containing grant_type and other params
 
@@ -189,9 +218,9 @@ class OAuthManager:
         logger.debug(f"Getting access token for grant type: {grant_type}")
 
         if grant_type == "client_credentials":
-            return await self._client_credentials_flow(credentials)
+            return await self._cached_token("client_credentials", credentials, self._client_credentials_flow)
         if grant_type == "password":
-            return await self._password_flow(credentials)
+            return await self._cached_token("password", credentials, self._password_flow)
         if grant_type == "authorization_code":
             # For authorization code flow in gateway initialization, we need to handle this differently
             # Since this is called during gateway setup, we'll try to use client credentials as fallback
@@ -199,7 +228,7 @@ class OAuthManager:
             logger.warning("Authorization code flow requires user interaction. " + "For gateway initialization, consider using 'client_credentials' grant type instead.")
             # Try to use client credentials flow if possible (some OAuth providers support this)
             try:
-                return await self._client_credentials_flow(credentials)
+                return await self._cached_token("client_credentials", credentials, self._client_credentials_flow)
             except Exception as e:
                 raise OAuthError(
                     f"Authorization code flow cannot be used for automatic gateway initialization. "
@@ -209,6 +238,45 @@ class OAuthManager:
         else:
             raise ValueError(f"Unsupported grant type: {grant_type}")
 
+    async def _cached_token(self, grant_type: str, credentials: Dict[str, Any], flow: Callable[[Dict[str, Any]], Awaitable[str]]) -> str:
+        """Return a token for ``credentials`` through the OAuth token cache.
+
+        Args:
+            grant_type: Grant used by ``flow``; part of the cache key.
+            credentials: OAuth configuration passed to the flow.
+            flow: Token flow to run on a cache miss or refresh.
+
+        Returns:
+            Access token string
+        """
+        key = oauth_token_cache.build_key(grant_type, credentials)
+        return await oauth_token_cache.get_or_fetch(key, lambda: flow(credentials))
+
+    async def invalidate_access_token(self, credentials: Dict[str, Any]) -> None:
+        """Drop the cached token for ``credentials`` so the next call fetches a new one.
+
+        Call this when the upstream rejects the token (HTTP 401) or when the
+        credentials are replaced.
+
+        Args:
+            credentials: OAuth configuration previously passed to :meth:`get_access_token`.
+
+        Examples:
+            >>> import asyncio
+            >>> from unittest.mock import AsyncMock, patch
+            >>> creds = {"grant_type": "authorization_code", "token_url": "https://idp/token", "client_id": "c"}
+            >>> with patch.object(oauth_token_cache, "invalidate", new_callable=AsyncMock) as invalidate:
+            ...     asyncio.run(OAuthManager().invalidate_access_token(creds))
+            >>> invalidate.await_args.args[0] == oauth_token_cache.build_key("client_credentials", creds)
+            True
+        """
+        grant_type = credentials.get("grant_type")
+        if grant_type == "authorization_code":
+            # get_access_token falls back to client credentials for this grant
+            grant_type = "client_credentials"
+        if grant_type in ("client_credentials", "password"):
+            await oauth_token_cache.invalidate(oauth_token_cache.build_key(grant_type, credentials))
+
     async def _client_credentials_flow(self, credentials: Dict[str, Any]) -> str:
         """Machine-to-machine authentication using client credentials.
 
@@ -281,7 +349,7 @@ class OAuthManager:
                     raise OAuthError(f"No access_token in response: {token_response}")
 
                 logger.info("""Successfully obtained access token via client credentials""")
-                return token_response["access_token"]
+                return IssuedAccessToken.from_response(token_response)
 
             except httpx.HTTPError as e:
                 logger.warning(f"Token request attempt {attempt + 1} failed: {str(e)}")
@@ -380,7 +448,7 @@ class OAuthManager:
                     raise OAuthError(f"No access_token in response: {token_response}")
 
                 logger.info("Successfully obtained access token via password grant")
-                return token_response["access_token"]
+                return IssuedAccessToken.from_response(token_response)
 
             except httpx.HTTPError as e:
                 logger.warning(f"Token request attempt {attempt + 1} failed: {str(e)}")
@@ -0,0 +1,655 @@
+# -*- coding: utf-8 -*-
+"""Buffered exporter for observability traces, spans, and events.
+
+Traces opened by the observability middleware are assembled in memory and
+handed to a background flusher once they end, which bulk-inserts the trace,
+span, and event rows of many requests in one transaction. Request handling
+never waits on the database: when the export queue is full, completed traces
+are dropped and counted instead.
+
+Sampling happens in two stages:
+
+- Head: each trace is sampled with probability ``OBSERVABILITY_SAMPLE_RATE``
+  when it starts (an upstream ``traceparent`` with the sampled flag always wins).
+- Tail: when a trace ends, traces that errored or ran longer than
+  ``OBSERVABILITY_SLOW_REQUEST_THRESHOLD_MS`` are kept even if the head
+  decision dropped them.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Examples:
+    >>> buffer = ObservabilityBufferService(enabled=True, sample_rate=1.0, max_queue_size=10)
+    >>> trace_id = buffer.start_trace("GET /rpc", http_method="GET")
+    >>> span_id = buffer.start_span(trace_id, "http.request", kind="server")
+    >>> buffer.end_span(span_id, status="ok")
+    True
+    >>> buffer.end_trace(trace_id, status="ok", http_status_code=200)
+    True
+    >>> buffer.get_stats()["queued_traces"]
+    1
+"""
+
+# Standard
+import asyncio
+from collections import deque, OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import logging
+import random
+import threading
+from typing import Any, Deque, Dict, List, Optional
+import uuid
+
+# First-Party
+from mcpgateway.config import settings
+from mcpgateway.db import fresh_db_session, ObservabilityEvent, ObservabilitySpan, ObservabilityTrace
+
+logger = logging.getLogger(__name__)
+
+# Number of finished-trace sampling decisions remembered for spans that end after their trace
+_DECISION_HISTORY = 10000
+
+
+@dataclass
+class BufferedTrace:
+    """Rows of one trace waiting to be exported.
+
+    ``trace`` is None for spans that started or ended after their trace was
+    already exported; those rows are flushed on their own.
+    """
+
+    trace: Optional[Dict[str, Any]]
+    spans: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    sampled: bool = True
+    error: bool = False
+
+
+def _utc_now() -> datetime:
+    """Return the current UTC time.
+
+    Returns:
+        datetime: Timezone-aware current time.
+    """
+    return datetime.now(timezone.utc)
+
+
+def _finish(row: Dict[str, Any], status: str, status_message: Optional[str], attributes: Optional[Dict[str, Any]]) -> None:
+    """Close a buffered trace or span row.
+
+    Args:
+        row: Row mapping to update in place.
+        status: Final status.
+        status_message: Optional status message.
+        attributes: Attributes merged into the row.
+    """
+    end_time = _utc_now()
+    row["end_time"] = end_time
+    row["duration_ms"] = (end_time - row["start_time"]).total_seconds() * 1000
+    row["status"] = status
+    row["status_message"] = status_message
+    if attributes:
+        row["attributes"] = {**row["attributes"], **attributes}
+
+
+class ObservabilityBufferService:
+    """Buffer traces in memory and export them to the database in batches.
+
+    Configuration (via environment variables):
+    - OBSERVABILITY_BUFFER_ENABLED: Buffer middleware traces (default: True)
+    - OBSERVABILITY_BUFFER_MAX_QUEUE_SIZE: Completed traces waiting for export before new ones are dropped (default: 10000)
+    - OBSERVABILITY_BUFFER_BATCH_SIZE: Traces written per transaction (default: 500)
+    - OBSERVABILITY_BUFFER_FLUSH_INTERVAL: Seconds between flushes (default: 2.0)
+    - OBSERVABILITY_SAMPLE_RATE: Head sampling probability (default: 1.0)
+    - OBSERVABILITY_SLOW_REQUEST_THRESHOLD_MS: Always keep traces at least this slow, 0 disables (default: 1000)
+    """
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        sample_rate: Optional[float] = None,
+        slow_threshold_ms: Optional[float] = None,
+        max_queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+    ):
+        """Initialize the buffer.
+
+        Args:
+            enabled: Whether traces are buffered (default: from settings)
+            sample_rate: Head sampling probability (default: from settings)
+            slow_threshold_ms: Duration from which traces are always kept (default: from settings)
+            max_queue_size: Maximum completed traces awaiting export (default: from settings)
+            batch_size: Maximum traces per database transaction (default: from settings)
+            flush_interval: Seconds between flushes (default: from settings)
+        """
+        self.enabled = enabled if enabled is not None else getattr(settings, "observability_buffer_enabled", True)
+        self.sample_rate = sample_rate if sample_rate is not None else getattr(settings, "observability_sample_rate", 1.0)
+        self.slow_threshold_ms = slow_threshold_ms if slow_threshold_ms is not None else getattr(settings, "observability_slow_request_threshold_ms", 1000.0)
+        self.max_queue_size = max_queue_size or getattr(settings, "observability_buffer_max_queue_size", 10000)
+        self.batch_size = batch_size or getattr(settings, "observability_buffer_batch_size", 500)
+        self.flush_interval = flush_interval or getattr(settings, "observability_buffer_flush_interval", 2.0)
+
+        self._lock = threading.Lock()
+        self._active: Dict[str, BufferedTrace] = {}
+        self._span_traces: Dict[str, str] = {}
+        self._late_spans: Dict[str, BufferedTrace] = {}
+        self._decisions: "OrderedDict[str, bool]" = OrderedDict()
+        self._queue: Deque[BufferedTrace] = deque()
+
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Stats for monitoring
+        self._traces_started = 0
+        self._traces_sampled_out = 0
+        self._traces_tail_kept = 0
+        self._traces_dropped = 0
+        self._rows_flushed = 0
+        self._rows_failed = 0
+        self._flush_count = 0
+
+    async def start(self) -> None:
+        """Start the background flush task."""
+        if not self.enabled:
+            logger.info("ObservabilityBufferService disabled, skipping start")
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._loop = asyncio.get_running_loop()
+            self._flush_event = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._flush_loop())
+            logger.info(f"ObservabilityBufferService flush task started (interval={self.flush_interval}s, batch_size={self.batch_size})")
+
+    async def shutdown(self) -> None:
+        """Stop the flush task and export everything still queued."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        self._loop = None
+        await self._flush_all()
+        logger.info(f"ObservabilityBufferService shutdown complete: rows_flushed={self._rows_flushed}, traces_dropped={self._traces_dropped}")
+
+    # ==============================
+    # Recording
+    # ==============================
+
+    def start_trace(
+        self,
+        name: str,
+        trace_id: Optional[str] = None,
+        parent_span_id: Optional[str] = None,
+        http_method: Optional[str] = None,
+        http_url: Optional[str] = None,
+        user_email: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+        resource_attributes: Optional[Dict[str, Any]] = None,
+        sampled: Optional[bool] = None,
+    ) -> str:
+        """Open a trace in memory.
+
+        Args:
+            name: Trace name (e.g., "POST /rpc")
+            trace_id: External trace ID (generated when omitted)
+            parent_span_id: Parent span ID from upstream service
+            http_method: HTTP method
+            http_url: Full request URL
+            user_email: Authenticated user email
+            user_agent: Client user agent string
+            ip_address: Client IP address
+            attributes: Additional trace attributes
+            resource_attributes: Resource attributes
+            sampled: Upstream sampling decision; ``None`` applies the local sample rate
+
+        Returns:
+            str: Trace ID
+
+        Examples:
+            >>> buffer = ObservabilityBufferService(enabled=True, sample_rate=0.0)
+            >>> trace_id = buffer.start_trace("GET /rpc")
+            >>> buffer._active[trace_id].sampled
+            False
+            >>> buffer._active[buffer.start_trace("GET /rpc", sampled=True)].sampled
+            True
+        """
+        trace_id = trace_id or str(uuid.uuid4())
+        attrs = attributes or {}
+        if parent_span_id:
+            attrs["parent_span_id"] = parent_span_id
+        now = _utc_now()
+        row = {
+            "trace_id": trace_id,
+            "name": name,
+            "start_time": now,
+            "status": "unset",
+            "http_method": http_method,
+            "http_url": http_url,
+            "user_email": user_email,
+            "user_agent": user_agent,
+            "ip_address": ip_address,
+            "attributes": attrs,
+            "resource_attributes": resource_attributes or {},
+            "created_at": now,
+        }
+        if sampled is None:
+            sampled = self.sample_rate >= 1.0 or random.random() < self.sample_rate  # nosec B311 - sampling, not security
+        with self._lock:
+            self._active[trace_id] = BufferedTrace(trace=row, sampled=sampled)
+            self._traces_started += 1
+        return trace_id
+
+    def end_trace(
+        self,
+        trace_id: str,
+        status: str = "ok",
+        status_message: Optional[str] = None,
+        http_status_code: Optional[int] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Close a buffered trace and queue it for export if it is sampled.
+
+        Args:
+            trace_id: Trace ID to end
+            status: Trace status (ok, error)
+            status_message: Optional status message
+            http_status_code: HTTP response status code
+            attributes: Additional attributes to merge
+
+        Returns:
+            bool: True if the trace was buffered here, False if it is unknown.
+
+        Examples:
+            >>> buffer = ObservabilityBufferService(enabled=True, sample_rate=0.0, slow_threshold_ms=0)
+            >>> buffer.end_trace(buffer.start_trace("GET /rpc"), status="ok")
+            True
+            >>> buffer.end_trace(buffer.start_trace("GET /rpc"), status="error")
+            True
+            >>> stats = buffer.get_stats()
+            >>> stats["traces_sampled_out"], stats["traces_tail_kept"], stats["queued_traces"]
+            (1, 1, 1)
+            >>> buffer.end_trace("unknown")
+            False
+        """
+        with self._lock:
+            record = self._active.pop(trace_id, None)
+            if record is None:
+                return False
+
+            row = record.trace
+            _finish(row, status, status_message, attributes)
+            if http_status_code is not None:
+                row["http_status_code"] = http_status_code
+
+            slow = self.slow_threshold_ms > 0 and row["duration_ms"] >= self.slow_threshold_ms
+            keep = record.sampled or record.error or status == "error" or slow
+            if keep and not record.sampled:
+                self._traces_tail_kept += 1
+            elif not keep:
+                self._traces_sampled_out += 1
+
+            late_groups = self._split_open_spans(record)
+            if keep and not self._enqueue(record):
+                # Without the trace row, late spans would violate the trace foreign key
+                keep = False
+
+            self._decisions[trace_id] = keep
+            if len(self._decisions) > _DECISION_HISTORY:
+                self._decisions.popitem(last=False)
+
+            for open_id, group in late_groups.items():
+                group.sampled = keep
+                self._track_late_span(open_id, group)
+        return True
+
+    def start_span(
+        self,
+        trace_id: str,
+        name: str,
+        parent_span_id: Optional[str] = None,
+        kind: str = "internal",
+        resource_name: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        """Open a span in a buffered trace.
+
+        Args:
+            trace_id: Parent trace ID
+            name: Span name
+            parent_span_id: Parent span ID
+            kind: Span kind
+            resource_name: Resource name being operated on
+            resource_type: Resource type
+            resource_id: Resource ID
+            attributes: Additional span attributes
+
+        Returns:
+            Optional[str]: Span ID, or None if the trace is not buffered here.
+
+        Examples:
+            >>> ObservabilityBufferService(enabled=True).start_span("not-buffered", "tool.invoke") is None
+            True
+        """
+        with self._lock:
+            record = self._active.get(trace_id)
+            keep = self._decisions.get(trace_id)
+            if record is None and keep is None:
+                return None
+
+            span_id = str(uuid.uuid4())
+            now = _utc_now()
+            row = {
+                "span_id": span_id,
+                "trace_id": trace_id,
+                "parent_span_id": parent_span_id,
+                "name": name,
+                "kind": kind,
+                "start_time": now,
+                "end_time": None,
+                "status": "unset",
+                "resource_name": resource_name,
+                "resource_type": resource_type,
+                "resource_id": resource_id,
+                "attributes": attributes or {},
+                "created_at": now,
+            }
+            if record is not None:
+                record.spans[span_id] = row
+                self._span_traces[span_id] = trace_id
+            else:
+                # Children of a pending late span are exported with it, after their parent row
+                group = self._late_spans.get(parent_span_id) if parent_span_id else None
+                if group is None:
+                    group = BufferedTrace(trace=None, sampled=bool(keep))
+                group.spans[span_id] = row
+                self._track_late_span(span_id, group)
+        return span_id
+
+    def end_span(
+        self,
+        span_id: str,
+        status: str = "ok",
+        status_message: Optional[str] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Close a buffered span.
+
+        Args:
+            span_id: Span ID to end
+            status: Span status (ok, error)
+            status_message: Optional status message
+            attributes: Additional attributes to merge
+
+        Returns:
+            bool: True if the span was buffered here, False if it is unknown.
+        """
+        with self._lock:
+            trace_id = self._span_traces.get(span_id)
+            if trace_id is not None:
+                record = self._active[trace_id]
+                _finish(record.spans[span_id], status, status_message, attributes)
+                record.error = record.error or status == "error"
+                return True
+
+            late = self._late_spans.pop(span_id, None)
+            if late is None:
+                return False
+            _finish(late.spans[span_id], status, status_message, attributes)
+            if late.sampled and all(span.get("end_time") is not None for span in late.spans.values()):
+                self._enqueue(late)
+        return True
+
+    def add_event(
+        self,
+        span_id: str,
+        name: str,
+        severity: Optional[str] = None,
+        message: Optional[str] = None,
+        exception_type: Optional[str] = None,
+        exception_message: Optional[str] = None,
+        exception_stacktrace: Optional[str] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Attach an event to a buffered span.
+
+        Args:
+            span_id: Parent span ID
+            name: Event name
+            severity: Log severity
+            message: Event message
+            exception_type: Exception class name
+            exception_message: Exception message
+            exception_stacktrace: Exception stacktrace
+            attributes: Additional event attributes
+
+        Returns:
+            bool: True if the span was buffered here, False if it is unknown.
+        """
+        with self._lock:
+            trace_id = self._span_traces.get(span_id)
+            record = self._active[trace_id] if trace_id is not None else self._late_spans.get(span_id)
+            if record is None:
+                return False
+            now = _utc_now()
+            record.events.append(
+                {
+                    "span_id": span_id,
+                    "name": name,
+                    "timestamp": now,
+                    "severity": severity,
+                    "message": message,
+                    "exception_type": exception_type,
+                    "exception_message": exception_message,
+                    "exception_stacktrace": exception_stacktrace,
+                    "attributes": attributes or {},
+                    "created_at": now,
+                }
+            )
+            record.error = record.error or severity in ("error", "critical")
+        return True
+
+    def _split_open_spans(self, record: BufferedTrace) -> Dict[str, BufferedTrace]:
+        """Move spans still open when their trace ends out of the trace entry.
+
+        Each outermost open span gets its own entry, together with every span
+        below it in the parent chain (finished or not) and their events, so a
+        child row is never exported before its parent. Must be called with
+        ``self._lock`` held.
+
+        Args:
+            record: Ended trace entry, updated in place.
+
+        Returns:
+            Dict[str, BufferedTrace]: Late entry of each open span, keyed by span ID.
+
+        Examples:
+            >>> buffer = ObservabilityBufferService(enabled=True)
+            >>> record = BufferedTrace(trace={}, spans={
+            ...     "root": {"end_time": None, "parent_span_id": None},
+            ...     "child": {"end_time": 1, "parent_span_id": "root"},
+            ...     "done": {"end_time": 1, "parent_span_id": None},
+            ... }, events=[{"span_id": "child"}, {"span_id": "done"}])
+            >>> groups = buffer._split_open_spans(record)
+            >>> list(record.spans), list(groups), list(groups["root"].spans), groups["root"].events
+            (['done'], ['root'], ['root', 'child'], [{'span_id': 'child'}])
+        """
+        spans = record.spans
+        for span_id in spans:
+            self._span_traces.pop(span_id, None)
+
+        owners: Dict[str, str] = {}
+        for span_id in spans:
+            owner, current, seen = None, span_id, set()
+            while current in spans and current not in seen:
+                seen.add(current)
+                if spans[current].get("end_time") is None:
+                    owner = current
+                current = spans[current].get("parent_span_id")
+            if owner is not None:
+                owners[span_id] = owner
+        if not owners:
+            return {}
+
+        groups: Dict[str, BufferedTrace] = {}
+        for span_id, owner in owners.items():
+            group = groups.setdefault(owner, BufferedTrace(trace=None))
+            group.spans[span_id] = spans.pop(span_id)
+        kept_events = []
+        for event in record.events:
+            owner = owners.get(event["span_id"])
+            (groups[owner].events if owner is not None else kept_events).append(event)
+        record.events = kept_events
+        return {span_id: groups[owner] for span_id, owner in owners.items() if groups[owner].spans[span_id].get("end_time") is None}
+
+    def _track_late_span(self, span_id: str, record: BufferedTrace) -> None:
+        """Remember a span that outlives its trace, forgetting the oldest ones past the history limit.
+
+        Must be called with ``self._lock`` held.
+
+        Args:
+            span_id: Span ID.
+            record: Entry holding the span row.
+        """
+        self._late_spans[span_id] = record
+        if len(self._late_spans) > _DECISION_HISTORY:
+            del self._late_spans[next(iter(self._late_spans))]
+
+    def _enqueue(self, record: BufferedTrace) -> bool:
+        """Queue a finished entry for export, dropping it if the queue is full.
+
+        Must be called with ``self._lock`` held.
+
+        Args:
+            record: Entry to export.
+
+        Returns:
+            bool: True if the entry was queued, False if it was dropped.
+        """
+        if len(self._queue) >= self.max_queue_size:
+            self._traces_dropped += 1
+            if self._traces_dropped == 1 or self._traces_dropped % 1000 == 0:
+                logger.warning(f"Observability export queue full ({self.max_queue_size}); {self._traces_dropped} traces dropped so far")
+            return False
+        self._queue.append(record)
+        if len(self._queue) >= self.batch_size and self._loop is not None and self._flush_event is not None:
+            self._loop.call_soon_threadsafe(self._flush_event.set)
+        return True
+
+    # ==============================
+    # Export
+    # ==============================
+
+    async def _flush_loop(self) -> None:
+        """Background task that flushes queued traces on an interval or when a batch is full.
+
+        Raises:
+            asyncio.CancelledError: When the flush loop is cancelled.
+        """
+        while True:
+            try:
+                try:
+                    await asyncio.wait_for(self._flush_event.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._flush_event.clear()
+                await self._flush_all()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in observability flush loop: {e}", exc_info=True)
+                await asyncio.sleep(self.flush_interval)
+
+    async def _flush_all(self) -> None:
+        """Export every queued entry, one batch per transaction."""
+        while True:
+            with self._lock:
+                batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+            if not batch:
+                return
+            await asyncio.to_thread(self._flush_to_db, batch)
+
+    def _flush_to_db(self, batch: List[BufferedTrace]) -> None:
+        """Bulk-insert a batch of traces, spans, and events (runs in a thread).
+
+        Rows are inserted parents first: traces, then spans sorted by start
+        time, then events. If the batch transaction fails, each entry is
+        retried in its own transaction so one bad entry does not lose the rest.
+
+        Args:
+            batch: Entries to export.
+        """
+        traces = [record.trace for record in batch if record.trace is not None]
+        spans = sorted((span for record in batch for span in record.spans.values()), key=lambda span: span["start_time"])
+        events = [event for record in batch for event in record.events]
+        rows = len(traces) + len(spans) + len(events)
+        try:
+            with fresh_db_session() as db:
+                if traces:
+                    db.bulk_insert_mappings(ObservabilityTrace, traces)
+                if spans:
+                    db.bulk_insert_mappings(ObservabilitySpan, spans)
+                if events:
+                    db.bulk_insert_mappings(ObservabilityEvent, events)
+                db.commit()
+        except Exception as e:
+            if len(batch) > 1:
+                logger.warning(f"Failed to export observability batch ({rows} rows), retrying entries one by one: {e}")
+                for record in batch:
+                    self._flush_to_db([record])
+                return
+            # Traces are lost on failure - observability must never back up request handling
+            self._rows_failed += rows
+            logger.error(f"Failed to export observability entry ({rows} rows): {e}")
+            return
+        self._rows_flushed += rows
+        self._flush_count += 1
+        logger.debug(f"Observability flush #{self._flush_count}: {len(traces)} traces, {len(spans)} spans, {len(events)} events")
+
+    def get_stats(self) -> dict:
+        """Get buffer statistics for monitoring.
+
+        Returns:
+            dict: Buffer sizes, sampling counters, and export counters.
+        """
+        with self._lock:
+            active, queued = len(self._active), len(self._queue)
+
+        return {
+            "enabled": self.enabled,
+            "sample_rate": self.sample_rate,
+            "slow_threshold_ms": self.slow_threshold_ms,
+            "max_queue_size": self.max_queue_size,
+            "active_traces": active,
+            "queued_traces": queued,
+            "traces_started": self._traces_started,
+            "traces_sampled_out": self._traces_sampled_out,
+            "traces_tail_kept": self._traces_tail_kept,
+            "traces_dropped": self._traces_dropped,
+            "rows_flushed": self._rows_flushed,
+            "rows_failed": self._rows_failed,
+            "flush_count": self._flush_count,
+        }
+
+
+# Singleton instance
+_observability_buffer_service: Optional[ObservabilityBufferService] = None
+
+
+def get_observability_buffer_service() -> ObservabilityBufferService:
+    """Get or create the singleton ObservabilityBufferService instance.
+
+    Returns:
+        ObservabilityBufferService: The singleton buffer instance.
+    """
+    global _observability_buffer_service  # pylint: disable=global-statement
+    if _observability_buffer_service is None:
+        _observability_buffer_service = ObservabilityBufferService()
+    return _observability_buffer_service
@@ -42,6 +42,7 @@ from sqlalchemy.orm import joinedload, Session
 
 # First-Party
 from mcpgateway.db import ObservabilityEvent, ObservabilityMetric, ObservabilitySpan, ObservabilityTrace
+from mcpgateway.services.observability_buffer_service import get_observability_buffer_service
 
 logger = logging.getLogger(__name__)
 
@@ -385,6 +386,13 @@ class ObservabilityService:
             ...     resource_name="get_weather"
             ... )
         """
+        # Traces buffered by the middleware keep their spans in memory until export
+        span_id = get_observability_buffer_service().start_span(
+            trace_id, name, parent_span_id=parent_span_id, kind=kind, resource_name=resource_name, resource_type=resource_type, resource_id=resource_id, attributes=attributes
+        )
+        if span_id:
+            return span_id
+
         span_id = str(uuid.uuid4())
         span = ObservabilitySpan(
             span_id=span_id,
@@ -429,6 +437,9 @@ class ObservabilityService:
         Examples:
             >>> service.end_span(db, span_id, status="ok")  # doctest: +SKIP
         """
+        if get_observability_buffer_service().end_span(span_id, status=status, status_message=status_message, attributes=attributes):
+            return
+
         span = db.query(ObservabilitySpan).filter_by(span_id=span_id).first()
         if not span:
             logger.warning(f"Span {span_id} not found")
@@ -605,7 +616,7 @@ class ObservabilityService:
             attributes: Additional event attributes
 
         Returns:
-            Event ID
+            Event ID (0 if the commit failed or the event is buffered for export)
 
         Examples:
             >>> event_id = service.add_event(  # doctest: +SKIP
@@ -616,6 +627,19 @@ class ObservabilityService:
             ...     message="Failed to connect to database"  # doctest: +SKIP
             ... )  # doctest: +SKIP
         """
+        if get_observability_buffer_service().add_event(
+            span_id,
+            name,
+            severity=severity,
+            message=message,
+            exception_type=exception_type,
+            exception_message=exception_message,
+            exception_stacktrace=exception_stacktrace,
+            attributes=attributes,
+        ):
+            # Buffered events get their ID when exported
+            return 0
+
         event = ObservabilityEvent(
             span_id=span_id,
             name=name,
@@ -8,18 +8,23 @@ Permission Service for RBAC System.
 
 This module provides the core permission checking logic for the RBAC system.
 It handles role-based permission validation, permission auditing, and caching.
+
+Effective permissions are compiled once per user and scope into a process-wide
+index held by the AuthCache, so the per-request PermissionService instances
+created by the RBAC middleware share them instead of re-querying roles.
 """
 
 # Standard
 from datetime import datetime
 import logging
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set
 
 # Third-Party
 from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import contains_eager, Session
 
 # First-Party
+from mcpgateway.cache.auth_cache import CompiledPermissions, get_auth_cache
 from mcpgateway.config import settings
 from mcpgateway.db import PermissionAuditLog, Permissions, Role, UserRole, utc_now
 
@@ -63,6 +68,7 @@ class PermissionService:
         self.audit_enabled = audit_enabled
         self._permission_cache: Dict[str, Set[str]] = {}
         self._roles_cache: Dict[str, List[UserRole]] = {}
+        self._compiled_cache: Dict[str, CompiledPermissions] = {}
         self._cache_timestamps: Dict[str, datetime] = {}
         self.cache_ttl = 300  # 5 minutes
 
@@ -198,7 +204,9 @@ class PermissionService:
         """Get all effective permissions for a user.
 
         Collects permissions from all user's roles across applicable scopes.
-        Includes role inheritance and handles permission caching.
+        Includes role inheritance and handles permission caching: the instance
+        cache is checked first, then the process-wide compiled permission index,
+        and only on a miss in both are the user's roles queried.
 
         Args:
             user_email: Email of the user
@@ -229,24 +237,63 @@ class PermissionService:
             logger.debug(f"[RBAC] Cache hit for {user_email} (team_id={team_id}): {cached_perms}")
             return cached_perms
 
-        permissions = set()
+        permission_index = get_auth_cache()
+        compiled = permission_index.get_compiled_permissions(cache_key)
+        if compiled is not None:
+            logger.debug(f"[RBAC] Permission index hit for {user_email} (team_id={team_id})")
+        else:
+            # Read before querying so an invalidation racing with this lookup discards the result
+            generation = permission_index.permission_generation
+
+            permissions = set()
+
+            # Get all active roles for the user (with eager-loaded role relationship)
+            user_roles = await self._get_user_roles(user_email, team_id, include_all_teams=include_all_teams)
+            logger.debug(f"[RBAC] Found {len(user_roles)} roles for {user_email} (team_id={team_id})")
 
-        # Get all active roles for the user (with eager-loaded role relationship)
-        user_roles = await self._get_user_roles(user_email, team_id, include_all_teams=include_all_teams)
-        logger.debug(f"[RBAC] Found {len(user_roles)} roles for {user_email} (team_id={team_id})")
+            # Collect permissions from all roles
+            for user_role in user_roles:
+                role_permissions = user_role.role.get_effective_permissions()
+                logger.debug(f"[RBAC] Role '{user_role.role.name}' (scope={user_role.scope}, scope_id={user_role.scope_id}) has permissions: {role_permissions}")
+                permissions.update(role_permissions)
 
-        # Collect permissions from all roles
-        for user_role in user_roles:
-            role_permissions = user_role.role.get_effective_permissions()
-            logger.debug(f"[RBAC] Role '{user_role.role.name}' (scope={user_role.scope}, scope_id={user_role.scope_id}) has permissions: {role_permissions}")
-            permissions.update(role_permissions)
+            compiled = self._compile_permissions(permissions, user_roles)
+            permission_index.set_compiled_permissions(cache_key, compiled, generation)
+            self._roles_cache[cache_key] = user_roles
 
-        # Cache both permissions and roles
-        self._permission_cache[cache_key] = permissions
-        self._roles_cache[cache_key] = user_roles
+        # Cache permissions (and roles, above) on the instance
+        self._permission_cache[cache_key] = compiled.permissions
+        self._compiled_cache[cache_key] = compiled
         self._cache_timestamps[cache_key] = utc_now()
 
-        return permissions
+        return compiled.permissions
+
+    @staticmethod
+    def _compile_permissions(permissions: Iterable[str], user_roles: Iterable[UserRole] = ()) -> CompiledPermissions:
+        """Compile a user's effective permissions for O(1) checks.
+
+        Args:
+            permissions: Effective permissions collected from the user's roles
+            user_roles: Roles the permissions came from, summarized for audit logging
+
+        Returns:
+            CompiledPermissions: Frozen permission set with wildcard and admin flags resolved
+
+        Examples:
+            >>> compiled = PermissionService._compile_permissions({"tools.read", "admin.system_config"})
+            >>> compiled.allows("tools.read"), compiled.allows("tools.create"), compiled.has_admin_permission
+            (True, False, True)
+            >>> PermissionService._compile_permissions({"*"}).allows("tools.create")
+            True
+        """
+        frozen = frozenset(permissions)
+        wildcard = Permissions.ALL_PERMISSIONS in frozen
+        return CompiledPermissions(
+            permissions=frozen,
+            wildcard=wildcard,
+            has_admin_permission=wildcard or any(perm.startswith("admin.") for perm in frozen),
+            roles=tuple({"id": ur.role_id, "name": ur.role.name, "scope": ur.scope, "permissions": ur.role.permissions} for ur in user_roles),
+        )
 
     async def get_user_roles(self, user_email: str, scope: Optional[str] = None, team_id: Optional[str] = None, include_expired: bool = False) -> List[UserRole]:
         """Get user's role assignments.
@@ -412,8 +459,11 @@ class PermissionService:
         for key in keys_to_remove:
             self._permission_cache.pop(key, None)
             self._roles_cache.pop(key, None)
+            self._compiled_cache.pop(key, None)
             self._cache_timestamps.pop(key, None)
 
+        get_auth_cache().invalidate_permissions_local(email=user_email)
+
         logger.debug(f"Cleared permission cache for user: {user_email}")
 
     def clear_cache(self) -> None:
@@ -433,7 +483,9 @@ class PermissionService:
         """
         self._permission_cache.clear()
         self._roles_cache.clear()
+        self._compiled_cache.clear()
         self._cache_timestamps.clear()
+        get_auth_cache().invalidate_permissions_local()
         logger.debug("Cleared all permission cache")
 
     async def _get_user_roles(self, user_email: str, team_id: Optional[str] = None, include_all_teams: bool = False) -> List[UserRole]:
@@ -525,7 +577,8 @@ class PermissionService:
     def _get_roles_for_audit(self, user_email: str, team_id: Optional[str]) -> Dict:
         """Get role information for audit logging from cached roles.
 
-        Uses roles cached by get_user_permissions() to avoid a duplicate DB query.
+        Uses roles cached by get_user_permissions() to avoid a duplicate DB query,
+        falling back to the role summaries stored in the compiled permission index.
 
         Args:
             user_email: Email address of the user.
@@ -535,6 +588,8 @@ class PermissionService:
             Dict: Role information for audit logging
         """
         cache_key = f"{user_email}:{team_id or 'global'}"
+        if cache_key not in self._roles_cache and cache_key in self._compiled_cache:
+            return {"roles": list(self._compiled_cache[cache_key].roles)}
         user_roles = self._roles_cache.get(cache_key, [])
         return {"roles": [{"id": ur.role_id, "name": ur.role.name, "scope": ur.scope, "permissions": ur.role.permissions} for ur in user_roles]}
 
@@ -572,8 +627,16 @@ class PermissionService:
         if user_email == getattr(settings, "platform_admin_email", ""):
             return True
 
+        permission_index = get_auth_cache()
+        cached = permission_index.get_user_is_admin(user_email)
+        if cached is not None:
+            return cached
+
+        generation = permission_index.permission_generation
         user = self.db.execute(select(EmailUser).where(EmailUser.email == user_email)).scalar_one_or_none()
-        return bool(user and user.is_admin)
+        is_admin = bool(user and user.is_admin)
+        permission_index.set_user_is_admin(user_email, is_admin, generation)
+        return is_admin
 
     async def _check_team_fallback_permissions(self, user_email: str, permission: str, team_id: Optional[str]) -> bool:
         """Check fallback team permissions for users without explicit RBAC roles.
@@ -32,6 +32,7 @@ from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import joinedload, Session
 
 # First-Party
+from mcpgateway.cache.registry_versions import registry_versions
 from mcpgateway.common.models import Message, PromptResult, Role, TextContent
 from mcpgateway.config import settings
 from mcpgateway.db import EmailTeam
@@ -966,6 +967,60 @@ class PromptService:
 
         return stats
 
+    @staticmethod
+    def apply_visibility_filter(query: Any, user_email: Optional[str], team_ids: List[str], token_teams: Optional[List[str]], team_id: Optional[str]) -> Any:
+        """Restrict a prompt query to the rows the caller may list.
+
+        This is the single source of the prompt listing visibility rules; it is
+        shared by :meth:`list_prompts` and the registry delta listing.
+
+        - public: visible to all
+        - team: visible to members of the owning team (team_ids)
+        - private: visible only to the owner, but not for public-only tokens (token_teams == [])
+
+        Args:
+            query: SQLAlchemy select over DbPrompt.
+            user_email: Caller email for owner access.
+            team_ids: Teams the caller belongs to (token teams or DB memberships).
+            token_teams: Teams from the token; [] marks a public-only token.
+            team_id: Restrict to a single team.
+
+        Returns:
+            The filtered query, or None if the caller has no access to ``team_id``.
+
+        Examples:
+            >>> PromptService.apply_visibility_filter(select(DbPrompt.id), "a@x.com", ["t1"], ["t1"], "t2") is None
+            True
+            >>> "visibility" in str(PromptService.apply_visibility_filter(select(DbPrompt.id), "a@x.com", ["t1"], ["t1"], None))
+            True
+        """
+        # Check if this is a public-only token (empty teams array)
+        # Public-only tokens can ONLY see public prompts - no owner access
+        is_public_only_token = token_teams is not None and len(token_teams) == 0
+
+        if team_id:
+            # User requesting specific team - verify access
+            if team_id not in team_ids:
+                return None
+            access_conditions = [
+                and_(DbPrompt.team_id == team_id, DbPrompt.visibility.in_(["team", "public"])),
+            ]
+            # Only include owner access for non-public-only tokens with user_email
+            if not is_public_only_token and user_email:
+                access_conditions.append(and_(DbPrompt.team_id == team_id, DbPrompt.owner_email == user_email))
+            return query.where(or_(*access_conditions))
+
+        # General access: public prompts + team prompts (+ owner prompts if not public-only token)
+        access_conditions = [
+            DbPrompt.visibility == "public",
+        ]
+        # Only include owner access for non-public-only tokens with user_email
+        if not is_public_only_token and user_email:
+            access_conditions.append(DbPrompt.owner_email == user_email)
+        if team_ids:
+            access_conditions.append(and_(DbPrompt.team_id.in_(team_ids), DbPrompt.visibility.in_(["team", "public"])))
+        return query.where(or_(*access_conditions))
+
     async def list_prompts(
         self,
         db: Session,
@@ -1056,32 +1111,9 @@ class PromptService:
             else:
                 team_ids = []
 
-            # Check if this is a public-only token (empty teams array)
-            # Public-only tokens can ONLY see public resources - no owner access
-            is_public_only_token = token_teams is not None and len(token_teams) == 0
-
-            if team_id:
-                # User requesting specific team - verify access
-                if team_id not in team_ids:
-                    return ([], None)
-                access_conditions = [
-                    and_(DbPrompt.team_id == team_id, DbPrompt.visibility.in_(["team", "public"])),
-                ]
-                # Only include owner access for non-public-only tokens with user_email
-                if not is_public_only_token and user_email:
-                    access_conditions.append(and_(DbPrompt.team_id == team_id, DbPrompt.owner_email == user_email))
-                query = query.where(or_(*access_conditions))
-            else:
-                # General access: public prompts + team prompts (+ owner prompts if not public-only token)
-                access_conditions = [
-                    DbPrompt.visibility == "public",
-                ]
-                # Only include owner access for non-public-only tokens with user_email
-                if not is_public_only_token and user_email:
-                    access_conditions.append(DbPrompt.owner_email == user_email)
-                if team_ids:
-                    access_conditions.append(and_(DbPrompt.team_id.in_(team_ids), DbPrompt.visibility.in_(["team", "public"])))
-                query = query.where(or_(*access_conditions))
+            query = self.apply_visibility_filter(query, user_email, team_ids, token_teams, team_id)
+            if query is None:
+                return ([], None)
 
             if visibility:
                 query = query.where(DbPrompt.visibility == visibility)
@@ -2592,6 +2624,7 @@ class PromptService:
         Args:
             event: Event to publish
         """
+        registry_versions.record_event("prompts", event)
         await self._event_service.publish_event(event)
 
     # --- Metrics ---
@@ -29,7 +29,7 @@ import os
 import re
 import ssl
 import time
-from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union
 import uuid
 
 # Third-Party
@@ -44,6 +44,7 @@ from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import joinedload, Session
 
 # First-Party
+from mcpgateway.cache.registry_versions import registry_versions
 from mcpgateway.common.models import ResourceContent, ResourceTemplate, TextContent
 from mcpgateway.common.validators import SecurityValidator
 from mcpgateway.config import settings
@@ -69,6 +70,7 @@ from mcpgateway.utils.pagination import unified_paginate
 from mcpgateway.utils.services_auth import decode_auth
 from mcpgateway.utils.sqlalchemy_modifier import json_contains_tag_expr
 from mcpgateway.utils.ssl_context_cache import get_cached_ssl_context
+from mcpgateway.utils.uri_template_router import compile_uri_template, TemplateRoute, UriTemplateRouter
 from mcpgateway.utils.url_auth import apply_query_param_auth, sanitize_exception_message
 from mcpgateway.utils.validate_signature import validate_signature
 
@@ -104,6 +106,9 @@ def _get_registry_cache():
 logging_service = LoggingService()
 logger = logging_service.get_logger(__name__)
 
+# Minimum seconds between template router refreshes triggered by unmatched URIs
+_TEMPLATE_MISS_REFRESH_INTERVAL = 5.0
+
 # Initialize structured logger and audit trail for resource operations
 structured_logger = get_structured_logger("resource_service")
 audit_trail = get_audit_trail_service()
@@ -166,7 +171,9 @@ class ResourceService:
     def __init__(self) -> None:
         """Initialize the resource service."""
         self._event_service = EventService(channel_name="mcpgateway:resource_events")
-        self._template_cache: Dict[str, ResourceTemplate] = {}
+        self._template_router = UriTemplateRouter()
+        self._template_router_refreshed_at = 0.0
+        _get_registry_cache().add_invalidation_listener("resources", self._template_router.mark_stale)
         self.oauth_manager = OAuthManager(request_timeout=int(os.getenv("OAUTH_REQUEST_TIMEOUT", "30")), max_retries=int(os.getenv("OAUTH_MAX_RETRIES", "3")))
 
         # Initialize plugin manager if plugins are enabled in settings
@@ -486,6 +493,8 @@ class ResourceService:
             db.add(db_resource)
             db.commit()
             db.refresh(db_resource)
+            if db_resource.uri_template:
+                self._template_router.mark_stale()
 
             # Notify subscribers
             await self._notify_resource_added(db_resource)
@@ -785,6 +794,7 @@ class ResourceService:
 
                 # Commit the chunk
                 db.commit()
+                self._template_router.mark_stale()
 
                 # Refresh resources for notifications and audit trail
                 for db_resource in resources_to_add:
@@ -919,6 +929,60 @@ class ResourceService:
 
         return False
 
+    @staticmethod
+    def apply_visibility_filter(query: Any, user_email: Optional[str], team_ids: List[str], token_teams: Optional[List[str]], team_id: Optional[str]) -> Any:
+        """Restrict a resource query to the rows the caller may list.
+
+        This is the single source of the resource listing visibility rules; it is
+        shared by :meth:`list_resources` and the registry delta listing.
+
+        - public: visible to all
+        - team: visible to members of the owning team (team_ids)
+        - private: visible only to the owner, but not for public-only tokens (token_teams == [])
+
+        Args:
+            query: SQLAlchemy select over DbResource.
+            user_email: Caller email for owner access.
+            team_ids: Teams the caller belongs to (token teams or DB memberships).
+            token_teams: Teams from the token; [] marks a public-only token.
+            team_id: Restrict to a single team.
+
+        Returns:
+            The filtered query, or None if the caller has no access to ``team_id``.
+
+        Examples:
+            >>> ResourceService.apply_visibility_filter(select(DbResource.id), "a@x.com", ["t1"], ["t1"], "t2") is None
+            True
+            >>> "visibility" in str(ResourceService.apply_visibility_filter(select(DbResource.id), "a@x.com", ["t1"], ["t1"], None))
+            True
+        """
+        # Check if this is a public-only token (empty teams array)
+        # Public-only tokens can ONLY see public resources - no owner access
+        is_public_only_token = token_teams is not None and len(token_teams) == 0
+
+        if team_id:
+            # User requesting specific team - verify access
+            if team_id not in team_ids:
+                return None
+            access_conditions = [
+                and_(DbResource.team_id == team_id, DbResource.visibility.in_(["team", "public"])),
+            ]
+            # Only include owner access for non-public-only tokens with user_email
+            if not is_public_only_token and user_email:
+                access_conditions.append(and_(DbResource.team_id == team_id, DbResource.owner_email == user_email))
+            return query.where(or_(*access_conditions))
+
+        # General access: public resources + team resources (+ owner resources if not public-only token)
+        access_conditions = [
+            DbResource.visibility == "public",
+        ]
+        # Only include owner access for non-public-only tokens with user_email
+        if not is_public_only_token and user_email:
+            access_conditions.append(DbResource.owner_email == user_email)
+        if team_ids:
+            access_conditions.append(and_(DbResource.team_id.in_(team_ids), DbResource.visibility.in_(["team", "public"])))
+        return query.where(or_(*access_conditions))
+
     async def list_resources(
         self,
         db: Session,
@@ -1023,34 +1087,9 @@ class ResourceService:
             else:
                 team_ids = []
 
-            # Check if this is a public-only token (empty teams array)
-            # Public-only tokens can ONLY see public resources - no owner access
-            is_public_only_token = token_teams is not None and len(token_teams) == 0
-
-            if team_id:
-                # User requesting specific team - verify access
-                if team_id not in team_ids:
-                    return ([], None)  # No access to this team
-
-                access_conditions = [
-                    and_(DbResource.team_id == team_id, DbResource.visibility.in_(["team", "public"])),
-                ]
-                # Only include owner access for non-public-only tokens with user_email
-                if not is_public_only_token and user_email:
-                    access_conditions.append(and_(DbResource.team_id == team_id, DbResource.owner_email == user_email))
-                query = query.where(or_(*access_conditions))
-            else:
-                # General access: public resources + team resources (+ owner resources if not public-only token)
-                access_conditions = [
-                    DbResource.visibility == "public",
-                ]
-                # Only include owner access for non-public-only tokens with user_email
-                if not is_public_only_token and user_email:
-                    access_conditions.append(DbResource.owner_email == user_email)
-                if team_ids:
-                    access_conditions.append(and_(DbResource.team_id.in_(team_ids), DbResource.visibility.in_(["team", "public"])))
-
-                query = query.where(or_(*access_conditions))
+            query = self.apply_visibility_filter(query, user_email, team_ids, token_teams, team_id)
+            if query is None:
+                return ([], None)
 
             # Apply visibility filter if specified
             if visibility:
@@ -3205,10 +3244,14 @@ class ResourceService:
         """
         Read a templated resource.
 
+        The matching template and its parameters are resolved in one pass by
+        the indexed template router, which also carries each template's
+        enabled state.
+
         Args:
             db: Database session.
             uri: Template URI with parameters.
-            include_inactive: Whether to include inactive resources in DB lookups.
+            include_inactive: Kept for compatibility; inactive templates are always rejected.
 
         Returns:
             ResourceContent: The resolved content from the matching template.
@@ -3218,28 +3261,15 @@ class ResourceService:
             ResourceError: For other template resolution errors.
             NotImplementedError: If a binary template resource is encountered.
         """
-        # Find matching template # DRT BREAKPOINT
-        template = None
-        if not self._template_cache:
-            logger.info("_template_cache is empty, fetching exisitng resource templates")
-            resource_templates = await self.list_resource_templates(db=db, include_inactive=include_inactive)
-            for i in resource_templates:
-                self._template_cache[i.name] = i
-        for cached in self._template_cache.values():
-            if self._uri_matches_template(uri, cached.uri_template):
-                template = cached
-                break
-
-        if template:
-            check_inactivity = db.execute(select(DbResource).where(DbResource.id == str(template.id)).where(not_(DbResource.enabled))).scalar_one_or_none()
-            if check_inactivity:
-                raise ResourceNotFoundError(f"Resource '{template.id}' exists but is inactive")
-        else:
+        match = self._match_template(db, uri)
+        if match is None:
             raise ResourceNotFoundError(f"No template matches URI: {uri}")
+        route, params = match
+        template = route.template
+        if not route.enabled:
+            raise ResourceNotFoundError(f"Resource '{template.id}' exists but is inactive")
 
         try:
-            # Extract parameters
-            params = self._extract_template_params(uri, template.uri_template)
             # Generate content
             if template.mime_type and template.mime_type.startswith("text/"):
                 content = template.uri_template.format(**params)
@@ -3252,6 +3282,56 @@ class ResourceService:
         except Exception as e:
             raise ResourceError(f"Failed to process template: {str(e)}") from e
 
+    def _match_template(self, db: Session, uri: str) -> Optional[Tuple[TemplateRoute, Dict[str, str]]]:
+        """
+        Resolve a URI against the template router, refreshing the index when needed.
+
+        The index is refreshed when a ``resources`` registry invalidation marked
+        it stale, and at most every ``_TEMPLATE_MISS_REFRESH_INTERVAL`` seconds
+        on a miss so templates registered on other workers are picked up.
+
+        Args:
+            db: Database session.
+            uri: Concrete resource URI.
+
+        Returns:
+            Tuple of (TemplateRoute, params) or None when nothing matches.
+        """
+        if self._template_router.stale:
+            self._refresh_template_router(db)
+            return self._template_router.match(uri)
+        match = self._template_router.match(uri)
+        if match is None and time.monotonic() - self._template_router_refreshed_at >= _TEMPLATE_MISS_REFRESH_INTERVAL:
+            self._refresh_template_router(db)
+            match = self._template_router.match(uri)
+        return match
+
+    def _refresh_template_router(self, db: Session) -> None:
+        """
+        Bring the template router in line with the database.
+
+        Only templates whose URI template, enabled flag or ``updated_at``
+        changed are re-validated and re-indexed; deleted templates are removed.
+
+        Args:
+            db: Database session.
+        """
+        router = self._template_router
+        # Clear the flag first so an invalidation racing with the query re-flags it
+        router.stale = False
+        self._template_router_refreshed_at = time.monotonic()
+        rows = db.execute(select(DbResource).where(DbResource.uri_template.isnot(None))).scalars().all()
+        seen = set()
+        for row in rows:
+            key = str(row.id)
+            seen.add(key)
+            version = (row.uri_template, bool(row.enabled), row.updated_at)
+            if router.version(key) != version:
+                router.add(key, ResourceTemplate.model_validate(row), row.uri_template, enabled=bool(row.enabled), version=version)
+        for key in router.keys() - seen:
+            router.remove(key)
+        logger.debug(f"Template router refreshed with {len(router)} templates")
+
     @staticmethod
     @lru_cache(maxsize=256)
     def _build_regex(template: str) -> re.Pattern:
@@ -3290,22 +3370,7 @@ class ResourceService:
             Results are cached using LRU cache (maxsize=256) to avoid
             recompiling the same template pattern repeatedly.
         """
-        # Remove query parameter syntax for path matching
-        template_without_query = re.sub(r"\{\?[^}]+\}", "", template)
-
-        parts = re.split(r"(\{[^}]+\})", template_without_query)
-        pattern = ""
-        for part in parts:
-            if part.startswith("{") and part.endswith("}"):
-                name = part[1:-1]
-                if name.endswith("*"):
-                    name = name[:-1]
-                    pattern += f"(?P<{name}>.+)"
-                else:
-                    pattern += f"(?P<{name}>[^/]+)"
-            else:
-                pattern += re.escape(part)
-        return re.compile(f"^{pattern}$")
+        return compile_uri_template(template)
 
     @staticmethod
     @lru_cache(maxsize=256)
@@ -3406,6 +3471,7 @@ class ResourceService:
         Args:
             event: Event to publish
         """
+        registry_versions.record_event("resources", event)
         await self._event_service.publish_event(event)
 
     # --- Resource templates ---
@@ -20,6 +20,7 @@ from sqlalchemy import and_, delete, select
 from sqlalchemy.orm import Session
 
 # First-Party
+from mcpgateway.cache.auth_cache import get_auth_cache
 from mcpgateway.db import Permissions, Role, UserRole, utc_now
 
 logger = logging.getLogger(__name__)
@@ -465,6 +466,8 @@ class RoleService:
 
         self.db.commit()
         self.db.refresh(role)
+        # Permission and inheritance changes affect every holder of the role
+        await get_auth_cache().invalidate_permissions()
 
         logger.info(f"Updated role: {role.name} (id: {role.id})")
         return role
@@ -522,6 +525,7 @@ class RoleService:
         self.db.execute(select(UserRole).where(UserRole.role_id == role_id)).update({"is_active": False})
 
         self.db.commit()
+        await get_auth_cache().invalidate_permissions()
 
         logger.info(f"Deleted role: {role.name} (id: {role.id})")
         return True
@@ -624,6 +628,7 @@ class RoleService:
         self.db.add(user_role)
         self.db.commit()
         self.db.refresh(user_role)
+        await get_auth_cache().invalidate_permissions(user_email)
 
         logger.info(f"Assigned role {role.name} to {user_email} (scope: {scope}, scope_id: {scope_id})")
         return user_role
@@ -667,6 +672,7 @@ class RoleService:
 
         user_role.is_active = False
         self.db.commit()
+        await get_auth_cache().invalidate_permissions(user_email)
 
         logger.info(f"Revoked role {role_id} from {user_email} (scope: {scope}, scope_id: {scope_id})")
         return True
@@ -877,7 +883,9 @@ class RoleService:
         Intended for use when permanently deleting a user account.
 
         Note: Does not commit the transaction. The caller is responsible for
-        committing (e.g., as part of a larger user deletion operation).
+        committing (e.g., as part of a larger user deletion operation) and for
+        invalidating the user's cached permissions after the commit, so that a
+        concurrent request cannot re-cache the uncommitted role state.
 
         Args:
             user_email: Email of user whose roles should be deleted
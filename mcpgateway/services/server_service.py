@@ -25,6 +25,7 @@ from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import joinedload, selectinload, Session
 
 # First-Party
+from mcpgateway.cache.registry_versions import registry_versions
 from mcpgateway.config import settings
 from mcpgateway.db import A2AAgent as DbA2AAgent
 from mcpgateway.db import EmailTeam as DbEmailTeam
@@ -710,6 +711,69 @@ class ServerService:
             )
             raise ServerError(f"Failed to register server: {str(ex)}")
 
+    @staticmethod
+    def apply_visibility_filter(query: Any, user_email: Optional[str], team_ids: List[str], token_teams: Optional[List[str]], team_id: Optional[str]) -> Any:
+        """Restrict a server query to the rows the caller may list.
+
+        This is the single source of the server listing visibility rules; it is
+        shared by :meth:`list_servers` and the registry delta listing.
+
+        - token_teams is None: admin bypass when user_email is None, else DB team memberships (team_ids) apply
+        - token_teams is []: public-only access
+        - token_teams is [...]: public + servers in those teams + the caller's private servers
+
+        Args:
+            query: SQLAlchemy select over DbServer.
+            user_email: Caller email for owner access.
+            team_ids: Caller's DB team memberships (used when token_teams is None).
+            token_teams: Teams from the token; None means no token scoping.
+            team_id: Restrict to a single team (DB-membership access only).
+
+        Returns:
+            The filtered query, or None if the caller has no access to ``team_id``.
+
+        Examples:
+            >>> ServerService.apply_visibility_filter(select(DbServer.id), "a@x.com", ["t1"], None, "t2") is None
+            True
+            >>> q = select(DbServer.id)
+            >>> ServerService.apply_visibility_filter(q, None, [], None, None) is q
+            True
+        """
+        if token_teams is not None:
+            if len(token_teams) == 0:
+                # Public-only token: only access public servers
+                return query.where(DbServer.visibility == "public")
+            # Team-scoped token: public servers + servers in allowed teams + user's own
+            access_conditions = [
+                DbServer.visibility == "public",
+                and_(DbServer.team_id.in_(token_teams), DbServer.visibility.in_(["team", "public"])),
+            ]
+            if user_email:
+                access_conditions.append(and_(DbServer.owner_email == user_email, DbServer.visibility == "private"))
+            return query.where(or_(*access_conditions))
+
+        if not user_email:
+            return query
+
+        if team_id:
+            # User requesting specific team - verify access
+            if team_id not in team_ids:
+                return None
+            access_conditions = [
+                and_(DbServer.team_id == team_id, DbServer.visibility.in_(["team", "public"])),
+                and_(DbServer.team_id == team_id, DbServer.owner_email == user_email),
+            ]
+            return query.where(or_(*access_conditions))
+
+        # General access: user's servers + public servers + team servers
+        access_conditions = [
+            DbServer.owner_email == user_email,
+            DbServer.visibility == "public",
+        ]
+        if team_ids:
+            access_conditions.append(and_(DbServer.team_id.in_(team_ids), DbServer.visibility.in_(["team", "public"])))
+        return query.where(or_(*access_conditions))
+
     async def list_servers(
         self,
         db: Session,
@@ -794,50 +858,18 @@ class ServerService:
         # - token_teams is None: admin bypass (is_admin=true with explicit null teams) - sees all
         # - token_teams is []: public-only access (missing teams or explicit empty)
         # - token_teams is [...]: access to specified teams + public + user's own
-        if token_teams is not None:
-            if len(token_teams) == 0:
-                # Public-only token: only access public servers
-                query = query.where(DbServer.visibility == "public")
-            else:
-                # Team-scoped token: public servers + servers in allowed teams + user's own
-                access_conditions = [
-                    DbServer.visibility == "public",
-                    and_(DbServer.team_id.in_(token_teams), DbServer.visibility.in_(["team", "public"])),
-                ]
-                if user_email:
-                    access_conditions.append(and_(DbServer.owner_email == user_email, DbServer.visibility == "private"))
-                query = query.where(or_(*access_conditions))
-
-            if visibility:
-                query = query.where(DbServer.visibility == visibility)
-
-        # Apply team-based access control if user_email is provided (and no token_teams filtering)
-        elif user_email:
+        if token_teams is None and user_email:
             team_service = TeamManagementService(db)
             user_teams = await team_service.get_user_teams(user_email)
             team_ids = [team.id for team in user_teams]
+        else:
+            team_ids = []
+        query = self.apply_visibility_filter(query, user_email, team_ids, token_teams, team_id)
+        if query is None:
+            return ([], None)
 
-            if team_id:
-                # User requesting specific team - verify access
-                if team_id not in team_ids:
-                    return ([], None)
-                access_conditions = [
-                    and_(DbServer.team_id == team_id, DbServer.visibility.in_(["team", "public"])),
-                    and_(DbServer.team_id == team_id, DbServer.owner_email == user_email),
-                ]
-                query = query.where(or_(*access_conditions))
-            else:
-                # General access: user's servers + public servers + team servers
-                access_conditions = [
-                    DbServer.owner_email == user_email,
-                    DbServer.visibility == "public",
-                ]
-                if team_ids:
-                    access_conditions.append(and_(DbServer.team_id.in_(team_ids), DbServer.visibility.in_(["team", "public"])))
-                query = query.where(or_(*access_conditions))
-
-            if visibility:
-                query = query.where(DbServer.visibility == visibility)
+        if visibility and (token_teams is not None or user_email):
+            query = query.where(DbServer.visibility == visibility)
 
         # Add tag filtering if tags are provided (supports both List[str] and List[Dict] formats)
         if tags:
@@ -1708,6 +1740,7 @@ class ServerService:
         Args:
             event: Event to publish
         """
+        registry_versions.record_event("servers", event)
         for queue in self._event_subscribers:
             await queue.put(event)
 
@@ -45,6 +45,7 @@ from sqlalchemy.orm import joinedload, selectinload, Session
 
 # First-Party
 from mcpgateway.cache.global_config_cache import global_config_cache
+from mcpgateway.cache.registry_versions import registry_versions
 from mcpgateway.common.models import Gateway as PydanticGateway
 from mcpgateway.common.models import TextContent
 from mcpgateway.common.models import Tool as PydanticTool
@@ -72,11 +73,12 @@ from mcpgateway.plugins.framework.constants import GATEWAY_METADATA, TOOL_METADA
 from mcpgateway.schemas import AuthenticationValues, ToolCreate, ToolRead, ToolUpdate, TopPerformer
 from mcpgateway.services.audit_trail_service import get_audit_trail_service
 from mcpgateway.services.event_service import EventService
+from mcpgateway.services.health_check_scheduler import gateway_health_signals
 from mcpgateway.services.logging_service import LoggingService
 from mcpgateway.services.mcp_session_pool import get_mcp_session_pool, TransportType
 from mcpgateway.services.metrics_cleanup_service import delete_metrics_in_batches, pause_rollup_during_purge
 from mcpgateway.services.metrics_query_service import get_top_performers_combined
-from mcpgateway.services.oauth_manager import OAuthManager
+from mcpgateway.services.oauth_manager import is_unauthorized_error, OAuthManager
 from mcpgateway.services.observability_service import current_trace_id, ObservabilityService
 from mcpgateway.services.performance_tracker import get_performance_tracker
 from mcpgateway.services.structured_logger import get_structured_logger
@@ -874,6 +876,42 @@ class ToolService:
                 error_message=error_message,
             )
 
+    @staticmethod
+    def _plugin_tool_result(payload: ToolPreInvokePayload) -> Optional[ToolResult]:
+        """Return the final tool result supplied by a ``tool_pre_invoke`` plugin, if any.
+
+        Plugins short-circuit an invocation (e.g. on a cache hit) by returning a modified
+        payload with ``result`` set. Results that are not shaped like a tool result are
+        wrapped as text content, mirroring how ``tool_post_invoke`` results are handled.
+
+        Args:
+            payload: The (possibly modified) pre-invoke payload.
+
+        Returns:
+            The ToolResult to return without contacting the upstream, or None to proceed normally.
+
+        Examples:
+            >>> from mcpgateway.plugins.framework import ToolPreInvokePayload
+            >>> ToolService._plugin_tool_result(ToolPreInvokePayload(name="t")) is None
+            True
+            >>> r = ToolService._plugin_tool_result(ToolPreInvokePayload(name="t", result={"content": [{"type": "text", "text": "hi"}], "isError": False}))
+            >>> r.content[0].text, r.is_error
+            ('hi', False)
+            >>> ToolService._plugin_tool_result(ToolPreInvokePayload(name="t", result={"ok": True})).content[0].text
+            "{'ok': True}"
+        """
+        result = getattr(payload, "result", None)
+        if result is None:
+            return None
+        if isinstance(result, ToolResult):
+            return result
+        if isinstance(result, dict) and "content" in result:
+            try:
+                return ToolResult.model_validate(result)
+            except ValidationError:
+                logger.debug("Plugin-supplied tool result failed validation; returning it as text")
+        return ToolResult(content=[TextContent(type="text", text=str(result))])
+
     def _extract_and_validate_structured_content(self, tool: DbTool, tool_result: "ToolResult", candidate: Optional[Any] = None) -> bool:
         """
         Extract structured content (if any) and validate it against ``tool.output_schema``.
@@ -1704,6 +1742,60 @@ class ToolService:
             plugin_chain_post=tool.plugin_chain_post if tool.integration_type == "REST" else None,
         )
 
+    @staticmethod
+    def apply_visibility_filter(query: Any, user_email: Optional[str], team_ids: List[str], token_teams: Optional[List[str]], team_id: Optional[str]) -> Any:
+        """Restrict a tool query to the rows the caller may list.
+
+        This is the single source of the tool listing visibility rules; it is
+        shared by :meth:`list_tools` and the registry delta listing.
+
+        - public: visible to all
+        - team: visible to members of the owning team (team_ids)
+        - private: visible only to the owner, but not for public-only tokens (token_teams == [])
+
+        Args:
+            query: SQLAlchemy select over DbTool.
+            user_email: Caller email for owner access.
+            team_ids: Teams the caller belongs to (token teams or DB memberships).
+            token_teams: Teams from the token; [] marks a public-only token.
+            team_id: Restrict to a single team.
+
+        Returns:
+            The filtered query, or None if the caller has no access to ``team_id``.
+
+        Examples:
+            >>> ToolService.apply_visibility_filter(select(DbTool.id), "a@x.com", ["t1"], ["t1"], "t2") is None
+            True
+            >>> "visibility" in str(ToolService.apply_visibility_filter(select(DbTool.id), "a@x.com", ["t1"], ["t1"], None))
+            True
+        """
+        # Check if this is a public-only token (empty teams array)
+        # Public-only tokens can ONLY see public tools - no owner access
+        is_public_only_token = token_teams is not None and len(token_teams) == 0
+
+        if team_id:
+            # User requesting specific team - verify access
+            if team_id not in team_ids:
+                return None
+            access_conditions = [
+                and_(DbTool.team_id == team_id, DbTool.visibility.in_(["team", "public"])),
+            ]
+            # Only include owner access for non-public-only tokens with user_email
+            if not is_public_only_token and user_email:
+                access_conditions.append(and_(DbTool.team_id == team_id, DbTool.owner_email == user_email))
+            return query.where(or_(*access_conditions))
+
+        # General access: public tools + team tools (+ owner tools if not public-only token)
+        access_conditions = [
+            DbTool.visibility == "public",
+        ]
+        # Only include owner access for non-public-only tokens with user_email
+        if not is_public_only_token and user_email:
+            access_conditions.append(DbTool.owner_email == user_email)
+        if team_ids:
+            access_conditions.append(and_(DbTool.team_id.in_(team_ids), DbTool.visibility.in_(["team", "public"])))
+        return query.where(or_(*access_conditions))
+
     async def list_tools(
         self,
         db: Session,
@@ -1809,32 +1901,9 @@ class ToolService:
             else:
                 team_ids = []
 
-            # Check if this is a public-only token (empty teams array)
-            # Public-only tokens can ONLY see public resources - no owner access
-            is_public_only_token = token_teams is not None and len(token_teams) == 0
-
-            if team_id:
-                # User requesting specific team - verify access
-                if team_id not in team_ids:
-                    return ([], None)
-                access_conditions = [
-                    and_(DbTool.team_id == team_id, DbTool.visibility.in_(["team", "public"])),
-                ]
-                # Only include owner access for non-public-only tokens
-                if not is_public_only_token and user_email:
-                    access_conditions.append(and_(DbTool.team_id == team_id, DbTool.owner_email == user_email))
-                query = query.where(or_(*access_conditions))
-            else:
-                # General access: public tools + team tools (+ owner tools if not public-only token)
-                access_conditions = [
-                    DbTool.visibility == "public",
-                ]
-                # Only include owner access for non-public-only tokens with user_email
-                if not is_public_only_token and user_email:
-                    access_conditions.append(DbTool.owner_email == user_email)
-                if team_ids:
-                    access_conditions.append(and_(DbTool.team_id.in_(team_ids), DbTool.visibility.in_(["team", "public"])))
-                query = query.where(or_(*access_conditions))
+            query = self.apply_visibility_filter(query, user_email, team_ids, token_teams, team_id)
+            if query is None:
+                return ([], None)
 
             if visibility:
                 query = query.where(DbTool.visibility == visibility)
@@ -2830,6 +2899,8 @@ class ToolService:
         start_time = time.monotonic()
         success = False
         error_message = None
+        # OAuth config whose cached token authenticates this call; its token is dropped if the upstream answers 401
+        oauth_credentials: Optional[Dict[str, Any]] = None
 
         # Get trace_id from context for database span creation
         trace_id = current_trace_id.get()
@@ -2879,6 +2950,7 @@ class ToolService:
             },
         ) as span:
             try:
+                plugin_tool_result: Optional[ToolResult] = None
                 # Get combined headers for the tool including base headers, auth, and passthrough headers
                 headers = tool_headers.copy()
                 if tool_integration_type == "REST":
@@ -2887,6 +2959,7 @@ class ToolService:
                         try:
                             access_token = await self.oauth_manager.get_access_token(tool_oauth_config)
                             headers["Authorization"] = f"Bearer {access_token}"
+                            oauth_credentials = tool_oauth_config
                         except Exception as e:
                             logger.error(f"Failed to obtain OAuth access token for tool {tool_name_computed}: {e}")
                             raise ToolInvocationError(f"OAuth authentication failed: {str(e)}")
@@ -2935,111 +3008,117 @@ class ToolService:
                             arguments = payload.args
                             if payload.headers is not None:
                                 headers = payload.headers.model_dump()
+                            plugin_tool_result = self._plugin_tool_result(payload)
 
-                    # Build the payload based on integration type
-                    payload = arguments.copy()
-
-                    # Handle URL path parameter substitution (using local variable)
-                    final_url = tool_url
-                    if "{" in tool_url and "}" in tool_url:
-                        # Extract path parameters from URL template and arguments
-                        url_params = re.findall(r"\{(\w+)\}", tool_url)
-                        url_substitutions = {}
-
-                        for param in url_params:
-                            if param in payload:
-                                url_substitutions[param] = payload.pop(param)  # Remove from payload
-                                final_url = final_url.replace(f"{{{param}}}", str(url_substitutions[param]))
-                            else:
-                                raise ToolInvocationError(f"Required URL parameter '{param}' not found in arguments")
-
-                    # --- Extract query params from URL ---
-                    parsed = urlparse(final_url)
-                    final_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+                    if plugin_tool_result is not None:
+                        # A tool_pre_invoke plugin supplied the final result (e.g. a cache hit): skip upstream I/O
+                        tool_result = plugin_tool_result
+                        success = not tool_result.is_error
+                    else:
+                        # Build the payload based on integration type
+                        payload = arguments.copy()
+
+                        # Handle URL path parameter substitution (using local variable)
+                        final_url = tool_url
+                        if "{" in tool_url and "}" in tool_url:
+                            # Extract path parameters from URL template and arguments
+                            url_params = re.findall(r"\{(\w+)\}", tool_url)
+                            url_substitutions = {}
+
+                            for param in url_params:
+                                if param in payload:
+                                    url_substitutions[param] = payload.pop(param)  # Remove from payload
+                                    final_url = final_url.replace(f"{{{param}}}", str(url_substitutions[param]))
+                                else:
+                                    raise ToolInvocationError(f"Required URL parameter '{param}' not found in arguments")
 
-                    query_params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+                        # --- Extract query params from URL ---
+                        parsed = urlparse(final_url)
+                        final_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
 
-                    # Merge leftover payload + query params
-                    payload.update(query_params)
+                        query_params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
 
-                    # Use the tool's request_type rather than defaulting to POST (using local variable)
-                    method = tool_request_type.upper() if tool_request_type else "POST"
-                    rest_start_time = time.time()
-                    try:
-                        if method == "GET":
-                            response = await asyncio.wait_for(self._http_client.get(final_url, params=payload, headers=headers), timeout=effective_timeout)
-                        else:
-                            response = await asyncio.wait_for(self._http_client.request(method, final_url, json=payload, headers=headers), timeout=effective_timeout)
-                    except (asyncio.TimeoutError, httpx.TimeoutException):
-                        rest_elapsed_ms = (time.time() - rest_start_time) * 1000
-                        structured_logger.log(
-                            level="WARNING",
-                            message=f"REST tool invocation timed out: {tool_name_computed}",
-                            component="tool_service",
-                            correlation_id=get_correlation_id(),
-                            duration_ms=rest_elapsed_ms,
-                            metadata={"event": "tool_timeout", "tool_name": tool_name_computed, "timeout_seconds": effective_timeout},
-                        )
+                        # Merge leftover payload + query params
+                        payload.update(query_params)
 
-                        # Manually trigger circuit breaker (or other plugins) on timeout
+                        # Use the tool's request_type rather than defaulting to POST (using local variable)
+                        method = tool_request_type.upper() if tool_request_type else "POST"
+                        rest_start_time = time.time()
                         try:
-                            # First-Party
-                            from mcpgateway.services.metrics import tool_timeout_counter  # pylint: disable=import-outside-toplevel
-
-                            tool_timeout_counter.labels(tool_name=name).inc()
-                        except Exception as exc:
-                            logger.debug(
-                                "Failed to increment tool_timeout_counter for %s: %s",
-                                name,
-                                exc,
-                                exc_info=True,
+                            if method == "GET":
+                                response = await asyncio.wait_for(self._http_client.get(final_url, params=payload, headers=headers), timeout=effective_timeout)
+                            else:
+                                response = await asyncio.wait_for(self._http_client.request(method, final_url, json=payload, headers=headers), timeout=effective_timeout)
+                        except (asyncio.TimeoutError, httpx.TimeoutException):
+                            rest_elapsed_ms = (time.time() - rest_start_time) * 1000
+                            structured_logger.log(
+                                level="WARNING",
+                                message=f"REST tool invocation timed out: {tool_name_computed}",
+                                component="tool_service",
+                                correlation_id=get_correlation_id(),
+                                duration_ms=rest_elapsed_ms,
+                                metadata={"event": "tool_timeout", "tool_name": tool_name_computed, "timeout_seconds": effective_timeout},
                             )
 
-                        if self._plugin_manager:
-                            if context_table:
-                                for ctx in context_table.values():
-                                    ctx.set_state("cb_timeout_failure", True)
-
-                            if self._plugin_manager.has_hooks_for(ToolHookType.TOOL_POST_INVOKE):
-                                timeout_error_result = ToolResult(content=[TextContent(type="text", text=f"Tool invocation timed out after {effective_timeout}s")], is_error=True)
-                                await self._plugin_manager.invoke_hook(
-                                    ToolHookType.TOOL_POST_INVOKE,
-                                    payload=ToolPostInvokePayload(name=name, result=timeout_error_result.model_dump(by_alias=True)),
-                                    global_context=global_context,
-                                    local_contexts=context_table,
-                                    violations_as_exceptions=False,
+                            # Manually trigger circuit breaker (or other plugins) on timeout
+                            try:
+                                # First-Party
+                                from mcpgateway.services.metrics import tool_timeout_counter  # pylint: disable=import-outside-toplevel
+
+                                tool_timeout_counter.labels(tool_name=name).inc()
+                            except Exception as exc:
+                                logger.debug(
+                                    "Failed to increment tool_timeout_counter for %s: %s",
+                                    name,
+                                    exc,
+                                    exc_info=True,
                                 )
 
-                        raise ToolTimeoutError(f"Tool invocation timed out after {effective_timeout}s")
-                    response.raise_for_status()
+                            if self._plugin_manager:
+                                if context_table:
+                                    for ctx in context_table.values():
+                                        ctx.set_state("cb_timeout_failure", True)
 
-                    # Handle 204 No Content responses that have no body
-                    if response.status_code == 204:
-                        tool_result = ToolResult(content=[TextContent(type="text", text="Request completed successfully (No Content)")])
-                        success = True
-                    elif response.status_code not in [200, 201, 202, 206]:
-                        try:
-                            result = response.json()
-                        except orjson.JSONDecodeError:
-                            result = {"response_text": response.text} if response.text else {}
-                        tool_result = ToolResult(
-                            content=[TextContent(type="text", text=str(result["error"]) if "error" in result else "Tool error encountered")],
-                            is_error=True,
-                        )
-                        # Don't mark as successful for error responses - success remains False
-                    else:
-                        try:
-                            result = response.json()
-                        except orjson.JSONDecodeError:
-                            result = {"response_text": response.text} if response.text else {}
-                        logger.debug(f"REST API tool response: {result}")
-                        filtered_response = extract_using_jq(result, tool_jsonpath_filter)
-                        tool_result = ToolResult(content=[TextContent(type="text", text=orjson.dumps(filtered_response, option=orjson.OPT_INDENT_2).decode())])
-                        success = True
-                        # If output schema is present, validate and attach structured content
-                        if tool_output_schema:
-                            valid = self._extract_and_validate_structured_content(tool_for_validation, tool_result, candidate=filtered_response)
-                            success = bool(valid)
+                                if self._plugin_manager.has_hooks_for(ToolHookType.TOOL_POST_INVOKE):
+                                    timeout_error_result = ToolResult(content=[TextContent(type="text", text=f"Tool invocation timed out after {effective_timeout}s")], is_error=True)
+                                    await self._plugin_manager.invoke_hook(
+                                        ToolHookType.TOOL_POST_INVOKE,
+                                        payload=ToolPostInvokePayload(name=name, result=timeout_error_result.model_dump(by_alias=True)),
+                                        global_context=global_context,
+                                        local_contexts=context_table,
+                                        violations_as_exceptions=False,
+                                    )
+
+                            raise ToolTimeoutError(f"Tool invocation timed out after {effective_timeout}s")
+                        response.raise_for_status()
+
+                        # Handle 204 No Content responses that have no body
+                        if response.status_code == 204:
+                            tool_result = ToolResult(content=[TextContent(type="text", text="Request completed successfully (No Content)")])
+                            success = True
+                        elif response.status_code not in [200, 201, 202, 206]:
+                            try:
+                                result = response.json()
+                            except orjson.JSONDecodeError:
+                                result = {"response_text": response.text} if response.text else {}
+                            tool_result = ToolResult(
+                                content=[TextContent(type="text", text=str(result["error"]) if "error" in result else "Tool error encountered")],
+                                is_error=True,
+                            )
+                            # Don't mark as successful for error responses - success remains False
+                        else:
+                            try:
+                                result = response.json()
+                            except orjson.JSONDecodeError:
+                                result = {"response_text": response.text} if response.text else {}
+                            logger.debug(f"REST API tool response: {result}")
+                            filtered_response = extract_using_jq(result, tool_jsonpath_filter)
+                            tool_result = ToolResult(content=[TextContent(type="text", text=orjson.dumps(filtered_response, option=orjson.OPT_INDENT_2).decode())])
+                            success = True
+                            # If output schema is present, validate and attach structured content
+                            if tool_output_schema:
+                                valid = self._extract_and_validate_structured_content(tool_for_validation, tool_result, candidate=filtered_response)
+                                success = bool(valid)
                 elif tool_integration_type == "MCP":
                     transport = tool_request_type.lower() if tool_request_type else "sse"
 
@@ -3077,6 +3156,7 @@ class ToolService:
                             try:
                                 access_token = await self.oauth_manager.get_access_token(gateway_oauth_config)
                                 headers = {"Authorization": f"Bearer {access_token}"}
+                                oauth_credentials = gateway_oauth_config
                             except Exception as e:
                                 logger.error(f"Failed to obtain OAuth access token for gateway {gateway_name}: {e}")
                                 raise ToolInvocationError(f"OAuth authentication failed for gateway: {str(e)}")
@@ -3480,25 +3560,31 @@ class ToolService:
                             arguments = payload.args
                             if payload.headers is not None:
                                 headers = payload.headers.model_dump()
+                            plugin_tool_result = self._plugin_tool_result(payload)
 
-                    tool_call_result = ToolResult(content=[TextContent(text="", type="text")])
-                    if transport == "sse":
-                        tool_call_result = await connect_to_sse_server(gateway_url, headers=headers)
-                    elif transport == "streamablehttp":
-                        tool_call_result = await connect_to_streamablehttp_server(gateway_url, headers=headers)
-                    dump = tool_call_result.model_dump(by_alias=True, mode="json")
-                    logger.debug(f"Tool call result dump: {dump}")
-                    content = dump.get("content", [])
-                    # Accept both alias and pythonic names for structured content
-                    structured = dump.get("structuredContent") or dump.get("structured_content")
-                    filtered_response = extract_using_jq(content, tool_jsonpath_filter)
-
-                    is_err = getattr(tool_call_result, "is_error", None)
-                    if is_err is None:
-                        is_err = getattr(tool_call_result, "isError", False)
-                    tool_result = ToolResult(content=filtered_response, structured_content=structured, is_error=is_err, meta=getattr(tool_call_result, "meta", None))
-                    success = not is_err
-                    logger.debug(f"Final tool_result: {tool_result}")
+                    if plugin_tool_result is not None:
+                        # A tool_pre_invoke plugin supplied the final result (e.g. a cache hit): skip upstream I/O
+                        tool_result = plugin_tool_result
+                        success = not tool_result.is_error
+                    else:
+                        tool_call_result = ToolResult(content=[TextContent(text="", type="text")])
+                        if transport == "sse":
+                            tool_call_result = await connect_to_sse_server(gateway_url, headers=headers)
+                        elif transport == "streamablehttp":
+                            tool_call_result = await connect_to_streamablehttp_server(gateway_url, headers=headers)
+                        dump = tool_call_result.model_dump(by_alias=True, mode="json")
+                        logger.debug(f"Tool call result dump: {dump}")
+                        content = dump.get("content", [])
+                        # Accept both alias and pythonic names for structured content
+                        structured = dump.get("structuredContent") or dump.get("structured_content")
+                        filtered_response = extract_using_jq(content, tool_jsonpath_filter)
+
+                        is_err = getattr(tool_call_result, "is_error", None)
+                        if is_err is None:
+                            is_err = getattr(tool_call_result, "isError", False)
+                        tool_result = ToolResult(content=filtered_response, structured_content=structured, is_error=is_err, meta=getattr(tool_call_result, "meta", None))
+                        success = not is_err
+                        logger.debug(f"Final tool_result: {tool_result}")
                 elif tool_integration_type == "A2A" and a2a_agent_endpoint_url:
                     # A2A tool invocation using pre-extracted agent data (extracted in Phase 2 before db.close())
                     headers = {"Content-Type": "application/json"}
@@ -3520,105 +3606,111 @@ class ToolService:
                             arguments = payload.args
                             if payload.headers is not None:
                                 headers = payload.headers.model_dump()
+                            plugin_tool_result = self._plugin_tool_result(payload)
 
-                    # Build request data based on agent type
-                    endpoint_url = a2a_agent_endpoint_url
-                    if a2a_agent_type in ["generic", "jsonrpc"] or endpoint_url.endswith("/"):
-                        # JSONRPC agents: Convert flat query to nested message structure
-                        params = None
-                        if isinstance(arguments, dict) and "query" in arguments and isinstance(arguments["query"], str):
-                            message_id = f"admin-test-{int(time.time())}"
-                            # A2A v0.3.x: message.parts use "kind" (not "type").
-                            params = {
-                                "message": {
-                                    "kind": "message",
-                                    "messageId": message_id,
-                                    "role": "user",
-                                    "parts": [{"kind": "text", "text": arguments["query"]}],
+                    if plugin_tool_result is not None:
+                        # A tool_pre_invoke plugin supplied the final result (e.g. a cache hit): skip upstream I/O
+                        tool_result = plugin_tool_result
+                        success = not tool_result.is_error
+                    else:
+                        # Build request data based on agent type
+                        endpoint_url = a2a_agent_endpoint_url
+                        if a2a_agent_type in ["generic", "jsonrpc"] or endpoint_url.endswith("/"):
+                            # JSONRPC agents: Convert flat query to nested message structure
+                            params = None
+                            if isinstance(arguments, dict) and "query" in arguments and isinstance(arguments["query"], str):
+                                message_id = f"admin-test-{int(time.time())}"
+                                # A2A v0.3.x: message.parts use "kind" (not "type").
+                                params = {
+                                    "message": {
+                                        "kind": "message",
+                                        "messageId": message_id,
+                                        "role": "user",
+                                        "parts": [{"kind": "text", "text": arguments["query"]}],
+                                    }
                                 }
-                            }
-                            method = arguments.get("method", "message/send")
+                                method = arguments.get("method", "message/send")
+                            else:
+                                params = arguments.get("params", arguments) if isinstance(arguments, dict) else arguments
+                                method = arguments.get("method", "message/send") if isinstance(arguments, dict) else "message/send"
+                            request_data = {"jsonrpc": "2.0", "method": method, "params": params, "id": 1}
                         else:
-                            params = arguments.get("params", arguments) if isinstance(arguments, dict) else arguments
-                            method = arguments.get("method", "message/send") if isinstance(arguments, dict) else "message/send"
-                        request_data = {"jsonrpc": "2.0", "method": method, "params": params, "id": 1}
-                    else:
-                        # Custom agents: Pass parameters directly
-                        params = arguments if isinstance(arguments, dict) else {}
-                        request_data = {"interaction_type": params.get("interaction_type", "query"), "parameters": params, "protocol_version": a2a_agent_protocol_version}
-
-                    # Add authentication
-                    if a2a_agent_auth_type == "api_key" and a2a_agent_auth_value:
-                        headers["Authorization"] = f"Bearer {a2a_agent_auth_value}"
-                    elif a2a_agent_auth_type == "bearer" and a2a_agent_auth_value:
-                        headers["Authorization"] = f"Bearer {a2a_agent_auth_value}"
-                    elif a2a_agent_auth_type == "query_param" and a2a_agent_auth_query_params:
-                        auth_query_params_decrypted: dict[str, str] = {}
-                        for param_key, encrypted_value in a2a_agent_auth_query_params.items():
-                            if encrypted_value:
-                                try:
-                                    decrypted = decode_auth(encrypted_value)
-                                    auth_query_params_decrypted[param_key] = decrypted.get(param_key, "")
-                                except Exception:
-                                    logger.debug(f"Failed to decrypt query param for key '{param_key}'")
-                        if auth_query_params_decrypted:
-                            endpoint_url = apply_query_param_auth(endpoint_url, auth_query_params_decrypted)
-
-                    # Make HTTP request with timeout enforcement
-                    logger.info(f"Calling A2A agent '{a2a_agent_name}' at {endpoint_url}")
-                    a2a_start_time = time.time()
-                    try:
-                        http_response = await asyncio.wait_for(self._http_client.post(endpoint_url, json=request_data, headers=headers), timeout=effective_timeout)
-                    except (asyncio.TimeoutError, httpx.TimeoutException):
-                        a2a_elapsed_ms = (time.time() - a2a_start_time) * 1000
-                        structured_logger.log(
-                            level="WARNING",
-                            message=f"A2A tool invocation timed out: {name}",
-                            component="tool_service",
-                            correlation_id=get_correlation_id(),
-                            duration_ms=a2a_elapsed_ms,
-                            metadata={"event": "tool_timeout", "tool_name": name, "a2a_agent": a2a_agent_name, "timeout_seconds": effective_timeout},
-                        )
-
-                        # Increment timeout counter
+                            # Custom agents: Pass parameters directly
+                            params = arguments if isinstance(arguments, dict) else {}
+                            request_data = {"interaction_type": params.get("interaction_type", "query"), "parameters": params, "protocol_version": a2a_agent_protocol_version}
+
+                        # Add authentication
+                        if a2a_agent_auth_type == "api_key" and a2a_agent_auth_value:
+                            headers["Authorization"] = f"Bearer {a2a_agent_auth_value}"
+                        elif a2a_agent_auth_type == "bearer" and a2a_agent_auth_value:
+                            headers["Authorization"] = f"Bearer {a2a_agent_auth_value}"
+                        elif a2a_agent_auth_type == "query_param" and a2a_agent_auth_query_params:
+                            auth_query_params_decrypted: dict[str, str] = {}
+                            for param_key, encrypted_value in a2a_agent_auth_query_params.items():
+                                if encrypted_value:
+                                    try:
+                                        decrypted = decode_auth(encrypted_value)
+                                        auth_query_params_decrypted[param_key] = decrypted.get(param_key, "")
+                                    except Exception:
+                                        logger.debug(f"Failed to decrypt query param for key '{param_key}'")
+                            if auth_query_params_decrypted:
+                                endpoint_url = apply_query_param_auth(endpoint_url, auth_query_params_decrypted)
+
+                        # Make HTTP request with timeout enforcement
+                        logger.info(f"Calling A2A agent '{a2a_agent_name}' at {endpoint_url}")
+                        a2a_start_time = time.time()
                         try:
-                            # First-Party
-                            from mcpgateway.services.metrics import tool_timeout_counter  # pylint: disable=import-outside-toplevel
-
-                            tool_timeout_counter.labels(tool_name=name).inc()
-                        except Exception as exc:
-                            logger.debug("Failed to increment tool_timeout_counter for %s: %s", name, exc, exc_info=True)
-
-                        # Trigger circuit breaker on timeout
-                        if self._plugin_manager:
-                            if context_table:
-                                for ctx in context_table.values():
-                                    ctx.set_state("cb_timeout_failure", True)
-
-                            if self._plugin_manager.has_hooks_for(ToolHookType.TOOL_POST_INVOKE):
-                                timeout_error_result = ToolResult(content=[TextContent(type="text", text=f"Tool invocation timed out after {effective_timeout}s")], is_error=True)
-                                await self._plugin_manager.invoke_hook(
-                                    ToolHookType.TOOL_POST_INVOKE,
-                                    payload=ToolPostInvokePayload(name=name, result=timeout_error_result.model_dump(by_alias=True)),
-                                    global_context=global_context,
-                                    local_contexts=context_table,
-                                    violations_as_exceptions=False,
-                                )
+                            http_response = await asyncio.wait_for(self._http_client.post(endpoint_url, json=request_data, headers=headers), timeout=effective_timeout)
+                        except (asyncio.TimeoutError, httpx.TimeoutException):
+                            a2a_elapsed_ms = (time.time() - a2a_start_time) * 1000
+                            structured_logger.log(
+                                level="WARNING",
+                                message=f"A2A tool invocation timed out: {name}",
+                                component="tool_service",
+                                correlation_id=get_correlation_id(),
+                                duration_ms=a2a_elapsed_ms,
+                                metadata={"event": "tool_timeout", "tool_name": name, "a2a_agent": a2a_agent_name, "timeout_seconds": effective_timeout},
+                            )
 
-                        raise ToolTimeoutError(f"Tool invocation timed out after {effective_timeout}s")
+                            # Increment timeout counter
+                            try:
+                                # First-Party
+                                from mcpgateway.services.metrics import tool_timeout_counter  # pylint: disable=import-outside-toplevel
+
+                                tool_timeout_counter.labels(tool_name=name).inc()
+                            except Exception as exc:
+                                logger.debug("Failed to increment tool_timeout_counter for %s: %s", name, exc, exc_info=True)
+
+                            # Trigger circuit breaker on timeout
+                            if self._plugin_manager:
+                                if context_table:
+                                    for ctx in context_table.values():
+                                        ctx.set_state("cb_timeout_failure", True)
 
-                    if http_response.status_code == 200:
-                        response_data = http_response.json()
-                        if isinstance(response_data, dict) and "response" in response_data:
-                            content = [TextContent(type="text", text=str(response_data["response"]))]
+                                if self._plugin_manager.has_hooks_for(ToolHookType.TOOL_POST_INVOKE):
+                                    timeout_error_result = ToolResult(content=[TextContent(type="text", text=f"Tool invocation timed out after {effective_timeout}s")], is_error=True)
+                                    await self._plugin_manager.invoke_hook(
+                                        ToolHookType.TOOL_POST_INVOKE,
+                                        payload=ToolPostInvokePayload(name=name, result=timeout_error_result.model_dump(by_alias=True)),
+                                        global_context=global_context,
+                                        local_contexts=context_table,
+                                        violations_as_exceptions=False,
+                                    )
+
+                            raise ToolTimeoutError(f"Tool invocation timed out after {effective_timeout}s")
+
+                        if http_response.status_code == 200:
+                            response_data = http_response.json()
+                            if isinstance(response_data, dict) and "response" in response_data:
+                                content = [TextContent(type="text", text=str(response_data["response"]))]
+                            else:
+                                content = [TextContent(type="text", text=str(response_data))]
+                            tool_result = ToolResult(content=content, is_error=False)
+                            success = True
                         else:
-                            content = [TextContent(type="text", text=str(response_data))]
-                        tool_result = ToolResult(content=content, is_error=False)
-                        success = True
-                    else:
-                        error_message = f"HTTP {http_response.status_code}: {http_response.text}"
-                        content = [TextContent(type="text", text=f"A2A agent error: {error_message}")]
-                        tool_result = ToolResult(content=content, is_error=True)
+                            error_message = f"HTTP {http_response.status_code}: {http_response.text}"
+                            content = [TextContent(type="text", text=f"A2A agent error: {error_message}")]
+                            tool_result = ToolResult(content=content, is_error=True)
                 else:
                     tool_result = ToolResult(content=[TextContent(type="text", text="Invalid tool type")], is_error=True)
 
@@ -3670,6 +3762,10 @@ class ToolService:
                     span.set_attribute("error", True)
                     span.set_attribute("error.message", error_message)
 
+                # A 401 means the cached OAuth token was revoked upstream; fetch a new one next time
+                if oauth_credentials and is_unauthorized_error(e):
+                    await self.oauth_manager.invalidate_access_token(oauth_credentials)
+
                 # Notify plugins of the failure so circuit breaker can track it
                 # This ensures HTTP 4xx/5xx errors and MCP failures are counted
                 if self._plugin_manager and self._plugin_manager.has_hooks_for(ToolHookType.TOOL_POST_INVOKE):
@@ -3733,6 +3829,10 @@ class ToolService:
                 except Exception as metric_error:
                     logger.warning(f"Failed to record tool metric: {metric_error}")
 
+                # Passive health signal: a gateway that just served a call needs no probe
+                if success and gateway_id_str:
+                    gateway_health_signals.record_success(gateway_id=gateway_id_str)
+
                 # Log structured message with performance tracking (using local variables)
                 if success:
                     structured_logger.info(
@@ -4198,6 +4298,7 @@ class ToolService:
         Args:
             event: Event to publish
         """
+        registry_versions.record_event("tools", event)
         await self._event_service.publish_event(event)
 
     async def _validate_tool_url(self, url: str) -> None:
@@ -117,7 +117,9 @@ from __future__ import annotations
 # Standard
 import argparse
 import asyncio
+from collections import OrderedDict
 from contextlib import suppress
+import itertools
 import logging
 import os
 import shlex
@@ -179,6 +181,12 @@ KEEP_ALIVE_INTERVAL = DEFAULT_KEEP_ALIVE_INTERVAL  # seconds - from config or fa
 # Set to 16MB to handle tools that return large amounts of data (e.g., search results)
 STDIO_BUFFER_LIMIT = 16 * 1024 * 1024  # 16MB
 
+# Prefix for JSON-RPC ids rewritten by StdIOEndpoint so concurrent sessions never collide
+ROUTED_ID_PREFIX = "translate-"
+
+# Maximum number of session -> worker assignments remembered by StdIOPool
+STDIO_POOL_MAX_AFFINITY = 10000
+
 __all__ = ["main"]  # for console-script entry-point
 
 
@@ -190,6 +198,9 @@ class _PubSub:
 
     This class implements a simple publish-subscribe pattern using asyncio queues
     for distributing messages from stdio subprocess to multiple SSE clients.
+    Subscribers registered with a session id can also be addressed directly
+    with :meth:`publish_to`, which is how JSON-RPC responses reach only the
+    session that sent the request.
 
     Examples:
         >>> import asyncio
@@ -220,6 +231,8 @@ class _PubSub:
             True
         """
         self._subscribers: List[asyncio.Queue[str]] = []
+        self._sessions: Dict[str, asyncio.Queue[str]] = {}
+        self._queue_sessions: Dict[asyncio.Queue[str], str] = {}
 
     async def publish(self, data: str) -> None:
         """Publish data to all subscribers.
@@ -259,15 +272,50 @@ class _PubSub:
             except asyncio.QueueFull:
                 dead.append(q)
         for q in dead:
-            with suppress(ValueError):
-                self._subscribers.remove(q)
+            self.unsubscribe(q)
+
+    async def publish_to(self, session_id: str, data: str) -> bool:
+        """Publish data to the subscriber registered for one session only.
+
+        A full session queue is treated like in :meth:`publish` and removed.
+
+        Args:
+            session_id: Session id the subscriber registered with.
+            data: The data string to deliver.
+
+        Returns:
+            bool: True if a subscriber for the session exists, False otherwise.
 
-    def subscribe(self) -> "asyncio.Queue[str]":
+        Examples:
+            >>> import asyncio
+            >>> async def test_publish_to():
+            ...     pubsub = _PubSub()
+            ...     mine, other = pubsub.subscribe("a"), pubsub.subscribe("b")
+            ...     delivered = await pubsub.publish_to("a", "only-a")
+            ...     missing = await pubsub.publish_to("gone", "x")
+            ...     return delivered, missing, mine.qsize(), other.qsize()
+            >>> asyncio.run(test_publish_to())
+            (True, False, 1, 0)
+        """
+        q = self._sessions.get(session_id)
+        if q is None:
+            return False
+        try:
+            q.put_nowait(data)
+        except asyncio.QueueFull:
+            self.unsubscribe(q)
+        return True
+
+    def subscribe(self, session_id: Optional[str] = None) -> "asyncio.Queue[str]":
         """Subscribe to published data.
 
         Creates a new queue for receiving published messages with a maximum
         size of 1024 items.
 
+        Args:
+            session_id: Optional session id under which the queue can also be
+                addressed with :meth:`publish_to`.
+
         Returns:
             asyncio.Queue[str]: A queue that will receive published data.
 
@@ -285,6 +333,9 @@ class _PubSub:
         """
         q: asyncio.Queue[str] = asyncio.Queue(maxsize=1024)
         self._subscribers.append(q)
+        if session_id is not None:
+            self._sessions[session_id] = q
+            self._queue_sessions[q] = session_id
         return q
 
     def unsubscribe(self, q: "asyncio.Queue[str]") -> None:
@@ -304,6 +355,9 @@ class _PubSub:
         """
         with suppress(ValueError):
             self._subscribers.remove(q)
+        session_id = self._queue_sessions.pop(q, None)
+        if session_id is not None and self._sessions.get(session_id) is q:
+            del self._sessions[session_id]
 
 
 # ---------------------------------------------------------------------------#
@@ -365,6 +419,22 @@ class StdIOEndpoint:
         self._proc: Optional[asyncio.subprocess.Process] = None
         self._stdin: Optional[asyncio.StreamWriter] = None
         self._pump_task: Optional[asyncio.Task[None]] = None
+        # Rewritten request id -> (session id, original request id)
+        self._pending: Dict[str, Tuple[str, Any]] = {}
+        self._id_counter = itertools.count(1)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of routed requests still waiting for a response.
+
+        Returns:
+            int: Count of pending rewritten request ids.
+
+        Examples:
+            >>> StdIOEndpoint("cat", _PubSub()).in_flight
+            0
+        """
+        return len(self._pending)
 
     async def start(self, additional_env_vars: Optional[Dict[str, str]] = None) -> None:
         """Start the stdio subprocess with custom environment variables.
@@ -484,6 +554,7 @@ class StdIOEndpoint:
                     await self._pump_task
             self._proc = None
             self._stdin = None  # Reset stdin too!
+            self._pending.clear()
 
     def is_running(self) -> bool:
         """Check if the stdio subprocess is currently running.
@@ -502,11 +573,19 @@ class StdIOEndpoint:
         """
         return self._proc is not None
 
-    async def send(self, raw: str) -> None:
+    async def send(self, raw: str, session_id: Optional[str] = None, affinity: Optional[str] = None) -> None:  # pylint: disable=unused-argument
         """Send data to the subprocess stdin.
 
+        When ``session_id`` is given, JSON-RPC request ids are rewritten to ids
+        unique to this endpoint so the response can be routed back to that
+        session only (see :meth:`_route`), even if several sessions reuse the
+        same id. Without it the data is written unchanged and every response
+        is broadcast to all subscribers.
+
         Args:
             raw: The raw data string to send to the subprocess.
+            session_id: Optional session that should receive the responses.
+            affinity: Accepted for interface parity with :class:`StdIOPool`.
 
         Raises:
             RuntimeError: If the stdio endpoint is not started.
@@ -525,10 +604,149 @@ class StdIOEndpoint:
         """
         if not self._stdin:
             raise RuntimeError("stdio endpoint not started")
+        if session_id is not None:
+            raw = self._rewrite_ids(raw, session_id)
         LOGGER.debug(f"→ stdio: {raw.strip()}")
         self._stdin.write(raw.encode())
         await self._stdin.drain()
 
+    def _rewrite_ids(self, raw: str, session_id: str) -> str:
+        """Replace request ids with endpoint-unique ids and remember their origin.
+
+        Cancellation notifications have their ``requestId`` rewritten to match.
+        Anything that is not a JSON-RPC request is returned unchanged.
+
+        Args:
+            raw: Raw JSON-RPC message or batch.
+            session_id: Session that should receive the responses.
+
+        Returns:
+            str: Message to write to the subprocess.
+
+        Examples:
+            >>> stdio = StdIOEndpoint("cat", _PubSub())
+            >>> stdio._rewrite_ids('{"jsonrpc":"2.0","id":1,"method":"ping"}\\n', "s1")
+            '{"jsonrpc":"2.0","id":"translate-1","method":"ping"}\\n'
+            >>> stdio._pending
+            {'translate-1': ('s1', 1)}
+            >>> stdio._rewrite_ids("not json", "s1")
+            'not json'
+        """
+        try:
+            payload = orjson.loads(raw)
+        except (orjson.JSONDecodeError, ValueError):
+            return raw
+
+        originals = {(sid, orig): rid for rid, (sid, orig) in self._pending.items() if sid == session_id}
+        changed = False
+        for message in payload if isinstance(payload, list) else [payload]:
+            if not isinstance(message, dict) or "method" not in message:
+                continue
+            if "id" in message and message["id"] is not None:
+                routed_id = f"{ROUTED_ID_PREFIX}{next(self._id_counter)}"
+                self._pending[routed_id] = (session_id, message["id"])
+                originals[(session_id, message["id"])] = routed_id
+                message["id"] = routed_id
+                changed = True
+            elif message["method"] == "notifications/cancelled" and isinstance(message.get("params"), dict):
+                routed_id = originals.get((session_id, message["params"].get("requestId")))
+                if routed_id is not None:
+                    message["params"]["requestId"] = routed_id
+                    self._pending.pop(routed_id, None)
+                    changed = True
+
+        if not changed:
+            return raw
+        return orjson.dumps(payload).decode() + ("\n" if raw.endswith("\n") else "")
+
+    async def _route(self, text: str) -> bool:
+        """Deliver responses to rewritten requests to their originating session.
+
+        Args:
+            text: One line of subprocess output.
+
+        Responses whose session is gone (or was released) are dropped rather
+        than broadcast, so one client never sees another client's results.
+
+        Returns:
+            bool: True if the line was fully handled, False if it should be broadcast.
+
+        Examples:
+            >>> import asyncio
+            >>> async def test_route():
+            ...     pubsub = _PubSub()
+            ...     mine, other = pubsub.subscribe("s1"), pubsub.subscribe("s2")
+            ...     stdio = StdIOEndpoint("cat", pubsub)
+            ...     stdio._rewrite_ids('{"jsonrpc":"2.0","id":7,"method":"ping"}', "s1")
+            ...     routed = await stdio._route('{"jsonrpc":"2.0","id":"translate-1","result":{}}')
+            ...     return routed, mine.get_nowait(), other.qsize(), stdio.in_flight
+            >>> asyncio.run(test_route())
+            (True, '{"jsonrpc":"2.0","id":7,"result":{}}', 0, 0)
+            >>> async def test_orphan():
+            ...     pubsub = _PubSub()
+            ...     other = pubsub.subscribe("s2")
+            ...     stdio = StdIOEndpoint("cat", pubsub)
+            ...     stdio._rewrite_ids('{"jsonrpc":"2.0","id":7,"method":"ping"}', "gone")
+            ...     routed = await stdio._route('{"jsonrpc":"2.0","id":"translate-1","result":{}}')
+            ...     late = await stdio._route('{"jsonrpc":"2.0","id":"translate-9","result":{}}')
+            ...     return routed, late, other.qsize()
+            >>> asyncio.run(test_orphan())
+            (True, True, 0)
+        """
+        try:
+            payload = orjson.loads(text)
+        except (orjson.JSONDecodeError, ValueError):
+            return False
+
+        is_batch = isinstance(payload, list)
+        by_session: Dict[str, List[Any]] = {}
+        unrouted: List[Any] = []
+        orphaned = 0
+        for message in payload if is_batch else [payload]:
+            origin = None
+            if isinstance(message, dict) and "method" not in message and ("result" in message or "error" in message) and isinstance(message.get("id"), str):
+                origin = self._pending.pop(message["id"], None)
+                if origin is None and message["id"].startswith(ROUTED_ID_PREFIX):
+                    # Answer to a released request (timed out or its session disconnected)
+                    orphaned += 1
+                    continue
+            if origin is None:
+                unrouted.append(message)
+                continue
+            session_id, original_id = origin
+            message["id"] = original_id
+            by_session.setdefault(session_id, []).append(message)
+
+        if not by_session and not orphaned:
+            return False
+
+        for session_id, messages in by_session.items():
+            data = orjson.dumps(messages if is_batch else messages[0]).decode()
+            if not await self._pubsub.publish_to(session_id, data):
+                orphaned += len(messages)
+        if orphaned:
+            LOGGER.debug(f"Dropped {orphaned} stdio response(s) for sessions that are no longer connected")
+        if unrouted:
+            await self._pubsub.publish(orjson.dumps(unrouted).decode())
+        return True
+
+    def release(self, session_id: str) -> None:
+        """Forget requests still pending for a session that went away.
+
+        Args:
+            session_id: Session that disconnected or stopped waiting.
+
+        Examples:
+            >>> stdio = StdIOEndpoint("cat", _PubSub())
+            >>> _ = stdio._rewrite_ids('{"jsonrpc":"2.0","id":1,"method":"ping"}', "s1")
+            >>> _ = stdio._rewrite_ids('{"jsonrpc":"2.0","id":1,"method":"ping"}', "s2")
+            >>> stdio.release("s1")
+            >>> stdio._pending
+            {'translate-2': ('s2', 1)}
+        """
+        for routed_id in [rid for rid, (sid, _) in self._pending.items() if sid == session_id]:
+            del self._pending[routed_id]
+
     async def _pump_stdout(self) -> None:
         """Pump stdout from subprocess to pubsub.
 
@@ -550,6 +768,8 @@ class StdIOEndpoint:
                     break
                 text = line.decode(errors="replace")
                 LOGGER.debug(f"← stdio: {text.strip()}")
+                if (self._pending or ROUTED_ID_PREFIX in text) and await self._route(text):
+                    continue
                 await self._pubsub.publish(text)
         except ConnectionResetError:  # pragma: no cover --subprocess terminated
             # Subprocess terminated abruptly - this is expected behavior
@@ -559,6 +779,156 @@ class StdIOEndpoint:
             raise
 
 
+class StdIOPool:
+    """Pool of identical stdio subprocesses behind the StdIOEndpoint interface.
+
+    Each session (or explicit affinity key such as an ``mcp-session-id``) is
+    pinned to one worker so stateful servers keep their ``initialize`` state;
+    new sessions go to the least busy worker. Keyless messages always go to the
+    first worker, so clients that never identify themselves still talk to one
+    consistent subprocess. Responses are routed back per session by the
+    workers' id rewriting.
+
+    Examples:
+        >>> pool = StdIOPool("cat", _PubSub(), size=3)
+        >>> len(pool.workers), pool.is_running()
+        (3, False)
+        >>> StdIOPool("cat", _PubSub(), size=0)
+        Traceback (most recent call last):
+        ...
+        ValueError: stdio pool size must be at least 1
+    """
+
+    def __init__(self, cmd: str, pubsub: _PubSub, size: int, env_vars: Optional[Dict[str, str]] = None, header_mappings: Optional[NormalizedMappings] = None) -> None:
+        """Create the pool; subprocesses are started by :meth:`start`.
+
+        Args:
+            cmd: The command string to execute in every worker.
+            pubsub: Shared publish-subscribe system for worker output.
+            size: Number of worker subprocesses.
+            env_vars: Optional environment variables for every worker.
+            header_mappings: Optional header to environment variable mappings.
+
+        Raises:
+            ValueError: If size is smaller than 1.
+        """
+        if size < 1:
+            raise ValueError("stdio pool size must be at least 1")
+        self.workers = [StdIOEndpoint(cmd, pubsub, env_vars=env_vars, header_mappings=header_mappings) for _ in range(size)]
+        self._affinity: "OrderedDict[str, int]" = OrderedDict()
+        self._sessions_per_worker = [0] * size
+
+    async def start(self, additional_env_vars: Optional[Dict[str, str]] = None) -> None:
+        """Start every worker subprocess.
+
+        Args:
+            additional_env_vars: Optional extra environment variables for the workers.
+        """
+        self._affinity.clear()
+        self._sessions_per_worker = [0] * len(self.workers)
+        for worker in self.workers:
+            await worker.start(additional_env_vars)
+
+    async def stop(self) -> None:
+        """Stop every worker subprocess.
+
+        Examples:
+            >>> import asyncio
+            >>> asyncio.run(StdIOPool("cat", _PubSub(), size=2).stop())
+        """
+        await asyncio.gather(*(worker.stop() for worker in self.workers))
+
+    def is_running(self) -> bool:
+        """Check if all worker subprocesses are running.
+
+        Returns:
+            True if every worker is running, False otherwise.
+        """
+        return all(worker.is_running() for worker in self.workers)
+
+    def _least_busy(self) -> int:
+        """Pick the worker with the fewest in-flight requests, then fewest sessions.
+
+        Returns:
+            int: Index of the chosen worker.
+
+        Examples:
+            >>> pool = StdIOPool("cat", _PubSub(), size=2)
+            >>> pool.workers[0]._pending["translate-1"] = ("s", 1)
+            >>> pool._least_busy()
+            1
+        """
+        return min(range(len(self.workers)), key=lambda index: (self.workers[index].in_flight, self._sessions_per_worker[index]))
+
+    def _worker_for(self, key: Optional[str]) -> StdIOEndpoint:
+        """Return the worker pinned to ``key``, assigning the least busy one if new.
+
+        Args:
+            key: Session or affinity key, or None/empty for keyless messages,
+                which always go to the first worker.
+
+        Returns:
+            StdIOEndpoint: Worker that should receive the message.
+
+        Examples:
+            >>> pool = StdIOPool("cat", _PubSub(), size=2)
+            >>> pool._worker_for("a") is pool._worker_for("a")
+            True
+            >>> pool._worker_for("b") is pool._worker_for("a")
+            False
+            >>> pool._worker_for("") is pool._worker_for(None) is pool.workers[0]
+            True
+            >>> sorted(pool._affinity)
+            ['a', 'b']
+        """
+        if not key:
+            return self.workers[0]
+
+        index = self._affinity.get(key)
+        if index is None:
+            index = self._least_busy()
+            self._affinity[key] = index
+            self._sessions_per_worker[index] += 1
+            if len(self._affinity) > STDIO_POOL_MAX_AFFINITY:
+                _, evicted = self._affinity.popitem(last=False)
+                self._sessions_per_worker[evicted] -= 1
+        else:
+            self._affinity.move_to_end(key)
+        return self.workers[index]
+
+    async def send(self, raw: str, session_id: Optional[str] = None, affinity: Optional[str] = None) -> None:
+        """Send data to the worker serving the session.
+
+        Args:
+            raw: The raw data string to send.
+            session_id: Optional session that should receive the responses.
+            affinity: Optional key pinning the message to a worker; defaults to
+                ``session_id``. An empty string sends it to the first worker
+                without pinning anything.
+        """
+        worker = self._worker_for(session_id if affinity is None else affinity)
+        await worker.send(raw, session_id=session_id)
+
+    def release(self, session_id: str) -> None:
+        """Forget a departed session's pending requests and worker pinning.
+
+        Args:
+            session_id: Session that disconnected or stopped waiting.
+
+        Examples:
+            >>> pool = StdIOPool("cat", _PubSub(), size=2)
+            >>> worker = pool._worker_for("s1")
+            >>> pool.release("s1")
+            >>> "s1" in pool._affinity, pool._sessions_per_worker
+            (False, [0, 0])
+        """
+        for worker in self.workers:
+            worker.release(session_id)
+        index = self._affinity.pop(session_id, None)
+        if index is not None:
+            self._sessions_per_worker[index] -= 1
+
+
 # ---------------------------------------------------------------------------#
 # SSE Event Parser                                                           #
 # ---------------------------------------------------------------------------#
@@ -648,7 +1018,7 @@ class SSEEvent:
 
 def _build_fastapi(
     pubsub: _PubSub,
-    stdio: StdIOEndpoint,
+    stdio: StdIOEndpoint | StdIOPool,
     keep_alive: float = KEEP_ALIVE_INTERVAL,
     sse_path: str = "/sse",
     message_path: str = "/message",
@@ -662,7 +1032,7 @@ def _build_fastapi(
 
     Args:
         pubsub: The publish/subscribe system for message routing.
-        stdio: The stdio endpoint for subprocess communication.
+        stdio: The stdio endpoint (or pool) for subprocess communication.
         keep_alive: Interval in seconds for keepalive messages. Defaults to KEEP_ALIVE_INTERVAL.
         sse_path: Path for the SSE endpoint. Defaults to "/sse".
         message_path: Path for the message endpoint. Defaults to "/message".
@@ -736,8 +1106,8 @@ def _build_fastapi(
                 await stdio.stop()  # Stop existing process
                 await stdio.start(additional_env_vars)  # Start with new env vars
 
-        queue = pubsub.subscribe()
         session_id = uuid.uuid4().hex
+        queue = pubsub.subscribe(session_id)
 
         async def event_gen() -> AsyncIterator[Dict[str, Any]]:
             """Generate Server-Sent Events for the SSE stream.
@@ -796,6 +1166,7 @@ def _build_fastapi(
             finally:
                 if pubsub:
                     pubsub.unsubscribe(queue)
+                stdio.release(session_id)
 
         return EventSourceResponse(
             event_gen(),
@@ -816,13 +1187,13 @@ def _build_fastapi(
                 a single JSON-RPC message.
             session_id (str | None): The SSE session identifier that originated
                 this back-channel call (present when the client obtained the
-                endpoint URL from an ``endpoint`` bootstrap frame).
+                endpoint URL from an ``endpoint`` bootstrap frame). Responses
+                to requests are delivered to that session only.
 
         Returns:
             Response: ``202 Accepted`` if the payload is forwarded successfully,
             or ``400 Bad Request`` when the body is not valid JSON.
         """
-        _ = session_id  # Unused but required for API compatibility
 
         # Extract environment variables from headers if dynamic env is enabled
         additional_env_vars = {}
@@ -851,7 +1222,7 @@ def _build_fastapi(
                 f"Invalid JSON payload: {exc}",
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
-        await stdio.send(payload.decode().rstrip() + "\n")
+        await stdio.send(payload.decode().rstrip() + "\n", session_id=session_id)
         return PlainTextResponse("forwarded", status_code=status.HTTP_202_ACCEPTED)
 
     # ----- Liveness ---------------------------------------------------------#
@@ -1030,6 +1401,12 @@ def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
         "--stdioCommand",
         help="Command to run when bridging SSE/streamableHttp to stdio (optional with --sse or --streamableHttp)",
     )
+    p.add_argument(
+        "--stdioWorkers",
+        type=int,
+        default=1,
+        help="Number of --stdioCommand subprocesses to run; sessions are pinned to the least busy worker (default: 1)",
+    )
 
     # Dynamic environment variable injection
     p.add_argument("--enable-dynamic-env", action="store_true", help="Enable dynamic environment variable injection from HTTP headers")
@@ -1067,6 +1444,7 @@ async def _run_stdio_to_sse(
     message_path: str = "/message",
     keep_alive: float = KEEP_ALIVE_INTERVAL,
     header_mappings: Optional[NormalizedMappings] = None,
+    stdio_workers: int = 1,
 ) -> None:
     """Run stdio to SSE bridge.
 
@@ -1083,6 +1461,7 @@ async def _run_stdio_to_sse(
         message_path: Path for the message endpoint. Defaults to "/message".
         keep_alive: Keep-alive interval in seconds. Defaults to KEEP_ALIVE_INTERVAL.
         header_mappings: Optional mapping of HTTP headers to environment variables.
+        stdio_workers: Number of subprocesses to run; more than one uses a StdIOPool.
 
     Examples:
         >>> import asyncio # doctest: +SKIP
@@ -1093,7 +1472,7 @@ async def _run_stdio_to_sse(
         True
     """
     pubsub = _PubSub()
-    stdio = StdIOEndpoint(cmd, pubsub, header_mappings=header_mappings)
+    stdio = StdIOPool(cmd, pubsub, stdio_workers, header_mappings=header_mappings) if stdio_workers > 1 else StdIOEndpoint(cmd, pubsub, header_mappings=header_mappings)
     await stdio.start()
 
     app = _build_fastapi(pubsub, stdio, keep_alive=keep_alive, sse_path=sse_path, message_path=message_path, cors_origins=cors, header_mappings=header_mappings)
@@ -1808,6 +2187,7 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
     stateless: bool = False,
     json_response: bool = False,
     header_mappings: Optional[NormalizedMappings] = None,
+    stdio_workers: int = 1,
 ) -> None:
     """Run a stdio server and expose it via multiple protocols simultaneously.
 
@@ -1825,6 +2205,7 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
         stateless: Whether to use stateless mode for streamable HTTP.
         json_response: Whether to return JSON responses for streamable HTTP.
         header_mappings: Optional mapping of HTTP headers to environment variables.
+        stdio_workers: Number of subprocesses to run; more than one uses a StdIOPool.
     """
     LOGGER.info(f"Starting multi-protocol server for command: {cmd}")
     LOGGER.info(f"Protocols: SSE={expose_sse}, StreamableHTTP={expose_streamable_http}")
@@ -1832,8 +2213,13 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
     # Create a shared pubsub whenever either protocol needs stdout observations
     pubsub = _PubSub() if (expose_sse or expose_streamable_http) else None
 
-    # Create the stdio endpoint
-    stdio = StdIOEndpoint(cmd, pubsub, header_mappings=header_mappings) if (expose_sse or expose_streamable_http) and pubsub else None
+    # Create the stdio endpoint, or a pool of them when several workers are requested
+    stdio: StdIOEndpoint | StdIOPool | None = None
+    if (expose_sse or expose_streamable_http) and pubsub:
+        if stdio_workers > 1:
+            stdio = StdIOPool(cmd, pubsub, stdio_workers, header_mappings=header_mappings)
+        else:
+            stdio = StdIOEndpoint(cmd, pubsub, header_mappings=header_mappings)
 
     # Create fastapi app and middleware
     app = FastAPI()
@@ -1880,8 +2266,8 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
                     await stdio.stop()  # Stop existing process
                     await stdio.start(additional_env_vars)  # Start with new env vars
 
-            queue = pubsub.subscribe()
             session_id = uuid.uuid4().hex
+            queue = pubsub.subscribe(session_id)
 
             async def event_gen() -> AsyncIterator[Dict[str, Any]]:
                 """Generate SSE events for the client.
@@ -1918,6 +2304,8 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
                 finally:
                     if pubsub:
                         pubsub.unsubscribe(queue)
+                    if stdio:
+                        stdio.release(session_id)
 
             return EventSourceResponse(
                 event_gen(),
@@ -1934,12 +2322,11 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
 
             Args:
                 raw: The incoming HTTP request.
-                session_id: Optional session ID for correlation.
+                session_id: Optional SSE session ID; responses are delivered to that session only.
 
             Returns:
                 Response: Acknowledgement of message receipt.
             """
-            _ = session_id
 
             # Extract environment variables from headers if dynamic env is enabled
             additional_env_vars = {}
@@ -1970,7 +2357,7 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
                 )
             if not stdio:
                 raise RuntimeError("Stdio endpoint not available")
-            await stdio.send(payload.decode().rstrip() + "\n")
+            await stdio.send(payload.decode().rstrip() + "\n", session_id=session_id)
             return PlainTextResponse("forwarded", status_code=status.HTTP_202_ACCEPTED)
 
     # Add health check
@@ -2014,6 +2401,9 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
             The request body is expected to be a JSON object or newline-delimited JSON.
             If the JSON includes an "id" field, the function attempts to match it with
             a response from stdio using a pubsub queue, within a timeout period.
+            An ``initialize`` request without an ``mcp-session-id`` header is issued a
+            new session id in the response headers; messages carrying that id stay on
+            the worker that handled the initialize.
 
             Args:
                 request (Request): The incoming FastAPI request containing the JSON payload.
@@ -2042,15 +2432,29 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
             # Forward raw newline-delimited JSON to stdio
             if not stdio:
                 raise RuntimeError("Stdio endpoint not available")
-            await stdio.send(body.decode().rstrip() + "\n")
+
+            # Every message of an MCP session goes to the same worker so a stateful server
+            # keeps its initialize state; initialize without a session id is issued one
+            session_id = request.headers.get("mcp-session-id")
+            session_headers = None
+            if not session_id and isinstance(obj, dict) and obj.get("method") == "initialize":
+                session_id = uuid.uuid4().hex
+                session_headers = {"mcp-session-id": session_id}
+            affinity = session_id or ""  # Unkeyed traffic always shares the first worker
 
             # If it's a request (has an id) -> attempt to correlate response from stdio
             if isinstance(obj, dict) and "id" in obj:
                 if not pubsub:
-                    return PlainTextResponse("accepted", status_code=status.HTTP_202_ACCEPTED)
+                    await stdio.send(body.decode().rstrip() + "\n", affinity=affinity)
+                    return PlainTextResponse("accepted", status_code=status.HTTP_202_ACCEPTED, headers=session_headers)
 
-                queue = pubsub.subscribe()
+                # Subscribe before sending so a fast response cannot be missed; the
+                # response is routed to this queue only, even if other clients reuse the id
+                route = uuid.uuid4().hex
+                queue = pubsub.subscribe(route)
                 try:
+                    # The one-off route only carries the response; the session decides the worker
+                    await stdio.send(body.decode().rstrip() + "\n", session_id=route, affinity=affinity)
                     timeout = 10.0  # seconds; tuneable
                     deadline = asyncio.get_event_loop().time() + timeout
                     while True:
@@ -2073,15 +2477,16 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
                         for candidate in candidates:
                             if isinstance(candidate, dict) and candidate.get("id") == obj.get("id"):
                                 # return the matched response as JSON
-                                return ORJSONResponse(candidate)
+                                return ORJSONResponse(candidate, headers=session_headers)
 
                     # timeout -> accept and return 202
-                    return PlainTextResponse("accepted (no response yet)", status_code=status.HTTP_202_ACCEPTED)
+                    return PlainTextResponse("accepted (no response yet)", status_code=status.HTTP_202_ACCEPTED, headers=session_headers)
                 finally:
-                    if pubsub:
-                        pubsub.unsubscribe(queue)
+                    pubsub.unsubscribe(queue)
+                    stdio.release(route)
 
             # Notification -> return 202
+            await stdio.send(body.decode().rstrip() + "\n", affinity=affinity)
             return PlainTextResponse("accepted", status_code=status.HTTP_202_ACCEPTED)
 
         # ASGI wrapper to route GET/other /mcp scopes to streamable_manager.handle_request
@@ -2435,6 +2840,7 @@ def main(argv: Optional[Sequence[str]] | None = None) -> None:
                     stateless=getattr(args, "stateless", False),
                     json_response=getattr(args, "jsonResponse", False),
                     header_mappings=header_mappings,
+                    stdio_workers=getattr(args, "stdioWorkers", 1),
                 )
             )
 
@@ -6,11 +6,21 @@ Design goals:
 - Multi-worker safe: store+evict is atomic (Lua), so concurrent writers do not corrupt meta/count.
 - Bounded memory: per-stream ring buffer with eviction.
 - Bounded index growth: event_id index entries expire with the stream TTL.
+
+Two storage modes are available:
+- ``hash`` (default): sorted set + hash + per-event index written by a Lua script.
+  Replay fetches messages with batched HMGET calls.
+- ``stream``: one Redis Stream per event stream id (XADD with approximate MAXLEN
+  trimming). Each stream gets a random nonce the first time it is written, which
+  is part of its key; the event_id embeds the stream id, nonce and entry id, so no
+  index keys are needed and event ids of other streams cannot be guessed. Store is
+  a single script call and replay is a single XRANGE.
 """
 
 # Standard
 import logging
-from typing import TYPE_CHECKING
+import secrets
+from typing import Any, List, Literal, Optional, Tuple, TYPE_CHECKING
 import uuid
 
 # Third-Party
@@ -27,6 +37,12 @@ if TYPE_CHECKING:  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
+# Max message ids fetched per HMGET during hash-mode replay
+_REPLAY_BATCH_SIZE = 500
+
+# Separator between stream id, stream nonce and Redis Stream entry id in stream-mode event ids
+_STREAM_EVENT_ID_SEP = "/"
+
 
 _STORE_EVENT_LUA = r"""
 -- KEYS:
@@ -93,21 +109,102 @@ return seq_num
 """
 
 
-class RedisEventStore(EventStore):
-    """Redis-backed event store for multi-worker Streamable HTTP."""
+_STORE_STREAM_EVENT_LUA = r"""
+-- KEYS:
+--  1) nonce_key (string: random nonce of the stream, shared by all workers)
+-- ARGV:
+--  1) nonce to use if the stream has none yet
+--  2) log_key_prefix (stream log key is log_key_prefix .. nonce .. ':log')
+--  3) message_json
+--  4) ttl_seconds
+--  5) max_events
+
+local nonce = redis.call('GET', KEYS[1])
+if not nonce then
+  nonce = ARGV[1]
+end
+local ttl = tonumber(ARGV[4])
+redis.call('SET', KEYS[1], nonce, 'EX', ttl)
+
+local log_key = ARGV[2] .. nonce .. ':log'
+local entry_id = redis.call('XADD', log_key, 'MAXLEN', '~', tonumber(ARGV[5]), '*', 'm', ARGV[3])
+redis.call('EXPIRE', log_key, ttl)
+
+return {nonce, entry_id}
+"""
+
 
-    def __init__(self, max_events_per_stream: int = 100, ttl: int = 3600, key_prefix: str = "mcpgw:eventstore"):
+def _to_str(value: Any) -> str:
+    """Decode a Redis reply value that may be bytes.
+
+    Args:
+        value: Reply value (bytes or str).
+
+    Returns:
+        String value.
+
+    Examples:
+        >>> _to_str(b"1-0")
+        '1-0'
+        >>> _to_str("1-0")
+        '1-0'
+    """
+    return value.decode("latin-1") if isinstance(value, (bytes, bytearray)) else str(value)
+
+
+def _parse_stream_entry_id(entry_id: str) -> Optional[Tuple[int, int]]:
+    """Parse a Redis Stream entry id ("<ms>-<seq>") into a comparable tuple.
+
+    Args:
+        entry_id: Stream entry id.
+
+    Returns:
+        (milliseconds, sequence) tuple, or None if malformed.
+
+    Examples:
+        >>> _parse_stream_entry_id("1700000000000-3")
+        (1700000000000, 3)
+        >>> _parse_stream_entry_id("not-an-id") is None
+        True
+    """
+    ms, _, seq = entry_id.partition("-")
+    try:
+        return int(ms), int(seq)
+    except ValueError:
+        return None
+
+
+class RedisEventStore(EventStore):
+    """Redis-backed event store for multi-worker Streamable HTTP.
+
+    Examples:
+        >>> RedisEventStore(mode="stream").mode
+        'stream'
+        >>> RedisEventStore(mode="list")
+        Traceback (most recent call last):
+        ...
+        ValueError: Unsupported event store mode: list
+    """
+
+    def __init__(self, max_events_per_stream: int = 100, ttl: int = 3600, key_prefix: str = "mcpgw:eventstore", mode: Literal["hash", "stream"] = "hash"):
         """Initialize Redis event store.
 
         Args:
             max_events_per_stream: Maximum events per stream (ring buffer size).
             ttl: Stream TTL in seconds.
             key_prefix: Redis key prefix for namespacing this store's data. Primarily useful for test isolation.
+            mode: Storage layout, ``hash`` (sorted set + hash via Lua) or ``stream`` (Redis Streams).
+
+        Raises:
+            ValueError: If mode is not supported.
         """
+        if mode not in ("hash", "stream"):
+            raise ValueError(f"Unsupported event store mode: {mode}")
         self.max_events = max_events_per_stream
         self.ttl = ttl
         self.key_prefix = key_prefix.rstrip(":")
-        logger.debug("RedisEventStore initialized: max_events=%s ttl=%ss", max_events_per_stream, ttl)
+        self.mode = mode
+        logger.debug("RedisEventStore initialized: mode=%s max_events=%s ttl=%ss", mode, max_events_per_stream, ttl)
 
     def _get_stream_meta_key(self, stream_id: str) -> str:
         """Return Redis key for stream metadata hash.
@@ -142,6 +239,33 @@ class RedisEventStore(EventStore):
         """
         return f"{self.key_prefix}:{stream_id}:messages"
 
+    def _get_stream_nonce_key(self, stream_id: str) -> str:
+        """Return Redis key holding the random nonce of a stream-mode stream.
+
+        Args:
+            stream_id: Unique stream identifier.
+
+        Returns:
+            Redis key string.
+        """
+        return f"{self.key_prefix}:{stream_id}:nonce"
+
+    def _get_stream_log_key(self, stream_id: str, nonce: str) -> str:
+        """Return Redis key for the stream-mode Redis Stream.
+
+        Args:
+            stream_id: Unique stream identifier.
+            nonce: Random nonce of the stream.
+
+        Returns:
+            Redis key string.
+
+        Examples:
+            >>> RedisEventStore(mode="stream")._get_stream_log_key("7", "ab12")
+            'mcpgw:eventstore:7:ab12:log'
+        """
+        return f"{self.key_prefix}:{stream_id}:{nonce}:log"
+
     def _event_index_prefix(self) -> str:
         """Return prefix for per-event index keys.
 
@@ -178,12 +302,15 @@ class RedisEventStore(EventStore):
         if redis is None:
             raise RuntimeError("Redis client not available - cannot store event")
 
-        event_id = str(uuid.uuid4())
-
         # Convert message to dict for serialization (Pydantic model -> dict)
         message_dict = None if message is None else (message.model_dump() if hasattr(message, "model_dump") else dict(message))
         message_json = orjson.dumps(message_dict)
 
+        if self.mode == "stream":
+            return await self._store_stream_event(redis, stream_id, message_json)
+
+        event_id = str(uuid.uuid4())
+
         meta_key = self._get_stream_meta_key(stream_id)
         events_key = self._get_stream_events_key(stream_id)
         messages_key = self._get_stream_messages_key(stream_id)
@@ -204,6 +331,32 @@ class RedisEventStore(EventStore):
 
         return event_id
 
+    async def _store_stream_event(self, redis: "Redis", stream_id: str, message_json: bytes) -> str:
+        """Append an event to the stream's Redis Stream in one round trip.
+
+        The script reuses the stream's nonce, or records a new random one when
+        the stream is written for the first time (or has expired).
+
+        Args:
+            redis: Redis client.
+            stream_id: Unique stream identifier.
+            message_json: Serialized message.
+
+        Returns:
+            Event id of the form ``<stream_id>/<nonce>/<entry_id>``.
+        """
+        nonce, entry_id = await redis.eval(
+            _STORE_STREAM_EVENT_LUA,
+            1,
+            self._get_stream_nonce_key(stream_id),
+            secrets.token_hex(16),
+            f"{self.key_prefix}:{stream_id}:",
+            message_json,
+            int(self.ttl),
+            int(self.max_events),
+        )
+        return _STREAM_EVENT_ID_SEP.join((stream_id, _to_str(nonce), _to_str(entry_id)))
+
     async def replay_events_after(self, last_event_id: str, send_callback: EventCallback) -> str | None:
         """Replay events after a specific event_id.
 
@@ -219,6 +372,9 @@ class RedisEventStore(EventStore):
             logger.debug("Redis client not available - cannot replay events")
             return None
 
+        if self.mode == "stream":
+            return await self._replay_stream_events_after(redis, last_event_id, send_callback)
+
         index_data = await redis.get(self._event_index_key(last_event_id))
         if not index_data:
             return None
@@ -247,16 +403,63 @@ class RedisEventStore(EventStore):
             if start_seq is not None and int(last_seq) < start_seq:
                 return None
 
-        event_ids = await redis.zrangebyscore(events_key, int(last_seq) + 1, "+inf")
-        for event_id_bytes in event_ids:
-            ev_id = event_id_bytes.decode("latin-1") if isinstance(event_id_bytes, (bytes, bytearray)) else str(event_id_bytes)
-            msg_json = await redis.hget(messages_key, ev_id)
+        event_ids = [_to_str(event_id) for event_id in await redis.zrangebyscore(events_key, int(last_seq) + 1, "+inf")]
+        for start in range(0, len(event_ids), _REPLAY_BATCH_SIZE):
+            for msg_json in await redis.hmget(messages_key, event_ids[start : start + _REPLAY_BATCH_SIZE]):
+                if msg_json is None:
+                    continue
+                await send_callback(self._decode_message(msg_json))
+
+        return stream_id
+
+    async def _replay_stream_events_after(self, redis: "Redis", last_event_id: str, send_callback: EventCallback) -> str | None:
+        """Replay stream-mode events after ``last_event_id`` with a single XRANGE.
+
+        Args:
+            redis: Redis client.
+            last_event_id: Event ID to replay from.
+            send_callback: Async callback to receive replayed messages.
+
+        Returns:
+            stream_id if found, None if the event id is malformed, has the wrong nonce, or was trimmed or expired.
+        """
+        prefix, _, entry_id = last_event_id.rpartition(_STREAM_EVENT_ID_SEP)
+        stream_id, _, nonce = prefix.rpartition(_STREAM_EVENT_ID_SEP)
+        if not stream_id or not nonce or _parse_stream_entry_id(entry_id) is None:
+            return None
+
+        # The nonce is part of the key, so an event id with a guessed nonce finds no stream.
+        # The range is inclusive: the first entry must be last_event_id itself,
+        # otherwise it was trimmed (or the stream expired) and replay is impossible.
+        entries: List[Tuple[Any, Any]] = await redis.xrange(self._get_stream_log_key(stream_id, nonce), min=entry_id, max="+")
+        if not entries or _to_str(entries[0][0]) != entry_id:
+            return None
+
+        for _, fields in entries[1:]:
+            msg_json = fields.get("m", fields.get(b"m"))
             if msg_json is None:
                 continue
-            try:
-                msg = orjson.loads(msg_json)
-            except Exception:
-                msg = None
-            await send_callback(msg)
+            await send_callback(self._decode_message(msg_json))
 
         return stream_id
+
+    @staticmethod
+    def _decode_message(msg_json: Any) -> Any:
+        """Deserialize a stored message, mapping corrupt payloads to None.
+
+        Args:
+            msg_json: Stored JSON payload.
+
+        Returns:
+            Decoded message, or None if it cannot be parsed.
+
+        Examples:
+            >>> RedisEventStore._decode_message(b'{"id": 1}')
+            {'id': 1}
+            >>> RedisEventStore._decode_message(b"{") is None
+            True
+        """
+        try:
+            return orjson.loads(msg_json)
+        except Exception:
+            return None
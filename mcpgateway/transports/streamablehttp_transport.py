@@ -1255,7 +1255,11 @@ class SessionManagerWrapper:
         if settings.use_stateful_sessions:
             # Use Redis event store for single-worker stateful deployments
             if settings.cache_type == "redis" and settings.redis_url:
-                event_store = RedisEventStore(max_events_per_stream=settings.streamable_http_max_events_per_stream, ttl=settings.streamable_http_event_ttl)
+                event_store = RedisEventStore(
+                    max_events_per_stream=settings.streamable_http_max_events_per_stream,
+                    ttl=settings.streamable_http_event_ttl,
+                    mode=settings.streamable_http_event_store_mode,
+                )
                 logger.debug("Using RedisEventStore for stateful sessions (single-worker)")
             else:
                 # Fall back to in-memory for single-worker or when Redis not available
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""Content hashes for federated tool, resource and prompt catalogs.
+
+Location: ./mcpgateway/utils/catalog_hash.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Each entity discovered from an upstream gateway gets a hash over exactly the
+fields that GatewayService copies into its database row, including the
+gateway fields that are denormalized onto the row (URL, auth, visibility).
+Per-gateway digests over those hashes let a refresh detect an unchanged
+catalog without loading or comparing any rows.
+
+Examples:
+    >>> from types import SimpleNamespace
+    >>> gw = SimpleNamespace(url="http://gw", auth_type=None, auth_value=None, visibility="public")
+    >>> p1 = SimpleNamespace(name="p", description="d", template="hi")
+    >>> p2 = SimpleNamespace(name="p", description="d", template="hello")
+    >>> prompt_content_hash(p1, gw) == prompt_content_hash(p1, gw)
+    True
+    >>> prompt_content_hash(p1, gw) == prompt_content_hash(p2, gw)
+    False
+    >>> catalog_digest([("b", "2"), ("a", "1")]) == catalog_digest([("a", "1"), ("b", "2")])
+    True
+"""
+
+# Standard
+import hashlib
+from typing import Any, Iterable, Tuple
+
+# Third-Party
+import orjson
+
+
+def _hash(payload: Any) -> str:
+    """Return a stable SHA-256 hex digest of a JSON-serializable payload.
+
+    Args:
+        payload: Value to hash; dict keys are sorted and unknown types stringified.
+
+    Returns:
+        Hex digest.
+    """
+    return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)).hexdigest()
+
+
+def tool_content_hash(tool: Any, gateway: Any) -> str:
+    """Hash the fields of an upstream tool that are synced into its row.
+
+    Args:
+        tool: Tool definition from the upstream server.
+        gateway: Gateway the tool belongs to.
+
+    Returns:
+        Hex digest.
+    """
+    return _hash(
+        [
+            "tool",
+            tool.name,
+            tool.description,
+            tool.request_type,
+            tool.headers,
+            tool.input_schema,
+            tool.output_schema,
+            tool.jsonpath_filter,
+            gateway.url,
+            gateway.auth_type,
+            gateway.auth_value,
+            gateway.visibility,
+        ]
+    )
+
+
+def resource_content_hash(resource: Any, gateway: Any) -> str:
+    """Hash the fields of an upstream resource that are synced into its row.
+
+    Args:
+        resource: Resource definition from the upstream server.
+        gateway: Gateway the resource belongs to.
+
+    Returns:
+        Hex digest.
+    """
+    return _hash(["resource", resource.uri, resource.name, resource.description, resource.mime_type, resource.uri_template, gateway.visibility])
+
+
+def prompt_content_hash(prompt: Any, gateway: Any) -> str:
+    """Hash the fields of an upstream prompt that are synced into its row.
+
+    Args:
+        prompt: Prompt definition from the upstream server.
+        gateway: Gateway the prompt belongs to.
+
+    Returns:
+        Hex digest.
+    """
+    return _hash(["prompt", prompt.name, prompt.description, getattr(prompt, "template", ""), gateway.visibility])
+
+
+def catalog_digest(entries: Iterable[Tuple[str, str]]) -> str:
+    """Combine (key, content hash) pairs into one order-independent digest.
+
+    Args:
+        entries: Pairs of entity key (name or URI) and content hash.
+
+    Returns:
+        Hex digest.
+    """
+    return _hash(sorted(entries))
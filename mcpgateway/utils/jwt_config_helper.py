@@ -205,3 +205,9 @@ def clear_jwt_caches() -> None:
     get_jwt_public_key_or_secret.cache_clear()
     get_jwt_private_key_or_secret.cache_clear()
     _key_file_cache.clear()
+
+    # Payloads verified with the previous keys must be re-verified
+    # First-Party
+    from mcpgateway.cache.auth_cache import get_auth_cache  # pylint: disable=import-outside-toplevel
+
+    get_auth_cache().invalidate_verified_tokens()
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/utils/percentile_sketch.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Mergeable percentile sketch for response-time rollups.
+
+A compact DDSketch: values are counted in logarithmic buckets whose width
+guarantees a relative error of at most ``relative_accuracy`` for every
+quantile. Sketches with the same accuracy merge by adding bucket counts, so
+percentiles over any range of hourly rollups can be answered from the stored
+sketches without reading raw metrics.
+
+Examples:
+    >>> sketch = PercentileSketch()
+    >>> for value in range(1, 101):
+    ...     sketch.add(value / 100)
+    >>> abs(sketch.quantile(0.5) - 0.5) <= 0.5 * sketch.relative_accuracy
+    True
+    >>> restored = PercentileSketch.from_dict(sketch.to_dict())
+    >>> restored.count, restored.quantile(0.99) == sketch.quantile(0.99)
+    (100, True)
+"""
+
+# Standard
+import math
+from typing import Any, Dict, Iterable, Optional
+
+# Values at or below this are counted in the zero bucket
+MIN_INDEXABLE_VALUE = 1e-9
+
+
+class PercentileSketch:
+    """DDSketch with a bounded number of logarithmic buckets.
+
+    Attributes:
+        relative_accuracy: Maximum relative error of any returned quantile.
+        max_buckets: Bucket budget; the lowest buckets are collapsed beyond it.
+        count: Number of values added.
+        total: Sum of values added.
+        min_value: Smallest value added, or None when empty.
+        max_value: Largest value added, or None when empty.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        """Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of returned quantiles (0 < a < 1).
+            max_buckets: Maximum number of non-empty buckets kept.
+
+        Raises:
+            ValueError: If relative_accuracy is outside (0, 1).
+
+        Examples:
+            >>> PercentileSketch(relative_accuracy=0)
+            Traceback (most recent call last):
+            ...
+            ValueError: relative_accuracy must be between 0 and 1
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._multiplier = 1 / math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min_value: Optional[float] = None
+        self.max_value: Optional[float] = None
+
+    def add(self, value: float, weight: int = 1) -> None:
+        """Add a value to the sketch.
+
+        Args:
+            value: Value to record; negative values are counted as zero.
+            weight: Number of occurrences of the value.
+
+        Examples:
+            >>> sketch = PercentileSketch()
+            >>> sketch.add(0.25, weight=3)
+            >>> sketch.count, sketch.min_value, sketch.max_value
+            (3, 0.25, 0.25)
+        """
+        if value <= MIN_INDEXABLE_VALUE:
+            self._zero_count += weight
+        else:
+            key = math.ceil(math.log(value) * self._multiplier)
+            self._buckets[key] = self._buckets.get(key, 0) + weight
+            if len(self._buckets) > self.max_buckets:
+                self._collapse()
+        self.count += weight
+        self.total += value * weight
+        self.min_value = value if self.min_value is None else min(self.min_value, value)
+        self.max_value = value if self.max_value is None else max(self.max_value, value)
+
+    def update(self, values: Iterable[float]) -> "PercentileSketch":
+        """Add every non-null value from an iterable.
+
+        Args:
+            values: Values to record; None entries are skipped.
+
+        Returns:
+            PercentileSketch: This sketch, for chaining.
+
+        Examples:
+            >>> PercentileSketch().update([0.1, None, 0.3]).count
+            2
+        """
+        for value in values:
+            if value is not None:
+                self.add(value)
+        return self
+
+    def merge(self, other: "PercentileSketch") -> "PercentileSketch":
+        """Merge another sketch into this one.
+
+        Args:
+            other: Sketch built with the same relative accuracy.
+
+        Returns:
+            PercentileSketch: This sketch, for chaining.
+
+        Raises:
+            ValueError: If the sketches use different relative accuracies.
+
+        Examples:
+            >>> a = PercentileSketch().update([0.1, 0.2])
+            >>> b = PercentileSketch().update([0.3])
+            >>> a.merge(b).count, a.max_value
+            (3, 0.3)
+            >>> a.merge(PercentileSketch(relative_accuracy=0.05))
+            Traceback (most recent call last):
+            ...
+            ValueError: Cannot merge sketches with different relative accuracy
+        """
+        if not math.isclose(other.relative_accuracy, self.relative_accuracy):
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        if other.count == 0:
+            return self
+
+        for key, bucket_count in other._buckets.items():  # pylint: disable=protected-access
+            self._buckets[key] = self._buckets.get(key, 0) + bucket_count
+        if len(self._buckets) > self.max_buckets:
+            self._collapse()
+        self._zero_count += other._zero_count  # pylint: disable=protected-access
+        self.count += other.count
+        self.total += other.total
+        self.min_value = other.min_value if self.min_value is None else min(self.min_value, other.min_value)
+        self.max_value = other.max_value if self.max_value is None else max(self.max_value, other.max_value)
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the approximate value at quantile ``q``.
+
+        Args:
+            q: Quantile between 0 and 1 (e.g. 0.95 for p95).
+
+        Returns:
+            Optional[float]: Approximate quantile value, or None when the sketch is empty.
+
+        Examples:
+            >>> PercentileSketch().quantile(0.5) is None
+            True
+            >>> PercentileSketch().update([2.0]).quantile(0.99)
+            2.0
+        """
+        if self.count == 0:
+            return None
+        if q <= 0:
+            return self.min_value
+        if q >= 1:
+            return self.max_value
+
+        rank = q * (self.count - 1)
+        seen = self._zero_count
+        if seen > rank:
+            return max(self.min_value, 0.0)
+
+        value = self.max_value
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if seen > rank:
+                value = 2 * self._gamma**key / (self._gamma + 1)
+                break
+        return min(max(value, self.min_value), self.max_value)
+
+    def mean(self) -> Optional[float]:
+        """Return the exact mean of the added values.
+
+        Returns:
+            Optional[float]: Mean value, or None when the sketch is empty.
+
+        Examples:
+            >>> PercentileSketch().update([1.0, 3.0]).mean()
+            2.0
+        """
+        return self.total / self.count if self.count else None
+
+    def _collapse(self) -> None:
+        """Fold the lowest buckets together so at most ``max_buckets`` remain.
+
+        Low quantiles lose accuracy first, which keeps p50/p95/p99 exact to the
+        configured relative error.
+        """
+        keys = sorted(self._buckets)
+        excess = keys[: len(keys) - self.max_buckets + 1]
+        folded = sum(self._buckets.pop(key) for key in excess)
+        target = excess[-1]
+        self._buckets[target] = folded
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the sketch into a compact JSON-compatible dictionary.
+
+        Buckets are stored densely as counts starting from ``offset``.
+
+        Returns:
+            Dict[str, Any]: Serialized sketch.
+
+        Examples:
+            >>> data = PercentileSketch(relative_accuracy=0.5).update([0, 1.0, 1.0]).to_dict()
+            >>> data["zero_count"], data["offset"], data["counts"]
+            (1, 0, [2])
+        """
+        offset = min(self._buckets) if self._buckets else 0
+        counts = [0] * (max(self._buckets) - offset + 1) if self._buckets else []
+        for key, bucket_count in self._buckets.items():
+            counts[key - offset] = bucket_count
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "zero_count": self._zero_count,
+            "offset": offset,
+            "counts": counts,
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min_value,
+            "max": self.max_value,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PercentileSketch":
+        """Restore a sketch produced by :meth:`to_dict`.
+
+        Args:
+            data: Serialized sketch.
+
+        Returns:
+            PercentileSketch: Restored sketch.
+
+        Examples:
+            >>> PercentileSketch.from_dict(PercentileSketch().update([0.5]).to_dict()).max_value
+            0.5
+        """
+        sketch = cls(relative_accuracy=data["relative_accuracy"])
+        offset = data.get("offset", 0)
+        sketch._buckets = {offset + index: bucket_count for index, bucket_count in enumerate(data.get("counts", [])) if bucket_count}  # pylint: disable=protected-access
+        sketch._zero_count = data.get("zero_count", 0)  # pylint: disable=protected-access
+        sketch.count = data.get("count", 0)
+        sketch.total = data.get("sum", 0.0)
+        sketch.min_value = data.get("min")
+        sketch.max_value = data.get("max")
+        return sketch
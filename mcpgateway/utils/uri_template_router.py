@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/utils/uri_template_router.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Indexed router for resource URI templates.
+
+Resource template reads used to scan every known template and test each one
+against the requested URI. This module indexes templates by their literal
+prefix (the text before the first ``{expression}``) in a character trie, so a
+lookup only evaluates the templates whose prefix the URI actually starts with.
+Each template is compiled once into a regex with named groups, which means the
+matching route and its extracted parameters come back from a single match.
+
+Routes also carry the template's enabled state so callers can reject inactive
+templates without another database round-trip.
+
+Examples:
+    >>> router = UriTemplateRouter()
+    >>> router.add("1", "users-template", "users://{user_id}/profile")
+    >>> router.add("2", "files-template", "files://root/{path*}", enabled=False)
+    >>> route, params = router.match("users://42/profile")
+    >>> route.template, params
+    ('users-template', {'user_id': '42'})
+    >>> route, params = router.match("files://root/a/b.txt")
+    >>> route.enabled, params
+    (False, {'path': 'a/b.txt'})
+    >>> router.match("other://42") is None
+    True
+"""
+
+# Standard
+from dataclasses import dataclass
+from functools import lru_cache
+import re
+import threading
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+
+_QUERY_EXPRESSION = re.compile(r"\{\?[^}]+\}")
+_EXPRESSION = re.compile(r"(\{[^}]+\})")
+
+
+@lru_cache(maxsize=1024)
+def compile_uri_template(template: str) -> re.Pattern:
+    """Convert a URI template into a compiled path-matching regex.
+
+    ``{var}`` matches a single segment, ``{var*}`` matches one or more segments
+    (including ``/``) and ``{?var1,var2}`` query expressions are ignored.
+
+    Args:
+        template: URI template string.
+
+    Returns:
+        Compiled pattern with one named group per template variable.
+
+    Examples:
+        >>> compile_uri_template("files://root/{path*}/meta/{id}{?expand}").pattern
+        '^files://root/(?P<path>.+)/meta/(?P<id>[^/]+)$'
+    """
+    parts = _EXPRESSION.split(_QUERY_EXPRESSION.sub("", template))
+    pattern = ""
+    for part in parts:
+        if part.startswith("{") and part.endswith("}"):
+            name = part[1:-1]
+            if name.endswith("*"):
+                pattern += f"(?P<{name[:-1]}>.+)"
+            else:
+                pattern += f"(?P<{name}>[^/]+)"
+        else:
+            pattern += re.escape(part)
+    return re.compile(f"^{pattern}$")
+
+
+def literal_prefix(template: str) -> str:
+    """Return the literal text of a template before its first expression.
+
+    Args:
+        template: URI template string.
+
+    Returns:
+        Literal prefix (the whole template when it has no expressions).
+
+    Examples:
+        >>> literal_prefix("db://tables/{name}/rows")
+        'db://tables/'
+        >>> literal_prefix("static://readme")
+        'static://readme'
+    """
+    return template.split("{", 1)[0]
+
+
+@dataclass(frozen=True)
+class TemplateRoute:
+    """A template registered in the router.
+
+    Attributes:
+        key: Unique route key (the template's resource id).
+        template: Object returned to callers on a match.
+        uri_template: Raw URI template string.
+        pattern: Compiled regex for the template path.
+        prefix: Literal prefix used for trie placement.
+        enabled: Whether the underlying template is active.
+        version: Opaque value used to detect changed templates during refresh.
+    """
+
+    key: str
+    template: Any
+    uri_template: str
+    pattern: re.Pattern
+    prefix: str
+    enabled: bool = True
+    version: Hashable = None
+
+
+class _TrieNode:
+    """Character trie node holding the routes whose prefix ends here."""
+
+    __slots__ = ("children", "routes")
+
+    def __init__(self) -> None:
+        """Create an empty node."""
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.routes: Tuple[TemplateRoute, ...] = ()
+
+
+class UriTemplateRouter:
+    """Prefix-trie index of URI templates.
+
+    Writers take a lock; node route tuples are replaced rather than mutated so
+    concurrent lookups always see a consistent view. ``stale`` is set by
+    invalidation listeners and tells the owner to refresh before the next
+    lookup.
+
+    Examples:
+        >>> router = UriTemplateRouter()
+        >>> router.stale
+        True
+        >>> router.add("a", "A", "res://{id}")
+        >>> router.add("b", "B", "res://special/{id}")
+        >>> router.match("res://special/7")[0].key  # longest literal prefix wins
+        'b'
+        >>> router.remove("b")
+        True
+        >>> router.match("res://special/7") is None  # "{id}" does not span "/"
+        True
+        >>> len(router), router.version("a")
+        (1, None)
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty router."""
+        self._root = _TrieNode()
+        self._routes: Dict[str, TemplateRoute] = {}
+        self._lock = threading.Lock()
+        self.stale = True
+
+    def __len__(self) -> int:
+        """Return the number of registered routes.
+
+        Returns:
+            Route count.
+        """
+        return len(self._routes)
+
+    def keys(self) -> Set[str]:
+        """Return the keys of all registered routes.
+
+        Returns:
+            Set of route keys.
+        """
+        return set(self._routes)
+
+    def version(self, key: str) -> Hashable:
+        """Return the version stored for a route.
+
+        Args:
+            key: Route key.
+
+        Returns:
+            Stored version, or None when the route is unknown.
+        """
+        route = self._routes.get(key)
+        return route.version if route else None
+
+    def mark_stale(self) -> None:
+        """Flag the index for refresh on the next lookup."""
+        self.stale = True
+
+    def add(self, key: str, template: Any, uri_template: str, enabled: bool = True, version: Hashable = None) -> None:
+        """Register or replace a route.
+
+        Args:
+            key: Unique route key.
+            template: Object returned on a match.
+            uri_template: URI template string.
+            enabled: Whether the template is active.
+            version: Opaque change-detection value.
+        """
+        prefix = literal_prefix(uri_template)
+        route = TemplateRoute(key=key, template=template, uri_template=uri_template, pattern=compile_uri_template(uri_template), prefix=prefix, enabled=enabled, version=version)
+        with self._lock:
+            self._unlink(key)
+            node = self._root
+            for char in prefix:
+                child = node.children.get(char)
+                if child is None:
+                    child = _TrieNode()
+                    node.children[char] = child
+                node = child
+            node.routes = node.routes + (route,)
+            self._routes[key] = route
+
+    def remove(self, key: str) -> bool:
+        """Remove a route.
+
+        Args:
+            key: Route key.
+
+        Returns:
+            True if a route was removed.
+        """
+        with self._lock:
+            return self._unlink(key)
+
+    def clear(self) -> None:
+        """Remove all routes and mark the index stale."""
+        with self._lock:
+            self._root = _TrieNode()
+            self._routes = {}
+            self.stale = True
+
+    def match(self, uri: str) -> Optional[Tuple[TemplateRoute, Dict[str, str]]]:
+        """Find the route for a URI and extract its parameters.
+
+        Candidates are the routes whose literal prefix the URI path starts
+        with, tried longest prefix first and in registration order within a
+        prefix. Enabled routes take precedence over disabled ones so that an
+        inactive template never shadows an active one.
+
+        Args:
+            uri: Concrete resource URI (a query string is ignored).
+
+        Returns:
+            Tuple of (route, params), or None when no template matches.
+        """
+        path = uri.partition("?")[0]
+        levels: List[Tuple[TemplateRoute, ...]] = []
+        node = self._root
+        if node.routes:
+            levels.append(node.routes)
+        for char in path:
+            node = node.children.get(char)
+            if node is None:
+                break
+            if node.routes:
+                levels.append(node.routes)
+
+        disabled: Optional[Tuple[TemplateRoute, Dict[str, str]]] = None
+        for routes in reversed(levels):
+            for route in routes:
+                found = route.pattern.match(path)
+                if found is None:
+                    continue
+                if route.enabled:
+                    return route, found.groupdict()
+                if disabled is None:
+                    disabled = (route, found.groupdict())
+        return disabled
+
+    def _unlink(self, key: str) -> bool:
+        """Detach a route from the trie; caller must hold the lock.
+
+        Args:
+            key: Route key.
+
+        Returns:
+            True if the route existed.
+        """
+        route = self._routes.pop(key, None)
+        if route is None:
+            return False
+        node = self._root
+        for char in route.prefix:
+            node = node.children[char]
+        node.routes = tuple(r for r in node.routes if r.key != key)
+        return True
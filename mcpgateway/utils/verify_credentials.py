@@ -53,6 +53,7 @@ Examples:
 # Standard
 from base64 import b64decode
 import binascii
+import hashlib
 from typing import Optional
 
 # Third-Party
@@ -62,9 +63,10 @@ from fastapi.security.utils import get_authorization_scheme_param
 import jwt
 
 # First-Party
+from mcpgateway.cache.auth_cache import get_auth_cache
 from mcpgateway.config import settings
 from mcpgateway.services.logging_service import LoggingService
-from mcpgateway.utils.jwt_config_helper import validate_jwt_algo_and_keys
+from mcpgateway.utils.jwt_config_helper import get_jwt_public_key_or_secret, validate_jwt_algo_and_keys
 
 basic_security = HTTPBasic(auto_error=False)
 security = HTTPBearer(auto_error=False)
@@ -172,12 +174,37 @@ async def verify_jwt_token(token: str) -> dict:
         )
 
 
+def _verification_fingerprint() -> tuple:
+    """Return the settings a verified payload depends on.
+
+    A cached payload is only reused while these are unchanged, so toggling
+    audience/issuer checks or rotating keys forces re-verification.
+
+    Returns:
+        tuple: Verification key and claim-validation settings
+    """
+    return (
+        get_jwt_public_key_or_secret(),
+        settings.jwt_algorithm,
+        settings.jwt_audience_verification,
+        settings.jwt_audience,
+        settings.jwt_issuer_verification,
+        settings.jwt_issuer,
+        settings.require_token_expiration,
+        settings.require_jti,
+        settings.validate_token_environment,
+        settings.environment,
+    )
+
+
 async def verify_jwt_token_cached(token: str, request: Optional[Request] = None) -> dict:
-    """Verify JWT token with request-level caching.
+    """Verify JWT token with request-level and process-level caching.
 
     If a request object is provided and the token has already been verified
-    for this request, returns the cached payload. Otherwise, performs
-    verification and caches the result in request.state.
+    for this request, returns the cached payload. Otherwise the process-wide
+    verified-token cache (keyed by token hash, entries expire with the token
+    and are dropped once its JTI is revoked) is consulted before performing
+    signature and claim verification. The result is cached in request.state.
 
     Args:
         token: JWT token string to verify
@@ -199,8 +226,20 @@ async def verify_jwt_token_cached(token: str, request: Optional[Request] = None)
             if cached_token == token:
                 return cached_payload
 
-    # Verify token (single decode)
-    payload = await verify_jwt_token(token)
+    token_hash = hashlib.sha256(token.encode()).hexdigest()
+    verified_cache = get_auth_cache()
+    try:
+        fingerprint = _verification_fingerprint()
+    except Exception:
+        # Invalid key configuration: let verify_jwt_token raise the proper error
+        fingerprint = None
+    payload = verified_cache.get_verified_token(token_hash, fingerprint) if fingerprint is not None else None
+
+    if payload is None:
+        # Verify token (single decode)
+        payload = await verify_jwt_token(token)
+        if fingerprint is not None:
+            verified_cache.set_verified_token(token_hash, fingerprint, payload)
 
     # Cache in request.state for reuse across middleware
     if request is not None and hasattr(request, "state"):
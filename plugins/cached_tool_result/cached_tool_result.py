@@ -5,17 +5,21 @@ SPDX-License-Identifier: Apache-2.0
 Authors: Mihai Criveti
 
 Cached Tool Result Plugin.
-Stores idempotent tool results in an in-memory cache keyed by tool name and
-selected argument fields. Reads are advisory (metadata) due to framework
-constraints; writes occur in tool_post_invoke.
+Stores idempotent tool results in a bounded LRU cache keyed by tool name and
+selected argument fields, optionally backed by Redis so hits are shared across
+workers. On a hit, tool_pre_invoke returns the cached result in the payload and
+the gateway skips the upstream call; writes occur in tool_post_invoke.
 """
 
 # Future
 from __future__ import annotations
 
 # Standard
+from collections import OrderedDict
 from dataclasses import dataclass
 import hashlib
+import logging
+import threading
 import time
 from typing import Any, Dict, List, Optional
 
@@ -34,6 +38,8 @@ from mcpgateway.plugins.framework import (
     ToolPreInvokeResult,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class CacheConfig(BaseModel):
     """Configuration for cached tool result plugin.
@@ -42,41 +48,180 @@ class CacheConfig(BaseModel):
         cacheable_tools: List of tool names that should be cached.
         ttl: Time-to-live in seconds for cached results.
         key_fields: Optional mapping of tool names to specific argument fields to use for cache keys.
+        max_entries: Maximum number of results kept in the in-process LRU.
+        max_bytes: Maximum total serialized size of results kept in the in-process LRU.
+        max_entry_bytes: Results larger than this are never cached.
+        redis_enabled: Share cached results across workers through Redis (requires CACHE_TYPE=redis).
+        redis_prefix: Key prefix for results stored in Redis.
     """
 
     cacheable_tools: List[str] = Field(default_factory=list)
     ttl: int = 300
     key_fields: Optional[Dict[str, List[str]]] = None  # {tool: [fields...]}
+    max_entries: int = Field(default=1000, ge=1)
+    max_bytes: int = Field(default=16 * 1024 * 1024, ge=1)
+    max_entry_bytes: int = Field(default=1024 * 1024, ge=1)
+    redis_enabled: bool = False
+    redis_prefix: str = "mcpgw:tool_result:"
 
 
 @dataclass
 class _Entry:
-    """Cache entry containing a value and expiration timestamp.
+    """Cache entry containing a serialized value and expiration timestamp.
 
     Attributes:
-        value: Cached tool result.
+        data: Cached tool result serialized with orjson.
         expires_at: Unix timestamp when the cached value expires.
     """
 
-    value: Any
+    data: bytes
     expires_at: float
 
 
-_CACHE: Dict[str, _Entry] = {}
+class _LRUCache:
+    """Thread-safe LRU of serialized results bounded by entry count and total bytes.
+
+    Examples:
+        >>> cache = _LRUCache(max_entries=2, max_bytes=1024)
+        >>> cache.set("a", b"1", ttl=60); cache.set("b", b"2", ttl=60)
+        >>> cache.get("a")
+        b'1'
+        >>> cache.set("c", b"3", ttl=60)  # evicts "b", the least recently used
+        >>> cache.get("b") is None, len(cache)
+        (True, 2)
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries.
+            max_bytes: Maximum total size of cached values in bytes.
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries.
+
+        Returns:
+            Number of entries currently held.
+        """
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Total serialized size of cached values.
+
+        Returns:
+            Size in bytes.
+        """
+        return self._bytes
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return a live cached value and mark it most recently used.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Serialized value, or None when missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.time():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry.data
+
+    def set(self, key: str, data: bytes, ttl: int) -> None:
+        """Store a value, evicting least recently used entries to stay within bounds.
+
+        Args:
+            key: Cache key.
+            data: Serialized value.
+            ttl: Time-to-live in seconds.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = _Entry(data=data, expires_at=time.time() + ttl)
+            self._bytes += len(data)
+            while self._entries and (len(self._entries) > self._max_entries or self._bytes > self._max_bytes):
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
 
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
 
-def _make_key(tool: str, args: dict | None, fields: Optional[List[str]]) -> str:
-    """Generate a cache key hash from tool name and selected argument fields.
+    def _drop(self, key: str) -> None:
+        """Remove an entry; caller must hold the lock.
+
+        Args:
+            key: Cache key.
+        """
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.data)
+
+
+def _caller_scope(context: Optional[PluginContext]) -> Dict[str, Any]:
+    """Extract the caller identity that a cached result must be scoped to.
+
+    Args:
+        context: Plugin execution context.
+
+    Returns:
+        Dict with user, tenant_id and server_id (None when unknown).
+
+    Examples:
+        >>> from mcpgateway.plugins.framework import GlobalContext
+        >>> ctx = PluginContext(global_context=GlobalContext(request_id="r", user={"email": "a@x", "is_admin": False}, tenant_id="t1"))
+        >>> _caller_scope(ctx)
+        {'user': 'a@x', 'tenant_id': 't1', 'server_id': None}
+        >>> _caller_scope(None)
+        {'user': None, 'tenant_id': None, 'server_id': None}
+    """
+    gctx = context.global_context if context else None
+    if gctx is None:
+        return {"user": None, "tenant_id": None, "server_id": None}
+    user = gctx.user
+    if isinstance(user, dict):
+        user = user.get("email") or user.get("id") or user.get("sub") or orjson.dumps(user, default=str, option=orjson.OPT_SORT_KEYS).decode()
+    return {"user": user, "tenant_id": gctx.tenant_id, "server_id": gctx.server_id}
+
+
+def _make_key(tool: str, args: dict | None, fields: Optional[List[str]], scope: Optional[Dict[str, Any]] = None) -> str:
+    """Generate a cache key hash from tool name, selected argument fields and caller scope.
 
     Args:
         tool: Tool name.
         args: Tool arguments dictionary.
         fields: Optional list of specific argument fields to include in the key.
+        scope: Caller identity (user, tenant_id, server_id) the result is cached for.
 
     Returns:
         SHA256 hex digest cache key.
+
+    Examples:
+        >>> _make_key("t", {"a": 1, "b": 2}, None) == _make_key("t", {"b": 2, "a": 1}, None)
+        True
+        >>> _make_key("t", {"a": 1, "b": 2}, ["a"]) == _make_key("t", {"a": 1, "b": 3}, ["a"])
+        True
+        >>> _make_key("t", {"a": 1}, None, {"user": "alice"}) == _make_key("t", {"a": 1}, None, {"user": "bob"})
+        False
     """
-    base = {"tool": tool, "args": {}}
+    base = {"tool": tool, "args": {}, "scope": scope or {}}
     if args:
         if fields:
             base["args"] = {k: args.get(k) for k in fields}
@@ -87,7 +232,7 @@ def _make_key(tool: str, args: dict | None, fields: Optional[List[str]]) -> str:
 
 
 class CachedToolResultPlugin(Plugin):
-    """Cache idempotent tool results (write-through)."""
+    """Cache idempotent tool results and serve hits without calling the upstream tool."""
 
     def __init__(self, config: PluginConfig) -> None:
         """Initialize the cached tool result plugin.
@@ -97,31 +242,89 @@ class CachedToolResultPlugin(Plugin):
         """
         super().__init__(config)
         self._cfg = CacheConfig(**(config.config or {}))
+        self._cacheable = frozenset(self._cfg.cacheable_tools)
+        self._cache = _LRUCache(self._cfg.max_entries, self._cfg.max_bytes)
+        self._hits = 0
+        self._misses = 0
+
+    async def _get_redis_client(self):
+        """Return the shared Redis client when the Redis tier is enabled.
+
+        Returns:
+            Redis client or None if disabled or unavailable.
+        """
+        if not self._cfg.redis_enabled:
+            return None
+        try:
+            # First-Party
+            from mcpgateway.utils.redis_client import get_redis_client  # pylint: disable=import-outside-toplevel
+
+            return await get_redis_client()
+        except Exception as e:
+            logger.debug(f"CachedToolResultPlugin: Redis unavailable: {e}")
+            return None
+
+    async def _lookup(self, key: str) -> Optional[bytes]:
+        """Look up a serialized result in L1, then in Redis.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Serialized result or None on miss.
+        """
+        data = self._cache.get(key)
+        if data is not None:
+            return data
+        redis = await self._get_redis_client()
+        if not redis:
+            return None
+        try:
+            data = await redis.get(self._cfg.redis_prefix + key)
+        except Exception as e:
+            logger.debug(f"CachedToolResultPlugin: Redis get failed: {e}")
+            return None
+        if data is None:
+            return None
+        if isinstance(data, str):
+            data = data.encode()
+        ttl = max(1, int(self._cfg.ttl))
+        try:
+            remaining = await redis.ttl(self._cfg.redis_prefix + key)
+            if isinstance(remaining, int) and remaining > 0:
+                ttl = remaining
+        except Exception:  # nosec B110 - fall back to the configured TTL
+            pass
+        self._cache.set(key, data, ttl)
+        return data
 
     async def tool_pre_invoke(self, payload: ToolPreInvokePayload, context: PluginContext) -> ToolPreInvokeResult:
-        """Check cache before tool invocation and store cache key in context.
+        """Check the cache before tool invocation and return the cached result on a hit.
 
         Args:
             payload: Tool invocation payload.
             context: Plugin execution context.
 
         Returns:
-            Result with cache hit/miss metadata.
+            Result with cache hit/miss metadata; on a hit the modified payload carries the cached result.
         """
         tool = payload.name
-        if tool not in self._cfg.cacheable_tools:
+        if tool not in self._cacheable:
             return ToolPreInvokeResult(continue_processing=True)
         fields = (self._cfg.key_fields or {}).get(tool)
-        key = _make_key(tool, payload.args or {}, fields)
+        key = _make_key(tool, payload.args or {}, fields, _caller_scope(context))
         # Persist key for post-invoke
         context.set_state("cache_key", key)
         context.set_state("cache_tool", tool)
-        ent = _CACHE.get(key)
-        now = time.time()
-        if ent and ent.expires_at > now:
-            # Advisory metadata; actual short-circuiting is not supported here
-            return ToolPreInvokeResult(metadata={"cache_hit": True, "key": key})
-        return ToolPreInvokeResult(metadata={"cache_hit": False, "key": key})
+        data = await self._lookup(key)
+        if data is None:
+            self._misses += 1
+            context.set_state("cache_hit", False)
+            return ToolPreInvokeResult(metadata={"cache_hit": False, "key": key})
+        self._hits += 1
+        context.set_state("cache_hit", True)
+        cached = orjson.loads(data)
+        return ToolPreInvokeResult(modified_payload=payload.model_copy(update={"result": cached}), metadata={"cache_hit": True, "key": key})
 
     async def tool_post_invoke(self, payload: ToolPostInvokePayload, context: PluginContext) -> ToolPostInvokeResult:
         """Store tool result in cache after invocation.
@@ -135,13 +338,50 @@ class CachedToolResultPlugin(Plugin):
         """
         tool = payload.name
         # Persist only for configured tools
-        if tool not in self._cfg.cacheable_tools:
+        if tool not in self._cacheable:
             return ToolPostInvokeResult(continue_processing=True)
+        # Results served from the cache are already stored
+        if context and context.get_state("cache_hit"):
+            return ToolPostInvokeResult(metadata={"cache_stored": False, "cache_hit": True})
+        # Never cache error results
+        result = payload.result
+        if isinstance(result, dict) and (result.get("isError") or result.get("is_error")):
+            return ToolPostInvokeResult(metadata={"cache_stored": False, "reason": "error_result"})
         # Read key from context
         key = context.get_state("cache_key") if context else None
         if not key:
-            # Fallback to a coarse key when args are unknown
-            key = _make_key(tool, None, None)
+            # Without the pre-invoke key the args and caller are unknown; never store under a coarse key
+            return ToolPostInvokeResult(metadata={"cache_stored": False, "reason": "no_cache_key"})
+        try:
+            data = orjson.dumps(result, default=str)
+        except TypeError as e:
+            logger.debug(f"CachedToolResultPlugin: result for {tool} is not serializable: {e}")
+            return ToolPostInvokeResult(metadata={"cache_stored": False, "reason": "not_serializable"})
+        if len(data) > self._cfg.max_entry_bytes:
+            return ToolPostInvokeResult(metadata={"cache_stored": False, "reason": "too_large"})
         ttl = max(1, int(self._cfg.ttl))
-        _CACHE[key] = _Entry(value=payload.result, expires_at=time.time() + ttl)
+        self._cache.set(key, data, ttl)
+        redis = await self._get_redis_client()
+        if redis:
+            try:
+                await redis.setex(self._cfg.redis_prefix + key, ttl, data)
+            except Exception as e:
+                logger.debug(f"CachedToolResultPlugin: Redis setex failed: {e}")
         return ToolPostInvokeResult(metadata={"cache_stored": True, "key": key, "ttl": ttl})
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache statistics.
+
+        Returns:
+            Hit/miss counters, hit rate and L1 occupancy.
+        """
+        total = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total if total else 0.0,
+            "entries": len(self._cache),
+            "size_bytes": self._cache.size_bytes,
+            "evictions": self._cache.evictions,
+            "redis_enabled": self._cfg.redis_enabled,
+        }
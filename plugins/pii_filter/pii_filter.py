@@ -10,10 +10,11 @@ and their responses, including SSNs, credit cards, emails, phone numbers, and mo
 """
 
 # Standard
+from bisect import bisect_left
 from enum import Enum
 import logging
 import re
-from typing import Any, Dict, List, Pattern, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Tuple
 
 # Third-Party
 import orjson
@@ -133,6 +134,103 @@ class PIIFilterConfig(BaseModel):
     # Whitelist configuration
     whitelist_patterns: List[str] = Field(default_factory=list, description="Patterns to exclude from PII detection")
 
+    # Streaming configuration for large payloads
+    stream_threshold: int = Field(default=1_048_576, ge=1, description="Strings longer than this are scanned in chunks as raw text, without parsing embedded JSON; applies per string, not to nested payloads as a whole")
+    stream_chunk_size: int = Field(default=65_536, ge=1, description="Chunk size used when scanning large strings")
+    stream_overlap: int = Field(default=512, ge=0, description="Look-ahead past each chunk boundary; must exceed the longest expected match")
+
+
+# Precedence of built-in patterns in the combined scanner: when several patterns
+# match at the same position, the first listed wins. Labelled and structured
+# formats come before the generic digit runs they would otherwise be mistaken for.
+# Custom patterns take precedence over all built-ins.
+_BUILTIN_PRECEDENCE: Tuple[str, ...] = (
+    "Date of birth with label",
+    "Driver's license number",
+    "Medical record number",
+    "Generic API key",
+    "Email address",
+    "IPv6 address",
+    "IPv4 address",
+    "Credit card number",
+    "US Social Security Number",
+    "IBAN",
+    "AWS Access Key ID",
+    "Date in MM/DD/YYYY format",
+    "US phone number",
+    "Passport number",
+    "AWS Secret Access Key",
+    "Dutch BSN (Burgerservicenummer)",
+    "Bank account number",
+    "International phone number",
+)
+
+
+def _non_overlapping(spans: List[Tuple[int, int, Any]]) -> List[Tuple[int, int, Any]]:
+    """Resolve overlapping spans, keeping the earliest-starting one.
+
+    Spans must be sorted by start, then precedence. Accepted spans are kept in a
+    sorted interval list, so each candidate is checked with a binary search.
+
+    Args:
+        spans: ``(start, end, payload)`` tuples sorted by ``(start, precedence)``.
+
+    Returns:
+        Non-overlapping spans in start order.
+
+    Examples:
+        >>> _non_overlapping([(0, 5, "a"), (2, 4, "b"), (5, 8, "c")])
+        [(0, 5, 'a'), (5, 8, 'c')]
+    """
+    accepted: List[Tuple[int, int, Any]] = []
+    ends: List[int] = []
+    for start, end, payload in spans:
+        i = bisect_left(ends, start + 1)
+        if i < len(accepted):
+            continue
+        accepted.append((start, end, payload))
+        ends.append(end)
+    return accepted
+
+
+_JSON_STRING_LITERAL = re.compile(r'"(?:[^"\\]|\\.)*"')
+
+
+def _within_json_strings(text: str, detections: Dict[PIIType, List[Dict]]) -> Dict[PIIType, List[Dict]]:
+    """Keep only detections that lie inside string literals of a JSON document.
+
+    Used when a large JSON string is masked as raw text: masking numbers or
+    structural characters would corrupt the document, and only string values are
+    masked when JSON is processed as parsed data.
+
+    Args:
+        text: Serialized JSON text.
+        detections: Detections found in ``text``.
+
+    Returns:
+        The detections that fall entirely within a JSON string literal.
+
+    Examples:
+        >>> dets = {PIIType.PHONE: [{"start": 6, "end": 16}, {"start": 24, "end": 34}]}
+        >>> _within_json_strings('{"a": 5551234567, "b": "5551234567"}', dets)
+        {<PIIType.PHONE: 'phone'>: [{'start': 24, 'end': 34}]}
+    """
+    starts: List[int] = []
+    ends: List[int] = []
+    for literal in _JSON_STRING_LITERAL.finditer(text):
+        starts.append(literal.start())
+        ends.append(literal.end())
+    kept: Dict[PIIType, List[Dict]] = {}
+    for pii_type, items in detections.items():
+        inside = []
+        for item in items:
+            i = bisect_left(starts, item["start"] + 1) - 1
+            if i >= 0 and item["start"] > starts[i] and item["end"] < ends[i]:
+                inside.append(item)
+        if inside:
+            kept[pii_type] = inside
+    return kept
+
 
 class PIIDetector:
     """Core PII detection logic."""
@@ -145,6 +243,10 @@ class PIIDetector:
         """
         self.config = config
         self.patterns: Dict[PIIType, List[Tuple[Pattern, MaskingStrategy]]] = {}
+        # Combined scanner: one alternation over all enabled patterns, in precedence order
+        self._combined: Optional[Pattern] = None
+        self._alternatives: Dict[int, Tuple[PIIType, MaskingStrategy]] = {}
+        self._ordered: List[Tuple[Pattern, PIIType, MaskingStrategy]] = []
         self._compile_patterns()
         self._compile_whitelist()
 
@@ -269,6 +371,47 @@ class PIIDetector:
                     self.patterns[pattern_config.type] = []
                 self.patterns[pattern_config.type].append((compiled, pattern_config.mask_strategy))
 
+        self._compile_combined([p for p in patterns if p.enabled], len(patterns) - len(self.config.custom_patterns))
+
+    def _compile_combined(self, patterns: List[PIIPattern], builtin_count: int) -> None:
+        """Compile all enabled patterns into a single alternation.
+
+        Each pattern is wrapped in its own capturing group, so ``match.lastindex``
+        identifies which alternative matched. Patterns that cannot be embedded in
+        an alternation (e.g. inline global flags or numbered back-references) make
+        the detector fall back to scanning each pattern and merging the results.
+
+        Args:
+            patterns: Enabled patterns, built-ins first, then custom patterns.
+            builtin_count: Number of built-in patterns at the head of the list.
+        """
+        builtins = sorted(patterns[:builtin_count], key=lambda p: _BUILTIN_PRECEDENCE.index(p.description) if p.description in _BUILTIN_PRECEDENCE else len(_BUILTIN_PRECEDENCE))
+        ordered = patterns[builtin_count:] + builtins
+        self._ordered = [(re.compile(p.pattern, re.IGNORECASE), p.type, p.mask_strategy) for p in ordered]
+        if not ordered:
+            return
+
+        parts: List[str] = []
+        group = 1
+        for (compiled, pii_type, strategy), pattern_config in zip(self._ordered, ordered):
+            self._alternatives[group] = (pii_type, strategy)
+            parts.append(f"({pattern_config.pattern})")
+            group += 1 + compiled.groups
+        alternation = "|".join(parts)
+        # When every alternative is anchored on a word boundary, hoisting the anchor lets
+        # the engine reject positions inside words once instead of once per alternative
+        if all(p.pattern.startswith(r"\b") for p in ordered):
+            alternation = rf"\b(?:{alternation})"
+        try:
+            combined = re.compile(alternation, re.IGNORECASE)
+        except re.error as e:
+            logger.debug(f"PII patterns cannot be combined, scanning them individually: {e}")
+            return
+        if any(re.search(r"\\[1-9]|\(\?P=", p.pattern) for p in ordered):
+            logger.debug("PII patterns use back-references, scanning them individually")
+            return
+        self._combined = combined
+
     def _compile_whitelist(self) -> None:
         """Compile whitelist patterns."""
         self.whitelist_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.config.whitelist_patterns]
@@ -290,38 +433,120 @@ class PIIDetector:
                 return True
         return False
 
-    def detect(self, text: str) -> Dict[PIIType, List[Dict]]:
-        """Detect PII in text.
+    def _scan(self, text: str, pos: int = 0, endpos: Optional[int] = None) -> Iterator[Tuple[int, int, PIIType, MaskingStrategy]]:
+        """Scan ``text[pos:endpos]`` once for all enabled PII types.
+
+        At each position the highest-precedence matching pattern wins and scanning
+        resumes after the match, so results are sorted and never overlap. Whitelisted
+        matches are skipped along with their span. Slicing is done with ``pos`` and
+        ``endpos`` so no copy of the text is made.
 
         Args:
-            text: Text to scan for PII
+            text: Text to scan.
+            pos: Offset to start scanning at.
+            endpos: Offset to stop scanning at (defaults to the end of the text).
 
-        Returns:
-            Dictionary of detected PII by type
+        Yields:
+            ``(start, end, pii_type, mask_strategy)`` tuples in start order.
         """
-        detections = {}
+        endpos = len(text) if endpos is None else endpos
+        if self._combined is None:
+            yield from self._scan_individually(text, pos, endpos)
+            return
+        alternatives = self._alternatives
+        search = self._combined.search
+        while pos < endpos:
+            match = search(text, pos, endpos)
+            if match is None:
+                return
+            start, end = match.span()
+            pos = end if end > start else start + 1
+            if end == start or (self.whitelist_patterns and self._is_whitelisted(text, start, end)):
+                continue
+            pii_type, strategy = alternatives[match.lastindex]
+            yield start, end, pii_type, strategy
+
+    def _scan_individually(self, text: str, pos: int, endpos: int) -> Iterator[Tuple[int, int, PIIType, MaskingStrategy]]:
+        """Fallback scan running each pattern separately with the same precedence rules.
 
-        for pii_type, pattern_list in self.patterns.items():
-            type_detections = []
-            seen_ranges = []  # Track ranges we've already detected
+        Args:
+            text: Text to scan.
+            pos: Offset to start scanning at.
+            endpos: Offset to stop scanning at.
 
-            for pattern, mask_strategy in pattern_list:
-                for match in pattern.finditer(text):
-                    if not self._is_whitelisted(text, match.start(), match.end()):
-                        # Check if this overlaps with any existing detection
-                        overlaps = False
-                        for start, end in seen_ranges:
-                            if (match.start() >= start and match.start() < end) or (match.end() > start and match.end() <= end) or (match.start() <= start and match.end() >= end):
-                                overlaps = True
-                                break
+        Yields:
+            ``(start, end, pii_type, mask_strategy)`` tuples in start order.
+        """
+        spans = []
+        for rank, (pattern, pii_type, strategy) in enumerate(self._ordered):
+            for match in pattern.finditer(text, pos, endpos):
+                start, end = match.span()
+                if end > start:
+                    spans.append((start, rank, end, pii_type, strategy))
+        spans.sort()
+        # Whitelisted matches claim their span too, mirroring the combined scan
+        resolved = _non_overlapping([(start, end, (pii_type, strategy)) for start, _, end, pii_type, strategy in spans])
+        for start, end, (pii_type, strategy) in resolved:
+            if not (self.whitelist_patterns and self._is_whitelisted(text, start, end)):
+                yield start, end, pii_type, strategy
+
+    def iter_detections(self, text: str) -> Iterator[Dict[str, Any]]:
+        """Stream PII detections from ``text`` in order, scanning it chunk by chunk.
+
+        Each chunk is scanned with a look-ahead of ``stream_overlap`` characters so
+        matches crossing a chunk boundary are found whole; only matches starting
+        inside the chunk are emitted and the next chunk resumes after the last one.
 
-                        if not overlaps:
-                            type_detections.append({"value": match.group(), "start": match.start(), "end": match.end(), "mask_strategy": mask_strategy})
-                            seen_ranges.append((match.start(), match.end()))
+        Args:
+            text: Text to scan.
+
+        Yields:
+            Detection dictionaries with ``type``, ``value``, ``start``, ``end`` and ``mask_strategy``.
 
-            if type_detections:
-                detections[pii_type] = type_detections
+        Examples:
+            >>> detector = PIIDetector(PIIFilterConfig(stream_chunk_size=8, stream_overlap=16))
+            >>> [(d["type"].value, d["value"]) for d in detector.iter_detections("mail a@b.io and SSN 123-45-6789")]
+            [('email', 'a@b.io'), ('ssn', '123-45-6789')]
+        """
+        n = len(text)
+        chunk = self.config.stream_chunk_size
+        pos = 0
+        while pos < n:
+            boundary = min(pos + chunk, n)
+            resume = boundary
+            for start, end, pii_type, strategy in self._scan(text, pos, min(boundary + self.config.stream_overlap, n)):
+                if start >= boundary:
+                    break
+                yield {"type": pii_type, "value": text[start:end], "start": start, "end": end, "mask_strategy": strategy}
+                resume = max(resume, end)
+            pos = resume
 
+    def detect(self, text: str) -> Dict[PIIType, List[Dict]]:
+        """Detect PII in text.
+
+        All enabled patterns are matched in a single pass; overlapping matches are
+        resolved in favour of the earliest, then highest-precedence, match. Texts
+        longer than ``stream_threshold`` are scanned in chunks.
+
+        Args:
+            text: Text to scan for PII
+
+        Returns:
+            Dictionary of detected PII by type
+
+        Examples:
+            >>> detector = PIIDetector(PIIFilterConfig())
+            >>> sorted(t.value for t in detector.detect("SSN 123-45-6789, IP 192.168.1.1"))
+            ['ip_address', 'ssn']
+        """
+        detections: Dict[PIIType, List[Dict]] = {}
+        if len(text) > self.config.stream_threshold:
+            found = self.iter_detections(text)
+        else:
+            found = ({"value": text[start:end], "start": start, "end": end, "mask_strategy": strategy, "type": pii_type} for start, end, pii_type, strategy in self._scan(text))
+        for detection in found:
+            pii_type = detection.pop("type")
+            detections.setdefault(pii_type, []).append(detection)
         return detections
 
     def mask(self, text: str, detections: Dict[PIIType, List[Dict]]) -> str:
@@ -337,23 +562,25 @@ class PIIDetector:
         if not detections:
             return text
 
-        # Sort all detections by position (reverse order for replacement)
+        # Sort all detections by position; overlapping spans (e.g. from merged results) keep the first
         all_detections = []
         for pii_type, items in detections.items():
             for item in items:
                 item["type"] = pii_type
-                all_detections.append(item)
+                all_detections.append((item["start"], item["end"], item))
+        all_detections.sort(key=lambda x: x[0])
 
-        all_detections.sort(key=lambda x: x["start"], reverse=True)
-
-        # Apply masking
-        masked_text = text
-        for detection in all_detections:
+        # Apply masking, building the result in a single join
+        parts: List[str] = []
+        last = 0
+        for start, end, detection in _non_overlapping(all_detections):
             strategy = detection.get("mask_strategy", self.config.default_mask_strategy)
-            masked_value = self._apply_mask(detection["value"], detection["type"], strategy)
-            masked_text = masked_text[: detection["start"]] + masked_value + masked_text[detection["end"] :]
+            parts.append(text[last:start])
+            parts.append(self._apply_mask(detection["value"], detection["type"], strategy))
+            last = end
+        parts.append(text[last:])
 
-        return masked_text
+        return "".join(parts)
 
     def _apply_mask(self, value: str, pii_type: PIIType, strategy: MaskingStrategy) -> str:
         """Apply masking strategy to a value.
@@ -749,6 +976,8 @@ class PIIFilterPlugin(Plugin):
         if isinstance(data, str):
             # Process string data - check for PII and also try to parse as JSON
             detections = self.detector.detect(data)
+            if detections and len(data) > self.pii_config.stream_threshold and data.lstrip()[:1] in ("{", "["):
+                detections = _within_json_strings(data, detections)
             if detections:
                 all_detections[path] = detections
                 self.detection_count += sum(len(items) for items in detections.values())
@@ -757,6 +986,11 @@ class PIIFilterPlugin(Plugin):
                 if self.pii_config.log_detections:
                     logger.warning(f"PII detected in tool result at '{path}': {', '.join(detections.keys())}")
 
+            # Large strings are masked as raw text (embedded JSON values included), so
+            # skip building and re-serializing a parsed copy of them
+            if len(data) > self.pii_config.stream_threshold:
+                return modified, has_detections
+
             # Try to parse as JSON and process nested content
             try:
                 parsed_json = orjson.loads(data)
@@ -5,17 +5,25 @@ SPDX-License-Identifier: Apache-2.0
 Authors: Mihai Criveti
 
 Rate Limiter Plugin.
-Enforces simple in-memory rate limits by user, tenant, and/or tool.
-Uses a fixed window keyed by second for simplicity and determinism.
+Enforces rate limits by user, tenant, and/or tool using a fixed-window,
+sliding-window-log or token-bucket algorithm. Counters live in Redis when
+``backend: redis`` is configured, so limits hold across workers and hosts;
+every decision is a single atomic Lua script call. The in-process store is
+used otherwise, and as a fallback when Redis is unavailable, and evicts
+idle counters once they expire.
 """
 
 # Future
 from __future__ import annotations
 
 # Standard
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
+import logging
+import math
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, List, Literal, Optional, Tuple
+import uuid
 
 # Third-Party
 from pydantic import BaseModel, Field
@@ -32,6 +40,10 @@ from mcpgateway.plugins.framework import (
     ToolPreInvokeResult,
 )
 
+logger = logging.getLogger(__name__)
+
+Algorithm = Literal["fixed_window", "sliding_window", "token_bucket"]
+
 
 def _parse_rate(rate: str) -> tuple[int, int]:
     """Parse rate like '60/m', '10/s', '100/h' -> (count, window_seconds).
@@ -44,6 +56,12 @@ def _parse_rate(rate: str) -> tuple[int, int]:
 
     Raises:
         ValueError: If the rate unit is not supported.
+
+    Examples:
+        >>> _parse_rate("60/m")
+        (60, 60)
+        >>> _parse_rate("10/s")
+        (10, 1)
     """
     count_str, per = rate.split("/")
     count = int(count_str)
@@ -64,58 +82,318 @@ class RateLimiterConfig(BaseModel):
         by_user: Rate limit per user (e.g., '60/m').
         by_tenant: Rate limit per tenant (e.g., '600/m').
         by_tool: Per-tool rate limits (e.g., {'search': '10/m'}).
+        algorithm: Limiting algorithm: fixed_window, sliding_window or token_bucket.
+        backend: Counter store: memory (per process) or redis (shared; requires CACHE_TYPE=redis).
+        redis_prefix: Key prefix for counters stored in Redis.
+        sweep_interval: Seconds between evictions of expired in-memory counters.
     """
 
     by_user: Optional[str] = Field(default=None, description="e.g. '60/m'")
     by_tenant: Optional[str] = Field(default=None, description="e.g. '600/m'")
     by_tool: Optional[Dict[str, str]] = Field(default=None, description="per-tool rates, e.g. {'search': '10/m'}")
+    algorithm: Algorithm = "fixed_window"
+    backend: Literal["memory", "redis"] = "memory"
+    redis_prefix: str = "mcpgw:ratelimit:"
+    sweep_interval: float = Field(default=60.0, gt=0)
 
 
-@dataclass
-class _Window:
-    """Internal rate limiting window tracking.
+@dataclass(frozen=True)
+class _Limit:
+    """A single limit to check.
 
     Attributes:
-        window_start: Timestamp when the current window started.
-        count: Number of requests in the current window.
+        key: Counter key (e.g., 'user:alice').
+        count: Requests allowed per window.
+        window: Window length in seconds.
     """
 
-    window_start: int
+    key: str
     count: int
+    window: int
+
+
+@dataclass
+class _Counter:
+    """In-memory counter state.
+
+    Attributes:
+        value: Requests counted (fixed window) or tokens left (token bucket).
+        stamp: Window start (fixed window) or last refill time (token bucket).
+        log: Request timestamps inside the window (sliding window).
+        expires_at: Time after which the counter is equivalent to a fresh one.
+    """
+
+    value: float = 0.0
+    stamp: float = 0.0
+    log: Deque[float] = field(default_factory=deque)
+    expires_at: float = 0.0
 
 
-_store: Dict[str, _Window] = {}
+class _MemoryStore:
+    """Per-process counter store with TTL-based eviction.
+
+    A request is admitted only if every limit allows it; counters are consumed
+    all-or-nothing so a rejected request does not use up the other limits.
+
+    Examples:
+        >>> store = _MemoryStore("sliding_window", sweep_interval=60)
+        >>> limits = [_Limit("user:a", 2, 10)]
+        >>> [store.hit(limits, now=100.0)[0] for _ in range(3)]
+        [True, True, False]
+        >>> store.hit(limits, now=110.5)[0]
+        True
+        >>> store.sweep(now=1000.0), len(store)
+        (1, 0)
+    """
+
+    def __init__(self, algorithm: Algorithm, sweep_interval: float) -> None:
+        """Initialize the store.
+
+        Args:
+            algorithm: Limiting algorithm.
+            sweep_interval: Seconds between sweeps of expired counters.
+        """
+        self._algorithm = algorithm
+        self._sweep_interval = sweep_interval
+        self._counters: Dict[str, _Counter] = {}
+        self._next_sweep = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of live counters.
+
+        Returns:
+            Counter count.
+        """
+        return len(self._counters)
 
+    def sweep(self, now: float) -> int:
+        """Drop counters that have expired.
+
+        Args:
+            now: Current time in seconds.
+
+        Returns:
+            Number of counters removed.
+        """
+        expired = [key for key, counter in self._counters.items() if counter.expires_at <= now]
+        for key in expired:
+            del self._counters[key]
+        self._next_sweep = now + self._sweep_interval
+        return len(expired)
+
+    def hit(self, limits: List[_Limit], now: float) -> Tuple[bool, List[Tuple[bool, int, float]]]:
+        """Check and consume one request against all limits.
+
+        Args:
+            limits: Limits to enforce.
+            now: Current time in seconds.
+
+        Returns:
+            Tuple of (allowed, per-limit (ok, remaining, reset_in_seconds)).
+        """
+        if now >= self._next_sweep:
+            self.sweep(now)
+        counters = [self._refresh(limit, now) for limit in limits]
+        oks = [self._available(limit, counter) >= 1 for limit, counter in zip(limits, counters)]
+        allowed = all(oks)
+        results = []
+        for limit, counter, ok in zip(limits, counters, oks):
+            if allowed:
+                self._consume(limit, counter, now)
+            remaining = max(0, int(self._available(limit, counter)))
+            results.append((ok, remaining, max(0.0, counter.expires_at - now)))
+        return allowed, results
+
+    def _refresh(self, limit: _Limit, now: float) -> _Counter:
+        """Return the counter for a limit, reset or refilled as of ``now``.
+
+        Args:
+            limit: Limit being checked.
+            now: Current time in seconds.
+
+        Returns:
+            Counter state.
+        """
+        counter = self._counters.get(limit.key)
+        if counter is None or counter.expires_at <= now:
+            counter = _Counter(value=float(limit.count) if self._algorithm == "token_bucket" else 0.0, stamp=now, expires_at=now + limit.window)
+            self._counters[limit.key] = counter
+        elif self._algorithm == "token_bucket":
+            counter.value = min(float(limit.count), counter.value + (now - counter.stamp) * limit.count / limit.window)
+            counter.stamp = now
+        elif self._algorithm == "sliding_window":
+            while counter.log and counter.log[0] <= now - limit.window:
+                counter.log.popleft()
+        return counter
+
+    def _available(self, limit: _Limit, counter: _Counter) -> float:
+        """Return how many more requests the counter admits.
+
+        Args:
+            limit: Limit being checked.
+            counter: Counter state.
+
+        Returns:
+            Remaining capacity.
+        """
+        if self._algorithm == "token_bucket":
+            return counter.value
+        if self._algorithm == "sliding_window":
+            return limit.count - len(counter.log)
+        return limit.count - counter.value
 
-def _allow(key: str, limit: Optional[str]) -> tuple[bool, dict[str, Any]]:
-    """Check if a request is allowed under the rate limit.
+    def _consume(self, limit: _Limit, counter: _Counter, now: float) -> None:
+        """Record one request on a counter and update its expiry.
+
+        Args:
+            limit: Limit being checked.
+            counter: Counter state.
+            now: Current time in seconds.
+        """
+        if self._algorithm == "token_bucket":
+            counter.value -= 1
+            # Once the bucket has refilled it is indistinguishable from a new one
+            counter.expires_at = now + (limit.count - counter.value) * limit.window / limit.count
+        elif self._algorithm == "sliding_window":
+            counter.log.append(now)
+            counter.expires_at = now + limit.window
+        else:
+            counter.value += 1
+
+
+# Each script takes one key per limit and (count, window_ms) per key in ARGV,
+# checks all limits, consumes all of them only if every one allows the request,
+# and returns {allowed, ok_1, remaining_1, reset_ms_1, ...}. Redis server time
+# is used so that limits agree across hosts.
+_FIXED_WINDOW_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local n = #KEYS
+local used, ttl, oks = {}, {}, {}
+local allowed = 1
+for i = 1, n do
+  local count = tonumber(ARGV[2 * i - 1])
+  used[i] = tonumber(redis.call('GET', KEYS[i]) or '0')
+  ttl[i] = redis.call('PTTL', KEYS[i])
+  if ttl[i] < 0 then ttl[i] = tonumber(ARGV[2 * i]) end
+  oks[i] = used[i] < count and 1 or 0
+  if oks[i] == 0 then allowed = 0 end
+end
+local out = {allowed}
+for i = 1, n do
+  local count = tonumber(ARGV[2 * i - 1])
+  if allowed == 1 then
+    used[i] = redis.call('INCR', KEYS[i])
+    if used[i] == 1 then redis.call('PEXPIRE', KEYS[i], ARGV[2 * i]) end
+  end
+  table.insert(out, oks[i])
+  table.insert(out, math.max(0, count - used[i]))
+  table.insert(out, ttl[i])
+end
+return out
+"""
+
+_SLIDING_WINDOW_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local n = #KEYS
+local member = ARGV[#ARGV]
+local used, oks = {}, {}
+local allowed = 1
+for i = 1, n do
+  local count = tonumber(ARGV[2 * i - 1])
+  local window = tonumber(ARGV[2 * i])
+  redis.call('ZREMRANGEBYSCORE', KEYS[i], '-inf', now - window)
+  used[i] = redis.call('ZCARD', KEYS[i])
+  oks[i] = used[i] < count and 1 or 0
+  if oks[i] == 0 then allowed = 0 end
+end
+local out = {allowed}
+for i = 1, n do
+  local count = tonumber(ARGV[2 * i - 1])
+  local window = tonumber(ARGV[2 * i])
+  if allowed == 1 then
+    redis.call('ZADD', KEYS[i], now, member)
+    redis.call('PEXPIRE', KEYS[i], window)
+    used[i] = used[i] + 1
+  end
+  local reset = 0
+  local newest = redis.call('ZRANGE', KEYS[i], -1, -1, 'WITHSCORES')
+  if newest[2] then reset = math.max(0, tonumber(newest[2]) + window - now) end
+  table.insert(out, oks[i])
+  table.insert(out, math.max(0, count - used[i]))
+  table.insert(out, reset)
+end
+return out
+"""
+
+_TOKEN_BUCKET_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local n = #KEYS
+local tokens, oks = {}, {}
+local allowed = 1
+for i = 1, n do
+  local count = tonumber(ARGV[2 * i - 1])
+  local window = tonumber(ARGV[2 * i])
+  local state = redis.call('HMGET', KEYS[i], 'tokens', 'ts')
+  local level = tonumber(state[1])
+  local ts = tonumber(state[2])
+  if level == nil or ts == nil then
+    level = count
+  else
+    level = math.min(count, level + (now - ts) * count / window)
+  end
+  tokens[i] = level
+  oks[i] = level >= 1 and 1 or 0
+  if oks[i] == 0 then allowed = 0 end
+end
+local out = {allowed}
+for i = 1, n do
+  local count = tonumber(ARGV[2 * i - 1])
+  local window = tonumber(ARGV[2 * i])
+  if allowed == 1 then tokens[i] = tokens[i] - 1 end
+  local reset = math.ceil((count - tokens[i]) * window / count)
+  redis.call('HSET', KEYS[i], 'tokens', tostring(tokens[i]), 'ts', now)
+  redis.call('PEXPIRE', KEYS[i], math.max(1, reset))
+  table.insert(out, oks[i])
+  table.insert(out, math.floor(tokens[i]))
+  table.insert(out, reset)
+end
+return out
+"""
+
+_SCRIPTS: Dict[str, str] = {
+    "fixed_window": _FIXED_WINDOW_LUA,
+    "sliding_window": _SLIDING_WINDOW_LUA,
+    "token_bucket": _TOKEN_BUCKET_LUA,
+}
+
+
+def _meta(limit: Optional[_Limit], result: Optional[Tuple[bool, int, float]]) -> dict[str, Any]:
+    """Build the metadata reported for one limit.
 
     Args:
-        key: Unique key for the rate limit (e.g., 'user:alice', 'tool:search').
-        limit: Rate limit string (e.g., '60/m') or None to allow unlimited.
+        limit: Limit that was checked, or None when unlimited.
+        result: Per-limit (ok, remaining, reset_in_seconds).
 
     Returns:
-        Tuple of (allowed, metadata) where allowed is True if the request is allowed,
-        and metadata contains rate limiting information.
+        Metadata dictionary.
+
+    Examples:
+        >>> _meta(None, None)
+        {'limited': False}
+        >>> _meta(_Limit("user:a", 5, 60), (True, 4, 59.2))
+        {'limited': True, 'remaining': 4, 'reset_in': 60}
     """
-    if not limit:
-        return True, {"limited": False}
-    count, window_seconds = _parse_rate(limit)
-    now = int(time.time())
-    win_key = f"{key}:{window_seconds}"
-    wnd = _store.get(win_key)
-    if not wnd or now - wnd.window_start >= window_seconds:
-        _store[win_key] = _Window(window_start=now, count=1)
-        return True, {"limited": True, "remaining": count - 1, "reset_in": window_seconds}
-    if wnd.count < count:
-        wnd.count += 1
-        return True, {"limited": True, "remaining": count - wnd.count, "reset_in": window_seconds - (now - wnd.window_start)}
-    # exceeded
-    return False, {"limited": True, "remaining": 0, "reset_in": window_seconds - (now - wnd.window_start)}
+    if limit is None or result is None:
+        return {"limited": False}
+    _, remaining, reset_in = result
+    return {"limited": True, "remaining": remaining, "reset_in": math.ceil(reset_in)}
 
 
 class RateLimiterPlugin(Plugin):
-    """Simple fixed-window rate limiter with per-user/tenant/tool buckets."""
+    """Rate limiter with per-user/tenant/tool limits and memory or Redis counters."""
 
     def __init__(self, config: PluginConfig) -> None:
         """Initialize the rate limiter plugin.
@@ -125,6 +403,92 @@ class RateLimiterPlugin(Plugin):
         """
         super().__init__(config)
         self._cfg = RateLimiterConfig(**(config.config or {}))
+        self._user_rate = _parse_rate(self._cfg.by_user) if self._cfg.by_user else None
+        self._tenant_rate = _parse_rate(self._cfg.by_tenant) if self._cfg.by_tenant else None
+        self._tool_rates = {tool: _parse_rate(rate) for tool, rate in (self._cfg.by_tool or {}).items() if rate}
+        self._memory = _MemoryStore(self._cfg.algorithm, self._cfg.sweep_interval)
+
+    async def _get_redis_client(self):
+        """Return the shared Redis client when the Redis backend is configured.
+
+        Returns:
+            Redis client or None if disabled or unavailable.
+        """
+        if self._cfg.backend != "redis":
+            return None
+        try:
+            # First-Party
+            from mcpgateway.utils.redis_client import get_redis_client  # pylint: disable=import-outside-toplevel
+
+            return await get_redis_client()
+        except Exception as e:
+            logger.debug(f"RateLimiterPlugin: Redis unavailable: {e}")
+            return None
+
+    async def _redis_hit(self, redis: Any, limits: List[_Limit]) -> Tuple[bool, List[Tuple[bool, int, float]]]:
+        """Check and consume one request against all limits in a single Lua call.
+
+        Args:
+            redis: Redis client.
+            limits: Limits to enforce.
+
+        Returns:
+            Tuple of (allowed, per-limit (ok, remaining, reset_in_seconds)).
+        """
+        algorithm = self._cfg.algorithm
+        keys = [f"{self._cfg.redis_prefix}{algorithm}:{limit.key}:{limit.window}" for limit in limits]
+        args: List[Any] = []
+        for limit in limits:
+            args.extend((limit.count, limit.window * 1000))
+        if algorithm == "sliding_window":
+            args.append(uuid.uuid4().hex)
+        raw = await redis.eval(_SCRIPTS[algorithm], len(keys), *keys, *args)
+        values = [int(v) for v in raw]
+        results = [(bool(values[i]), values[i + 1], values[i + 2] / 1000) for i in range(1, len(values), 3)]
+        return bool(values[0]), results
+
+    async def _check(self, limits: List[Optional[_Limit]]) -> Tuple[bool, List[Optional[Tuple[bool, int, float]]]]:
+        """Evaluate a set of limits against the configured backend.
+
+        Args:
+            limits: Limits to enforce; None entries are unlimited.
+
+        Returns:
+            Tuple of (allowed, per-limit results aligned with ``limits``).
+        """
+        active = [limit for limit in limits if limit is not None]
+        if not active:
+            return True, [None] * len(limits)
+        outcome = None
+        redis = await self._get_redis_client()
+        if redis:
+            try:
+                outcome = await self._redis_hit(redis, active)
+            except Exception as e:
+                logger.warning(f"RateLimiterPlugin: Redis check failed, using in-memory counters: {e}")
+        if outcome is None:
+            outcome = self._memory.hit(active, time.time())
+        allowed, results = outcome
+        it = iter(results)
+        return allowed, [next(it) if limit is not None else None for limit in limits]
+
+    def _limits(self, user: str, tenant: str, tool: Optional[str] = None) -> List[Optional[_Limit]]:
+        """Build the user, tenant and (optionally) tool limits for a request.
+
+        Args:
+            user: User identifier.
+            tenant: Tenant identifier.
+            tool: Tool name, if any.
+
+        Returns:
+            List of [user, tenant, tool] limits; None where no limit applies.
+        """
+        tool_rate = self._tool_rates.get(tool) if tool is not None else None
+        return [
+            _Limit(f"user:{user}", *self._user_rate) if self._user_rate else None,
+            _Limit(f"tenant:{tenant}", *self._tenant_rate) if self._tenant_rate else None,
+            _Limit(f"tool:{tool}", *tool_rate) if tool_rate else None,
+        ]
 
     async def prompt_pre_fetch(self, payload: PromptPrehookPayload, context: PluginContext) -> PromptPrehookResult:
         """Check rate limits before fetching a prompt.
@@ -139,27 +503,18 @@ class RateLimiterPlugin(Plugin):
         user = context.global_context.user or "anonymous"
         tenant = context.global_context.tenant_id or "default"
 
-        ok_u, meta_u = _allow(f"user:{user}", self._cfg.by_user)
-        if not ok_u:
-            return PromptPrehookResult(
-                continue_processing=False,
-                violation=PluginViolation(
-                    reason="Rate limit exceeded",
-                    description=f"User {user} rate limit exceeded",
-                    code="RATE_LIMIT",
-                    details=meta_u,
-                ),
-            )
-
-        ok_t, meta_t = _allow(f"tenant:{tenant}", self._cfg.by_tenant)
-        if not ok_t:
+        limits = self._limits(user, tenant)[:2]
+        allowed, (res_u, res_t) = await self._check(limits)
+        meta_u, meta_t = _meta(limits[0], res_u), _meta(limits[1], res_t)
+        if not allowed:
+            user_blocked = res_u is not None and not res_u[0]
             return PromptPrehookResult(
                 continue_processing=False,
                 violation=PluginViolation(
                     reason="Rate limit exceeded",
-                    description=f"Tenant {tenant} rate limit exceeded",
+                    description=f"User {user} rate limit exceeded" if user_blocked else f"Tenant {tenant} rate limit exceeded",
                     code="RATE_LIMIT",
-                    details=meta_t,
+                    details=meta_u if user_blocked else meta_t,
                 ),
             )
 
@@ -180,20 +535,15 @@ class RateLimiterPlugin(Plugin):
         user = context.global_context.user or "anonymous"
         tenant = context.global_context.tenant_id or "default"
 
-        meta: dict[str, Any] = {}
-        ok_u, meta_u = _allow(f"user:{user}", self._cfg.by_user)
-        ok_t, meta_t = _allow(f"tenant:{tenant}", self._cfg.by_tenant)
-        ok_tool = True
-        meta_tool: dict[str, Any] | None = None
-        by_tool_config = self._cfg.by_tool
-        if hasattr(by_tool_config, "__contains__"):
-            if tool in by_tool_config:  # pylint: disable=unsupported-membership-test
-                ok_tool, meta_tool = _allow(f"tool:{tool}", by_tool_config[tool])
-        meta.update({"by_user": meta_u, "by_tenant": meta_t})
-        if meta_tool is not None:
-            meta["by_tool"] = meta_tool
-
-        if not (ok_u and ok_t and ok_tool):
+        limits = self._limits(user, tenant, tool)
+        allowed, (res_u, res_t, res_tool) = await self._check(limits)
+        meta: dict[str, Any] = {"by_user": _meta(limits[0], res_u), "by_tenant": _meta(limits[1], res_t)}
+        if limits[2] is not None:
+            meta["by_tool"] = _meta(limits[2], res_tool)
+
+        if not allowed:
+            ok_tool = res_tool is None or res_tool[0]
+            ok_u = res_u is None or res_u[0]
             return ToolPreInvokeResult(
                 continue_processing=False,
                 violation=PluginViolation(
@@ -9,20 +9,28 @@ Response Cache by Prompt Plugin.
 Advisory approximate caching of tool results using cosine similarity over
 selected string fields (e.g., "prompt", "input").
 
-Because the plugin framework cannot short-circuit tool execution at pre-hook,
-the plugin returns cache hit info via metadata in `tool_pre_invoke`, and writes
-results at `tool_post_invoke` with a TTL.
+The plugin returns cache hit info via metadata in `tool_pre_invoke` (an
+approximate match is not substituted for the real result), and writes results
+at `tool_post_invoke` with a TTL.
+
+Lookups are served from a per-tool, capacity-bounded store: an inverted token
+index selects candidate entries, and when NumPy is installed their hashed
+dense vectors are scored in a single matrix-vector product with top-k
+selection. The top-k candidates are re-scored exactly against their sparse
+vectors, so reported similarities match the pure-Python path.
 """
 
 # Future
 from __future__ import annotations
 
 # Standard
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from dataclasses import dataclass, field
+import heapq
 import math
 import time
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+import zlib
 
 # Third-Party
 from pydantic import BaseModel, Field
@@ -38,6 +46,18 @@ from mcpgateway.plugins.framework import (
     ToolPreInvokeResult,
 )
 
+try:
+    # Third-Party
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numpy installed
+    np = None  # type: ignore[assignment]
+    NUMPY_AVAILABLE = False
+
+# Slack for float32 rounding when comparing upper bounds against exact float64 scores
+_BOUND_TOLERANCE = 1e-5
+
 
 def _tokenize(text: str) -> list[str]:
     """Tokenize text into lowercase words.
@@ -89,6 +109,34 @@ def _cos_sim(a: Dict[str, float], b: Dict[str, float]) -> float:
     return sum(a.get(k, 0.0) * b.get(k, 0.0) for k in a.keys())
 
 
+def _hash_vector(vec: Dict[str, float], dim: int) -> "np.ndarray":
+    """Project a sparse token vector onto a dense hashed vector (bucket sums, not re-normalized).
+
+    Tokens are bucketed with CRC32 (stable across processes). Because token
+    weights are non-negative and the projection is not re-normalized, a
+    collision only adds non-negative cross terms: the dot product of two hashed
+    vectors is an upper bound on the exact cosine similarity of the originals.
+
+    Args:
+        vec: Sparse token vector from :func:`_vectorize`.
+        dim: Number of hash buckets.
+
+    Returns:
+        Dense float32 vector of length ``dim``.
+
+    Examples:
+        >>> a, b = _vectorize("hello world"), _vectorize("hello there")
+        >>> _hash_vector(a, 64).shape
+        (64,)
+        >>> bool(float(_hash_vector(a, 2) @ _hash_vector(b, 2)) >= _cos_sim(a, b) - 1e-6)
+        True
+    """
+    out = np.zeros(dim, dtype=np.float32)
+    for tok, weight in vec.items():
+        out[zlib.crc32(tok.encode("utf-8")) % dim] += weight
+    return out
+
+
 class ResponseCacheConfig(BaseModel):
     """Configuration for response cache by prompt similarity.
 
@@ -97,14 +145,18 @@ class ResponseCacheConfig(BaseModel):
         fields: Argument fields to extract text from for similarity matching.
         ttl: Time-to-live for cache entries in seconds.
         threshold: Minimum cosine similarity threshold for cache hits.
-        max_entries: Maximum number of cache entries per tool.
+        max_entries: Maximum number of cache entries per tool; the oldest entry is evicted when full.
+        vector_dim: Width of the hashed dense vectors used for vectorized scoring.
+        top_k: Number of candidates re-scored exactly per round, highest upper bound first.
     """
 
     cacheable_tools: List[str] = Field(default_factory=list)
     fields: List[str] = Field(default_factory=lambda: ["prompt", "input", "query"])  # fields to read string text from args
     ttl: int = 600
     threshold: float = 0.92  # cosine similarity threshold
-    max_entries: int = 1000
+    max_entries: int = Field(default=1000, ge=1)
+    vector_dim: int = Field(default=256, ge=8)
+    top_k: int = Field(default=8, ge=1)
 
 
 @dataclass
@@ -126,6 +178,178 @@ class _Entry:
     tokens: set[str] = field(default_factory=set)  # Pre-computed token set for quick filtering
 
 
+class _ToolStore:
+    """Capacity-bounded, slot-based entry store for a single tool.
+
+    Entries live in fixed slots so inserts and evictions only touch the evicted
+    entry's postings in the inverted index. With NumPy, slot ``i`` of ``matrix``
+    holds the hashed vector of entry ``i`` and ``expires`` its expiry time.
+    Iterating yields live entries oldest first.
+
+    Examples:
+        >>> store = _ToolStore(capacity=2, dim=32)
+        >>> for t in ("a b", "b c", "c d"):
+        ...     _ = store.add(_Entry(text=t, vec=_vectorize(t), value=t, expires_at=time.time() + 60, tokens=set(t.split())))
+        >>> [e.text for e in store], sorted(store.index)
+        (['b c', 'c d'], ['b', 'c', 'd'])
+    """
+
+    def __init__(self, capacity: int, dim: int) -> None:
+        """Initialize an empty store.
+
+        Args:
+            capacity: Maximum number of live entries.
+            dim: Width of hashed dense vectors.
+        """
+        self.capacity = capacity
+        self.dim = dim
+        self.slots: List[Optional[_Entry]] = []
+        self.index: Dict[str, Set[int]] = defaultdict(set)
+        self._order: "OrderedDict[int, None]" = OrderedDict()  # insertion order == expiry order (uniform TTL)
+        self._free: List[int] = []
+        self.matrix = np.zeros((0, dim), dtype=np.float32) if NUMPY_AVAILABLE else None
+        self.expires = np.zeros(0, dtype=np.float64) if NUMPY_AVAILABLE else None
+
+    def __len__(self) -> int:
+        """Return the number of live entries.
+
+        Returns:
+            Live entry count.
+        """
+        return len(self._order)
+
+    def __iter__(self) -> Iterator[_Entry]:
+        """Iterate live entries oldest first.
+
+        Yields:
+            Cached entries.
+        """
+        for slot in self._order:
+            yield self.slots[slot]  # type: ignore[misc]
+
+    def __getitem__(self, position: int) -> _Entry:
+        """Return the live entry at ``position`` in age order (0 is the oldest).
+
+        Args:
+            position: Position among live entries.
+
+        Returns:
+            The entry.
+        """
+        return list(self)[position]
+
+    def _grow(self) -> None:
+        """Extend the slot arrays geometrically, up to capacity."""
+        old = len(self.slots)
+        new = min(self.capacity, max(16, old * 2))
+        self.slots.extend([None] * (new - old))
+        if self.matrix is not None:
+            matrix = np.zeros((new, self.dim), dtype=np.float32)
+            matrix[:old] = self.matrix
+            self.matrix = matrix
+            self.expires = np.concatenate([self.expires, np.zeros(new - old, dtype=np.float64)])
+        self._free.extend(range(old, new))
+        heapq.heapify(self._free)
+
+    def _remove(self, slot: int) -> None:
+        """Drop the entry in ``slot`` and its index postings.
+
+        Args:
+            slot: Slot number.
+        """
+        entry = self.slots[slot]
+        self.slots[slot] = None
+        self._order.pop(slot, None)
+        if entry is not None:
+            for tok in entry.tokens:
+                postings = self.index.get(tok)
+                if postings is not None:
+                    postings.discard(slot)
+                    if not postings:
+                        del self.index[tok]
+        if self.matrix is not None:
+            self.matrix[slot] = 0.0
+            self.expires[slot] = 0.0
+        heapq.heappush(self._free, slot)
+
+    def purge_expired(self, now: float) -> int:
+        """Remove expired entries from the old end of the store.
+
+        Args:
+            now: Current Unix time.
+
+        Returns:
+            Number of entries removed.
+        """
+        removed = 0
+        while self._order:
+            slot = next(iter(self._order))
+            entry = self.slots[slot]
+            if entry is not None and entry.expires_at > now:
+                break
+            self._remove(slot)
+            removed += 1
+        return removed
+
+    def add(self, entry: _Entry) -> int:
+        """Insert an entry, evicting the oldest one when the store is full.
+
+        Args:
+            entry: Entry to insert.
+
+        Returns:
+            Number of entries evicted for capacity.
+        """
+        evicted = 0
+        while len(self._order) >= self.capacity:
+            self._remove(next(iter(self._order)))
+            evicted += 1
+        if not self._free:
+            self._grow()
+        slot = heapq.heappop(self._free)
+        self.slots[slot] = entry
+        self._order[slot] = None
+        for tok in entry.tokens:
+            self.index[tok].add(slot)
+        if self.matrix is not None:
+            self.matrix[slot] = _hash_vector(entry.vec, self.dim)
+            self.expires[slot] = entry.expires_at
+        return evicted
+
+    def candidates(self, tokens: Set[str]) -> Set[int]:
+        """Return slots of entries sharing at least one token with the query.
+
+        Args:
+            tokens: Query tokens.
+
+        Returns:
+            Candidate slot numbers.
+        """
+        postings = [self.index[t] for t in tokens if t in self.index]
+        return set().union(*postings) if postings else set()
+
+    def dense_candidates(self, tokens: Set[str]) -> Tuple["np.ndarray", bool]:
+        """Return candidate slots as an array for vectorized scoring.
+
+        When a query token is shared by at least half of the live entries, building
+        the posting-list union costs more than scoring every slot, so all slots are
+        returned instead (empty slots carry a zero expiry and are filtered out).
+
+        Args:
+            tokens: Query tokens.
+
+        Returns:
+            Tuple of (candidate slot numbers, whether every slot was returned).
+        """
+        postings = [self.index[t] for t in tokens if t in self.index]
+        if not postings:
+            return np.zeros(0, dtype=np.intp), False
+        if 2 * max(len(p) for p in postings) >= len(self):
+            return np.arange(len(self.slots), dtype=np.intp), True
+        union = set().union(*postings)
+        return np.fromiter(union, dtype=np.intp, count=len(union)), False
+
+
 class ResponseCacheByPromptPlugin(Plugin):
     """Approximate response cache keyed by prompt similarity with optimized lookup."""
 
@@ -137,10 +361,27 @@ class ResponseCacheByPromptPlugin(Plugin):
         """
         super().__init__(config)
         self._cfg = ResponseCacheConfig(**(config.config or {}))
-        # Per-tool list of entries
-        self._cache: Dict[str, list[_Entry]] = {}
-        # Inverted index: tool -> token -> set of entry indices for fast filtering
-        self._index: Dict[str, Dict[str, Set[int]]] = defaultdict(lambda: defaultdict(set))
+        # Per-tool capacity-bounded stores
+        self._cache: Dict[str, _ToolStore] = {}
+        # Inverted index: tool -> token -> set of entry slots (shared with each store)
+        self._index: Dict[str, Dict[str, Set[int]]] = {}
+        self._evictions = 0
+
+    def _store(self, tool: str) -> _ToolStore:
+        """Return the store for a tool, creating it on first use.
+
+        Args:
+            tool: Tool name.
+
+        Returns:
+            The tool's entry store.
+        """
+        store = self._cache.get(tool)
+        if store is None:
+            store = _ToolStore(self._cfg.max_entries, self._cfg.vector_dim)
+            self._cache[tool] = store
+            self._index[tool] = store.index
+        return store
 
     def _gather_text(self, args: dict[str, Any] | None) -> str:
         """Extract and concatenate text from configured argument fields.
@@ -161,11 +402,14 @@ class ResponseCacheByPromptPlugin(Plugin):
         return "\n".join(chunks)
 
     def _find_best(self, tool: str, text: str) -> Tuple[Optional[_Entry], float]:
-        """Find the best matching cache entry for the given text (optimized).
+        """Find the best matching cache entry for the given text.
 
-        Uses inverted index to quickly filter candidates before computing
-        expensive cosine similarity. Only entries sharing tokens with the
-        query are considered.
+        Uses the inverted index to select candidates sharing a token with the
+        query. With NumPy, one matrix-vector product gives every candidate an
+        upper bound on its exact score (see :func:`_hash_vector`); candidates are
+        re-scored exactly in rounds of ``top_k``, highest bound first, until no
+        remaining bound can beat the best exact score. The result is the same as
+        scoring every candidate with :func:`_cos_sim`.
 
         Args:
             tool: Tool name to search cache for.
@@ -174,42 +418,65 @@ class ResponseCacheByPromptPlugin(Plugin):
         Returns:
             Tuple of (best matching entry, similarity score).
         """
-        bucket = self._cache.get(tool, [])
-        if not bucket:
+        store = self._cache.get(tool)
+        if not store:
             return None, 0.0
 
         vec = _vectorize(text)
-        query_tokens = set(vec.keys())
+        now = time.time()
+        if store.matrix is None:
+            return self._best_exact(store, vec, store.candidates(set(vec.keys())), now, None, 0.0)
+
+        slots, all_slots = store.dense_candidates(set(vec.keys()))
+        query = _hash_vector(vec, store.dim)
+        if all_slots:
+            bounds = store.matrix @ query
+            live = store.expires > now
+            slots, bounds = slots[live], bounds[live]
+        else:
+            slots = slots[store.expires[slots] > now]
+            bounds = store.matrix[slots] @ query
 
-        # Fast path: use inverted index to find candidate entries
-        # Only consider entries that share at least one token with query
-        tool_index = self._index.get(tool, {})
-        candidate_indices: Set[int] = set()
+        best: Optional[_Entry] = None
+        best_sim = 0.0
+        k = self._cfg.top_k
+        while slots.size:
+            if k < slots.size:
+                order = np.argpartition(bounds, -k)
+                chunk, rest = order[-k:], order[:-k]
+            else:
+                chunk, rest = np.arange(slots.size), np.zeros(0, dtype=np.intp)
+            best, best_sim = self._best_exact(store, vec, slots[chunk].tolist(), now, best, best_sim)
+            # Every remaining bound is <= the smallest bound in this round
+            if float(bounds[chunk].min()) + _BOUND_TOLERANCE <= best_sim:
+                break
+            slots, bounds = slots[rest], bounds[rest]
 
-        for token in query_tokens:
-            if token in tool_index:
-                candidate_indices.update(tool_index[token])
+        return best, best_sim
 
-        # If no candidates found via index, fall back to empty result
-        if not candidate_indices:
-            return None, 0.0
+    @staticmethod
+    def _best_exact(store: _ToolStore, vec: Dict[str, float], slots: Any, now: float, best: Optional[_Entry], best_sim: float) -> Tuple[Optional[_Entry], float]:
+        """Score candidate slots exactly and keep the best live entry.
 
-        # Compute similarity only for candidates
-        best: Optional[_Entry] = None
-        best_sim = 0.0
-        now = time.time()
+        Args:
+            store: Tool store holding the entries.
+            vec: Query vector.
+            slots: Candidate slot numbers.
+            now: Current Unix time.
+            best: Best entry found so far.
+            best_sim: Similarity of ``best``.
 
-        for idx in candidate_indices:
-            if idx >= len(bucket):
-                continue
-            e = bucket[idx]
-            if e.expires_at <= now:
+        Returns:
+            Tuple of (best matching entry, similarity score).
+        """
+        for slot in slots:
+            e = store.slots[slot]
+            if e is None or e.expires_at <= now:
                 continue
             sim = _cos_sim(vec, e.vec)
             if sim > best_sim:
                 best = e
                 best_sim = sim
-
         return best, best_sim
 
     async def tool_pre_invoke(self, payload: ToolPreInvokePayload, context: PluginContext) -> ToolPreInvokeResult:
@@ -265,36 +532,23 @@ class ResponseCacheByPromptPlugin(Plugin):
             return ToolPostInvokeResult(continue_processing=True)
 
         vec = _vectorize(text)
-        tokens = set(vec.keys())
-        entry = _Entry(text=text, vec=vec, value=payload.result, expires_at=time.time() + max(1, int(self._cfg.ttl)), tokens=tokens)
-
-        bucket = self._cache.setdefault(tool, [])
-        entry_idx = len(bucket)
-        bucket.append(entry)
-
-        # Update inverted index for new entry
-        tool_index = self._index[tool]
-        for token in tokens:
-            tool_index[token].add(entry_idx)
-
-        # Evict expired entries and rebuild index
         now = time.time()
-        # Filter out expired entries
-        valid_entries = [e for e in bucket if e.expires_at > now]
+        entry = _Entry(text=text, vec=vec, value=payload.result, expires_at=now + max(1, int(self._cfg.ttl)), tokens=set(vec.keys()))
 
-        # Cap size if needed
-        if len(valid_entries) > self._cfg.max_entries:
-            valid_entries = valid_entries[-self._cfg.max_entries:]
+        store = self._store(tool)
+        store.purge_expired(now)
+        self._evictions += store.add(entry)
 
-        # Rebuild bucket and index if we removed or modified entries
-        if len(valid_entries) != len(bucket):
-            bucket.clear()
-            bucket.extend(valid_entries)
+        return ToolPostInvokeResult(metadata={"approx_cache_stored": True})
 
-            # Rebuild inverted index for this tool
-            self._index[tool].clear()
-            for new_idx, entry in enumerate(bucket):
-                for token in entry.tokens:
-                    self._index[tool][token].add(new_idx)
+    def stats(self) -> Dict[str, Any]:
+        """Return cache occupancy statistics.
 
-        return ToolPostInvokeResult(metadata={"approx_cache_stored": True})
+        Returns:
+            Entry counts per tool, capacity evictions and whether vectorized scoring is active.
+        """
+        return {
+            "entries": {tool: len(store) for tool, store in self._cache.items()},
+            "evictions": self._evictions,
+            "vectorized": NUMPY_AVAILABLE,
+        }
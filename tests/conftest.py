@@ -405,6 +405,31 @@ def clear_metrics_cache():
         pass
 
 
+@pytest.fixture(autouse=True)
+def clear_permission_index():
+    """Clear the process-wide compiled permission index between tests.
+
+    Permission sets and admin flags are shared across PermissionService
+    instances, so tests that mock different roles for the same user must not
+    see each other's entries.
+    """
+    try:
+        from mcpgateway.cache.auth_cache import auth_cache
+
+        auth_cache.invalidate_permissions_local()
+    except ImportError:
+        pass  # Cache module not available
+
+    yield
+
+    try:
+        from mcpgateway.cache.auth_cache import auth_cache
+
+        auth_cache.invalidate_permissions_local()
+    except ImportError:
+        pass
+
+
 @pytest.fixture(autouse=True)
 def clear_jwt_cache_between_tests():
     """Ensure JWT caches are cleared between tests for isolation.
@@ -428,3 +453,55 @@ def clear_jwt_cache_between_tests():
         clear_jwt_caches()
     except ImportError:
         pass
+
+
+@pytest.fixture(autouse=True)
+def clear_derived_key_cache():
+    """Clear cached Argon2id-derived keys and counters between tests."""
+    try:
+        from mcpgateway.services.encryption_service import clear_derived_key_cache as _clear
+
+        _clear()
+    except ImportError:
+        pass  # Module not available
+
+    yield
+
+
+@pytest.fixture(autouse=True)
+def clear_oauth_token_cache():
+    """Clear cached OAuth access tokens between tests.
+
+    Tests reuse the same token_url/client_id with different mocked token
+    endpoints, so a token cached by one test must not leak into another.
+    """
+    try:
+        from mcpgateway.cache.oauth_token_cache import oauth_token_cache
+
+        oauth_token_cache.invalidate_all_local()
+    except ImportError:
+        pass  # Cache module not available
+
+    yield
+
+    try:
+        from mcpgateway.cache.oauth_token_cache import oauth_token_cache
+
+        oauth_token_cache.invalidate_all_local()
+    except ImportError:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def clear_listing_cache():
+    """Clear the scope-aware listing cache between tests.
+
+    RPC list handlers serve repeated calls from this per-worker cache, so a
+    page cached by one test must not satisfy another test's mocked services.
+    """
+    try:
+        from mcpgateway.cache.listing_cache import listing_cache
+
+        listing_cache.invalidate_all()
+    except ImportError:
+        pass  # Cache module not available
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/performance/test_response_cache_by_prompt_lookup.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Lookup latency benchmark for ResponseCacheByPromptPlugin.
+
+Fills the cache with synthetic prompts that share a common vocabulary (so the
+inverted index returns many candidates) and measures the average
+``tool_pre_invoke`` latency as the number of cached entries grows, with and
+without NumPy-backed vectorized scoring.
+
+Usage:
+    python tests/performance/test_response_cache_by_prompt_lookup.py [--sizes 1000 5000 20000] [--queries 200]
+
+Output:
+    A table of average and p95 lookup latency per entry count and scoring mode.
+"""
+
+# Standard
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from typing import List
+
+# Add repo root to PYTHONPATH
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.join(SCRIPT_DIR, "..", "..")
+sys.path.insert(0, ROOT_DIR)
+
+# First-Party
+from mcpgateway.plugins.framework import GlobalContext, PluginConfig, PluginContext, ToolHookType, ToolPostInvokePayload, ToolPreInvokePayload  # noqa: E402
+from plugins.response_cache_by_prompt import response_cache_by_prompt as rcbp  # noqa: E402
+
+VOCABULARY = [f"word{i}" for i in range(2000)]
+COMMON = ["what", "is", "the", "best", "way", "to"]
+
+
+def make_prompt(rng: random.Random) -> str:
+    """Build a synthetic prompt sharing common tokens with every other prompt.
+
+    Args:
+        rng: Random generator.
+
+    Returns:
+        Prompt text.
+    """
+    return " ".join(rng.sample(COMMON, 3) + rng.sample(VOCABULARY, 6))
+
+
+def make_plugin(max_entries: int) -> rcbp.ResponseCacheByPromptPlugin:
+    """Create a plugin instance with capacity for ``max_entries`` entries.
+
+    Args:
+        max_entries: Per-tool capacity.
+
+    Returns:
+        Plugin instance.
+    """
+    return rcbp.ResponseCacheByPromptPlugin(
+        PluginConfig(
+            name="bench",
+            kind="plugins.response_cache_by_prompt.response_cache_by_prompt.ResponseCacheByPromptPlugin",
+            hooks=[ToolHookType.TOOL_PRE_INVOKE, ToolHookType.TOOL_POST_INVOKE],
+            config={"cacheable_tools": ["search"], "ttl": 3600, "max_entries": max_entries},
+        )
+    )
+
+
+async def bench(size: int, queries: int, vectorized: bool) -> List[float]:
+    """Fill a cache with ``size`` entries and time ``queries`` lookups.
+
+    Args:
+        size: Number of cached entries.
+        queries: Number of timed lookups.
+        vectorized: Use NumPy scoring when available.
+
+    Returns:
+        Per-lookup latencies in milliseconds.
+    """
+    saved = rcbp.NUMPY_AVAILABLE
+    rcbp.NUMPY_AVAILABLE = vectorized and saved
+    try:
+        rng = random.Random(42)
+        plugin = make_plugin(size)
+        for i in range(size):
+            ctx = PluginContext(global_context=GlobalContext(request_id=f"fill-{i}"))
+            ctx.set_state("rcbp_last_text", make_prompt(rng))
+            await plugin.tool_post_invoke(ToolPostInvokePayload(name="search", result={"i": i}), ctx)
+
+        latencies = []
+        for i in range(queries):
+            payload = ToolPreInvokePayload(name="search", args={"prompt": make_prompt(rng)})
+            ctx = PluginContext(global_context=GlobalContext(request_id=f"q-{i}"))
+            start = time.perf_counter()
+            await plugin.tool_pre_invoke(payload, ctx)
+            latencies.append((time.perf_counter() - start) * 1000)
+        return latencies
+    finally:
+        rcbp.NUMPY_AVAILABLE = saved
+
+
+async def main() -> None:
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(description="Benchmark ResponseCacheByPromptPlugin lookup latency")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000, 50000])
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    modes = [("python", False)] + ([("numpy", True)] if rcbp.NUMPY_AVAILABLE else [])
+    print(f"{'entries':>8} {'mode':>8} {'avg ms':>9} {'p95 ms':>9}")
+    for size in args.sizes:
+        for name, vectorized in modes:
+            lat = sorted(await bench(size, args.queries, vectorized))
+            p95 = lat[int(len(lat) * 0.95) - 1]
+            print(f"{size:>8} {name:>8} {statistics.mean(lat):>9.3f} {p95:>9.3f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
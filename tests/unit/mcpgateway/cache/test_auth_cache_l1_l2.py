@@ -20,7 +20,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 # First-Party
-from mcpgateway.cache.auth_cache import AuthCache, CachedAuthContext, CacheEntry
+from mcpgateway.cache.auth_cache import AuthCache, CachedAuthContext, CacheEntry, CompiledPermissions
 
 
 @pytest.fixture
@@ -520,6 +520,57 @@ class TestAuthCacheInvalidation:
         assert auth_cache._team_cache == {}
 
 
+class TestPermissionIndex:
+    """Cover the process-wide compiled permission index."""
+
+    def test_lru_bound(self, auth_cache):
+        auth_cache._permission_max_entries = 2
+        compiled = CompiledPermissions(permissions=frozenset({"tools.read"}))
+        for email in ("a", "b"):
+            auth_cache.set_compiled_permissions(f"{email}@example.com:global", compiled, auth_cache.permission_generation)
+        auth_cache.get_compiled_permissions("a@example.com:global")  # a becomes most recently used
+        auth_cache.set_compiled_permissions("c@example.com:global", compiled, auth_cache.permission_generation)
+        assert auth_cache.get_compiled_permissions("b@example.com:global") is None
+        assert auth_cache.get_compiled_permissions("a@example.com:global") is compiled
+        assert auth_cache.stats()["permission_cache_size"] == 2
+
+    def test_expired_entry_is_miss(self, auth_cache):
+        auth_cache._permission_cache["a@example.com:global"] = CacheEntry(value=CompiledPermissions(permissions=frozenset()), expiry=time.time() - 1)
+        assert auth_cache.get_compiled_permissions("a@example.com:global") is None
+        assert "a@example.com:global" not in auth_cache._permission_cache
+
+    def test_disabled(self):
+        cache = AuthCache(enabled=False)
+        cache.set_compiled_permissions("a@example.com:global", CompiledPermissions(permissions=frozenset()), cache.permission_generation)
+        assert cache.get_compiled_permissions("a@example.com:global") is None
+
+    @pytest.mark.asyncio
+    async def test_role_and_team_invalidation_evict_permissions(self, auth_cache, mock_redis):
+        compiled = CompiledPermissions(permissions=frozenset({"tools.read"}))
+        for key in ("a@example.com:team-1", "a@example.com:global", "b@example.com:__anyteam__", "b@example.com:team-2"):
+            auth_cache.set_compiled_permissions(key, compiled, auth_cache.permission_generation)
+        auth_cache.set_user_is_admin("a@example.com", False, auth_cache.permission_generation)
+        mock_redis.publish = AsyncMock()
+
+        async def _scan_iter(match=None):
+            return
+            yield
+
+        mock_redis.scan_iter = _scan_iter
+        with patch.object(auth_cache, "_get_redis_client", return_value=mock_redis):
+            await auth_cache.invalidate_team_roles("team-2")
+            assert auth_cache.get_compiled_permissions("b@example.com:team-2") is None
+            assert auth_cache.get_compiled_permissions("b@example.com:__anyteam__") is None
+            assert auth_cache.get_compiled_permissions("a@example.com:global") is compiled
+
+            await auth_cache.invalidate_user_role("a@example.com", "team-1")
+            assert auth_cache.get_compiled_permissions("a@example.com:global") is None
+            assert auth_cache.get_user_is_admin("a@example.com") is None
+
+            await auth_cache.invalidate_permissions()
+        mock_redis.publish.assert_called_with("mcpgw:auth:invalidate", "permissions:*")
+
+
 def test_auth_cache_import_error_defaults(monkeypatch):
     real_import = builtins.__import__
 
@@ -45,6 +45,7 @@ def create_mock_registry_cache(cache_data: dict) -> MagicMock:
     mock._lock = threading.Lock()
     # Configure _get_redis_key to return proper prefixes
     mock._get_redis_key = lambda key_type: f"{key_type}:"
+    mock._consume_echo.return_value = False
     return mock
 
 
@@ -102,6 +103,19 @@ class TestCacheInvalidationSubscriber:
 
             assert "resources:hash1" not in mock_registry_cache._cache
             assert "tools:hash2" in mock_registry_cache._cache
+            mock_registry_cache._notify_listeners.assert_called_once_with("resources")
+
+    @pytest.mark.asyncio
+    async def test_process_registry_invalidation_skips_listeners_for_own_echo(self, cache_subscriber):
+        """Listeners already ran locally, so our own published message only clears the cache."""
+        mock_registry_cache = create_mock_registry_cache({"tools:hash1": {"data": "cached"}})
+        mock_registry_cache._consume_echo.return_value = True
+
+        with patch("mcpgateway.cache.registry_cache.get_registry_cache", return_value=mock_registry_cache):
+            await cache_subscriber._process_invalidation("registry:tools")
+
+        assert "tools:hash1" not in mock_registry_cache._cache
+        mock_registry_cache._notify_listeners.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_process_tool_lookup_name_invalidation(self, cache_subscriber):
@@ -157,6 +171,24 @@ class TestCacheInvalidationSubscriber:
             assert "admin:users:list" not in mock_admin_cache._cache
             assert "admin:teams:list" in mock_admin_cache._cache
 
+    @pytest.mark.asyncio
+    async def test_process_auth_permission_invalidation(self, cache_subscriber):
+        """Test that AuthCache messages clear the local compiled permission index."""
+        mock_auth_cache = MagicMock()
+
+        with patch("mcpgateway.cache.auth_cache.get_auth_cache", return_value=mock_auth_cache):
+            await cache_subscriber._process_invalidation("role:user@example.com:team-1")
+            mock_auth_cache.invalidate_permissions_local.assert_called_with(email="user@example.com")
+
+            await cache_subscriber._process_invalidation("team_roles:team-1")
+            mock_auth_cache.invalidate_permissions_local.assert_called_with(team_id="team-1")
+
+            await cache_subscriber._process_invalidation("permissions:*")
+            mock_auth_cache.invalidate_permissions_local.assert_called_with()
+
+            await cache_subscriber._process_invalidation("revoke:jti-123")
+            mock_auth_cache.mark_token_revoked_local.assert_called_once_with("jti-123")
+
     @pytest.mark.asyncio
     async def test_process_unknown_message_format(self, cache_subscriber):
         """Test that unknown message formats are handled gracefully."""
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/cache/test_listing_cache.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Unit tests for mcpgateway.cache.listing_cache.
+"""
+
+# Standard
+from unittest.mock import patch
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.cache.listing_cache import ListingCache
+from mcpgateway.cache.registry_cache import RegistryCache
+
+
+@pytest.fixture
+def registry():
+    registry = RegistryCache()
+    with patch("mcpgateway.cache.listing_cache.get_registry_cache", return_value=registry):
+        yield registry
+
+
+@pytest.fixture
+def cache(registry):
+    return ListingCache()
+
+
+def test_scope_key_normalizes_teams():
+    assert ListingCache.scope_key(None, None) == "admin"
+    assert ListingCache.scope_key("a@x.com", None) == "user=a@x.com"
+    assert ListingCache.scope_key("a@x.com", []) == ListingCache.scope_key("b@x.com", []) == "public"
+    assert ListingCache.scope_key("a@x.com", ["t2", "t1"]) == ListingCache.scope_key("a@x.com", ["t1", "t2", "t1"])
+    assert ListingCache.scope_key("a@x.com", ["t1"]) != ListingCache.scope_key("b@x.com", ["t1"])
+
+
+def test_make_key_distinguishes_server_cursor_and_requester():
+    keys = {
+        ListingCache.make_key("tools", "public"),
+        ListingCache.make_key("tools", "public", server_id="s1"),
+        ListingCache.make_key("tools", "public", cursor="c1"),
+        ListingCache.make_key("tools", "public", requester="a@x.com"),
+        ListingCache.make_key("prompts", "public"),
+    }
+    assert len(keys) == 5
+
+
+def test_get_set_and_stats(cache):
+    key = cache.make_key("tools", "admin")
+    assert cache.get(key) is None
+    cache.set(key, b'{"tools":[]}', "tools")
+    assert cache.get(key) == b'{"tools":[]}'
+
+    stats = cache.stats()
+    assert stats["hit_count"] == 1
+    assert stats["miss_count"] == 1
+    assert stats["entries"] == 1
+    assert stats["size_bytes"] == len(b'{"tools":[]}')
+
+    cache.reset_stats()
+    assert cache.stats()["hit_count"] == 0
+
+
+def test_entries_expire_with_registry_ttl(cache):
+    key = cache.make_key("prompts", "public")
+    with patch("mcpgateway.cache.listing_cache.time.time", return_value=1000.0):
+        cache.set(key, b"{}", "prompts")
+    with patch("mcpgateway.cache.listing_cache.time.time", return_value=1000.0 + cache._ttls["prompts"] + 1):
+        assert cache.get(key) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_eviction_by_count_and_bytes(cache):
+    cache._max_entries = 2
+    cache.set("a", b"1", "tools")
+    cache.set("b", b"2", "tools")
+    cache.get("a")
+    cache.set("c", b"3", "tools")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+
+    cache._max_entries = 100
+    cache._max_bytes = 4
+    cache.set("d", b"444", "tools")
+    assert cache.stats()["size_bytes"] <= 4
+    assert cache.get("d") == b"444"
+
+    cache.set("huge", b"x" * 10, "tools")
+    assert cache.get("huge") is None
+
+
+def test_disabled_cache_is_a_no_op(cache):
+    cache._enabled = False
+    cache.set("k", b"{}", "tools")
+    assert cache.get("k") is None
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_registry_invalidation_drops_matching_pages(cache, registry):
+    tools = cache.make_key("tools", "public")
+    prompts = cache.make_key("prompts", "public")
+    server_resources = cache.make_key("resources", "public", server_id="s1")
+    resources = cache.make_key("resources", "public")
+    for key, kind in ((tools, "tools"), (prompts, "prompts"), (server_resources, "resources"), (resources, "resources")):
+        cache.set(key, b"{}", kind)
+
+    await registry.invalidate_tools()
+    assert cache.get(tools) is None
+    assert cache.get(prompts) == b"{}"
+
+    await registry.invalidate_servers()
+    assert cache.get(server_resources) is None
+    assert cache.get(resources) == b"{}"
+
+    await registry.invalidate_prompts()
+    assert cache.get(prompts) is None
+    assert cache.get(resources) == b"{}"
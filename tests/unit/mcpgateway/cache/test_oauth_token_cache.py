@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""Tests for OAuthTokenCache."""
+
+# Standard
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third-Party
+import orjson
+import pytest
+
+# First-Party
+from mcpgateway.cache.oauth_token_cache import IssuedAccessToken, OAuthTokenCache, TokenEntry
+from mcpgateway.services.oauth_manager import OAuthManager
+
+
+@pytest.fixture
+def token_cache():
+    cache = OAuthTokenCache()
+    cache._enabled = True
+    cache._l2_enabled = False
+    cache._refresh_margin_seconds = 60
+    cache._default_ttl_seconds = 3600
+    cache.invalidate_all_local()
+    cache.reset_stats()
+    return cache
+
+
+def _fetcher(*tokens, expires_in=300, delay=0.0):
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        if delay:
+            await asyncio.sleep(delay)
+        value = tokens[min(len(calls), len(tokens)) - 1]
+        if isinstance(value, Exception):
+            raise value
+        return IssuedAccessToken(value, expires_in=expires_in)
+
+    return fetch, calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch(token_cache):
+    fetch, calls = _fetcher("tok", delay=0.01)
+
+    results = await asyncio.gather(*(token_cache.get_or_fetch("k", fetch) for _ in range(10)))
+
+    assert results == ["tok"] * 10
+    assert len(calls) == 1
+    assert token_cache.stats()["coalesced_count"] == 9
+
+
+@pytest.mark.asyncio
+async def test_expires_in_is_honored(token_cache):
+    fetch, calls = _fetcher("old", "new", expires_in=120)
+
+    assert await token_cache.get_or_fetch("k", fetch) == "old"
+    entry = token_cache._cache["k"]
+    assert 119 <= entry.expires_at - time.time() <= 120
+
+    entry.expires_at = time.time() - 1
+    assert await token_cache.get_or_fetch("k", fetch) == "new"
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_default_ttl_used_without_expires_in(token_cache):
+    token_cache._default_ttl_seconds = 900
+
+    async def fetch():
+        return "plain"
+
+    assert await token_cache.get_or_fetch("k", fetch) == "plain"
+    assert 899 <= token_cache._cache["k"].expires_at - time.time() <= 900
+
+
+@pytest.mark.asyncio
+async def test_zero_lifetime_tokens_are_not_cached(token_cache):
+    fetch, calls = _fetcher("a", "b", expires_in=0)
+
+    assert await token_cache.get_or_fetch("k", fetch) == "a"
+    assert await token_cache.get_or_fetch("k", fetch) == "b"
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_window_serves_current_token_and_refreshes_in_background(token_cache):
+    fetch, calls = _fetcher("old", "new")
+    await token_cache.get_or_fetch("k", fetch)
+    token_cache._cache["k"].refresh_at = time.time() - 1
+
+    assert await token_cache.get_or_fetch("k", fetch) == "old"
+    await asyncio.gather(*token_cache._background)
+
+    assert len(calls) == 2
+    assert await token_cache.get_or_fetch("k", fetch) == "new"
+    assert token_cache.stats()["refresh_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_background_refresh_keeps_valid_token(token_cache):
+    fetch, calls = _fetcher("old", RuntimeError("idp down"))
+    await token_cache.get_or_fetch("k", fetch)
+    token_cache._cache["k"].refresh_at = time.time() - 1
+
+    assert await token_cache.get_or_fetch("k", fetch) == "old"
+    await asyncio.gather(*token_cache._background, return_exceptions=True)
+
+    assert len(calls) == 2
+    assert token_cache._cache["k"].token == "old"
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_is_raised_to_every_waiter(token_cache):
+    fetch, calls = _fetcher(RuntimeError("bad client"), delay=0.01)
+
+    results = await asyncio.gather(*(token_cache.get_or_fetch("k", fetch) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(calls) == 1
+    assert "k" not in token_cache._cache
+
+
+@pytest.mark.asyncio
+async def test_disabled_or_unkeyed_always_fetches(token_cache):
+    fetch, calls = _fetcher("a", "b", "c")
+    await token_cache.get_or_fetch(None, fetch)
+    token_cache._enabled = False
+    await token_cache.get_or_fetch("k", fetch)
+    await token_cache.get_or_fetch("k", fetch)
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_l1_evicts_least_recently_used(token_cache):
+    token_cache._l1_maxsize = 2
+    for key in ("a", "b", "c"):
+        fetch, _ = _fetcher(key)
+        await token_cache.get_or_fetch(key, fetch)
+    assert list(token_cache._cache) == ["b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_l2_shares_encrypted_tokens(token_cache):
+    store = {}
+    redis = MagicMock()
+    redis.get = AsyncMock(side_effect=lambda k: store.get(k))
+    redis.setex = AsyncMock(side_effect=lambda k, ttl, v: store.__setitem__(k, v))
+    token_cache._l2_enabled = True
+
+    encryption = MagicMock()
+    encryption.encrypt_secret_async = AsyncMock(side_effect=lambda t: f"enc:{t}")
+    encryption.decrypt_secret_async = AsyncMock(side_effect=lambda t: t.removeprefix("enc:"))
+
+    with patch.object(token_cache, "_get_redis_client", AsyncMock(return_value=redis)), patch.object(OAuthTokenCache, "_get_encryption", return_value=encryption):
+        fetch, calls = _fetcher("shared")
+        await token_cache.get_or_fetch("k", fetch)
+
+        stored = orjson.loads(store[token_cache._redis_key("k")])
+        assert stored["token"] == "enc:shared"
+        ttl = redis.setex.await_args.args[1]
+        assert 0 < ttl <= 300
+
+        # Another worker with an empty L1 picks the token up from Redis.
+        token_cache.invalidate_all_local()
+        other_fetch, other_calls = _fetcher("unused")
+        assert await token_cache.get_or_fetch("k", other_fetch) == "shared"
+        assert other_calls == []
+        assert token_cache.stats()["l2_hit_count"] == 1
+
+
+def test_build_key_separates_password_users():
+    creds = {"token_url": "https://idp/token", "client_id": "c"}
+    assert OAuthTokenCache.build_key("password", dict(creds, username="a")) != OAuthTokenCache.build_key("password", dict(creds, username="b"))
+    assert OAuthTokenCache.build_key("client_credentials", creds) != OAuthTokenCache.build_key("password", creds)
+
+
+def test_build_key_separates_secrets():
+    creds = {"token_url": "https://idp/token", "client_id": "c", "client_secret": "old"}
+    assert OAuthTokenCache.build_key("client_credentials", creds) != OAuthTokenCache.build_key("client_credentials", dict(creds, client_secret="new"))
+    owner = dict(creds, username="u", password="right")
+    assert OAuthTokenCache.build_key("password", owner) != OAuthTokenCache.build_key("password", dict(owner, password="wrong"))
+    assert "right" not in OAuthTokenCache.build_key("password", owner)
+
+
+def test_make_entry_caps_margin_for_short_lived_tokens(token_cache):
+    entry = token_cache._make_entry("t", time.time() + 600)
+    assert round(entry.expires_at - entry.refresh_at) == 60
+    assert isinstance(entry, TokenEntry)
+
+
+@pytest.mark.asyncio
+async def test_get_access_token_reuses_cached_token():
+    manager = OAuthManager(max_retries=1)
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.headers = {"content-type": "application/json"}
+    response.json.return_value = {"access_token": "cached-token", "expires_in": 600}
+    client = MagicMock()
+    client.post = AsyncMock(return_value=response)
+    creds = {"grant_type": "client_credentials", "client_id": "c", "client_secret": "s", "token_url": "https://idp/token", "scopes": ["read"]}
+
+    with patch.object(manager, "_get_client", AsyncMock(return_value=client)):
+        tokens = await asyncio.gather(*(manager.get_access_token(creds) for _ in range(5)))
+        tokens.append(await OAuthManager(max_retries=1).get_access_token(creds))
+
+    assert tokens == ["cached-token"] * 6
+    assert client.post.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_access_token_forces_new_fetch():
+    manager = OAuthManager(max_retries=1)
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.headers = {"content-type": "application/json"}
+    response.json.side_effect = [{"access_token": "revoked", "expires_in": 600}, {"access_token": "fresh", "expires_in": 600}]
+    client = MagicMock()
+    client.post = AsyncMock(return_value=response)
+    creds = {"grant_type": "client_credentials", "client_id": "c", "client_secret": "s", "token_url": "https://idp/invalidate", "scopes": ["read"]}
+
+    with patch.object(manager, "_get_client", AsyncMock(return_value=client)):
+        assert await manager.get_access_token(creds) == "revoked"
+        await manager.invalidate_access_token(creds)
+        assert await manager.get_access_token(creds) == "fresh"
+
+    assert client.post.await_count == 2
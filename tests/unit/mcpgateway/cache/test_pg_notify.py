@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/cache/test_pg_notify.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Unit tests for PostgreSQL LISTEN/NOTIFY fan-out and its use by the session registry.
+"""
+
+# Standard
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+# Third-Party
+import orjson
+import pytest
+
+# First-Party
+from mcpgateway.cache.pg_notify import PgNotifyListener
+from mcpgateway.cache.session_registry import SESSION_MESSAGE_CHANNEL, SessionRegistry
+
+
+class FakeConnection:
+    """Async connection stub yielding queued notifications."""
+
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.closed = False
+
+    async def notifies(self):
+        while True:
+            payload = await self.queue.get()
+            if payload is None:
+                return
+            yield SimpleNamespace(payload=payload)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_listener_fans_out_and_reconnects():
+    first, second = FakeConnection(), FakeConnection()
+    listener = PgNotifyListener("postgresql+psycopg://u:p@db/mcp", "chan", reconnect_delay=0.01)
+
+    with patch.object(listener, "_connect", AsyncMock(side_effect=[first, second])):
+        await listener.start()
+        mine, other = listener.subscribe("sid-1"), listener.subscribe("sid-2")
+
+        await first.queue.put("sid-1")
+        await asyncio.wait_for(mine.wait(), 1)
+        assert not other.is_set()
+
+        # Dropped connection: reconnect and wake everyone to re-check missed work
+        mine.clear()
+        await first.queue.put(None)
+        await asyncio.wait_for(other.wait(), 1)
+        assert mine.is_set() and first.closed
+        assert listener.reconnects == 1 and listener.connected
+
+        listener.unsubscribe("sid-1")
+        await second.queue.put("sid-1")
+        await asyncio.sleep(0.01)
+        assert listener.notifications_received == 2
+
+        await listener.stop()
+    assert second.closed and not listener.connected
+
+
+def _db_mocks(records):
+    read_query = Mock()
+    read_query.outerjoin.return_value = read_query
+    read_query.filter.return_value = read_query
+    read_query.order_by.return_value = read_query
+    read_query.first.side_effect = records
+    remove_query = Mock()
+    remove_query.filter.return_value = remove_query
+    db = Mock()
+    db.query.side_effect = lambda *args: read_query if len(args) == 2 else remove_query
+    return db, read_query
+
+
+@pytest.mark.asyncio
+async def test_respond_waits_on_notification_instead_of_polling(monkeypatch):
+    reg = SessionRegistry(backend="memory")
+    reg._backend = "database"
+    reg._notify_listener = listener = PgNotifyListener("postgresql://u@db/mcp", SESSION_MESSAGE_CHANNEL)
+    listener._conn = FakeConnection()
+    reg._sessions["sid"] = object()
+
+    record = Mock(message=orjson.dumps({"message": {"method": "ping", "id": 1}}).decode())
+    session = Mock()
+    db, read_query = _db_mocks([(session, None), (session, record), None])
+    monkeypatch.setattr("mcpgateway.cache.session_registry.get_db", lambda: iter([db]))
+    monkeypatch.setattr(reg, "generate_response", AsyncMock())
+    real_sleep, sleep = asyncio.sleep, AsyncMock()
+
+    # Patching the registry's asyncio.sleep patches asyncio itself, so keep the real one for the test
+    with patch("mcpgateway.cache.session_registry.asyncio.sleep", sleep):
+        task = asyncio.create_task(reg.respond(server_id=None, user={}, session_id="sid", base_url="http://localhost"))
+        await real_sleep(0.05)
+        assert read_query.first.call_count == 1  # idle: parked on the event, no further queries
+
+        listener._dispatch("sid")
+        await asyncio.wait_for(task, 1)
+
+    reg.generate_response.assert_awaited_once()
+    sleep.assert_not_awaited()
+    assert "sid" not in listener._waiters
+
+
+@pytest.mark.asyncio
+async def test_broadcast_notifies_in_same_transaction_on_postgres(monkeypatch):
+    monkeypatch.setattr("mcpgateway.cache.session_registry.settings.session_registry_pg_notify_enabled", True)
+    reg = SessionRegistry(backend="database", database_url="postgresql+psycopg://u@db/mcp")
+    assert reg._pg_notify is True
+    assert SessionRegistry(backend="database", database_url="sqlite:///./mcp.db")._pg_notify is False
+
+    db = Mock()
+    monkeypatch.setattr("mcpgateway.cache.session_registry.get_db", lambda: iter([db]))
+    await reg.broadcast("sid", {"method": "ping"})
+
+    sql, params = db.execute.call_args.args
+    assert "pg_notify" in str(sql)
+    assert params == {"channel": SESSION_MESSAGE_CHANNEL, "session_id": "sid"}
+    calls = [name for name, *_ in db.method_calls]
+    assert calls.index("execute") < calls.index("commit")
+
+
+@pytest.mark.asyncio
+async def test_initialize_falls_back_to_polling_when_listener_fails(monkeypatch):
+    monkeypatch.setattr("mcpgateway.cache.session_registry.settings.session_registry_pg_notify_enabled", True)
+    reg = SessionRegistry(backend="database", database_url="postgresql://u@db/mcp")
+    with patch("mcpgateway.cache.session_registry.PgNotifyListener.start", AsyncMock(side_effect=OSError("refused"))):
+        await reg.initialize()
+    assert reg._notify_listener is None
+    await reg.shutdown()
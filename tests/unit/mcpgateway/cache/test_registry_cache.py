@@ -225,6 +225,30 @@ class TestRegistryCache:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_invalidate_fires_listeners(self):
+        """Invalidation listeners run for their cache type only; bound methods are held weakly."""
+        cache = RegistryCache()
+        calls = []
+
+        class Owner:
+            def on_invalidate(self):
+                calls.append("owner")
+
+        owner = Owner()
+        cache.add_invalidation_listener("resources", owner.on_invalidate)
+        cache.add_invalidation_listener("resources", lambda: calls.append("func"))
+        cache.add_invalidation_listener("tools", lambda: calls.append("tools"))
+
+        await cache.invalidate_resources()
+        assert calls == ["owner", "func"]
+
+        del owner
+        calls.clear()
+        await cache.invalidate_resources()
+        assert calls == ["func"]
+        assert len(cache._listeners["resources"]) == 1
+
     @pytest.mark.asyncio
     async def test_invalidate_agents(self):
         """Test agents cache invalidation."""
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/cache/test_registry_versions.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Unit tests for mcpgateway.cache.registry_versions.
+"""
+
+# Standard
+import contextvars
+from unittest.mock import MagicMock, patch
+import uuid
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.cache.registry_cache import RegistryCache
+from mcpgateway.cache.registry_versions import registry_listing_headers, RegistryVersions
+from mcpgateway.db import Server
+
+
+@pytest.fixture
+def versions():
+    return RegistryVersions(register_listeners=False)
+
+
+def _in_other_task(fn, *args):
+    contextvars.Context().run(fn, *args)
+
+
+def test_invalidation_paired_with_event_from_same_mutation(versions):
+    token = versions.token("tools")
+    versions.record("tools")  # RegistryCache invalidation
+    versions.record_event("tools", {"type": "tool_updated", "data": {"id": "t1"}})
+    assert versions.changes_since("tools", token) == {"t1": "changed"}
+
+
+def test_unexplained_invalidation_forces_reset(versions):
+    token = versions.token("tools")
+    versions.record_event("tools", {"type": "tool_updated", "data": {"id": "t1"}})
+    _in_other_task(versions.record, "tools")
+    assert versions.changes_since("tools", token) is None
+
+
+def test_net_operation_per_id(versions):
+    token = versions.token("prompts")
+    versions.record("prompts", "a", "added")
+    versions.record("prompts", "a", "changed")
+    versions.record("prompts", "b", "changed")
+    versions.record("prompts", "b", "removed")
+    assert versions.changes_since("prompts", token) == {"a": "added", "b": "removed"}
+
+
+def test_tokens_from_other_epochs_truncated_logs_and_bad_input_reset(versions):
+    other = RegistryVersions(register_listeners=False)
+    assert versions.changes_since("tools", other.token("tools")) is None
+    assert versions.changes_since("tools", "not-a-token") is None
+
+    versions._logs["tools"] = type(versions._logs["tools"])(maxlen=2)
+    token = versions.token("tools")
+    for i in range(3):
+        versions.record("tools", f"t{i}", "changed")
+    assert versions.changes_since("tools", token) is None
+
+
+def test_tokens_expire_without_shared_invalidation(versions):
+    token = versions.token("servers")
+    with patch("mcpgateway.cache.registry_versions.time.time", return_value=10**10):
+        assert versions.changes_since("servers", token) is None
+    versions._shared_invalidation = True
+    with patch("mcpgateway.cache.registry_versions.time.time", return_value=10**10):
+        assert versions.changes_since("servers", token) == {}
+
+
+@pytest.mark.asyncio
+async def test_registry_invalidation_bumps_version():
+    registry = RegistryCache()
+    with patch("mcpgateway.cache.registry_cache.get_registry_cache", return_value=registry):
+        versions = RegistryVersions()
+    await registry.invalidate_gateways()
+    assert versions.version("gateways") == 1
+
+
+def test_listing_headers_and_not_modified(versions):
+    request = MagicMock()
+    request.url.path, request.url.query, request.headers = "/servers", "include_inactive=false", {}
+    with patch("mcpgateway.cache.registry_versions.registry_versions", versions):
+        headers, not_modified = registry_listing_headers(request, "servers", "a@x.com", ["t1"])
+        assert not_modified is None
+        assert headers["X-Registry-Version"] == versions.token("servers")
+
+        request.headers = {"if-none-match": headers["ETag"]}
+        assert registry_listing_headers(request, "servers", "a@x.com", ["t1"])[1].status_code == 304
+
+        versions.record("servers", "s1", "changed")
+        assert registry_listing_headers(request, "servers", "a@x.com", ["t1"])[1] is None
+
+        versions._enabled = False
+        assert registry_listing_headers(request, "servers", "a@x.com", ["t1"]) == ({}, None)
+
+
+def test_delta_filters_by_caller_visibility(versions, test_db):
+    def add(visibility, team_id=None, owner_email=None, enabled=True):
+        server = Server(id=uuid.uuid4().hex, name=f"srv-{uuid.uuid4().hex[:8]}", visibility=visibility, team_id=team_id, owner_email=owner_email, enabled=enabled)
+        test_db.add(server)
+        test_db.commit()
+        return server.id
+
+    public = add("public")
+    team = add("team", team_id="team-1")
+    other_team = add("team", team_id="team-2")
+    disabled = add("public", enabled=False)
+
+    token = versions.token("servers")
+    versions.record("servers", public, "added")
+    versions.record("servers", team, "changed")
+    versions.record("servers", other_team, "added")
+    versions.record("servers", disabled, "changed")
+    versions.record("servers", "gone", "removed")
+
+    delta = versions.delta(test_db, "servers", token, "a@x.com", ["team-1"])
+    assert delta["reset"] is False
+    assert delta["added"] == [public]
+    assert delta["changed"] == [team]
+    assert sorted(delta["removed"]) == sorted([disabled, "gone"])
+    assert versions.changes_since("servers", delta["version"]) == {}
+
+    admin = versions.delta(test_db, "servers", token, include_inactive=True)
+    assert sorted(admin["added"]) == sorted([public, other_team])
+    assert sorted(admin["changed"]) == sorted([team, disabled])
+
+    public_only = versions.delta(test_db, "servers", token, "a@x.com", [])
+    assert public_only["added"] == [public]
+    assert team in public_only["removed"]
+
+    _in_other_task(versions.record, "servers")
+    assert versions.delta(test_db, "servers", token)["reset"] is True
@@ -15,6 +15,12 @@ from starlette.responses import Response
 from mcpgateway.middleware.observability_middleware import ObservabilityMiddleware
 
 
+@pytest.fixture(autouse=True)
+def direct_writes(monkeypatch):
+    """These tests cover the unbuffered path that writes traces through ObservabilityService."""
+    monkeypatch.setattr("mcpgateway.middleware.observability_middleware.settings.observability_buffer_enabled", False)
+
+
 @pytest.fixture
 def mock_request():
     request = MagicMock(spec=Request)
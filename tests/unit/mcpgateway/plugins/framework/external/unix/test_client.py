@@ -10,9 +10,11 @@ Tests for UnixSocketExternalPlugin initialization, hook invocation, and error ha
 
 # Standard
 import asyncio
+import struct
 from unittest.mock import AsyncMock, MagicMock, patch
 
 # Third-Party
+import orjson
 import pytest
 
 # Check if grpc/protobuf is available
@@ -653,3 +655,100 @@ class TestUnixSocketExternalPluginDisconnect:
         await plugin._disconnect()
         assert plugin._writer is None
         assert plugin._connected is False
+
+
+class TestUnixSocketExternalPluginMultiplexing:
+    """Tests for pipelined requests sharing one connection."""
+
+    @pytest.fixture
+    def piped_plugin(self, mock_plugin_config):
+        """Create a connected plugin; tests attach a StreamReader to feed responses."""
+        plugin = UnixSocketExternalPlugin(mock_plugin_config)
+        plugin._connected = True
+        mock_writer = MagicMock()
+        mock_writer.is_closing.return_value = False
+        plugin._writer = mock_writer
+        return plugin
+
+    @staticmethod
+    def _frame(response) -> bytes:
+        from mcpgateway.plugins.framework.external.unix.protocol import LENGTH_FORMAT
+
+        data = response.SerializeToString()
+        return struct.pack(LENGTH_FORMAT, len(data)) + data
+
+    async def _invoke_concurrently(self, plugin, sent, names):
+        plugin._reader = asyncio.StreamReader()
+        context = PluginContext(global_context=GlobalContext(request_id="test", server_id="test"))
+        tasks = [asyncio.create_task(plugin.invoke_hook("tool_pre_invoke", ToolPreInvokePayload(name=name, args={}), context)) for name in names]
+        while len(sent) < len(names):
+            await asyncio.sleep(0)
+        return tasks
+
+    @pytest.mark.asyncio
+    async def test_out_of_order_responses_are_matched_by_request_id(self, piped_plugin):
+        """Concurrent invocations are all written before any response arrives."""
+        from mcpgateway.plugins.framework.external.grpc.proto import plugin_service_pb2
+
+        sent = []
+
+        async def capture(_writer, data):
+            request = plugin_service_pb2.InvokeHookRequest()
+            request.ParseFromString(data)
+            sent.append(request)
+
+        piped_plugin._json_payload = True
+        with patch("mcpgateway.plugins.framework.external.unix.client.write_message_async", side_effect=capture):
+            tasks = await self._invoke_concurrently(piped_plugin, sent, ["first", "second"])
+            assert [orjson.loads(request.payload_json)["name"] for request in sent] == ["first", "second"]
+            assert not sent[0].HasField("payload")
+
+            for request in reversed(sent):
+                response = plugin_service_pb2.InvokeHookResponse(request_id=request.request_id)
+                response.result_json = orjson.dumps({"continue_processing": True, "metadata": {"for": orjson.loads(request.payload_json)["name"]}})
+                piped_plugin._reader.feed_data(self._frame(response))
+            results = await asyncio.gather(*tasks)
+
+        assert [result.metadata["for"] for result in results] == ["first", "second"]
+        assert not piped_plugin._pending
+
+    @pytest.mark.asyncio
+    async def test_responses_without_request_id_resolve_in_order(self, piped_plugin):
+        """Servers that do not echo request ids answer in order and are matched FIFO."""
+        from mcpgateway.plugins.framework.external.grpc.proto import plugin_service_pb2
+
+        sent = []
+
+        async def capture(_writer, data):
+            request = plugin_service_pb2.InvokeHookRequest()
+            request.ParseFromString(data)
+            sent.append(request)
+
+        with patch("mcpgateway.plugins.framework.external.unix.client.write_message_async", side_effect=capture):
+            tasks = await self._invoke_concurrently(piped_plugin, sent, ["first", "second"])
+            assert sent[0].HasField("payload") and not sent[0].payload_json
+
+            for name in ("first", "second"):
+                response = plugin_service_pb2.InvokeHookResponse()
+                json_format.ParseDict({"continue_processing": True, "metadata": {"for": name}}, response.result)
+                piped_plugin._reader.feed_data(self._frame(response))
+            results = await asyncio.gather(*tasks)
+
+        assert [result.metadata["for"] for result in results] == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_connection_loss_fails_all_pending_requests(self, piped_plugin):
+        """A dropped connection fails every in-flight request after retries."""
+        piped_plugin._reconnect_attempts = 0
+        sent = []
+
+        async def capture(_writer, data):
+            sent.append(data)
+
+        with patch("mcpgateway.plugins.framework.external.unix.client.write_message_async", side_effect=capture):
+            tasks = await self._invoke_concurrently(piped_plugin, sent, ["first", "second"])
+            piped_plugin._reader.feed_eof()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(result, PluginError) for result in results)
+        assert piped_plugin._connected is False
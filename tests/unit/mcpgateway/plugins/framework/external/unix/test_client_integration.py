@@ -9,6 +9,7 @@ These tests spawn a real Unix socket server subprocess and test actual communica
 """
 
 # Standard
+import asyncio
 import os
 import stat
 import subprocess
@@ -178,6 +179,33 @@ async def test_unix_client_multiple_calls(unix_server_proc):
         await loader.shutdown()
 
 
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Unix domain sockets are not supported on Windows.")
+@pytest.mark.asyncio
+async def test_unix_client_concurrent_calls(unix_server_proc):
+    """Test concurrent calls are pipelined over one connection with JSON payloads."""
+    server_proc, socket_path = unix_server_proc
+    assert not server_proc.poll(), "Server failed to start"
+
+    config = ConfigLoader.load_config("tests/unit/mcpgateway/plugins/fixtures/configs/valid_unix_external_plugin.yaml")
+    config.plugins[0].unix_socket.path = socket_path
+
+    loader = PluginLoader()
+    plugin = await loader.load_and_instantiate_plugin(config.plugins[0])
+    try:
+        writer = plugin._writer
+        prompts = [PromptPrehookPayload(prompt_id="test_prompt", args={"user": f"Test crap {i}"}) for i in range(20)]
+        results = await asyncio.gather(
+            *(plugin.invoke_hook(PromptHookType.PROMPT_PRE_FETCH, prompt, PluginContext(global_context=GlobalContext(request_id=str(i), server_id="2"))) for i, prompt in enumerate(prompts))
+        )
+
+        assert [result.modified_payload.args["user"] for result in results] == [f"Test yikes {i}" for i in range(20)]
+        assert plugin._json_payload is True
+        assert plugin._writer is writer
+    finally:
+        await plugin.shutdown()
+        await loader.shutdown()
+
+
 @pytest.mark.skipif(sys.platform.startswith("win"), reason="Unix domain sockets are not supported on Windows.")
 @pytest.mark.asyncio
 async def test_unix_client_context_propagation(unix_server_proc):
@@ -714,3 +714,52 @@ class TestUnixSocketRunServer:
 
         mock_server.start.assert_called_once()
         mock_server.stop.assert_called_once()
+
+
+class TestUnixSocketPluginServerPipelining:
+    """Tests for concurrent request handling on one connection."""
+
+    @pytest.mark.asyncio
+    async def test_slow_request_does_not_block_later_ones(self, server, mock_plugin_server, tmp_path):
+        """Responses are written as requests complete and echo the request id."""
+        from mcpgateway.plugins.framework.external.unix.protocol import read_message, write_message_async
+
+        async def invoke_hook(hook_type, plugin_name, payload, context):
+            await asyncio.sleep(0.3 if payload["name"] == "slow" else 0)
+            return {"result": {"continue_processing": True, "metadata": {"tool": payload["name"], "count": 1}}}
+
+        mock_plugin_server.invoke_hook = AsyncMock(side_effect=invoke_hook)
+        server._running = True
+        socket_path = str(tmp_path / "pipe.sock")
+        unix_server = await asyncio.start_unix_server(server._handle_client, path=socket_path)
+        try:
+            reader, writer = await asyncio.open_unix_connection(socket_path)
+            for request_id, name in ((1, "slow"), (2, "fast")):
+                request = plugin_service_pb2.InvokeHookRequest(hook_type="tool_pre_invoke", plugin_name="TestPlugin", request_id=request_id)
+                request.payload_json = b'{"name": "%s", "args": {}}' % name.encode()
+                await write_message_async(writer, request.SerializeToString())
+
+            responses = []
+            for _ in range(2):
+                response = plugin_service_pb2.InvokeHookResponse()
+                response.ParseFromString(await read_message(reader, timeout=5))
+                responses.append(response)
+            writer.close()
+            await writer.wait_closed()
+        finally:
+            unix_server.close()
+            await unix_server.wait_closed()
+
+        assert [response.request_id for response in responses] == [2, 1]
+        # JSON requests get JSON results, so integers are not turned into floats by Struct
+        assert not responses[0].HasField("result")
+        assert b'"count":1' in responses[0].result_json and b'"tool":"fast"' in responses[0].result_json
+
+    @pytest.mark.asyncio
+    async def test_get_plugin_config_advertises_json_payload(self, server):
+        """The config response lists the json_payload transport feature."""
+        from mcpgateway.plugins.framework.external.unix.protocol import JSON_PAYLOAD_FEATURE
+
+        response = plugin_service_pb2.GetPluginConfigResponse()
+        response.ParseFromString(await server._handle_get_plugin_config(plugin_service_pb2.GetPluginConfigRequest(name="TestPlugin")))
+        assert JSON_PAYLOAD_FEATURE in response.features
@@ -968,3 +968,141 @@ async def test_manager_tool_post_invoke_coverage():
         assert result.modified_payload.result["original"] == "data"
 
     await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_manager_read_only_plugins_run_concurrently():
+    """Test that consecutive read-only plugins run concurrently and merge results in priority order."""
+
+    class SlowObserverPlugin(Plugin):
+        async def prompt_pre_fetch(self, payload, context: PluginContext):
+            await asyncio.sleep(0.2)
+            context.global_context.state[self.name] = True
+            return PluginResult(continue_processing=True, metadata={self.name: True, "shared": self.name})
+
+    class ModifyingPlugin(Plugin):
+        async def prompt_pre_fetch(self, payload, context):
+            return PluginResult(continue_processing=True, modified_payload=PromptPrehookPayload(prompt_id="test", args={"seen": ",".join(sorted(context.global_context.state))}))
+
+    manager = PluginManager("./tests/unit/mcpgateway/plugins/fixtures/configs/valid_no_plugin.yaml")
+    await manager.initialize()
+
+    def make_config(name, read_only):
+        return PluginConfig(name=name, description=name, author="Test", version="1.0", tags=["test"], kind=name, hooks=["prompt_pre_fetch"], read_only=read_only, config={})
+
+    observers = [SlowObserverPlugin(make_config(f"Observer{i}", True)) for i in range(3)]
+    modifier = ModifyingPlugin(make_config("Modifier", False))
+
+    with patch.object(manager._registry, "get_hook_refs_for_hook") as mock_get:
+        mock_get.return_value = [HookRef(PromptHookType.PROMPT_PRE_FETCH, PluginRef(p)) for p in [*observers, modifier]]
+
+        prompt = PromptPrehookPayload(prompt_id="test", args={})
+        global_context = GlobalContext(request_id="1")
+
+        start = asyncio.get_running_loop().time()
+        result, contexts = await manager.invoke_hook(PromptHookType.PROMPT_PRE_FETCH, prompt, global_context=global_context)
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert elapsed < 0.5  # three 0.2s observers overlapped
+        assert result.continue_processing
+        assert result.metadata["shared"] == "Observer2"  # priority order wins, not completion order
+        assert all(result.metadata[f"Observer{i}"] for i in range(3))
+        # The modifying plugin runs after the group and sees its merged state
+        assert result.modified_payload.args["seen"] == "Observer0,Observer1,Observer2"
+        assert len(contexts) == 4
+
+    await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_manager_read_only_group_enforce_block():
+    """Test that an ENFORCE block inside a concurrent group stops the hook with the first blocking violation."""
+
+    class ObserverPlugin(Plugin):
+        async def prompt_pre_fetch(self, payload, context):
+            return PluginResult(continue_processing=True, metadata={"observed": True})
+
+    class BlockingObserverPlugin(Plugin):
+        async def prompt_pre_fetch(self, payload, context):
+            violation = PluginViolation(reason="Blocked", description="Blocked by observer", code="OBSERVER_BLOCK")
+            return PluginResult(continue_processing=False, violation=violation)
+
+    class NeverCalledPlugin(Plugin):
+        async def prompt_pre_fetch(self, payload, context):
+            raise AssertionError("plugins after an ENFORCE block must not run")
+
+    manager = PluginManager("./tests/unit/mcpgateway/plugins/fixtures/configs/valid_no_plugin.yaml")
+    await manager.initialize()
+
+    def make_config(name, read_only=True, mode=PluginMode.ENFORCE):
+        return PluginConfig(name=name, description=name, author="Test", version="1.0", tags=["test"], kind=name, hooks=["prompt_pre_fetch"], mode=mode, read_only=read_only, config={})
+
+    plugins = [
+        ObserverPlugin(make_config("Observer")),
+        BlockingObserverPlugin(make_config("Blocker")),
+        NeverCalledPlugin(make_config("Modifier", read_only=False)),
+    ]
+
+    with patch.object(manager._registry, "get_hook_refs_for_hook") as mock_get:
+        mock_get.return_value = [HookRef(PromptHookType.PROMPT_PRE_FETCH, PluginRef(p)) for p in plugins]
+
+        prompt = PromptPrehookPayload(prompt_id="test", args={})
+        global_context = GlobalContext(request_id="1")
+
+        result, _ = await manager.invoke_hook(PromptHookType.PROMPT_PRE_FETCH, prompt, global_context=global_context)
+        assert not result.continue_processing
+        assert result.violation.code == "OBSERVER_BLOCK"
+        assert result.violation.plugin_name == "Blocker"
+        assert result.metadata["observed"]
+
+        with pytest.raises(PluginViolationError) as pve:
+            await manager.invoke_hook(PromptHookType.PROMPT_PRE_FETCH, prompt, global_context=global_context, violations_as_exceptions=True)
+        assert pve.value.violation.code == "OBSERVER_BLOCK"
+
+        # In permissive mode the block is logged and processing continues
+        plugins[1] = BlockingObserverPlugin(make_config("Blocker", mode=PluginMode.PERMISSIVE))
+        plugins[2] = ObserverPlugin(make_config("Observer2"))
+        mock_get.return_value = [HookRef(PromptHookType.PROMPT_PRE_FETCH, PluginRef(p)) for p in plugins]
+        result, _ = await manager.invoke_hook(PromptHookType.PROMPT_PRE_FETCH, prompt, global_context=global_context)
+        assert result.continue_processing
+
+    await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_manager_read_only_group_timeout_and_payload():
+    """Test per-plugin timeouts inside a concurrent group and that read-only payload changes are ignored."""
+
+    class TimeoutObserverPlugin(Plugin):
+        async def prompt_pre_fetch(self, payload, context):
+            await asyncio.sleep(10)
+            return PluginResult(continue_processing=True)
+
+    class MisbehavingObserverPlugin(Plugin):
+        async def prompt_pre_fetch(self, payload, context):
+            return PluginResult(continue_processing=True, modified_payload=PromptPrehookPayload(prompt_id="changed", args={}))
+
+    manager = PluginManager("./tests/unit/mcpgateway/plugins/fixtures/configs/valid_no_plugin.yaml")
+    await manager.initialize()
+    manager._executor.timeout = 0.01
+
+    def make_config(name, mode):
+        return PluginConfig(name=name, description=name, author="Test", version="1.0", tags=["test"], kind=name, hooks=["prompt_pre_fetch"], mode=mode, read_only=True, config={})
+
+    with patch.object(manager._registry, "get_hook_refs_for_hook") as mock_get:
+        prompt = PromptPrehookPayload(prompt_id="test", args={})
+        global_context = GlobalContext(request_id="1")
+
+        mock_get.return_value = [
+            HookRef(PromptHookType.PROMPT_PRE_FETCH, PluginRef(TimeoutObserverPlugin(make_config("Slow", PluginMode.PERMISSIVE)))),
+            HookRef(PromptHookType.PROMPT_PRE_FETCH, PluginRef(MisbehavingObserverPlugin(make_config("Misbehaving", PluginMode.PERMISSIVE)))),
+        ]
+        result, _ = await manager.invoke_hook(PromptHookType.PROMPT_PRE_FETCH, prompt, global_context=global_context)
+        assert result.continue_processing
+        assert result.modified_payload is None
+
+        mock_get.return_value[0] = HookRef(PromptHookType.PROMPT_PRE_FETCH, PluginRef(TimeoutObserverPlugin(make_config("Slow", PluginMode.ENFORCE))))
+        with pytest.raises(PluginError):
+            await manager.invoke_hook(PromptHookType.PROMPT_PRE_FETCH, prompt, global_context=global_context)
+
+    await manager.shutdown()
@@ -7,6 +7,8 @@ Authors: Mihai Criveti
 Tests for CachedToolResultPlugin.
 """
 
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
 from mcpgateway.plugins.framework import (
@@ -40,3 +42,111 @@ async def test_cache_store_and_hit():
     ctx2 = PluginContext(global_context=GlobalContext(request_id="r2"))
     pre2 = await plugin.tool_pre_invoke(ToolPreInvokePayload(name="echo", args={"x": 1}), ctx2)
     assert pre2.metadata and pre2.metadata.get("cache_hit") is True
+
+
+def _plugin(**config):
+    return CachedToolResultPlugin(
+        PluginConfig(
+            name="cache",
+            kind="plugins.cached_tool_result.cached_tool_result.CachedToolResultPlugin",
+            hooks=[ToolHookType.TOOL_PRE_INVOKE, ToolHookType.TOOL_POST_INVOKE],
+            config={"cacheable_tools": ["echo"], "ttl": 60, **config},
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_returns_result_in_payload():
+    plugin = _plugin()
+    result = {"content": [{"type": "text", "text": "hello"}], "isError": False}
+    ctx = PluginContext(global_context=GlobalContext(request_id="r1"))
+    await plugin.tool_pre_invoke(ToolPreInvokePayload(name="echo", args={"x": 1}), ctx)
+    await plugin.tool_post_invoke(ToolPostInvokePayload(name="echo", result=result), ctx)
+
+    ctx2 = PluginContext(global_context=GlobalContext(request_id="r2"))
+    pre = await plugin.tool_pre_invoke(ToolPreInvokePayload(name="echo", args={"x": 1}), ctx2)
+    assert pre.modified_payload is not None
+    assert pre.modified_payload.result == result
+    # A hit is not re-stored by the post hook
+    post = await plugin.tool_post_invoke(ToolPostInvokePayload(name="echo", result=result), ctx2)
+    assert post.metadata["cache_stored"] is False
+    assert plugin.stats()["hits"] == 1 and plugin.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_error_results_are_not_cached():
+    plugin = _plugin()
+    ctx = PluginContext(global_context=GlobalContext(request_id="r1"))
+    await plugin.tool_pre_invoke(ToolPreInvokePayload(name="echo", args={"x": 1}), ctx)
+    post = await plugin.tool_post_invoke(ToolPostInvokePayload(name="echo", result={"content": [], "isError": True}), ctx)
+    assert post.metadata["cache_stored"] is False
+    pre = await plugin.tool_pre_invoke(ToolPreInvokePayload(name="echo", args={"x": 1}), PluginContext(global_context=GlobalContext(request_id="r2")))
+    assert pre.modified_payload is None
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_by_entries_and_bytes():
+    plugin = _plugin(max_entries=2, max_bytes=100, max_entry_bytes=60)
+
+    async def store(x, result):
+        ctx = PluginContext(global_context=GlobalContext(request_id=f"r{x}"))
+        await plugin.tool_pre_invoke(ToolPreInvokePayload(name="echo", args={"x": x}), ctx)
+        return await plugin.tool_post_invoke(ToolPostInvokePayload(name="echo", result=result), ctx)
+
+    await store(1, {"v": 1})
+    await store(2, {"v": 2})
+    await store(3, {"v": 3})
+    stats = plugin.stats()
+    assert stats["entries"] == 2 and stats["evictions"] == 1
+
+    big = {"v": "x" * 40}
+    await store(4, big)
+    await store(5, big)
+    assert plugin.stats()["size_bytes"] <= 100
+
+    too_big = await store(6, {"v": "x" * 100})
+    assert too_big.metadata["reason"] == "too_large"
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_shared_across_instances():
+    store = {}
+    redis = AsyncMock()
+    redis.get.side_effect = lambda k: store.get(k)
+    redis.setex.side_effect = lambda k, ttl, v: store.__setitem__(k, v)
+    redis.ttl.return_value = 30
+
+    with patch("mcpgateway.utils.redis_client.get_redis_client", AsyncMock(return_value=redis)):
+        writer = _plugin(redis_enabled=True)
+        ctx = PluginContext(global_context=GlobalContext(request_id="r1"))
+        await writer.tool_pre_invoke(ToolPreInvokePayload(name="echo", args={"x": 1}), ctx)
+        await writer.tool_post_invoke(ToolPostInvokePayload(name="echo", result={"ok": True}), ctx)
+
+        reader = _plugin(redis_enabled=True)
+        pre = await reader.tool_pre_invoke(ToolPreInvokePayload(name="echo", args={"x": 1}), PluginContext(global_context=GlobalContext(request_id="r2")))
+    assert pre.modified_payload.result == {"ok": True}
+    assert reader.stats()["entries"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("other", [{"user": "bob"}, {"user": "alice", "tenant_id": "t2"}, {"user": "alice", "server_id": "s2"}])
+async def test_cached_results_are_scoped_to_the_caller(other):
+    plugin = _plugin()
+    owner = {"user": "alice", "tenant_id": "t1", "server_id": "s1"}
+    ctx = PluginContext(global_context=GlobalContext(request_id="r1", **owner))
+    await plugin.tool_pre_invoke(ToolPreInvokePayload(name="echo", args={"x": 1}), ctx)
+    await plugin.tool_post_invoke(ToolPostInvokePayload(name="echo", result={"secret": True}), ctx)
+
+    scope = {**owner, **other}
+    pre = await plugin.tool_pre_invoke(ToolPreInvokePayload(name="echo", args={"x": 1}), PluginContext(global_context=GlobalContext(request_id="r2", **scope)))
+    assert pre.metadata["cache_hit"] is False
+    assert pre.modified_payload is None
+
+
+@pytest.mark.asyncio
+async def test_post_invoke_without_pre_invoke_key_does_not_store():
+    plugin = _plugin()
+    ctx = PluginContext(global_context=GlobalContext(request_id="r1"))
+    post = await plugin.tool_post_invoke(ToolPostInvokePayload(name="echo", result={"ok": True}), ctx)
+    assert post.metadata == {"cache_stored": False, "reason": "no_cache_key"}
+    assert plugin.stats()["entries"] == 0
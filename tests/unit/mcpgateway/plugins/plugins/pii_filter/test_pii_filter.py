@@ -247,6 +247,42 @@ class TestPIIDetector:
         assert PIIType.SSN in detections
         assert len(detections) == 3
 
+    def test_overlapping_matches_resolved_across_types(self):
+        """Test that each span is attributed to one type and masking stays intact."""
+        detector = PIIDetector(PIIFilterConfig())
+
+        text = "Server 192.168.1.1, card 4111 1111 1111 1111, SSN 123-45-6789"
+        detections = detector.detect(text)
+
+        assert [d["value"] for d in detections[PIIType.IP_ADDRESS]] == ["192.168.1.1"]
+        assert [d["value"] for d in detections[PIIType.CREDIT_CARD]] == ["4111 1111 1111 1111"]
+        assert PIIType.PHONE not in detections
+        spans = sorted((d["start"], d["end"]) for items in detections.values() for d in items)
+        assert all(prev_end <= start for (_, prev_end), (start, _) in zip(spans, spans[1:]))
+        assert detector.mask(text, detections) == "Server [REDACTED], card ****-****-****-1111, SSN ***-**-6789"
+
+    def test_chunked_scan_matches_single_pass(self):
+        """Test that chunked scanning finds the same detections, including across boundaries."""
+        text = " ".join(f"user{i}@example.com 555-123-{1000 + i} filler" for i in range(200))
+        single = PIIDetector(PIIFilterConfig()).detect(text)
+        chunked = PIIDetector(PIIFilterConfig(stream_threshold=100, stream_chunk_size=37, stream_overlap=64)).detect(text)
+
+        assert chunked == single
+        assert len(chunked[PIIType.EMAIL]) == 200
+        assert len(chunked[PIIType.PHONE]) == 200
+
+    def test_fallback_scan_for_uncombinable_patterns(self):
+        """Test that patterns with back-references are scanned individually with the same results."""
+        from plugins.pii_filter.pii_filter import PIIPattern
+
+        custom = PIIPattern(type=PIIType.CUSTOM, pattern=r"\b(\w)\1{5}\b", description="Repeated character", mask_strategy=MaskingStrategy.REDACT)
+        detector = PIIDetector(PIIFilterConfig(custom_patterns=[custom]))
+        assert detector._combined is None
+
+        detections = detector.detect("code aaaaaa and mail john@example.com")
+        assert [d["value"] for d in detections[PIIType.CUSTOM]] == ["aaaaaa"]
+        assert [d["value"] for d in detections[PIIType.EMAIL]] == ["john@example.com"]
+
 
 class TestPIIFilterPlugin:
     """Test the PII Filter plugin integration."""
@@ -462,3 +498,33 @@ async def test_integration_with_manager():
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+@pytest.mark.asyncio
+async def test_large_json_string_masked_as_raw_text():
+    """Large strings are masked in place without parsing and re-serializing embedded JSON."""
+    from unittest.mock import patch
+
+    from mcpgateway.plugins.framework import ToolHookType, ToolPostInvokePayload
+
+    plugin = PIIFilterPlugin(
+        PluginConfig(
+            name="pii",
+            kind="plugins.pii_filter.pii_filter.PIIFilterPlugin",
+            hooks=[ToolHookType.TOOL_POST_INVOKE],
+            config={"stream_threshold": 1000, "stream_chunk_size": 256},
+        )
+    )
+    plugin.detector = PIIDetector(plugin.pii_config)
+    rows = [{"id": i, "email": f"user{i}@example.com"} for i in range(100)]
+    import orjson
+
+    payload = ToolPostInvokePayload(name="t", result={"content": [{"type": "text", "text": orjson.dumps(rows).decode()}]})
+    context = PluginContext(global_context=GlobalContext(request_id="1"))
+    with patch("plugins.pii_filter.pii_filter.orjson.loads", side_effect=orjson.loads) as loads:
+        result = await plugin.tool_post_invoke(payload, context)
+    assert all(len(call.args[0]) <= 1000 for call in loads.call_args_list)
+
+    masked = result.modified_payload.result["content"][0]["text"]
+    assert "user5@example.com" not in masked
+    assert [row["id"] for row in orjson.loads(masked)] == list(range(100))
@@ -7,6 +7,8 @@ Authors: Mihai Criveti
 Tests for RateLimiterPlugin.
 """
 
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
 from mcpgateway.plugins.framework import (
@@ -15,9 +17,10 @@ from mcpgateway.plugins.framework import (
     PluginContext,
     PromptHookType,
     PromptPrehookPayload,
-    ToolHookType
+    ToolHookType,
+    ToolPreInvokePayload,
 )
-from plugins.rate_limiter.rate_limiter import RateLimiterPlugin
+from plugins.rate_limiter.rate_limiter import _Limit, _MemoryStore, _SCRIPTS, RateLimiterPlugin
 
 
 def _mk(rate: str) -> RateLimiterPlugin:
@@ -42,3 +45,108 @@ async def test_rate_limit_blocks_on_third_call():
     assert r2.violation is None
     r3 = await plugin.prompt_pre_fetch(payload, ctx)
     assert r3.violation is not None
+
+
+def _mk_cfg(**config) -> RateLimiterPlugin:
+    return RateLimiterPlugin(
+        PluginConfig(
+            name="rl",
+            kind="plugins.rate_limiter.rate_limiter.RateLimiterPlugin",
+            hooks=[PromptHookType.PROMPT_PRE_FETCH, ToolHookType.TOOL_PRE_INVOKE],
+            config=config,
+        )
+    )
+
+
+def _ctx(user: str = "u1") -> PluginContext:
+    return PluginContext(global_context=GlobalContext(request_id="r1", user=user))
+
+
+def test_token_bucket_refills_gradually():
+    store = _MemoryStore("token_bucket", sweep_interval=60)
+    limits = [_Limit("user:a", 2, 10)]
+    assert [store.hit(limits, now=0.0)[0] for _ in range(3)] == [True, True, False]
+    # One token every 5 seconds
+    assert store.hit(limits, now=4.0)[0] is False
+    allowed, [(ok, remaining, reset_in)] = store.hit(limits, now=5.0)
+    assert allowed and ok and remaining == 0
+    assert reset_in == pytest.approx(10.0)
+
+
+def test_sliding_window_has_no_boundary_burst():
+    store = _MemoryStore("sliding_window", sweep_interval=60)
+    limits = [_Limit("user:a", 2, 10)]
+    assert store.hit(limits, now=8.0)[0] and store.hit(limits, now=9.0)[0]
+    # A fixed window starting at 0 would reset at 10 and admit two more requests
+    assert store.hit(limits, now=10.5)[0] is False
+    assert store.hit(limits, now=18.5)[0] is True
+
+
+def test_rejected_request_does_not_consume_other_limits():
+    store = _MemoryStore("fixed_window", sweep_interval=60)
+    user, tool = _Limit("user:a", 5, 60), _Limit("tool:t", 1, 60)
+    assert store.hit([user, tool], now=0.0)[0] is True
+    allowed, [(ok_user, remaining_user, _), (ok_tool, _, _)] = store.hit([user, tool], now=1.0)
+    assert not allowed and ok_user and not ok_tool
+    assert remaining_user == 4
+
+
+def test_expired_counters_are_swept():
+    store = _MemoryStore("fixed_window", sweep_interval=30)
+    for i in range(100):
+        store.hit([_Limit(f"user:{i}", 1, 1)], now=0.0)
+    assert len(store) == 100
+    store.hit([_Limit("user:late", 1, 1)], now=31.0)
+    assert len(store) == 1
+
+
+@pytest.mark.asyncio
+async def test_tool_limit_reports_tool_violation():
+    plugin = _mk_cfg(by_user="10/s", by_tool={"search": "1/m"}, algorithm="token_bucket")
+    payload = ToolPreInvokePayload(name="search", args={})
+    r1 = await plugin.tool_pre_invoke(payload, _ctx())
+    assert r1.violation is None
+    assert r1.metadata["by_tool"]["remaining"] == 0
+    r2 = await plugin.tool_pre_invoke(payload, _ctx())
+    assert r2.violation is not None
+    assert r2.violation.description == "Rate limit exceeded for tool search"
+    other = await plugin.tool_pre_invoke(ToolPreInvokePayload(name="other", args={}), _ctx())
+    assert other.violation is None
+    assert "by_tool" not in other.metadata
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_makes_one_call_per_decision():
+    plugin = _mk_cfg(by_user="5/m", by_tenant="50/m", by_tool={"search": "2/m"}, backend="redis", algorithm="sliding_window")
+    redis = AsyncMock()
+    redis.eval.return_value = [1, 1, 4, 60000, 1, 49, 60000, 1, 1, 59000]
+    with patch.object(plugin, "_get_redis_client", AsyncMock(return_value=redis)):
+        result = await plugin.tool_pre_invoke(ToolPreInvokePayload(name="search", args={}), _ctx("alice"))
+
+    assert result.violation is None
+    assert result.metadata["by_tool"] == {"limited": True, "remaining": 1, "reset_in": 59}
+    redis.eval.assert_awaited_once()
+    script, numkeys, *rest = redis.eval.await_args.args
+    assert script == _SCRIPTS["sliding_window"]
+    assert numkeys == 3
+    assert rest[:3] == ["mcpgw:ratelimit:sliding_window:user:alice:60", "mcpgw:ratelimit:sliding_window:tenant:default:60", "mcpgw:ratelimit:sliding_window:tool:search:60"]
+    assert rest[3:9] == [5, 60000, 50, 60000, 2, 60000]
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_violation_and_fallback():
+    plugin = _mk_cfg(by_user="1/m", backend="redis")
+    redis = AsyncMock()
+    redis.eval.return_value = [0, 0, 0, 30000]
+    payload = PromptPrehookPayload(prompt_id="p", args={})
+    with patch.object(plugin, "_get_redis_client", AsyncMock(return_value=redis)):
+        blocked = await plugin.prompt_pre_fetch(payload, _ctx())
+    assert blocked.violation is not None
+    assert blocked.violation.details == {"limited": True, "remaining": 0, "reset_in": 30}
+
+    redis.eval.side_effect = ConnectionError("down")
+    with patch.object(plugin, "_get_redis_client", AsyncMock(return_value=redis)):
+        first = await plugin.prompt_pre_fetch(payload, _ctx())
+        second = await plugin.prompt_pre_fetch(payload, _ctx())
+    assert first.violation is None
+    assert second.violation is not None
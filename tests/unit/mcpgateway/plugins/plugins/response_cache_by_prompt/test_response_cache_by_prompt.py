@@ -377,3 +377,100 @@ class TestEvictionAndIndexRebuild:
         ctx_query2 = PluginContext(global_context=GlobalContext(request_id="query2"))
         pre2 = await plugin.tool_pre_invoke(ToolPreInvokePayload(name="test_tool", args={"prompt": "unique0 text"}), ctx_query2)
         assert pre2.metadata and pre2.metadata.get("approx_cache") is False
+
+
+class TestVectorizedLookup:
+    """Tests for the NumPy-backed store and top-k scoring."""
+
+    @staticmethod
+    def _plugin(**config):
+        return ResponseCacheByPromptPlugin(
+            PluginConfig(
+                name="cache",
+                kind="plugins.response_cache_by_prompt.response_cache_by_prompt.ResponseCacheByPromptPlugin",
+                hooks=[ToolHookType.TOOL_PRE_INVOKE, ToolHookType.TOOL_POST_INVOKE],
+                config={"cacheable_tools": ["test_tool"], "ttl": 3600, "threshold": 0.9, **config},
+            )
+        )
+
+    @staticmethod
+    async def _store(plugin, prompt, value):
+        ctx = PluginContext(global_context=GlobalContext(request_id=prompt))
+        await plugin.tool_pre_invoke(ToolPreInvokePayload(name="test_tool", args={"prompt": prompt}), ctx)
+        await plugin.tool_post_invoke(ToolPostInvokePayload(name="test_tool", result=value), ctx)
+
+    @pytest.mark.asyncio
+    async def test_matches_pure_python_scoring(self, monkeypatch):
+        """Vectorized lookup returns the same best entry and exact similarity as the sparse path."""
+        from plugins.response_cache_by_prompt import response_cache_by_prompt as rcbp
+
+        prompts = [f"weather forecast for city{i} tomorrow" for i in range(200)] + ["weather forecast for paris tomorrow morning"]
+        fast = self._plugin(top_k=4, vector_dim=64)
+        for i, p in enumerate(prompts):
+            await self._store(fast, p, i)
+
+        monkeypatch.setattr(rcbp, "NUMPY_AVAILABLE", False)
+        slow = self._plugin()
+        for i, p in enumerate(prompts):
+            await self._store(slow, p, i)
+        assert slow._cache["test_tool"].matrix is None
+
+        for query in ("weather forecast for paris tomorrow", "forecast city7 tomorrow weather", "nothing shared"):
+            best_fast, sim_fast = fast._find_best("test_tool", query)
+            best_slow, sim_slow = slow._find_best("test_tool", query)
+            assert (best_fast and best_fast.value) == (best_slow and best_slow.value)
+            assert sim_fast == pytest.approx(sim_slow)
+
+    @pytest.mark.asyncio
+    async def test_heavy_hash_collisions_still_find_the_exact_best(self, monkeypatch):
+        """With few buckets and top_k=1 the bounded re-scoring still returns the exact best match."""
+        import random
+
+        from plugins.response_cache_by_prompt import response_cache_by_prompt as rcbp
+
+        rng = random.Random(7)
+        words = [f"w{i}" for i in range(40)]
+        prompts = [" ".join(rng.choices(words, k=rng.randint(2, 6))) for _ in range(150)]
+        fast = self._plugin(top_k=1, vector_dim=8)
+        for i, p in enumerate(prompts):
+            await self._store(fast, p, i)
+
+        monkeypatch.setattr(rcbp, "NUMPY_AVAILABLE", False)
+        slow = self._plugin()
+        for i, p in enumerate(prompts):
+            await self._store(slow, p, i)
+
+        for _ in range(50):
+            query = " ".join(rng.choices(words, k=rng.randint(1, 5)))
+            _, sim_fast = fast._find_best("test_tool", query)
+            _, sim_slow = slow._find_best("test_tool", query)
+            assert sim_fast == pytest.approx(sim_slow)
+
+    @pytest.mark.asyncio
+    async def test_slots_are_reused_after_capacity_eviction(self):
+        """Capacity eviction reuses slots and keeps the dense matrix bounded."""
+        plugin = self._plugin(max_entries=4)
+        for i in range(50):
+            await self._store(plugin, f"query number{i}", i)
+
+        store = plugin._cache["test_tool"]
+        assert len(store) == 4
+        assert store.matrix.shape[0] == 4
+        assert [e.value for e in store] == [46, 47, 48, 49]
+        assert plugin.stats()["evictions"] == 46
+        assert plugin._index["test_tool"]["query"] == {0, 1, 2, 3}
+
+        best, sim = plugin._find_best("test_tool", "query number48")
+        assert best.value == 48 and sim == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_expired_candidates_are_skipped(self, monkeypatch):
+        """Expired entries are never returned even before they are purged."""
+        from plugins.response_cache_by_prompt import response_cache_by_prompt as rcbp
+
+        now = [1_000.0]
+        monkeypatch.setattr(rcbp.time, "time", lambda: now[0])
+        plugin = self._plugin(ttl=1)
+        await self._store(plugin, "stale prompt", "old")
+        now[0] += 5
+        assert plugin._find_best("test_tool", "stale prompt") == (None, 0.0)
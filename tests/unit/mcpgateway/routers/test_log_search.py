@@ -814,3 +814,14 @@ async def test_get_performance_metrics_error_path(monkeypatch):
         )
 
     assert exc_info.value.status_code == 500
+
+
+@pytest.mark.asyncio
+async def test_get_log_buffer_stats(monkeypatch: pytest.MonkeyPatch):
+    buffer = MagicMock()
+    buffer.get_stats.return_value = {"total_dropped": 3, "last_flush_ms": 1.5}
+    monkeypatch.setattr(log_search, "get_log_buffer_service", lambda: buffer)
+
+    stats = await log_search.get_log_buffer_stats(user={"email": "user@example.com"})
+
+    assert stats == {"total_dropped": 3, "last_flush_ms": 1.5}
@@ -10,7 +10,7 @@ import pytest
 from pydantic import SecretStr
 
 # First-Party
-from mcpgateway.services.encryption_service import EncryptionService, get_encryption_service
+from mcpgateway.services.encryption_service import clear_derived_key_cache, EncryptionService, get_derived_key_cache_stats, get_encryption_service
 
 
 # ---------- Construction ----------
@@ -205,3 +205,76 @@ def test_encrypt_secret_error_propagates():
     with patch.object(svc, "derive_key_argon2id", side_effect=RuntimeError("derive fail")):
         with pytest.raises(RuntimeError, match="derive fail"):
             svc.encrypt_secret("test")
+
+
+# ---------- Derived-key cache ----------
+
+
+def _fast_service(secret="k"):
+    return EncryptionService(secret, time_cost=1, memory_cost=1024, parallelism=1)
+
+
+def test_repeated_decrypt_derives_key_once():
+    """Decrypting the same bundle twice reuses the derived key."""
+    svc = _fast_service()
+    cipher = svc.encrypt_secret("hello")
+    with patch.object(svc, "derive_key_argon2id", wraps=svc.derive_key_argon2id) as derive:
+        assert svc.decrypt_secret(cipher) == "hello"
+        assert svc.decrypt_secret(cipher) == "hello"
+    derive.assert_not_called()  # key was cached by encrypt_secret
+    stats = get_derived_key_cache_stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+
+
+def test_derived_key_cache_is_shared_across_instances_but_not_secrets():
+    """Instances with the same secret share keys; a different secret does not."""
+    cipher = _fast_service().encrypt_secret("hello")
+    assert _fast_service().decrypt_secret(cipher) == "hello"
+    assert _fast_service("other").decrypt_secret(cipher) is None
+    assert get_derived_key_cache_stats()["misses"] == 2
+
+
+def test_derived_key_cache_is_bounded(monkeypatch):
+    """Least recently used keys are evicted beyond the configured size."""
+    monkeypatch.setattr("mcpgateway.services.encryption_service.settings.argon2id_key_cache_size", 2)
+    svc = _fast_service()
+    for _ in range(3):
+        svc.encrypt_secret("x")
+    stats = get_derived_key_cache_stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+
+
+def test_derived_key_cache_disabled(monkeypatch):
+    """A size of zero bypasses the cache."""
+    monkeypatch.setattr("mcpgateway.services.encryption_service.settings.argon2id_key_cache_size", 0)
+    svc = _fast_service()
+    cipher = svc.encrypt_secret("hello")
+    with patch.object(svc, "derive_key_argon2id", wraps=svc.derive_key_argon2id) as derive:
+        svc.decrypt_secret(cipher)
+    derive.assert_called_once()
+    assert get_derived_key_cache_stats()["size"] == 0
+
+
+# ---------- decrypt_many ----------
+
+
+def test_decrypt_many_derives_each_distinct_key_once():
+    """Bundles sharing a salt derive one key; failures map to None."""
+    svc = _fast_service()
+    a = svc.encrypt_secret("a")
+    b = svc.encrypt_secret("b")
+    clear_derived_key_cache()
+    with patch.object(svc, "derive_key_argon2id", wraps=svc.derive_key_argon2id) as derive:
+        assert svc.decrypt_many([a, b, a, "garbage", b]) == ["a", "b", "a", None, "b"]
+    assert derive.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_decrypt_many_async():
+    """Async wrapper returns results in input order."""
+    svc = _fast_service()
+    cipher = svc.encrypt_secret("hello")
+    assert await svc.decrypt_many_async((cipher, cipher)) == ["hello", "hello"]
+    assert await svc.decrypt_many_async([]) == []
@@ -340,3 +340,141 @@ class TestCacheInvalidationPerType:
         # Resources and prompts cache should NOT be invalidated (no changes)
         mock_cache.invalidate_resources.assert_not_called()
         mock_cache.invalidate_prompts.assert_not_called()
+
+
+def _upstream_tool(name: str, description: str = "desc") -> MagicMock:
+    """Create an upstream tool definition as returned by _initialize_gateway."""
+    tool = MagicMock()
+    tool.name = name
+    tool.description = description
+    tool.request_type = "SSE"
+    tool.headers = {}
+    tool.input_schema = {"type": "object"}
+    tool.output_schema = None
+    tool.jsonpath_filter = ""
+    return tool
+
+
+class TestIncrementalRefresh:
+    """Tests for content-hash based incremental refresh."""
+
+    def _catalog(self, gateway, tools):
+        # First-Party
+        from mcpgateway.utils.catalog_hash import catalog_digest, tool_content_hash
+
+        empty = catalog_digest([])
+        return {"tools": catalog_digest((t.name, tool_content_hash(t, gateway)) for t in tools), "resources": empty, "prompts": empty}
+
+    async def _refresh(self, gateway_service, mock_gateway, tools, **kwargs):
+        mock_session = MagicMock()
+        mock_session.dirty = set()
+        mock_session.execute.return_value.scalar_one_or_none.return_value = mock_gateway
+        with (
+            patch("mcpgateway.services.gateway_service.fresh_db_session") as mock_fresh,
+            patch.object(gateway_service, "_initialize_gateway", new_callable=AsyncMock, return_value=({}, tools, [], [])),
+            patch.object(gateway_service, "_update_or_create_tools", return_value=[]) as update_tools,
+            patch.object(gateway_service, "_update_or_create_resources", return_value=[]),
+            patch.object(gateway_service, "_update_or_create_prompts", return_value=[]),
+            patch("mcpgateway.services.gateway_service._get_registry_cache", return_value=AsyncMock()),
+            patch("mcpgateway.services.gateway_service._get_tool_lookup_cache", return_value=AsyncMock()),
+        ):
+            mock_fresh.return_value.__enter__.return_value = mock_session
+            result = await gateway_service._refresh_gateway_tools_resources_prompts("gw-123", **kwargs)
+        return result, update_tools, mock_session
+
+    @pytest.mark.asyncio
+    async def test_unchanged_catalog_skips_row_comparison(self, gateway_service):
+        mock_gateway = _make_mock_gateway()
+        tools = [_upstream_tool("a"), _upstream_tool("b")]
+        mock_gateway.catalog_hashes = self._catalog(mock_gateway, tools)
+
+        result, update_tools, session = await self._refresh(gateway_service, mock_gateway, list(reversed(tools)))
+
+        update_tools.assert_not_called()
+        session.commit.assert_called_once()
+        assert result["success"] is True
+        assert result["tools_added"] == result["tools_removed"] == result["tools_updated"] == 0
+
+    @pytest.mark.asyncio
+    async def test_force_reconciles_unchanged_catalog(self, gateway_service):
+        mock_gateway = _make_mock_gateway()
+        tools = [_upstream_tool("a")]
+        mock_gateway.catalog_hashes = self._catalog(mock_gateway, tools)
+
+        _, update_tools, _ = await self._refresh(gateway_service, mock_gateway, tools, force=True)
+
+        update_tools.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_changed_catalog_is_synced_and_digest_stored(self, gateway_service):
+        mock_gateway = _make_mock_gateway()
+        mock_gateway.catalog_hashes = self._catalog(mock_gateway, [_upstream_tool("a")])
+        tools = [_upstream_tool("a", description="changed")]
+
+        _, update_tools, _ = await self._refresh(gateway_service, mock_gateway, tools)
+
+        update_tools.assert_called_once()
+        assert mock_gateway.catalog_hashes == self._catalog(mock_gateway, tools)
+
+    def test_update_skips_tools_with_matching_hash(self, gateway_service):
+        # First-Party
+        from mcpgateway.utils.catalog_hash import tool_content_hash
+
+        mock_gateway = _make_mock_gateway()
+        upstream = _upstream_tool("a")
+        existing = _make_mock_tool("t1", "a")
+        existing.content_hash = tool_content_hash(upstream, mock_gateway)
+        existing.description = "stale"
+        db = MagicMock()
+        db.execute.return_value.scalars.return_value.all.return_value = [existing]
+
+        assert gateway_service._update_or_create_tools(db, [upstream], mock_gateway, "health_check") == []
+        assert existing.description == "stale"
+
+    def test_update_stores_hash_on_changed_tool(self, gateway_service):
+        # First-Party
+        from mcpgateway.utils.catalog_hash import tool_content_hash
+
+        mock_gateway = _make_mock_gateway()
+        upstream = _upstream_tool("a", description="new")
+        existing = _make_mock_tool("t1", "a")
+        existing.content_hash = None
+        db = MagicMock()
+        db.execute.return_value.scalars.return_value.all.return_value = [existing]
+
+        gateway_service._update_or_create_tools(db, [upstream], mock_gateway, "health_check")
+
+        assert existing.description == "new"
+        assert existing.content_hash == tool_content_hash(upstream, mock_gateway)
+
+    def test_created_tool_stores_hash_when_row_matches(self, gateway_service):
+        # First-Party
+        from mcpgateway.utils.catalog_hash import tool_content_hash
+
+        mock_gateway = _make_mock_gateway()
+        mock_gateway.visibility = "public"
+        upstream = _upstream_tool("a")
+        upstream.annotations = {}
+
+        db_tool = gateway_service._create_db_tool(upstream, mock_gateway)
+
+        assert db_tool.content_hash == tool_content_hash(upstream, mock_gateway)
+
+    def test_created_tool_without_hash_when_visibility_differs(self, gateway_service):
+        mock_gateway = _make_mock_gateway()
+        upstream = _upstream_tool("a")
+        upstream.annotations = {}
+
+        db_tool = gateway_service._create_db_tool(upstream, mock_gateway)
+
+        # Row is created public, so the next refresh must still reconcile it to the gateway's visibility
+        assert db_tool.visibility == "public"
+        assert db_tool.content_hash is None
+
+
+def test_gateway_supports_list_changed_without_notification_service():
+    # First-Party
+    from mcpgateway.services.mcp_session_pool import gateway_supports_list_changed
+
+    with patch("mcpgateway.services.notification_service.get_notification_service", side_effect=RuntimeError):
+        assert gateway_supports_list_changed("gw-1") is False
@@ -5262,6 +5262,44 @@ class TestUpdateGatewayAdvanced:
         result = await gateway_service.update_gateway(db, mock_gateway.id, update_data)
         assert mock_gateway.oauth_config == {"client_id": "cid", "grant_type": "client_credentials"}
 
+    @pytest.mark.asyncio
+    async def test_update_oauth_config_invalidates_cached_token(self, gateway_service, mock_gateway, monkeypatch):
+        """Replacing OAuth credentials drops the token cached for the old ones."""
+        db = MagicMock()
+        db.execute.return_value = _make_execute_result(scalar=mock_gateway)
+        old_config = {"client_id": "cid", "client_secret": "old", "grant_type": "client_credentials"}
+        mock_gateway.auth_type = "oauth"
+        mock_gateway.auth_value = {}
+        mock_gateway.auth_query_params = None
+        mock_gateway.version = 1
+        mock_gateway.tags = []
+        mock_gateway.oauth_config = old_config
+
+        update_data = _make_gateway(
+            auth_type=None,
+            auth_value=None,
+            url="http://example.com/gateway",
+            passthrough_headers=None,
+            visibility=None,
+            oauth_config=dict(old_config, client_secret="new"),
+        )
+        update_data.auth_token = None
+        update_data.auth_password = None
+        update_data.auth_header_value = None
+        update_data.auth_query_param_key = None
+        update_data.auth_query_param_value = None
+
+        monkeypatch.setattr("mcpgateway.services.gateway_service.get_for_update", MagicMock(side_effect=[mock_gateway, None]))
+        monkeypatch.setattr("mcpgateway.services.gateway_service._get_registry_cache", lambda: MagicMock(invalidate_gateways=AsyncMock()))
+        monkeypatch.setattr("mcpgateway.services.gateway_service._get_tool_lookup_cache", lambda: MagicMock(invalidate_gateway=AsyncMock()))
+        monkeypatch.setattr("mcpgateway.cache.admin_stats_cache.admin_stats_cache", MagicMock(invalidate_tags=AsyncMock()))
+        monkeypatch.setattr(gateway_service, "_initialize_gateway", AsyncMock(return_value=({"tools": {}}, [], [], [])))
+        monkeypatch.setattr(gateway_service.oauth_manager, "invalidate_access_token", AsyncMock())
+
+        await gateway_service.update_gateway(db, mock_gateway.id, update_data)
+
+        gateway_service.oauth_manager.invalidate_access_token.assert_awaited_once_with(old_config)
+
     @pytest.mark.asyncio
     async def test_update_metadata_fields(self, gateway_service, mock_gateway, monkeypatch):
         """Modified_by and other metadata are set during update."""
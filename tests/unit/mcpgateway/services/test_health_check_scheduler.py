@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""Tests for the adaptive gateway health-check scheduler."""
+
+# Standard
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.services.gateway_service import GatewayService
+from mcpgateway.services.health_check_scheduler import GatewayHealthSignals, HealthCheckScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def signals(clock):
+    return GatewayHealthSignals(clock=clock)
+
+
+def _gateways(n, reachable=True):
+    return [SimpleNamespace(id=f"gw{i}", url=f"http://gw{i}", reachable=reachable) for i in range(n)]
+
+
+def _scheduler(clock, signals, **kwargs):
+    kwargs.setdefault("interval", 60)
+    kwargs.setdefault("rng", lambda: 0.5)
+    return HealthCheckScheduler(signals=signals, clock=clock, **kwargs)
+
+
+def test_initial_checks_are_spread_over_the_interval(clock, signals):
+    sched = _scheduler(clock, signals)
+    sched.sync(_gateways(6))
+
+    probed = []
+    for _ in range(6):
+        probed.append(sched.due())
+        clock.now += 10
+
+    assert probed == [["gw0"], ["gw1"], ["gw2"], ["gw3"], ["gw4"], ["gw5"]]
+
+
+def test_healthy_gateway_is_rechecked_after_one_interval(clock, signals):
+    sched = _scheduler(clock, signals)
+    sched.sync(_gateways(1))
+    assert sched.due() == ["gw0"]
+    sched.record_result("gw0", healthy=True)
+
+    clock.now += 59
+    assert sched.due() == []
+    clock.now += 1
+    assert sched.due() == ["gw0"]
+
+
+def test_failing_gateway_backs_off_exponentially(clock, signals):
+    sched = _scheduler(clock, signals, max_backoff=200, rng=lambda: 1.0)
+    sched.sync(_gateways(1))
+    assert sched.due() == ["gw0"]
+
+    delays = []
+    for _ in range(4):
+        sched.record_result("gw0", healthy=False)
+        start = clock.now
+        while not sched.due():
+            clock.now += 1
+        delays.append(clock.now - start)
+
+    assert delays == [60, 120, 200, 200]
+    sched.record_result("gw0", healthy=True)
+    assert sched.stats()["failing"] == 0
+
+
+def test_backoff_jitter_stays_within_half_to_full_base(clock, signals):
+    low = _scheduler(clock, signals, rng=lambda: 0.0).backoff(2)
+    high = _scheduler(clock, signals, rng=lambda: 0.999).backoff(2)
+    assert low == 60
+    assert 119 < high <= 120
+
+
+def test_recent_passive_success_skips_probe_up_to_limit(clock, signals):
+    sched = _scheduler(clock, signals, passive_max_skips=2)
+    sched.sync(_gateways(1))
+    sched.due()
+    sched.record_result("gw0", healthy=True)
+
+    probes = 0
+    for _ in range(6):
+        clock.now += 60
+        signals.record_success(gateway_id="gw0")
+        due = sched.due()
+        if due:
+            probes += 1
+            sched.record_result("gw0", healthy=True)
+
+    # two skips, one probe, two skips, one probe
+    assert probes == 2
+    assert sched.stats()["skipped"] == 4
+
+
+def test_passive_success_by_url_is_matched(clock, signals):
+    sched = _scheduler(clock, signals)
+    sched.sync(_gateways(1))
+    sched.due()
+    sched.record_result("gw0", healthy=True)
+    clock.now += 60
+    signals.record_success(url="http://gw0")
+    assert sched.due() == []
+
+
+def test_unreachable_or_failing_gateways_are_never_skipped(clock, signals):
+    sched = _scheduler(clock, signals)
+    sched.sync(_gateways(1, reachable=False))
+    signals.record_success(gateway_id="gw0")
+    assert sched.due() == ["gw0"]
+
+
+def test_stale_passive_success_does_not_skip(clock, signals):
+    sched = _scheduler(clock, signals)
+    sched.sync(_gateways(1))
+    signals.record_success(gateway_id="gw0")
+    sched.due()
+    sched.record_result("gw0", healthy=True)
+    clock.now += 60
+    assert sched.due() == ["gw0"]
+
+
+def test_passive_failure_pulls_probe_forward(clock, signals):
+    sched = _scheduler(clock, signals)
+    sched.sync(_gateways(1))
+    sched.due()
+    sched.record_result("gw0", healthy=True)
+
+    clock.now += 5
+    signals.record_success(gateway_id="gw0")
+    signals.record_failure(url="http://gw0")
+    assert sched.due() == ["gw0"]
+
+
+def test_sync_drops_removed_gateways_and_adds_new_ones(clock, signals):
+    sched = _scheduler(clock, signals)
+    sched.sync(_gateways(2))
+    sched.sync([SimpleNamespace(id="gw1", url="http://gw1", reachable=True), SimpleNamespace(id="new", url="http://new", reachable=True)])
+    assert len(sched) == 2
+    clock.now += 60
+    assert sorted(sched.due()) == ["gw1", "new"]
+
+
+def test_finish_reschedules_gateways_without_result(clock, signals):
+    sched = _scheduler(clock, signals)
+    sched.sync(_gateways(1))
+    assert sched.due() == ["gw0"]
+    assert sched.due() == []  # in flight
+    sched.finish(["gw0"])
+    assert sched.next_delay() == 60
+
+
+@pytest.mark.asyncio
+async def test_gateway_service_probes_only_due_gateways():
+    service = GatewayService()
+    service._health_check_interval = 60
+    gateways = _gateways(3)
+    service._get_gateways = MagicMock(return_value=gateways)
+    service.check_health_of_gateways = AsyncMock(return_value=True)
+
+    delay = await service._run_due_health_checks(None)
+    assert service.check_health_of_gateways.await_args.args[0] == [gateways[0]]
+    assert 1.0 <= delay <= 20
+
+    # A second call within the interval does not re-read the gateway list
+    await service._run_due_health_checks(None)
+    service._get_gateways.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_gateway_failure_backs_off_in_service_scheduler():
+    service = GatewayService()
+    gateway = SimpleNamespace(id="gw0", name="gw0", url="http://gw0", reachable=True, enabled=False)
+    service._health_scheduler.sync([gateway])
+    service._health_scheduler.due()
+
+    await service._handle_gateway_failure(gateway)
+
+    state = service._health_scheduler._states["gw0"]
+    assert state.failures == 1
+    assert not state.in_flight
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Tests for the structured log buffer service.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Standard
+import asyncio
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.db import StructuredLogEntry
+from mcpgateway.services.log_buffer_service import LogBufferService
+from mcpgateway.services.structured_logger import LogRouter
+
+
+def test_overflow_policies_count_drops():
+    oldest = LogBufferService(enabled=True, max_size=2, overflow_policy="drop_oldest")
+    newest = LogBufferService(enabled=True, max_size=2, overflow_policy="drop_newest")
+    for i in range(5):
+        oldest.add({"message": str(i)})
+        newest.add({"message": str(i)})
+
+    assert [row["message"] for row in oldest._buffer] == ["3", "4"]
+    assert [row["message"] for row in newest._buffer] == ["0", "1"]
+    assert oldest.get_stats()["total_dropped"] == newest.get_stats()["total_dropped"] == 3
+
+
+@pytest.mark.asyncio
+async def test_router_buffers_while_running_and_flushes_in_batches(test_db):
+    buffer = LogBufferService(enabled=True, max_size=100, batch_size=2, flush_interval=60)
+    router = LogRouter.__new__(LogRouter)
+
+    @contextmanager
+    def session():
+        yield test_db
+
+    with (
+        patch("mcpgateway.services.structured_logger.get_log_buffer_service", return_value=buffer),
+        patch("mcpgateway.services.structured_logger.SessionLocal") as session_local,
+        patch("mcpgateway.services.log_buffer_service.fresh_db_session", session),
+    ):
+        await buffer.start()
+        for i in range(5):
+            router._persist_to_database({"message": f"buffered-{i}", "component": "log-buffer-test", "hostname": "host", "process_id": 1, "error_type": "ValueError"})
+        session_local.assert_not_called()
+
+        # Reaching a full batch wakes the flusher before the interval elapses
+        for _ in range(50):
+            if buffer.get_stats()["total_flushed"] >= 4:
+                break
+            await asyncio.sleep(0.01)
+        assert buffer.get_stats()["total_flushed"] >= 4
+
+        await buffer.shutdown()
+
+        # After shutdown the router writes immediately again
+        session_local.return_value = MagicMock()
+        router._persist_to_database({"level": "INFO", "message": "direct"})
+        session_local.return_value.commit.assert_called_once()
+
+    rows = test_db.query(StructuredLogEntry).filter_by(component="log-buffer-test").all()
+    assert sorted(row.message for row in rows) == [f"buffered-{i}" for i in range(5)]
+    assert rows[0].error_details["error_type"] == "ValueError"
+
+    stats = buffer.get_stats()
+    assert stats["total_flushed"] == 5 and stats["current_buffer_size"] == 0 and not stats["running"]
+    assert stats["flush_count"] == 3 and stats["max_flush_ms"] >= stats["avg_flush_ms"] > 0
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_counts_lost_entries():
+    buffer = LogBufferService(enabled=True, batch_size=10)
+    buffer.add({"message": "lost"})
+    with patch("mcpgateway.services.log_buffer_service.fresh_db_session", side_effect=RuntimeError("db down")):
+        await buffer._flush_all()
+    stats = buffer.get_stats()
+    assert stats["total_failed"] == 1 and stats["total_flushed"] == 0 and stats["current_buffer_size"] == 0
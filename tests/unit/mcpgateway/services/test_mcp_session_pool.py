@@ -1437,3 +1437,255 @@ class TestContextManager:
             assert pool._pools[pool_key].qsize() == 1
 
         await pool.close_all()
+
+
+class TestMultiplexedSessions:
+    """Tests for multiplexed (shared) sessions."""
+
+    @staticmethod
+    def _make_session():
+        return PooledSession(
+            session=MagicMock(),
+            transport_context=MagicMock(),
+            url="http://test:8080",
+            identity_key="anonymous",
+            transport_type=TransportType.STREAMABLE_HTTP,
+            headers={},
+        )
+
+    @pytest.mark.asyncio
+    async def test_burst_shares_sessions_least_loaded(self):
+        """A burst of concurrent acquires opens ceil(N / K) sessions, spread evenly."""
+        pool = MCPSessionPool(max_in_flight_per_session=3)
+
+        async def create(*_args, **_kwargs):
+            await asyncio.sleep(0.01)
+            return self._make_session()
+
+        with patch.object(pool, "_create_session", side_effect=create) as mock_create:
+            sessions = await asyncio.gather(*(pool.acquire("http://test:8080") for _ in range(6)))
+
+            assert mock_create.call_count == 2
+            assert len({id(s) for s in sessions}) == 2
+            assert sorted(s.in_flight for s in {id(s): s for s in sessions}.values()) == [3, 3]
+
+            # Free one slot on each session, then the next acquire goes to the least-loaded one
+            first, second = {id(s): s for s in sessions}.values()
+            await pool.release(first)
+            await pool.release(first)
+            await pool.release(second)
+            assert await pool.acquire("http://test:8080") is first
+            assert first.in_flight == 2
+
+            metrics = pool.get_metrics()
+            assert metrics["max_in_flight_per_session"] == 3
+            assert metrics["multiplexed_acquires"] >= 4
+            assert next(iter(metrics["pools"].values()))["shared"] == 2
+
+        await pool.close_all()
+        assert first.is_closed and second.is_closed
+
+    @pytest.mark.asyncio
+    async def test_waits_for_slot_when_sessions_saturated(self):
+        """With max sessions reached, acquirers wait for a release instead of opening more."""
+        pool = MCPSessionPool(max_sessions_per_key=1, max_in_flight_per_session=2, acquire_timeout_seconds=0.05)
+
+        with patch.object(pool, "_create_session", new_callable=AsyncMock, return_value=self._make_session()):
+            pooled = await pool.acquire("http://test:8080")
+            assert await pool.acquire("http://test:8080") is pooled
+
+            with pytest.raises(asyncio.TimeoutError):
+                await pool.acquire("http://test:8080")
+
+            waiter = asyncio.create_task(pool.acquire("http://test:8080", timeout=None))
+            await asyncio.sleep(0)
+            await pool.release(pooled)
+            assert await waiter is pooled
+            assert pooled.in_flight == 2
+
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_expired_session_retired_after_last_request(self):
+        """An expired shared session keeps serving in-flight requests and closes on the last release."""
+        pool = MCPSessionPool(max_in_flight_per_session=2, session_ttl_seconds=60.0)
+
+        with patch.object(pool, "_create_session", new_callable=AsyncMock, side_effect=[self._make_session(), self._make_session()]):
+            old = await pool.acquire("http://test:8080")
+            old.created_at -= 120
+
+            fresh = await pool.acquire("http://test:8080")
+            assert fresh is not old
+
+            await pool.release(old)
+            assert old.is_closed
+            assert pool._evictions == 1
+            assert pool._shared_sessions(("anonymous", "http://test:8080", "anonymous", "streamablehttp", "")) == [fresh]
+
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_release_of_closed_shared_session_frees_its_slot(self):
+        """A shared session closed mid-request is dropped from rotation and frees its pool slot."""
+        pool = MCPSessionPool(max_sessions_per_key=1, max_in_flight_per_session=2, acquire_timeout_seconds=0.05)
+        key = ("anonymous", "http://test:8080", "anonymous", "streamablehttp", "")
+
+        with patch.object(pool, "_create_session", new_callable=AsyncMock, side_effect=[self._make_session(), self._make_session()]):
+            broken = await pool.acquire("http://test:8080")
+            assert await pool.acquire("http://test:8080") is broken
+            broken.mark_closed()
+
+            await pool.release(broken)
+            assert broken.in_flight == 1
+            assert pool._shared_sessions(key) == []
+
+            await pool.release(broken)
+            assert broken.in_flight == 0
+
+            replacement = await pool.acquire("http://test:8080")
+            assert replacement is not broken
+
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_failed_creation_wakes_waiters(self):
+        """Waiters parked on a pending creation retry when it fails."""
+        pool = MCPSessionPool(max_in_flight_per_session=4)
+        calls = 0
+
+        async def create(*_args, **_kwargs):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            if calls == 1:
+                raise RuntimeError("boom")
+            return self._make_session()
+
+        with patch.object(pool, "_create_session", side_effect=create):
+            results = await asyncio.gather(*(pool.acquire("http://test:8080") for _ in range(3)), return_exceptions=True)
+
+        assert sum(isinstance(r, RuntimeError) for r in results) == 1
+        sessions = [r for r in results if isinstance(r, PooledSession)]
+        assert len(sessions) == 2 and sessions[0] is sessions[1]
+        assert calls == 2
+        await pool.close_all()
+
+
+class TestSessionWarmup:
+    """Tests for warm-up of the busiest pool keys."""
+
+    URL = "http://test:8080"
+    KEY = ("anonymous", URL, "anonymous", "streamablehttp", "")
+
+    @staticmethod
+    def _make_session(url="http://test:8080", *_args, **_kwargs):
+        return PooledSession(
+            session=MagicMock(),
+            transport_context=MagicMock(),
+            url=url,
+            identity_key="anonymous",
+            transport_type=TransportType.STREAMABLE_HTTP,
+            headers={},
+        )
+
+    @pytest.mark.asyncio
+    async def test_warms_top_keys_and_protects_them_from_eviction(self):
+        """Hot keys are topped up to the minimum; cold keys are not tracked forever."""
+        pool = MCPSessionPool(warmup_top_n=1, warmup_min_sessions=2)
+
+        with patch.object(pool, "_create_session", new_callable=AsyncMock, side_effect=self._make_session) as mock_create:
+            for _ in range(3):
+                await pool.release(await pool.acquire(self.URL))
+            await pool.release(await pool.acquire("http://cold:8080"))
+            assert mock_create.call_count == 2
+
+            await pool.run_warmup_cycle()
+
+            assert pool._warm_keys == {self.KEY}
+            assert pool._pools[self.KEY].qsize() == 2
+            assert mock_create.call_count == 3
+
+            pool._idle_pool_eviction = 0.0
+            pool._last_eviction_run = 0.0
+            await pool._maybe_evict_idle_pool_keys()
+            assert self.KEY in pool._pools
+            cold_key = ("anonymous", "http://cold:8080", "anonymous", "streamablehttp", "")
+            assert cold_key not in pool._pools
+            # The evicted key's headers are not kept for warm-up
+            assert list(pool._warmup_targets) == [self.KEY]
+
+            metrics = pool.get_metrics()["warmup"]
+            assert metrics["enabled"] is True
+            assert metrics["warm_keys"] == 1
+            assert metrics["sessions_created"] == 1
+
+            # Demand decays away once the key goes quiet
+            for _ in range(6):
+                await pool.run_warmup_cycle()
+            assert pool._warm_keys == set()
+            assert pool._warmup_targets == {}
+
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_close_all_forgets_warmup_targets(self):
+        """Recorded upstream headers do not outlive the pool."""
+        pool = MCPSessionPool(warmup_top_n=1)
+        with patch.object(pool, "_create_session", new_callable=AsyncMock, side_effect=self._make_session):
+            await pool.release(await pool.acquire(self.URL, headers={"Authorization": "Bearer secret"}))
+        assert [target.headers["Authorization"] for target in pool._warmup_targets.values()] == ["Bearer secret"]
+
+        await pool.close_all()
+        assert pool._warmup_targets == {}
+
+    @pytest.mark.asyncio
+    async def test_refreshes_sessions_before_ttl(self):
+        """A session close to its TTL is replaced while the key is at max sessions."""
+        pool = MCPSessionPool(max_sessions_per_key=1, session_ttl_seconds=300.0, warmup_top_n=5, warmup_refresh_margin_seconds=60.0)
+
+        with patch.object(pool, "_create_session", new_callable=AsyncMock, side_effect=self._make_session):
+            old = await pool.acquire(self.URL)
+            await pool.release(old)
+            old.created_at -= 250
+
+            await pool.run_warmup_cycle()
+
+        assert old.is_closed
+        fresh = pool._pools[self.KEY].get_nowait()
+        assert fresh is not old and fresh.age_seconds < 1
+        assert pool.get_metrics()["warmup"]["sessions_refreshed"] == 1
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_failure_keeps_old_session_and_skips_circuit_breaker(self):
+        """A failed warm-up keeps the expiring session in rotation and does not trip the breaker."""
+        pool = MCPSessionPool(max_sessions_per_key=1, warmup_top_n=5, circuit_breaker_threshold=1)
+
+        with patch.object(pool, "_create_session", new_callable=AsyncMock, return_value=self._make_session()):
+            old = await pool.acquire(self.URL)
+            await pool.release(old)
+        old.created_at -= 280
+
+        with patch.object(pool, "_create_session", new_callable=AsyncMock, side_effect=RuntimeError("down")):
+            await pool.run_warmup_cycle()
+
+        assert pool._pools[self.KEY].get_nowait() is old
+        assert not pool._is_circuit_open(self.URL)
+        assert pool.get_metrics()["warmup"]["failures"] == 1
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_start_warmup_runs_loop_until_closed(self):
+        """start_warmup() is a no-op when disabled and the loop stops on close_all()."""
+        disabled = MCPSessionPool()
+        disabled.start_warmup()
+        assert disabled._warmup_task is None
+
+        pool = MCPSessionPool(warmup_top_n=1, warmup_interval_seconds=0.01)
+        with patch.object(pool, "run_warmup_cycle", new_callable=AsyncMock) as mock_cycle:
+            pool.start_warmup()
+            await asyncio.sleep(0.05)
+            assert mock_cycle.await_count >= 2
+            assert pool.get_metrics()["warmup"]["running"] is True
+            await pool.close_all()
+        assert pool._warmup_task is None
@@ -534,3 +534,70 @@ class TestGetTopEntitiesCombined:
         db.execute.return_value = _Result()
 
         assert mqs.get_top_entities_combined(db, "tool", entity_model=Tool, order_by="avg_response_time") == []
+
+
+# ============================================================================
+# Tests for percentile sketches merged across rollups and raw metrics
+# ============================================================================
+
+
+class TestResponseTimeSketch:
+    """Range percentiles come from hourly rollup sketches plus unrolled raw metrics."""
+
+    def test_invalid_metric_type_raises(self):
+        with pytest.raises(ValueError, match="Unknown metric type"):
+            mqs.get_response_time_sketch(MagicMock(), "invalid_type")
+
+    def test_percentiles_merge_rollups_without_raw_rows(self, test_db, monkeypatch):
+        # Standard
+        from contextlib import contextmanager
+
+        # First-Party
+        from mcpgateway.db import Tool, ToolMetric, ToolMetricsHourly
+        from mcpgateway.services import metrics_rollup_service
+        from mcpgateway.services.metrics_rollup_service import MetricsRollupService
+
+        monkeypatch.setattr(mqs.settings, "metrics_retention_days", 1, raising=False)
+        monkeypatch.setattr(mqs.settings, "metrics_delete_raw_after_rollup", False, raising=False)
+
+        current_hour = mqs.get_current_hour_start()
+        old_hour = current_hour - timedelta(hours=30)  # before the retention cutoff
+        recent_hour = current_hour - timedelta(hours=2)  # raw data still retained
+        values = {
+            old_hour: [i / 100 for i in range(1, 201)],
+            recent_hour: [i / 10 for i in range(1, 51)],
+            current_hour: [5.0] * 10,
+        }
+        for hour, response_times in values.items():
+            test_db.add_all(ToolMetric(tool_id="tool-1", timestamp=hour + timedelta(minutes=1), response_time=rt, is_success=True) for rt in response_times)
+        test_db.commit()
+
+        @contextmanager
+        def session():
+            yield test_db
+
+        monkeypatch.setattr(metrics_rollup_service, "fresh_db_session", session)
+        service = MetricsRollupService(delete_raw_after_rollup=False)
+        result = service._rollup_table("tool_metrics", ToolMetric, ToolMetricsHourly, Tool, "tool_id", "name", old_hour, current_hour, False)
+        assert result.error is None and result.rollups_updated == 2
+
+        rollup = test_db.query(ToolMetricsHourly).filter_by(hour_start=old_hour).one()
+        assert rollup.response_time_sketch["count"] == 200
+        assert rollup.p99_response_time == pytest.approx(1.98, rel=0.01)
+
+        # Raw rows of rolled-up hours are not needed anymore
+        test_db.query(ToolMetric).filter(ToolMetric.timestamp < current_hour).delete()
+        test_db.commit()
+
+        all_values = sorted(rt for response_times in values.values() for rt in response_times)
+        sketch = mqs.get_response_time_sketch(test_db, "tool", entity_id="tool-1")
+        assert sketch.count == len(all_values)
+
+        # Old-hour rows come from rollups in the totals; percentiles cover all three sources
+        combined = mqs.aggregate_metrics_combined(test_db, "tool")
+        assert combined.p50_response_time == pytest.approx(all_values[int(0.5 * (len(all_values) - 1))], rel=0.011)
+        assert combined.p99_response_time == pytest.approx(all_values[int(0.99 * (len(all_values) - 1))], rel=0.011)
+        assert combined.to_dict()["p95_response_time"] == combined.p95_response_time
+
+        recent = mqs.get_response_time_sketch(test_db, "tool", since=recent_hour)
+        assert recent.count == 60 and recent.max_value == 5.0
@@ -810,8 +810,13 @@ class TestRollupInternals:
         row.p99_rt = 2.0
         row.interaction_type = "invoke"
 
+        agg_result = MagicMock()
+        agg_result.yield_per.return_value = [row]
+        rt_result = MagicMock()
+        rt_result.yield_per.return_value = [("agent-1", "invoke", 1.0), ("agent-1", "invoke", 2.0)]
+
         mock_db = MagicMock()
-        mock_db.execute.return_value.yield_per.return_value = [row]
+        mock_db.execute.side_effect = [agg_result, rt_result]
 
         aggregations = service._aggregate_hour(
             db=mock_db,
@@ -826,6 +831,7 @@ class TestRollupInternals:
 
         assert len(aggregations) == 1
         assert aggregations[0].interaction_type == "invoke"
+        assert aggregations[0].response_time_sketch["count"] == 2
 
     def test_aggregate_hour_postgresql_non_a2a(self, monkeypatch):
         """Cover the PostgreSQL percentile path when is_a2a=False."""
@@ -910,8 +916,13 @@ class TestRollupInternals:
         row.p95_rt = 2.0
         row.p99_rt = 2.0
 
+        agg_result = MagicMock()
+        agg_result.yield_per.return_value = [row]
+        rt_result = MagicMock()
+        rt_result.yield_per.return_value = []
+
         mock_db = MagicMock()
-        mock_db.execute.return_value.yield_per.return_value = [row]
+        mock_db.execute.side_effect = [agg_result, rt_result]
 
         aggregations = service._aggregate_hour(
             db=mock_db,
@@ -926,6 +937,7 @@ class TestRollupInternals:
 
         assert len(aggregations) == 1
         assert aggregations[0].interaction_type is None
+        assert aggregations[0].response_time_sketch is None
 
     def test_aggregate_hour_python_path_empty_response_times(self, monkeypatch):
         service = MetricsRollupService()
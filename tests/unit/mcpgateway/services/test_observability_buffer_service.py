@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""Tests for the buffered observability trace exporter.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Standard
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+# Third-Party
+import pytest
+from starlette.responses import Response
+
+# First-Party
+from mcpgateway.db import ObservabilityEvent, ObservabilitySpan, ObservabilityTrace
+from mcpgateway.middleware.observability_middleware import ObservabilityMiddleware
+from mcpgateway.services.observability_buffer_service import ObservabilityBufferService
+from mcpgateway.services.observability_service import ObservabilityService
+
+
+@pytest.fixture
+def buffer():
+    return ObservabilityBufferService(enabled=True, sample_rate=0.0, slow_threshold_ms=0, max_queue_size=100, batch_size=50, flush_interval=60)
+
+
+def test_tail_sampling_keeps_errors_and_slow_traces(buffer):
+    # Head sampling drops a successful fast request
+    buffer.end_trace(buffer.start_trace("GET /rpc"), status="ok")
+
+    # An error event anywhere in the trace keeps it
+    errored = buffer.start_trace("POST /rpc")
+    span = buffer.start_span(errored, "tool.invoke")
+    buffer.end_span(span, status="ok")
+    buffer.add_event(span, "tool.error", severity="error", message="boom")
+    buffer.end_trace(errored, status="ok", http_status_code=200)
+
+    # Slow requests are kept
+    buffer.slow_threshold_ms = 0.000001
+    slow = buffer.start_trace("POST /rpc")
+    with patch("mcpgateway.services.observability_buffer_service._utc_now", return_value=datetime(2100, 1, 1, tzinfo=timezone.utc)):
+        buffer.end_trace(slow, status="ok")
+
+    # Upstream sampled traces are kept without any tail reason
+    buffer.slow_threshold_ms = 0
+    buffer.end_trace(buffer.start_trace("GET /rpc", sampled=True), status="ok")
+
+    stats = buffer.get_stats()
+    assert stats["traces_sampled_out"] == 1
+    assert stats["traces_tail_kept"] == 2
+    assert [record.trace["trace_id"] for record in buffer._queue][:2] == [errored, slow]
+    assert stats["queued_traces"] == 3 and stats["active_traces"] == 0
+
+
+def test_full_queue_drops_and_counts(buffer):
+    buffer.max_queue_size = 2
+    for _ in range(5):
+        buffer.end_trace(buffer.start_trace("POST /rpc"), status="error")
+    stats = buffer.get_stats()
+    assert stats["queued_traces"] == 2
+    assert stats["traces_dropped"] == 3
+
+
+def test_full_queue_discards_late_spans_of_dropped_trace(buffer):
+    buffer.max_queue_size = 1
+    buffer.end_trace(buffer.start_trace("POST /rpc", sampled=True), status="ok")
+
+    dropped = buffer.start_trace("POST /rpc", sampled=True)
+    open_span = buffer.start_span(dropped, "tool.invoke")
+    buffer.end_trace(dropped, status="ok")
+    buffer._queue.clear()
+
+    # The trace row never reaches the database, so neither may its spans
+    late_span = buffer.start_span(dropped, "db.query")
+    assert buffer.end_span(late_span) and buffer.end_span(open_span)
+    assert buffer._decisions[dropped] is False
+    assert not buffer._queue and buffer._late_spans == {}
+    assert buffer.get_stats()["traces_dropped"] == 1
+
+
+def test_open_spans_keep_their_children_when_trace_ends(buffer):
+    trace_id = buffer.start_trace("POST /rpc", sampled=True)
+    parent = buffer.start_span(trace_id, "tool.invoke")
+    child = buffer.start_span(trace_id, "http.request", parent_span_id=parent)
+    buffer.end_span(child, status="error")
+    buffer.add_event(child, "http.error", severity="error")
+    buffer.end_trace(trace_id, status="ok")
+    grandchild = buffer.start_span(trace_id, "db.query", parent_span_id=parent)
+
+    trace_record = buffer._queue[0]
+    assert trace_record.spans == {} and trace_record.events == []
+
+    # The late entry is exported once every span in it has ended
+    buffer.end_span(parent)
+    assert len(buffer._queue) == 1
+    buffer.end_span(grandchild)
+    late = buffer._queue[1]
+    assert list(late.spans) == [parent, child, grandchild]
+    assert [event["span_id"] for event in late.events] == [child]
+
+
+def test_service_spans_follow_buffered_trace_and_late_spans(buffer):
+    service = ObservabilityService()
+    db = MagicMock()
+    with patch("mcpgateway.services.observability_service.get_observability_buffer_service", return_value=buffer):
+        kept = buffer.start_trace("POST /rpc", sampled=True)
+        span = service.start_span(db, kept, "tool.invoke", resource_type="tool")
+        service.end_span(db, span, status="error", status_message="failed")
+        assert service.add_event(db, span, "tool.error", severity="error") == 0
+
+        # Spans that outlive their trace are exported separately, or discarded with it
+        open_span = service.start_span(db, kept, "prompt.render")
+        buffer.end_trace(kept, status="ok")
+        late_span = service.start_span(db, kept, "db.query")
+        service.end_span(db, late_span)
+        service.end_span(db, open_span)
+
+        dropped = buffer.start_trace("GET /rpc")
+        buffer.end_trace(dropped, status="ok")
+        service.end_span(db, service.start_span(db, dropped, "db.query"))
+
+    db.add.assert_not_called()
+    db.query.assert_not_called()
+    db.commit.assert_not_called()
+    assert [list(record.spans) for record in buffer._queue] == [[span], [late_span], [open_span]]
+    assert buffer._queue[0].spans[span]["status"] == "error"
+    assert buffer._late_spans == {}
+
+
+@pytest.mark.asyncio
+async def test_flush_bulk_inserts_in_one_transaction(buffer, test_db):
+    trace_id = buffer.start_trace("POST /rpc", http_method="POST", sampled=True)
+    parent = buffer.start_span(trace_id, "http.request", kind="server")
+    child = buffer.start_span(trace_id, "tool.invoke", parent_span_id=parent)
+    buffer.end_span(child, status="error")
+    buffer.add_event(child, "tool.error", severity="error", message="boom")
+    buffer.end_span(parent, status="ok")
+    buffer.end_trace(trace_id, status="ok", http_status_code=200)
+
+    @contextmanager
+    def session():
+        yield test_db
+
+    with patch("mcpgateway.services.observability_buffer_service.fresh_db_session", session):
+        await buffer._flush_all()
+
+    trace = test_db.query(ObservabilityTrace).filter_by(trace_id=trace_id).one()
+    assert trace.http_status_code == 200 and trace.duration_ms is not None
+    assert {s.span_id for s in test_db.query(ObservabilitySpan).filter_by(trace_id=trace_id)} == {parent, child}
+    assert test_db.query(ObservabilityEvent).filter_by(span_id=child).one().message == "boom"
+    assert buffer.get_stats()["rows_flushed"] == 4 and buffer.get_stats()["flush_count"] == 1
+    assert not buffer._queue
+
+
+@pytest.mark.asyncio
+async def test_buffered_middleware_skips_database(buffer):
+    request = MagicMock()
+    request.method = "POST"
+    request.url.path = "/rpc"
+    request.url.query = ""
+    request.url.__str__.return_value = "http://testserver/rpc"
+    request.headers = {"traceparent": "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"}
+
+    async def call_next(_request):
+        return Response("OK", status_code=200)
+
+    async def failing_call_next(_request):
+        raise RuntimeError("handler failed")
+
+    with patch("mcpgateway.middleware.observability_middleware.get_observability_buffer_service", return_value=buffer), patch("mcpgateway.middleware.observability_middleware.SessionLocal") as session_local:
+        middleware = ObservabilityMiddleware(app=None, enabled=True, buffered=True)
+        assert (await middleware.dispatch(request, call_next)).status_code == 200
+        request.headers = {}
+        with pytest.raises(RuntimeError):
+            await middleware.dispatch(request, failing_call_next)
+
+    session_local.assert_not_called()
+    upstream, failed = buffer._queue
+    assert upstream.trace["trace_id"] == "0af7651916cd43dd8448eb211c80319c"
+    assert upstream.trace["attributes"]["parent_span_id"] == "b7ad6b7169203331"
+    assert failed.trace["status"] == "error" and failed.trace["http_status_code"] == 500
+    assert failed.events[0]["exception_type"] == "RuntimeError"
+
+
+@pytest.mark.asyncio
+async def test_flush_sorts_spans_and_isolates_failing_entries(buffer, test_db):
+    first = buffer.start_trace("POST /rpc", sampled=True)
+    parent = buffer.start_span(first, "tool.invoke")
+    buffer.end_trace(first, status="ok")
+    child = buffer.start_span(first, "db.query")
+    buffer.end_span(child)
+    buffer.end_span(parent)
+
+    inserted = []
+    bulk_insert = test_db.bulk_insert_mappings
+
+    def recording_insert(model, rows):
+        if model is ObservabilitySpan:
+            inserted.append([row["span_id"] for row in rows])
+        return bulk_insert(model, rows)
+
+    @contextmanager
+    def session():
+        try:
+            yield test_db
+        except Exception:
+            test_db.rollback()
+            raise
+
+    with patch("mcpgateway.services.observability_buffer_service.fresh_db_session", session), patch.object(test_db, "bulk_insert_mappings", recording_insert):
+        await buffer._flush_all()
+
+        # Spans go in start order even though the child's entry was queued first
+        assert inserted == [[parent, child]]
+
+        buffer.end_trace(buffer.start_trace("GET /rpc", trace_id=first, sampled=True), status="ok")
+        other = buffer.start_trace("GET /health", sampled=True)
+        buffer.end_trace(other, status="ok")
+        await buffer._flush_all()
+
+    assert test_db.query(ObservabilityTrace).filter_by(trace_id=other).one().name == "GET /health"
+    assert {s.span_id for s in test_db.query(ObservabilitySpan).filter_by(trace_id=first)} == {parent, child}
+    stats = buffer.get_stats()
+    assert stats["rows_failed"] == 1 and stats["rows_flushed"] == 4 and stats["flush_count"] == 2
@@ -302,6 +302,68 @@ async def test_get_user_permissions_any_team_cache_key(svc):
     assert "user@test.com:__anyteam__" in svc._permission_cache
 
 
+@pytest.mark.asyncio
+async def test_get_user_permissions_shared_across_instances(mock_db):
+    """Compiled permissions are reused by later per-request service instances."""
+    role = SimpleNamespace(name="viewer", permissions=["tools.read"], get_effective_permissions=lambda: ["tools.read"])
+    user_role = SimpleNamespace(role=role, role_id="r1", scope="global", scope_id=None)
+    first = PermissionService(mock_db, audit_enabled=False)
+    with patch.object(first, "_get_user_roles", return_value=[user_role]) as roles:
+        await first.get_user_permissions("user@test.com")
+    roles.assert_called_once()
+
+    second = PermissionService(mock_db, audit_enabled=True)
+    with patch.object(second, "_get_user_roles") as roles:
+        assert await second.get_user_permissions("user@test.com") == {"tools.read"}
+    roles.assert_not_called()
+    # Audit role summaries come from the compiled index entry
+    assert second._get_roles_for_audit("user@test.com", None)["roles"][0]["name"] == "viewer"
+
+
+@pytest.mark.asyncio
+async def test_get_user_permissions_invalidated_on_role_change(mock_db):
+    """Invalidating a user's permissions forces the next request to re-query roles."""
+    from mcpgateway.cache.auth_cache import auth_cache
+
+    role = SimpleNamespace(name="viewer", permissions=["tools.read"], get_effective_permissions=lambda: ["tools.read"])
+    user_role = SimpleNamespace(role=role, role_id="r1", scope="global", scope_id=None)
+    with patch.object(PermissionService, "_get_user_roles", return_value=[user_role]):
+        await PermissionService(mock_db).get_user_permissions("user@test.com")
+
+    await auth_cache.invalidate_permissions("user@test.com")
+
+    with patch.object(PermissionService, "_get_user_roles", return_value=[]) as roles:
+        assert await PermissionService(mock_db).get_user_permissions("user@test.com") == set()
+    roles.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_user_permissions_race_with_invalidation_not_cached(mock_db):
+    """Permissions computed while an invalidation happens are not stored in the index."""
+    from mcpgateway.cache.auth_cache import auth_cache
+
+    role = SimpleNamespace(name="viewer", permissions=["tools.read"], get_effective_permissions=lambda: ["tools.read"])
+    user_role = SimpleNamespace(role=role, role_id="r1", scope="global", scope_id=None)
+
+    async def roles_then_invalidate(*_args, **_kwargs):
+        auth_cache.invalidate_permissions_local("user@test.com")
+        return [user_role]
+
+    with patch.object(PermissionService, "_get_user_roles", side_effect=roles_then_invalidate):
+        await PermissionService(mock_db).get_user_permissions("user@test.com")
+    assert auth_cache.get_compiled_permissions("user@test.com:global") is None
+
+
+@pytest.mark.asyncio
+async def test_is_user_admin_cached_across_instances(mock_db):
+    """The is_admin lookup is served from the permission index after the first query."""
+    mock_db.execute.return_value.scalar_one_or_none.return_value = SimpleNamespace(is_admin=True)
+    assert await PermissionService(mock_db)._is_user_admin("admin@test.com") is True
+    mock_db.execute.reset_mock()
+    assert await PermissionService(mock_db)._is_user_admin("admin@test.com") is True
+    mock_db.execute.assert_not_called()
+
+
 # ---------- get_user_roles ----------
 
 
@@ -189,6 +189,13 @@ def mock_inactive_resource():
     return resource
 
 
+def _index_template(service, template, enabled=True, uri_template=None):
+    """Register a template in the service's router and mark the index fresh."""
+    service._template_router.add(str(template.id), template, uri_template or template.uri_template, enabled=enabled)
+    service._template_router.stale = False
+    service._template_router_refreshed_at = time.monotonic()
+
+
 @pytest.fixture
 def sample_resource_create():
     """Create a sample ResourceCreate object."""
@@ -208,7 +215,7 @@ class TestResourceServiceLifecycle:
         """Test service initialization."""
         await resource_service.initialize()
         # EventService handles subscribers internally now
-        assert resource_service._template_cache == {}
+        assert len(resource_service._template_router) == 0
 
     @pytest.mark.asyncio
     async def test_shutdown(self, resource_service):
@@ -1472,8 +1479,8 @@ class TestResourceTemplates:
             _meta={"version": "1.0"},
         )
 
-        # Cache contains ONE template
-        service._template_cache = {"1": template_obj}
+        # Router contains ONE template
+        _index_template(service, template_obj)
 
         # URI that DOES NOT match the template
         uri = "file://searching/hello"
@@ -1503,14 +1510,15 @@ class TestResourceTemplates:
             id="1", uriTemplate="test://template/{id}", name="template", description="Test template", mime_type="text/plain", annotations=None, _meta=None  # alias for uri_template
         )
 
-        # Pre-load template cache
-        service._template_cache = {"template": template_obj}
+        # Pre-load template router
+        _index_template(service, template_obj)
 
         # URI that should match
         uri = "test://template/123"
 
-        # Patch match + extraction to force an error
-        with patch.object(service, "_uri_matches_template", return_value=True), patch.object(service, "_extract_template_params", side_effect=Exception("Template error")):
+        # Return a match without the parameters the template needs to force an error
+        route = service._template_router.match(uri)[0]
+        with patch.object(service._template_router, "match", return_value=(route, {})):
 
             # Assert failure path
             with pytest.raises(ResourceError) as exc_info:
@@ -1540,15 +1548,13 @@ class TestResourceTemplates:
         template.name = "binary_template"
         template.mime_type = "application/octet-stream"
 
-        service._template_cache = {"binary": template}
-
-        with patch.object(service, "_uri_matches_template", return_value=True), patch.object(service, "_extract_template_params", return_value={"id": "123"}):
+        _index_template(service, template)
 
-            with pytest.raises(ResourceError) as exc_info:
-                await service._read_template_resource(db, uri)
+        with pytest.raises(ResourceError) as exc_info:
+            await service._read_template_resource(db, uri)
 
-            msg = str(exc_info.value)
-            assert "Failed to process template: Binary resource templates not yet supported" in msg
+        msg = str(exc_info.value)
+        assert "Failed to process template: Binary resource templates not yet supported" in msg
 
 
 # --------------------------------------------------------------------------- #
@@ -1999,7 +2005,7 @@ class TestResourceServiceMetricsExtended:
             _meta={"version": "1.0"},
         )
 
-        service._template_cache = {"1": template_obj}
+        _index_template(service, template_obj)
 
         # URI that does NOT match any template
         uri = "file://searching/hello"
@@ -4211,34 +4217,69 @@ class TestResourceServiceCoverageEdges:
         assert out == [{"type": "resource_added"}]
 
     @pytest.mark.asyncio
-    async def test_read_template_resource_populates_cache_and_returns_text(self):
-        """Cover template cache population (3227) and text template return (3245-3246)."""
-        from mcpgateway.common.models import ResourceContent, ResourceTemplate
+    async def test_read_template_resource_populates_router_and_returns_text(self):
+        """Cover template router population and text template return."""
+        from types import SimpleNamespace
+
+        from mcpgateway.common.models import ResourceContent
         from mcpgateway.services.resource_service import ResourceService
 
         svc = ResourceService()
         db = MagicMock()
-        db.execute.return_value.scalar_one_or_none.return_value = None
-
-        tmpl = ResourceTemplate(
+        row = SimpleNamespace(
             id="tmpl-1",
-            uriTemplate="greetme://morning/{name}",
+            uri_template="greetme://morning/{name}",
             name="greet",
             description="d",
             mime_type="text/plain",
             annotations=None,
-            _meta=None,
+            meta=None,
+            enabled=True,
+            updated_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
         )
+        db.execute.return_value.scalars.return_value.all.return_value = [row]
 
-        with (
-            patch.object(svc, "list_resource_templates", new_callable=AsyncMock, return_value=[tmpl]),
-            patch.object(svc, "_uri_matches_template", return_value=True),
-            patch.object(svc, "_extract_template_params", return_value={"name": "John"}),
-        ):
-            out = await svc._read_template_resource(db, "greetme://morning/John")
+        out = await svc._read_template_resource(db, "greetme://morning/John")
 
         assert isinstance(out, ResourceContent)
         assert out.text == "greetme://morning/John"
+        assert svc._template_router.stale is False
+        assert db.execute.call_count == 1
+
+        # Served from the index without another query
+        await svc._read_template_resource(db, "greetme://morning/Jane")
+        assert db.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_template_router_refreshes_incrementally_after_invalidation(self):
+        """A resources invalidation re-indexes only changed templates and drops deleted ones."""
+        from types import SimpleNamespace
+
+        from mcpgateway.services.resource_service import _get_registry_cache, ResourceNotFoundError, ResourceService
+
+        svc = ResourceService()
+        db = MagicMock()
+        stamp = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+        def make_row(rid, uri_template, enabled=True):
+            return SimpleNamespace(id=rid, uri_template=uri_template, name=rid, description=None, mime_type="text/plain", annotations=None, meta=None, enabled=enabled, updated_at=stamp)
+
+        keep, drop = make_row("keep", "a://{x}"), make_row("drop", "b://{y}")
+        db.execute.return_value.scalars.return_value.all.return_value = [keep, drop]
+        await svc._read_template_resource(db, "a://1")
+        kept_template = svc._template_router.match("a://1")[0].template
+
+        await _get_registry_cache().invalidate_resources()
+        assert svc._template_router.stale is True
+
+        db.execute.return_value.scalars.return_value.all.return_value = [keep, make_row("new", "c://{z}", enabled=False)]
+        out = await svc._read_template_resource(db, "a://2")
+        assert out.text == "a://2"
+        # Unchanged template was not re-validated
+        assert svc._template_router.match("a://1")[0].template is kept_template
+        assert svc._template_router.match("b://1") is None
+        with pytest.raises(ResourceNotFoundError, match="exists but is inactive"):
+            await svc._read_template_resource(db, "c://3")
 
     @pytest.mark.asyncio
     async def test_read_template_resource_inactive_template_raises(self):
@@ -4248,7 +4289,6 @@ class TestResourceServiceCoverageEdges:
 
         svc = ResourceService()
         db = MagicMock()
-        db.execute.return_value.scalar_one_or_none.return_value = MagicMock()  # inactive exists
 
         tmpl = ResourceTemplate(
             id="tmpl-1",
@@ -4259,11 +4299,11 @@ class TestResourceServiceCoverageEdges:
             annotations=None,
             _meta=None,
         )
-        svc._template_cache = {"greet": tmpl}
+        _index_template(svc, tmpl, enabled=False)
 
-        with patch.object(svc, "_uri_matches_template", return_value=True):
-            with pytest.raises(ResourceNotFoundError, match="exists but is inactive"):
-                await svc._read_template_resource(db, "greetme://morning/John")
+        with pytest.raises(ResourceNotFoundError, match="exists but is inactive"):
+            await svc._read_template_resource(db, "greetme://morning/John")
+        db.execute.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_read_template_resource_resource_not_found_error_is_reraised(self):
@@ -4284,14 +4324,14 @@ class TestResourceServiceCoverageEdges:
             annotations=None,
             _meta=None,
         )
-        svc._template_cache = {"greet": tmpl}
-
-        with (
-            patch.object(svc, "_uri_matches_template", return_value=True),
-            patch.object(svc, "_extract_template_params", side_effect=ResourceNotFoundError("nope")),
-        ):
-            with pytest.raises(ResourceNotFoundError, match="nope"):
-                await svc._read_template_resource(db, "greetme://morning/John")
+        failing = MagicMock(wraps=tmpl)
+        failing.id = tmpl.id
+        failing.mime_type = tmpl.mime_type
+        failing.uri_template.format.side_effect = ResourceNotFoundError("nope")
+        _index_template(svc, failing, uri_template=tmpl.uri_template)
+
+        with pytest.raises(ResourceNotFoundError, match="nope"):
+            await svc._read_template_resource(db, "greetme://morning/John")
 
     @pytest.mark.asyncio
     async def test_list_resource_templates_scoped_token_includes_owner_and_team_conditions(self):
@@ -18,6 +18,7 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock, call, MagicMock, Mock, patch
 
 # Third-Party
+import httpx
 import jsonschema
 import orjson
 import pytest
@@ -2502,6 +2503,9 @@ class TestToolService:
             last_execution_time="2025-01-10T12:00:00",
             raw_count=6,
             rollup_count=4,
+            p50_response_time=2.0,
+            p95_response_time=4.5,
+            p99_response_time=4.9,
         )
 
         with patch("mcpgateway.services.metrics_query_service.aggregate_metrics_combined", return_value=mock_result):
@@ -2516,6 +2520,9 @@ class TestToolService:
             "max_response_time": 5.0,
             "avg_response_time": 2.3,
             "last_execution_time": "2025-01-10T12:00:00",
+            "p50_response_time": 2.0,
+            "p95_response_time": 4.5,
+            "p99_response_time": 4.9,
         }
 
     @pytest.mark.asyncio
@@ -2560,6 +2567,9 @@ class TestToolService:
             "max_response_time": None,
             "avg_response_time": None,
             "last_execution_time": None,
+            "p50_response_time": None,
+            "p95_response_time": None,
+            "p99_response_time": None,
         }
 
     async def test_validate_tool_url_success(self, tool_service):
@@ -2792,6 +2802,27 @@ class TestToolService:
         # Verify result
         assert result.content[0].text == '{\n  "result": "OAuth success"\n}'
 
+    async def test_invoke_tool_rest_oauth_unauthorized_invalidates_token(self, tool_service, mock_tool, mock_global_config_obj, test_db):
+        """A 401 from the upstream drops the cached OAuth token for the tool's credentials."""
+        mock_tool.integration_type = "REST"
+        mock_tool.request_type = "POST"
+        mock_tool.auth_type = "oauth"
+        mock_tool.oauth_config = {"grant_type": "client_credentials", "client_id": "test_id", "client_secret": "test_secret"}
+        setup_db_execute_mock(test_db, mock_tool, mock_global_config_obj)
+
+        tool_service.oauth_manager.get_access_token = AsyncMock(return_value="revoked_token")
+        tool_service.oauth_manager.invalidate_access_token = AsyncMock()
+        request = httpx.Request("POST", "http://example.com/tool")
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock(side_effect=httpx.HTTPStatusError("401", request=request, response=httpx.Response(401, request=request)))
+        tool_service._http_client.request.return_value = mock_response
+        tool_service._record_tool_metric_sync = Mock()
+
+        with pytest.raises(ToolInvocationError):
+            await tool_service.invoke_tool(test_db, "test_tool", {"param": "value"}, request_headers=None)
+
+        tool_service.oauth_manager.invalidate_access_token.assert_awaited_once_with(mock_tool.oauth_config)
+
     async def test_invoke_tool_rest_oauth_failure(self, tool_service, mock_tool, mock_global_config_obj, test_db):
         """Test invoking REST tool with failed OAuth authentication."""
         # Configure tool with OAuth
@@ -3053,6 +3084,35 @@ class TestToolService:
         # Verify result was modified by plugin
         assert result.content[0].text == "Modified by plugin"
 
+    async def test_invoke_tool_with_plugin_pre_invoke_result_short_circuits(self, tool_service, mock_tool, mock_global_config_obj, test_db):
+        """Test a pre-invoke plugin supplying a final result skips the upstream call."""
+        # First-Party
+        from mcpgateway.plugins.framework import PluginResult, ToolHookType, ToolPreInvokePayload
+
+        mock_tool.integration_type = "REST"
+        mock_tool.request_type = "POST"
+        mock_tool.auth_value = None
+        setup_db_execute_mock(test_db, mock_tool, mock_global_config_obj)
+
+        cached = {"content": [{"type": "text", "text": "from cache"}], "isError": False}
+        tool_service._plugin_manager = Mock()
+
+        def invoke_hook_side_effect(hook_type, payload, global_context, local_contexts=None, **kwargs):
+            if hook_type == ToolHookType.TOOL_PRE_INVOKE:
+                return (PluginResult(modified_payload=ToolPreInvokePayload(name=payload.name, args=payload.args, result=cached)), None)
+            return (PluginResult(continue_processing=True), None)
+
+        tool_service._plugin_manager.invoke_hook = AsyncMock(side_effect=invoke_hook_side_effect)
+
+        with patch("mcpgateway.services.tool_service.decode_auth", return_value={}):
+            result = await tool_service.invoke_tool(test_db, "test_tool", {"param": "value"}, request_headers=None)
+
+        tool_service._http_client.request.assert_not_called()
+        assert result.content[0].text == "from cache"
+        assert result.is_error is False
+        # Post-invoke hooks still run on the short-circuited result
+        assert tool_service._plugin_manager.invoke_hook.call_count == 2
+
     async def test_invoke_tool_with_plugin_post_invoke_invalid_modified_payload(self, tool_service, mock_tool, mock_global_config_obj, test_db):
         """Test invoking tool with plugin post-invoke hook providing invalid modified payload."""
         # Configure tool as REST
@@ -176,6 +176,7 @@ from mcpgateway.admin import (  # admin_get_metrics,
     get_aggregated_metrics,
     get_client_ip,
     get_configuration_settings,
+    get_encryption_key_cache_stats,
     get_gateways_section,
     get_global_passthrough_headers,
     get_latency_heatmap,
@@ -8883,6 +8884,10 @@ async def test_cache_invalidation_endpoints(monkeypatch, mock_db, allow_permissi
     stats = await _unwrap(get_a2a_stats_cache_stats)(_user={"email": "user@example.com", "db": mock_db})
     assert stats["hits"] == 2
 
+    monkeypatch.setattr("mcpgateway.admin.get_derived_key_cache_stats", lambda: {"hits": 3, "misses": 1})
+    stats = await _unwrap(get_encryption_key_cache_stats)(_user={"email": "user@example.com", "db": mock_db})
+    assert stats["hits"] == 3
+
 
 @pytest.mark.asyncio
 async def test_get_mcp_session_pool_metrics_paths(monkeypatch, mock_db, allow_permission):
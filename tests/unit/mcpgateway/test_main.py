@@ -1983,6 +1983,109 @@ class TestRPCEndpoints:
         assert body["error"]["code"] == -32700
         assert body["error"]["message"] == "Parse error"
 
+    @patch("mcpgateway.main.tool_service.invoke_tool")
+    def test_rpc_batch_preserves_order(self, mock_invoke_tool, test_client, auth_headers):
+        """Test batch calls run concurrently but respond in request order."""
+
+        async def fake_invoke(**kwargs):
+            # Finish the first call last to prove ordering does not depend on completion order
+            await asyncio.sleep(0.05 if kwargs["name"] == "slow_tool" else 0)
+            return {"content": [{"type": "text", "text": kwargs["name"]}], "is_error": False}
+
+        mock_invoke_tool.side_effect = fake_invoke
+
+        batch = [
+            {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": "slow_tool", "arguments": {}}},
+            {"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": {"name": "fast_tool", "arguments": {}}},
+            {"jsonrpc": "2.0", "id": 3, "method": "ping"},
+        ]
+        response = test_client.post("/rpc/", json=batch, headers=auth_headers)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [item["id"] for item in body] == [1, 2, 3]
+        assert body[0]["result"]["content"][0]["text"] == "slow_tool"
+        assert body[1]["result"]["content"][0]["text"] == "fast_tool"
+        assert body[2]["result"] == {}
+        assert mock_invoke_tool.call_count == 2
+        # Concurrent entries must never share a database session
+        sessions = [call.kwargs["db"] for call in mock_invoke_tool.call_args_list]
+        assert sessions[0] is not sessions[1]
+
+    @patch("mcpgateway.main.tool_service.invoke_tool")
+    def test_rpc_batch_isolates_errors_and_skips_notifications(self, mock_invoke_tool, test_client, auth_headers):
+        """Test a failing entry does not affect its siblings and notifications get no response."""
+        mock_invoke_tool.side_effect = ValueError("not found")
+
+        batch = [
+            {"jsonrpc": "2.0", "id": "a", "method": "tools/call", "params": {"name": "missing", "arguments": {}}},
+            {"jsonrpc": "2.0", "method": "notifications/roots/list_changed"},
+            "not-an-object",
+            {"jsonrpc": "2.0", "id": "b", "method": "ping"},
+        ]
+        response = test_client.post("/rpc/", json=batch, headers=auth_headers)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert len(body) == 3
+        assert body[0]["id"] == "a"
+        assert body[0]["error"]["code"] == -32601
+        assert body[0]["error"]["message"] == "Tool not found: missing"
+        assert body[1]["error"]["code"] == -32600
+        assert body[1]["id"] is None
+        assert body[2] == {"jsonrpc": "2.0", "result": {}, "id": "b"}
+
+    def test_rpc_batch_only_notifications(self, test_client, auth_headers):
+        """Test a batch of notifications returns no content."""
+        batch = [{"jsonrpc": "2.0", "method": "notifications/roots/list_changed"}]
+        response = test_client.post("/rpc/", json=batch, headers=auth_headers)
+
+        assert response.status_code == 202
+        assert response.content == b""
+
+    def test_rpc_batch_empty(self, test_client, auth_headers):
+        """Test an empty batch is rejected as an invalid request."""
+        response = test_client.post("/rpc/", json=[], headers=auth_headers)
+
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == -32600
+
+    def test_rpc_batch_limits(self, test_client, auth_headers, monkeypatch):
+        """Test batch size limit and the batch feature flag."""
+        batch = [{"jsonrpc": "2.0", "id": i, "method": "ping"} for i in range(3)]
+
+        monkeypatch.setattr("mcpgateway.main.settings.mcpgateway_rpc_batch_max_size", 2)
+        response = test_client.post("/rpc/", json=batch, headers=auth_headers)
+        assert response.status_code == 400
+        assert "Batch too large" in response.json()["error"]["message"]
+
+        monkeypatch.setattr("mcpgateway.main.settings.mcpgateway_rpc_batch_enabled", False)
+        response = test_client.post("/rpc/", json=batch[:1], headers=auth_headers)
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == -32600
+
+    @patch("mcpgateway.main.tool_service.invoke_tool")
+    def test_rpc_batch_plugin_violation(self, mock_invoke_tool, test_client, auth_headers):
+        """Test plugin violations are reported per entry instead of failing the whole batch."""
+        # First-Party
+        from mcpgateway.plugins.framework.errors import PluginViolationError
+        from mcpgateway.plugins.framework.models import PluginViolation
+
+        mock_invoke_tool.side_effect = PluginViolationError("blocked", violation=PluginViolation(reason="r", description="denied", code="DENY", details={}))
+
+        batch = [
+            {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": "t", "arguments": {}}},
+            {"jsonrpc": "2.0", "id": 2, "method": "ping"},
+        ]
+        response = test_client.post("/rpc/", json=batch, headers=auth_headers)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body[0]["id"] == 1
+        assert body[0]["error"]["message"] == "Plugin Violation: denied"
+        assert body[0]["error"]["data"]["plugin_error_code"] == "DENY"
+        assert body[1]["result"] == {}
+
     @patch("mcpgateway.main.logging_service.set_level")
     def test_set_log_level_endpoint(self, mock_set_level, test_client, auth_headers):
         """Test setting the application log level."""
@@ -1017,6 +1017,44 @@ class TestServerEndpointCoverage:
         assert result["resources"] == [{"id": "res-1"}]
         assert result["nextCursor"] == "next-cursor"
 
+    @pytest.mark.asyncio
+    async def test_list_resources_conditional_get_and_delta(self, monkeypatch, allow_permission):
+        request = MagicMock(spec=Request)
+        request.state = SimpleNamespace(team_id=None)
+        request.url = SimpleNamespace(path="/resources", query="")
+        request.headers = {}
+        response = MagicMock()
+        response.headers = {}
+
+        list_mock = AsyncMock(return_value=([], None))
+        monkeypatch.setattr("mcpgateway.main._get_rpc_filter_context", lambda _req, _user: ("user@example.com", None, True))
+        monkeypatch.setattr("mcpgateway.main.resource_service.list_resources", list_mock)
+
+        await list_resources(request, db=MagicMock(), user={"email": "user@example.com"}, response=response)
+        etag = response.headers["ETag"]
+        token = response.headers["X-Registry-Version"]
+
+        request.headers = {"if-none-match": etag}
+        not_modified = await list_resources(request, db=MagicMock(), user={"email": "user@example.com"}, response=response)
+        assert not_modified.status_code == 304
+        assert list_mock.await_count == 1
+
+        request.url = SimpleNamespace(path="/resources", query=f"since={token}")
+        with patch("mcpgateway.main.registry_versions.delta", return_value={"version": token, "reset": False, "added": [], "changed": [], "removed": []}) as delta:
+            result = await list_resources(request, since=token, db=MagicMock(), user={"email": "user@example.com"}, response=response)
+        assert result.status_code == 200
+        assert json.loads(result.body)["reset"] is False
+        assert delta.call_args.args[1:4] == ("resources", token, None)
+        assert list_mock.await_count == 1
+
+        # Deltas do not apply listing filters, so combining them is refused
+        request.url = SimpleNamespace(path="/resources", query=f"since={token}&tags=a")
+        with pytest.raises(HTTPException) as excinfo:
+            await list_resources(request, since=token, tags="a", visibility="public", db=MagicMock(), user={"email": "user@example.com"}, response=response)
+        assert excinfo.value.status_code == 400
+        assert excinfo.value.detail == "The since parameter cannot be combined with: tags, visibility"
+        assert list_mock.await_count == 1
+
     @pytest.mark.asyncio
     async def test_list_resources_tags_and_public_only_default(self, monkeypatch, allow_permission):
         """Cover tags parsing + token_teams None -> [] public-only default."""
@@ -3202,6 +3240,23 @@ class TestRpcHandling:
             result = await handle_rpc(request, db=mock_db, user={"email": "user@example.com"})
             assert result["result"]["nextCursor"] == "next-cursor"
 
+    async def test_handle_rpc_list_prompts_served_from_listing_cache(self):
+        payload = {"jsonrpc": "2.0", "id": "1", "method": "prompts/list", "params": {}}
+
+        prompt = MagicMock()
+        prompt.model_dump.return_value = {"name": "p-1"}
+        list_prompts = AsyncMock(return_value=([prompt], None))
+
+        with (
+            patch("mcpgateway.main.prompt_service.list_prompts", new=list_prompts),
+            patch("mcpgateway.main._get_rpc_filter_context", return_value=("user@example.com", [], False)),
+        ):
+            first = await handle_rpc(self._make_request(payload), db=MagicMock(), user={"email": "user@example.com"})
+            second = await handle_rpc(self._make_request(payload), db=MagicMock(), user={"email": "user@example.com"})
+
+        assert first["result"] == second["result"] == {"prompts": [{"name": "p-1"}]}
+        list_prompts.assert_awaited_once()
+
     async def test_handle_rpc_list_gateways(self):
         payload = {"jsonrpc": "2.0", "id": "1", "method": "list_gateways", "params": {}}
         request = self._make_request(payload)
@@ -94,6 +94,45 @@ def test_get_rpc_filter_context_admin_scoping():
     assert is_admin is True
 
 
+def test_rpc_call_visibility_scope_resolved_once(monkeypatch):
+    calls = []
+
+    def fake_filter_context(request, user):
+        calls.append(user)
+        return ("user@example.com", None, True)
+
+    monkeypatch.setattr(main, "_get_rpc_filter_context", fake_filter_context)
+    call = main._RPCCall(request=None, db=None, user={"email": "user@example.com"}, method="tools/list", params={"server_id": "s1"}, req_id=1, headers={})
+
+    # Admin without team restrictions is unrestricted
+    assert call.visibility_scope() == (None, None)
+    assert call.filter_context() == ("user@example.com", None, True)
+    assert call.server_id == "s1"
+    assert call.cursor is None
+    assert len(calls) == 1
+
+
+def test_rpc_call_visibility_scope_defaults_to_public_only(monkeypatch):
+    monkeypatch.setattr(main, "_get_rpc_filter_context", lambda request, user: ("user@example.com", None, False))
+    call = main._RPCCall(request=None, db=None, user={}, method="tools/call", params={}, req_id=1, headers={})
+    assert call.visibility_scope() == ("user@example.com", [])
+
+    monkeypatch.setattr(main, "_get_rpc_filter_context", lambda request, user: ("user@example.com", ["t1"], True))
+    call = main._RPCCall(request=None, db=None, user={}, method="tools/call", params={}, req_id=1, headers={})
+    assert call.visibility_scope() == ("user@example.com", ["t1"])
+
+
+def test_resolve_rpc_handler():
+    assert main._resolve_rpc_handler("tools/list") is main._rpc_list_tools
+    assert main._resolve_rpc_handler("list_tools") is main._rpc_list_tools
+    assert main._resolve_rpc_handler("notifications/initialized") is main._rpc_notification_initialized
+    assert main._resolve_rpc_handler("notifications/progress") is main._rpc_empty_result
+    assert main._resolve_rpc_handler("logging/unknown") is main._rpc_empty_result
+    # Unknown namespaces and bare names fall back to direct tool invocation
+    assert main._resolve_rpc_handler("custom/tool") is main._rpc_invoke_tool_by_method
+    assert main._resolve_rpc_handler("weather") is main._rpc_invoke_tool_by_method
+
+
 def test_jsonpath_modifier_and_transform_mappings():
     data = [{"user": {"name": "Alice", "roles": ["a", "b"]}}, {"user": {"name": "Bob", "roles": ["c"]}}]
     result = main.jsonpath_modifier(data, "$[*].user", {"name": "$.name", "roles": "$.roles[*]"})
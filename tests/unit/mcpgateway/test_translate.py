@@ -45,6 +45,7 @@ from unittest.mock import AsyncMock, Mock
 
 # Third-Party
 from fastapi.testclient import TestClient
+import orjson
 import pytest
 
 # import inspect
@@ -4912,6 +4913,7 @@ async def test_multi_protocol_server_with_streamable_http(monkeypatch, translate
             calls.append("stdio_init")
             self._pubsub = pubsub
             self.send = AsyncMock()
+            self.release = Mock()
 
         async def start(self):
             calls.append("stdio_start")
@@ -4955,7 +4957,7 @@ async def test_multi_protocol_server_with_streamable_http(monkeypatch, translate
         def __init__(self):
             pubsub_holder["pubsub"] = self
 
-        def subscribe(self):
+        def subscribe(self, session_id=None):
             queue = asyncio.Queue()
             if self.next_message is not None:
                 queue.put_nowait(self.next_message)
@@ -5020,6 +5022,8 @@ async def test_multi_protocol_server_with_streamable_http(monkeypatch, translate
     mcp_handler = routes["/mcp"]
 
     class DummyRequest:
+        headers: dict[str, str] = {}
+
         async def body(self):
             return b'{"id": 1, "method": "ping"}'
 
@@ -5055,6 +5059,7 @@ async def test_multi_protocol_server_sse_message_keepalive_disabled_and_post_mes
             self._running = False
             self._pubsub = pubsub
             self.send = AsyncMock()
+            self.release = Mock()
             stdio_holder["stdio"] = self
 
         async def start(self, *_a, **_k):
@@ -5161,6 +5166,7 @@ async def test_multi_protocol_server_sse_header_mappings_empty_env_no_restart_an
             self.start = AsyncMock(side_effect=self._mark_running)
             self.stop = AsyncMock(side_effect=self._mark_stopped)
             self.send = AsyncMock()
+            self.release = Mock()
             stdio_holder["stdio"] = self
 
         async def _mark_running(self, *_a, **_k):
@@ -5372,6 +5378,9 @@ async def test_multi_protocol_server_sse_timeout_keepalive_disabled_and_pubsub_f
         def is_running(self):
             return True
 
+        def release(self, _session_id):
+            return None
+
     class FastAPI:
         def __init__(self):
             self.user_middleware = []
@@ -5450,6 +5459,7 @@ async def test_multi_protocol_server_post_message_raises_when_stdio_falsy(monkey
         def __init__(self, *_a, **_k):
             self.truthy = True
             self.send = AsyncMock()
+            self.release = Mock()
             stdio_holder["stdio"] = self
 
         def __bool__(self):
@@ -5538,7 +5548,7 @@ async def test_multi_protocol_server_mcp_post_branches_asgi_wrapper_shutdown_ide
         def __bool__(self):
             return self.truthy
 
-        def subscribe(self):
+        def subscribe(self, session_id=None):
             q: asyncio.Queue[str] = asyncio.Queue()
             self._subscribers.append(q)
             return q
@@ -5552,6 +5562,7 @@ async def test_multi_protocol_server_mcp_post_branches_asgi_wrapper_shutdown_ide
             self.truthy = True
             self._pubsub = pubsub
             self.send = AsyncMock()
+            self.release = Mock()
             stdio_holder["stdio"] = self
 
         def __bool__(self):
@@ -5675,6 +5686,8 @@ async def test_multi_protocol_server_mcp_post_branches_asgi_wrapper_shutdown_ide
 
     # Notification -> 202
     class NotifyReq:
+        headers: dict[str, str] = {}
+
         async def body(self):
             return b'{"method":"ping"}'
 
@@ -5685,6 +5698,8 @@ async def test_multi_protocol_server_mcp_post_branches_asgi_wrapper_shutdown_ide
     pubsub.truthy = False
 
     class IdReq:
+        headers: dict[str, str] = {}
+
         async def body(self):
             return b'{"id": 1, "method":"ping"}'
 
@@ -5740,6 +5755,94 @@ async def test_multi_protocol_server_mcp_post_branches_asgi_wrapper_shutdown_ide
         await mcp_handler(IdReq())
 
 
+@pytest.mark.asyncio
+async def test_multi_protocol_server_mcp_post_pins_sessions_to_stdio_workers(monkeypatch, translate, tmp_path):
+    """With two workers, initialize and later calls of one /mcp session reach the same subprocess."""
+    script = tmp_path / "stateful_rpc.py"
+    script.write_text(
+        "import json, os, sys\n"
+        "initialized = False\n"
+        "for line in sys.stdin:\n"
+        "    msg = json.loads(line)\n"
+        "    if msg.get('method') == 'initialize':\n"
+        "        initialized = True\n"
+        "    if 'id' in msg:\n"
+        "        result = {'pid': os.getpid(), 'initialized': initialized}\n"
+        "        print(json.dumps({'jsonrpc': '2.0', 'id': msg['id'], 'result': result}), flush=True)\n"
+    )
+    routes: dict[str, Any] = {}
+    results: dict[str, Any] = {}
+
+    class FastAPI:
+        def __init__(self):
+            self.routes = []
+            self.user_middleware = []
+
+        def add_middleware(self, *_a, **_k):
+            return None
+
+        def get(self, path):
+            return lambda func: routes.setdefault(path, func)
+
+        def post(self, path, **_k):
+            return lambda func: routes.setdefault(path, func)
+
+        async def __call__(self, scope, receive, send):
+            return None
+
+    class StreamableManager:
+        def __init__(self, *_a, **_k):
+            pass
+
+        def run(self):
+            class Ctx:
+                async def __aenter__(self):
+                    return self
+
+                async def __aexit__(self, *_a):
+                    return None
+
+            return Ctx()
+
+    class Req:
+        def __init__(self, payload, session_id=None):
+            self.headers = {"mcp-session-id": session_id} if session_id else {}
+            self._body = orjson.dumps(payload)
+
+        async def body(self):
+            return self._body
+
+    async def open_session(mcp):
+        init = await mcp(Req({"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}}))
+        session_id = init.headers["mcp-session-id"]
+        notified = await mcp(Req({"jsonrpc": "2.0", "method": "notifications/initialized"}, session_id))
+        call = await mcp(Req({"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": {}}, session_id))
+        assert notified.status_code == 202
+        return orjson.loads(init.body)["result"], orjson.loads(call.body)["result"]
+
+    class Server:
+        def __init__(self, _cfg):
+            self.should_exit = False
+
+        async def serve(self):
+            results["a"] = await open_session(routes["/mcp"])
+            results["b"] = await open_session(routes["/mcp"])
+
+    monkeypatch.setattr(translate, "FastAPI", FastAPI)
+    monkeypatch.setattr(translate, "MCPServer", lambda *_a, **_k: None)
+    monkeypatch.setattr(translate, "StreamableHTTPSessionManager", StreamableManager)
+    monkeypatch.setattr(translate.uvicorn, "Config", lambda app, **_k: app)
+    monkeypatch.setattr(translate.uvicorn, "Server", Server)
+    monkeypatch.setattr(asyncio.get_running_loop(), "add_signal_handler", lambda *_a, **_k: None)
+
+    await translate._run_multi_protocol_server(f"{sys.executable} {script}", 8000, "info", None, "127.0.0.1", expose_sse=False, expose_streamable_http=True, stdio_workers=2)
+
+    (init_a, call_a), (init_b, call_b) = results["a"], results["b"]
+    assert call_a == {"pid": init_a["pid"], "initialized": True}
+    assert call_b == {"pid": init_b["pid"], "initialized": True}
+    assert init_a["pid"] != init_b["pid"]  # new sessions are still spread across workers
+
+
 @pytest.mark.asyncio
 async def test_multi_protocol_server_sse_routes(monkeypatch, translate):
     """Exercise SSE routes and message handling in multi-protocol server."""
@@ -5752,7 +5855,7 @@ async def test_multi_protocol_server_sse_routes(monkeypatch, translate):
             pubsub_holder["pubsub"] = self
             self.subscribers = []
 
-        def subscribe(self):
+        def subscribe(self, session_id=None):
             queue = asyncio.Queue()
             self.subscribers.append(queue)
             return queue
@@ -5764,6 +5867,7 @@ async def test_multi_protocol_server_sse_routes(monkeypatch, translate):
         def __init__(self, cmd, pubsub, **kwargs):
             self._running = False
             self.send = AsyncMock()
+            self.release = Mock()
             self.last_env = None
             stdio_holder["stdio"] = self
 
@@ -20,7 +20,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 # First-Party
-from mcpgateway.translate import _PubSub, StdIOEndpoint
+from mcpgateway.translate import _PubSub, StdIOEndpoint, StdIOPool
 
 
 class TestStdIOEndpointEnvironmentVariables:
@@ -543,3 +543,106 @@ sys.stdout.flush()
 
         assert isinstance(endpoint._env_vars, dict)
         assert isinstance(endpoint._env_vars.get("GITHUB_TOKEN"), str)
+
+
+class TestStdIOSessionRouting:
+    """Test per-session response routing and the stdio worker pool."""
+
+    @pytest.fixture
+    def rpc_script(self):
+        """Create a JSON-RPC server that answers every request with its own pid."""
+        script_content = """#!/usr/bin/env python3
+import json, os, sys
+for line in sys.stdin:
+    msg = json.loads(line)
+    if "id" in msg:
+        print(json.dumps({"jsonrpc": "2.0", "id": msg["id"], "result": {"pid": os.getpid()}}), flush=True)
+    else:
+        print(json.dumps({"jsonrpc": "2.0", "method": "notifications/message", "params": {}}), flush=True)
+"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
+            f.write(script_content)
+        try:
+            yield f"{sys.executable} {f.name}"
+        finally:
+            os.unlink(f.name)
+
+    @pytest.mark.asyncio
+    async def test_colliding_ids_are_routed_to_their_session(self, rpc_script):
+        """Two sessions reusing id 1 each receive only their own response."""
+        pubsub = _PubSub()
+        first, second, observer = pubsub.subscribe("a"), pubsub.subscribe("b"), pubsub.subscribe()
+        endpoint = StdIOEndpoint(rpc_script, pubsub)
+        await endpoint.start()
+        try:
+            await endpoint.send('{"jsonrpc":"2.0","id":1,"method":"ping"}\n', session_id="a")
+            await endpoint.send('{"jsonrpc":"2.0","id":1,"method":"ping"}\n', session_id="b")
+            assert json.loads(await asyncio.wait_for(first.get(), 5))["id"] == 1
+            assert json.loads(await asyncio.wait_for(second.get(), 5))["id"] == 1
+            assert first.empty() and second.empty() and observer.empty()
+            assert endpoint.in_flight == 0
+
+            # Server-initiated messages are still broadcast to everyone
+            await endpoint.send('{"jsonrpc":"2.0","method":"notifications/initialized"}\n', session_id="a")
+            broadcast = await asyncio.wait_for(observer.get(), 5)
+            assert json.loads(broadcast)["method"] == "notifications/message"
+            assert (await asyncio.wait_for(second.get(), 5)) == broadcast
+        finally:
+            await endpoint.stop()
+
+    @pytest.mark.asyncio
+    async def test_pool_pins_sessions_to_workers(self, rpc_script):
+        """Sessions are spread across workers and stay on the worker they started on."""
+        pubsub = _PubSub()
+        queues = {session: pubsub.subscribe(session) for session in ("a", "b")}
+        pool = StdIOPool(rpc_script, pubsub, size=2)
+        await pool.start()
+        try:
+            assert pool.is_running()
+            pids = {}
+            for session in ("a", "b", "a", "b"):
+                await pool.send('{"jsonrpc":"2.0","id":"x","method":"ping"}\n', session_id=session)
+                response = json.loads(await asyncio.wait_for(queues[session].get(), 5))
+                assert response["id"] == "x"
+                pids.setdefault(session, set()).add(response["result"]["pid"])
+
+            assert len(pids["a"]) == len(pids["b"]) == 1
+            assert pids["a"] != pids["b"]
+        finally:
+            await pool.stop()
+        assert not pool.is_running()
+
+    @pytest.mark.asyncio
+    async def test_responses_for_departed_sessions_are_dropped(self, rpc_script):
+        """A response whose session is gone or released never reaches other subscribers."""
+        pubsub = _PubSub()
+        observer = pubsub.subscribe("other")
+        endpoint = StdIOEndpoint(rpc_script, pubsub)
+        await endpoint.start()
+        try:
+            await endpoint.send('{"jsonrpc":"2.0","id":1,"method":"ping"}\n', session_id="gone")
+            waiting = pubsub.subscribe("late")
+            await endpoint.send('{"jsonrpc":"2.0","id":2,"method":"ping"}\n', session_id="late")
+            endpoint.release("late")
+            assert endpoint.in_flight == 1
+
+            # Prove the pump has processed both answers before checking nothing leaked
+            await endpoint.send('{"jsonrpc":"2.0","id":3,"method":"ping"}\n', session_id="other")
+            assert json.loads(await asyncio.wait_for(observer.get(), 5))["id"] == 3
+            assert observer.empty() and waiting.empty()
+            assert endpoint.in_flight == 0
+        finally:
+            await endpoint.stop()
+
+    def test_pool_release_and_unpinned_sends(self):
+        """Released sessions free their worker slot; empty affinity keys never pin."""
+        pool = StdIOPool("cat", _PubSub(), size=2)
+        pool._worker_for("sse-session")
+        pool.workers[pool._affinity["sse-session"]]._pending["translate-1"] = ("sse-session", 1)
+
+        pool.release("sse-session")
+
+        assert not pool._affinity and pool._sessions_per_worker == [0, 0]
+        assert all(worker.in_flight == 0 for worker in pool.workers)
+        pool._worker_for("")
+        assert not pool._affinity
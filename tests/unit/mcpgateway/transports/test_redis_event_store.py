@@ -127,6 +127,12 @@ class InMemoryRedisClient:
                 return self._messages[key].get(field)
             return None
 
+    async def hmget(self, key: str, fields):
+        async with self._lock:
+            self._purge_expired_key(key)
+            messages = self._messages.get(key, {})
+            return [messages.get(field) for field in fields]
+
     async def zrangebyscore(self, key: str, min_score, max_score):
         async with self._lock:
             self._purge_expired_key(key)
@@ -533,16 +539,17 @@ class TestRedisEventStore:
                 self.get = AsyncMock(return_value=orjson.dumps({"stream_id": stream_id, "seq_num": 1}))
                 self.zrangebyscore = AsyncMock(return_value=[b"ev-1", b"ev-2"])
                 self.hget = AsyncMock(side_effect=self._hget)
+                self.hmget = AsyncMock(side_effect=self._hmget)
 
             async def _hget(self, key: str, field: str):
                 if key == meta_key and field == "start_seq":
                     return b"not-int"
-                if key == messages_key and field == "ev-1":
-                    return None
-                if key == messages_key and field == "ev-2":
-                    return b"{"  # invalid JSON -> replay None
                 raise AssertionError(f"Unexpected hget: {key=} {field=}")
 
+            async def _hmget(self, key: str, fields):
+                assert key == messages_key and fields == ["ev-1", "ev-2"]
+                return [None, b"{"]  # missing message skipped, invalid JSON -> replay None
+
         monkeypatch.setattr(
             "mcpgateway.transports.redis_event_store.get_redis_client",
             AsyncMock(return_value=DummyRedis()),
@@ -591,14 +598,17 @@ class TestRedisEventStore:
                 self.get = AsyncMock(return_value=orjson.dumps({"stream_id": stream_id, "seq_num": 1}))
                 self.zrangebyscore = AsyncMock(return_value=[b"ev-2"])
                 self.hget = AsyncMock(side_effect=self._hget)
+                self.hmget = AsyncMock(side_effect=self._hmget)
 
             async def _hget(self, key: str, field: str):
                 if field == "start_seq":
                     return None
-                if key == messages_key and field == "ev-2":
-                    return orjson.dumps({"jsonrpc": "2.0", "id": 2})
                 raise AssertionError(f"Unexpected hget: {key=} {field=}")
 
+            async def _hmget(self, key: str, fields):
+                assert key == messages_key and fields == ["ev-2"]
+                return [orjson.dumps({"jsonrpc": "2.0", "id": 2})]
+
         monkeypatch.setattr(
             "mcpgateway.transports.redis_event_store.get_redis_client",
             AsyncMock(return_value=DummyRedis()),
@@ -607,3 +617,127 @@ class TestRedisEventStore:
         callback = AsyncMock()
         assert await store.replay_events_after("event-id", callback) == stream_id
         callback.assert_awaited_once()
+
+    async def test_replay_fetches_messages_in_batches(self, monkeypatch: pytest.MonkeyPatch, fake_redis_client):
+        monkeypatch.setattr(
+            "mcpgateway.transports.redis_event_store.get_redis_client",
+            AsyncMock(return_value=fake_redis_client),
+        )
+        monkeypatch.setattr("mcpgateway.transports.redis_event_store._REPLAY_BATCH_SIZE", 4)
+        store = RedisEventStore(max_events_per_stream=20, ttl=60, key_prefix=f"mcpgw:eventstore:test:{uuid.uuid4().hex}")
+        event_ids = [await store.store_event("s", {"jsonrpc": "2.0", "id": i}) for i in range(10)]
+
+        fake_redis_client.hget = AsyncMock(wraps=fake_redis_client.hget)
+        fake_redis_client.hmget = AsyncMock(wraps=fake_redis_client.hmget)
+        replayed = []
+
+        async def callback(msg):
+            replayed.append(msg)
+
+        assert await store.replay_events_after(event_ids[0], callback) == "s"
+        assert [m["id"] for m in replayed] == list(range(1, 10))
+        assert fake_redis_client.hmget.await_count == 3  # 9 messages in batches of 4
+        assert fake_redis_client.hget.await_count == 1  # start_seq only
+
+
+class InMemoryStreamRedisClient:
+    """Minimal async Redis Streams simulation for stream-mode RedisEventStore tests."""
+
+    def __init__(self) -> None:
+        self.streams: dict[str, list[tuple[str, dict[str, bytes]]]] = {}
+        self.nonces: dict[str, str] = {}
+        self.expires: dict[str, int] = {}
+        self.evals = 0
+        self._ms = 1700000000000
+
+    async def eval(self, _script, _num_keys, nonce_key, nonce, log_key_prefix, message_json, ttl, max_events):
+        self.evals += 1
+        nonce = self.nonces.setdefault(nonce_key, nonce)
+        log_key = f"{log_key_prefix}{nonce}:log"
+        self.expires[nonce_key] = self.expires[log_key] = ttl
+        return [nonce.encode(), self._xadd(log_key, {"m": message_json}, max_events).encode()]
+
+    def _xadd(self, key, fields, maxlen):
+        self._ms += 1
+        entry_id = f"{self._ms}-0"
+        entries = self.streams.setdefault(key, [])
+        entries.append((entry_id, dict(fields)))
+        if maxlen is not None:
+            del entries[: max(0, len(entries) - maxlen)]
+        return entry_id
+
+    async def xrange(self, key, min="-", max="+"):
+        lower = tuple(int(p) for p in min.split("-"))
+        return [(entry_id, fields) for entry_id, fields in self.streams.get(key, []) if tuple(int(p) for p in entry_id.split("-")) >= lower]
+
+
+class TestRedisEventStoreStreamMode:
+    """Test suite for the Redis Streams storage mode."""
+
+    @pytest.fixture
+    def stream_client(self, monkeypatch):
+        client = InMemoryStreamRedisClient()
+        monkeypatch.setattr(
+            "mcpgateway.transports.redis_event_store.get_redis_client",
+            AsyncMock(return_value=client),
+        )
+        return client
+
+    @pytest.fixture
+    def stream_store(self, stream_client):
+        return RedisEventStore(max_events_per_stream=5, ttl=60, key_prefix="mcpgw:eventstore:test:streams", mode="stream")
+
+    async def test_store_and_replay(self, stream_store, stream_client, messages):
+        event_ids = [await stream_store.store_event("sess/1", msg) for msg in messages]
+        assert stream_client.evals == len(messages)  # one round trip per store
+        nonce = stream_client.nonces[stream_store._get_stream_nonce_key("sess/1")]
+        assert len(nonce) == 32 and all(event_id.startswith(f"sess/1/{nonce}/") for event_id in event_ids)
+        assert stream_client.expires == {stream_store._get_stream_nonce_key("sess/1"): 60, stream_store._get_stream_log_key("sess/1", nonce): 60}
+
+        replayed = []
+
+        async def callback(msg):
+            replayed.append(msg)
+
+        assert await stream_store.replay_events_after(event_ids[1], callback) == "sess/1"
+        assert replayed == messages[2:]
+
+    async def test_streams_get_distinct_nonces_shared_across_workers(self, stream_store, stream_client):
+        other_worker = RedisEventStore(max_events_per_stream=5, ttl=60, key_prefix=stream_store.key_prefix, mode="stream")
+        first = await stream_store.store_event("1", None)
+        second = await other_worker.store_event("1", {"jsonrpc": "2.0", "id": 1})
+        other_stream = await stream_store.store_event("2", None)
+
+        assert first.rsplit("/", 1)[0] == second.rsplit("/", 1)[0]
+        assert first.split("/")[1] != other_stream.split("/")[1]
+        callback = AsyncMock()
+        assert await other_worker.replay_events_after(first, callback) == "1"
+        callback.assert_awaited_once_with({"jsonrpc": "2.0", "id": 1})
+
+    async def test_replay_after_last_event_sends_nothing(self, stream_store, stream_client):
+        event_id = await stream_store.store_event("s", None)
+        callback = AsyncMock()
+        assert await stream_store.replay_events_after(event_id, callback) == "s"
+        callback.assert_not_awaited()
+
+    async def test_trimmed_event_cannot_be_replayed(self, stream_store, stream_client):
+        event_ids = [await stream_store.store_event("s", {"jsonrpc": "2.0", "id": i}) for i in range(8)]
+        callback = AsyncMock()
+        assert await stream_store.replay_events_after(event_ids[0], callback) is None
+        assert await stream_store.replay_events_after(event_ids[3], callback) == "s"
+        assert callback.await_count == 4
+
+    async def test_guessed_nonce_cannot_replay(self, stream_store, stream_client):
+        stream_id, _, entry_id = (await stream_store.store_event("_GET_stream", None)).split("/")
+        await stream_store.store_event("_GET_stream", {"jsonrpc": "2.0", "method": "notifications/message"})
+        callback = AsyncMock()
+        for nonce in ("", "0" * 32):
+            assert await stream_store.replay_events_after(f"{stream_id}/{nonce}/{entry_id}", callback) is None
+        assert await stream_store.replay_events_after(f"{stream_id}/{entry_id}", callback) is None
+        callback.assert_not_awaited()
+
+    @pytest.mark.parametrize("event_id", ["no-separator", "s/n/not-an-id", "/n/1-0", "s/1-0", "missing/n/1700000000001-0"])
+    async def test_unknown_event_ids_return_none(self, stream_store, stream_client, event_id):
+        callback = AsyncMock()
+        assert await stream_store.replay_events_after(event_id, callback) is None
+        callback.assert_not_awaited()
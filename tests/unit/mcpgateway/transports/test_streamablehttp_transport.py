@@ -4892,6 +4892,7 @@ async def test_session_manager_wrapper_redis_event_store(monkeypatch):
     monkeypatch.setattr("mcpgateway.transports.streamablehttp_transport.settings.redis_url", "redis://localhost:6379")
     monkeypatch.setattr("mcpgateway.transports.streamablehttp_transport.settings.streamable_http_max_events_per_stream", 50)
     monkeypatch.setattr("mcpgateway.transports.streamablehttp_transport.settings.streamable_http_event_ttl", 1800)
+    monkeypatch.setattr("mcpgateway.transports.streamablehttp_transport.settings.streamable_http_event_store_mode", "stream")
     monkeypatch.setattr(tr, "StreamableHTTPSessionManager", capture_manager)
 
     wrapper = SessionManagerWrapper()
@@ -4901,6 +4902,7 @@ async def test_session_manager_wrapper_redis_event_store(monkeypatch):
     from mcpgateway.transports.redis_event_store import RedisEventStore
 
     assert isinstance(captured_config["event_store"], RedisEventStore)
+    assert captured_config["event_store"].mode == "stream"
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/utils/test_catalog_hash.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Unit tests for federated catalog content hashes.
+"""
+
+# Standard
+from types import SimpleNamespace
+
+# First-Party
+from mcpgateway.utils.catalog_hash import catalog_digest, resource_content_hash, tool_content_hash
+
+
+def _gateway(**overrides):
+    fields = {"url": "http://gw", "auth_type": None, "auth_value": None, "visibility": "public"}
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _tool(**overrides):
+    fields = {"name": "t", "description": "d", "request_type": "SSE", "headers": {}, "input_schema": {"type": "object", "properties": {"b": {}, "a": {}}}, "output_schema": None, "jsonpath_filter": ""}
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def test_tool_hash_ignores_dict_key_order():
+    reordered = _tool(input_schema={"properties": {"a": {}, "b": {}}, "type": "object"})
+    assert tool_content_hash(_tool(), _gateway()) == tool_content_hash(reordered, _gateway())
+
+
+def test_tool_hash_covers_schema_and_gateway_fields():
+    base = tool_content_hash(_tool(), _gateway())
+    assert tool_content_hash(_tool(input_schema={"type": "string"}), _gateway()) != base
+    assert tool_content_hash(_tool(), _gateway(auth_type="bearer")) != base
+    assert tool_content_hash(_tool(), _gateway(visibility="private")) != base
+
+
+def test_resource_hash_changes_with_mime_type():
+    resource = SimpleNamespace(uri="file:///a", name="a", description=None, mime_type="text/plain", uri_template=None)
+    changed = SimpleNamespace(**{**vars(resource), "mime_type": "application/json"})
+    assert resource_content_hash(resource, _gateway()) != resource_content_hash(changed, _gateway())
+
+
+def test_catalog_digest_detects_additions_and_removals():
+    digest = catalog_digest([("a", "1"), ("b", "2")])
+    assert catalog_digest([("a", "1")]) != digest
+    assert catalog_digest([("a", "1"), ("b", "2"), ("c", "3")]) != digest
+    assert catalog_digest([]) == catalog_digest(iter(()))
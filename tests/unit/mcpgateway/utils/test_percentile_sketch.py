@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Tests for the mergeable percentile sketch.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Standard
+import json
+import random
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.utils.percentile_sketch import PercentileSketch
+
+
+def _exact(sorted_values, q):
+    return sorted_values[int(q * (len(sorted_values) - 1))]
+
+
+def test_quantiles_within_relative_accuracy():
+    rng = random.Random(42)
+    values = [rng.lognormvariate(-2, 1) for _ in range(20000)] + [0.0] * 50
+    sketch = PercentileSketch(relative_accuracy=0.01).update(values)
+    values.sort()
+
+    for q in (0.5, 0.9, 0.95, 0.99):
+        assert sketch.quantile(q) == pytest.approx(_exact(values, q), rel=0.011)
+    assert sketch.quantile(0) == 0.0
+    assert sketch.quantile(1) == values[-1]
+    assert sketch.mean() == pytest.approx(sum(values) / len(values))
+
+
+def test_merged_hourly_sketches_match_a_single_sketch_and_survive_json():
+    rng = random.Random(7)
+    hours = [[rng.uniform(0.01, 2.0) * (hour + 1) for _ in range(500)] for hour in range(24)]
+
+    merged = PercentileSketch()
+    for values in hours:
+        stored = json.loads(json.dumps(PercentileSketch().update(values).to_dict()))
+        merged.merge(PercentileSketch.from_dict(stored))
+    single = PercentileSketch().update(value for values in hours for value in values)
+
+    assert merged.count == single.count == 12000
+    for q in (0.5, 0.95, 0.99):
+        assert merged.quantile(q) == single.quantile(q)
+
+
+def test_bucket_budget_collapses_low_buckets_only():
+    values = [10 ** (exponent / 100) for exponent in range(-600, 200)]
+    sketch = PercentileSketch(max_buckets=100).update(values)
+
+    assert sum(1 for bucket_count in sketch.to_dict()["counts"] if bucket_count) == 100
+    assert sketch.count == len(values)
+    assert sketch.quantile(0.99) == pytest.approx(_exact(values, 0.99), rel=0.011)
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/utils/test_uri_template_router.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Unit tests for mcpgateway.utils.uri_template_router.
+"""
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.utils.uri_template_router import compile_uri_template, literal_prefix, UriTemplateRouter
+
+
+@pytest.fixture
+def router():
+    r = UriTemplateRouter()
+    r.add("users", "U", "users://{user_id}/profile")
+    r.add("files", "F", "files://root/{path*}")
+    r.add("search", "S", "search://query/{q}{?limit,offset}")
+    r.add("static", "T", "static://readme")
+    return r
+
+
+def test_match_returns_route_and_params_in_one_pass(router):
+    route, params = router.match("users://42/profile")
+    assert route.key == "users"
+    assert route.template == "U"
+    assert params == {"user_id": "42"}
+
+
+def test_wildcard_and_query_expressions(router):
+    assert router.match("files://root/a/b/c.txt")[1] == {"path": "a/b/c.txt"}
+    route, params = router.match("search://query/mcp?limit=5")
+    assert route.key == "search"
+    assert params == {"q": "mcp"}
+
+
+def test_literal_template_and_misses(router):
+    assert router.match("static://readme")[0].key == "static"
+    assert router.match("static://readme/extra") is None
+    assert router.match("users://42/settings") is None
+    assert router.match("unknown://x") is None
+    assert router.match("") is None
+
+
+def test_longest_prefix_is_preferred_over_registration_order():
+    r = UriTemplateRouter()
+    r.add("generic", "G", "docs://{section}/{page}")
+    r.add("api", "A", "docs://api/{page}")
+    assert r.match("docs://api/intro")[0].key == "api"
+    assert r.match("docs://guide/intro")[0].key == "generic"
+
+
+def test_enabled_route_wins_over_disabled_match():
+    r = UriTemplateRouter()
+    r.add("old", "O", "kb://articles/{id}", enabled=False)
+    r.add("new", "N", "kb://{kind}/{id}")
+    assert r.match("kb://articles/1")[0].key == "new"
+
+    r.remove("new")
+    route, params = r.match("kb://articles/1")
+    assert route.key == "old"
+    assert route.enabled is False
+    assert params == {"id": "1"}
+
+
+def test_add_replaces_existing_route_and_remove(router):
+    router.add("users", "U2", "members://{user_id}", version=2)
+    assert router.match("users://42/profile") is None
+    assert router.match("members://7")[0].template == "U2"
+    assert router.version("users") == 2
+    assert len(router) == 4
+
+    assert router.remove("users") is True
+    assert router.remove("users") is False
+    assert "users" not in router.keys()
+
+
+def test_stale_flag_and_clear(router):
+    router.stale = False
+    router.mark_stale()
+    assert router.stale is True
+
+    router.stale = False
+    router.clear()
+    assert len(router) == 0
+    assert router.stale is True
+    assert router.match("users://42/profile") is None
+
+
+def test_helpers():
+    assert literal_prefix("a://b/{c}/d") == "a://b/"
+    assert compile_uri_template("x://{a}.{b}").match("x://1.2").groupdict() == {"a": "1", "b": "2"}
+    assert compile_uri_template("x://{a}") is compile_uri_template("x://{a}")
@@ -716,6 +716,74 @@ async def test_verify_jwt_token_cached_different_tokens(monkeypatch):
     assert request.state._jwt_verified_payload[0] == token2
 
 
+# ---------------------------------------------------------------------------
+# Process-level verified token cache tests
+# ---------------------------------------------------------------------------
+def _configure_hs256(monkeypatch):
+    monkeypatch.setattr(vc.settings, "jwt_secret_key", SECRET, raising=False)
+    monkeypatch.setattr(vc.settings, "jwt_algorithm", ALGO, raising=False)
+    monkeypatch.setattr(vc.settings, "require_token_expiration", False, raising=False)
+    monkeypatch.setattr(vc.settings, "jwt_audience", "mcpgateway-api", raising=False)
+    monkeypatch.setattr(vc.settings, "jwt_issuer", "mcpgateway", raising=False)
+    monkeypatch.setattr(vc.settings, "jwt_audience_verification", True, raising=False)
+    monkeypatch.setattr(vc.settings, "jwt_issuer_verification", True, raising=False)
+
+
+@pytest.mark.asyncio
+async def test_verify_jwt_token_cached_across_requests_skips_decode(monkeypatch):
+    """A token verified by one request is not re-verified by the next."""
+    _configure_hs256(monkeypatch)
+    token = _token({"sub": "agent"})
+
+    first = await vc.verify_jwt_token_cached(token, None)
+    decode = Mock(side_effect=AssertionError("signature verified twice"))
+    monkeypatch.setattr(vc.jwt, "decode", decode)
+    second = await vc.verify_jwt_token_cached(token, None)
+
+    assert second == first
+    second["sub"] = "mutated"  # callers get a copy
+    assert (await vc.verify_jwt_token_cached(token, None))["sub"] == "agent"
+    assert vc.get_auth_cache().stats()["jwt_hit_count"] >= 2
+
+
+@pytest.mark.asyncio
+async def test_verify_jwt_token_cached_revoked_jti_reverifies(monkeypatch):
+    """Revoking a token's JTI drops the cached payload."""
+    _configure_hs256(monkeypatch)
+    token = _token({"sub": "agent"})
+    payload = await vc.verify_jwt_token_cached(token, None)
+
+    vc.get_auth_cache().mark_token_revoked_local(payload["jti"])
+    decode = Mock(wraps=jwt.decode)
+    monkeypatch.setattr(vc.jwt, "decode", decode)
+    await vc.verify_jwt_token_cached(token, None)
+    decode.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_verify_jwt_token_cached_settings_change_reverifies(monkeypatch):
+    """Changing verification settings invalidates cached payloads."""
+    _configure_hs256(monkeypatch)
+    token = _token({"sub": "agent"})
+    await vc.verify_jwt_token_cached(token, None)
+
+    monkeypatch.setattr(vc.settings, "jwt_audience", "another-audience", raising=False)
+    with pytest.raises(HTTPException) as exc:
+        await vc.verify_jwt_token_cached(token, None)
+    assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_verify_jwt_token_cached_entry_bounded_by_exp(monkeypatch):
+    """Cached payloads never outlive the token's exp claim."""
+    _configure_hs256(monkeypatch)
+    token = _token({"sub": "agent"}, exp_delta=1)
+    payload = await vc.verify_jwt_token_cached(token, None)
+
+    entry = next(iter(vc.get_auth_cache()._verified_token_cache.values()))
+    assert entry.expiry <= payload["exp"]
+
+
 # ---------------------------------------------------------------------------
 # JTI (JWT ID) validation tests
 # ---------------------------------------------------------------------------